@@ -42,11 +42,15 @@ class PerformanceMetrics:
     throughput: float = 0.0  # operations per second
     error_rate: float = 0.0
     rate_limit_hits: int = 0
-    cpu_usage: float = 0.0
-    memory_usage: float = 0.0
-    network_latency: float = 0.0
+    cpu_usage: Optional[float] = None  # None when the reporter did not measure it
+    memory_usage: Optional[float] = None
+    network_latency: Optional[float] = None
     timestamp: float = field(default_factory=time.time)
 
+def _exceeds(usage: Optional[float], limit: float) -> bool:
+    """Whether a measured resource usage is above a limit; unmeasured usage never is"""
+    return usage is not None and usage > limit
+
 @dataclass
 class BatchConfiguration:
     """Configuration for batch operations"""
@@ -167,10 +171,19 @@ class AdaptiveBatchingEngine:
         historical_throughput = self._get_historical_throughput(operation_type)
         throughput_score = min(1.0, metrics.throughput / max(1, historical_throughput))
         
-        # Resource usage score (lower is better)
-        cpu_score = max(0, 1 - (metrics.cpu_usage / 100))
-        memory_score = max(0, 1 - (metrics.memory_usage / 100))
-        resource_score = (cpu_score + memory_score) / 2
+        # Resource usage score (lower is better), from the resources that were measured
+        resource_scores = [
+            max(0, 1 - (usage / 100))
+            for usage in (metrics.cpu_usage, metrics.memory_usage)
+            if usage is not None
+        ]
+        if resource_scores:
+            resource_score = statistics.mean(resource_scores)
+        else:
+            # Unmeasured resources neither reward nor penalize: reweight the other factors
+            weights = {name: weight / (1 - weights['resource_usage']) for name, weight in weights.items()}
+            weights['resource_usage'] = 0.0
+            resource_score = 0.0
         
         # Rate limit score (fewer hits is better)
         rate_limit_score = max(0, 1 - (metrics.rate_limit_hits / self.config.rate_limit_threshold))
@@ -254,10 +267,10 @@ class AdaptiveBatchingEngine:
         new_size = max(self.config.min_batch_size, min(new_size, self.config.max_batch_size))
         
         # Resource-based constraints
-        if metrics.cpu_usage > self.config.cpu_threshold:
+        if _exceeds(metrics.cpu_usage, self.config.cpu_threshold):
             new_size = min(new_size, new_size // 2)
         
-        if metrics.memory_usage > self.config.memory_threshold:
+        if _exceeds(metrics.memory_usage, self.config.memory_threshold):
             new_size = min(new_size, new_size // 2)
         
         # Rate limiting constraints
@@ -302,16 +315,16 @@ class AdaptiveBatchingEngine:
         should_activate = (
             metrics.error_rate > self.config.max_error_rate * 2 or
             metrics.rate_limit_hits > self.config.rate_limit_threshold or
-            metrics.cpu_usage > 95 or
-            metrics.memory_usage > 95
+            _exceeds(metrics.cpu_usage, 95) or
+            _exceeds(metrics.memory_usage, 95)
         )
         
         # Check for circuit breaker deactivation conditions
         should_deactivate = (
             metrics.error_rate < self.config.max_error_rate * 0.5 and
             metrics.rate_limit_hits == 0 and
-            metrics.cpu_usage < self.config.cpu_threshold and
-            metrics.memory_usage < self.config.memory_threshold
+            not _exceeds(metrics.cpu_usage, self.config.cpu_threshold) and
+            not _exceeds(metrics.memory_usage, self.config.memory_threshold)
         )
         
         if should_activate and not self.circuit_breaker_active[operation_type]:
@@ -392,7 +405,7 @@ class AdaptiveBatchingEngine:
             strategy_scores[strategy] = score
         
         # Factor in current system conditions
-        if metrics.cpu_usage > 80 or metrics.memory_usage > 80:
+        if _exceeds(metrics.cpu_usage, 80) or _exceeds(metrics.memory_usage, 80):
             return BatchStrategy.CONSERVATIVE
         elif metrics.rate_limit_hits > 0:
             return BatchStrategy.CONSERVATIVE
@@ -423,7 +436,7 @@ class AdaptiveBatchingEngine:
         if metrics.rate_limit_hits > 0:
             reasons.append("Rate limiting detected - using conservative batching")
         
-        if metrics.cpu_usage > self.config.cpu_threshold:
+        if _exceeds(metrics.cpu_usage, self.config.cpu_threshold):
             reasons.append(f"High CPU usage ({metrics.cpu_usage:.1f}%) - reducing batch size")
         
         if not reasons:
@@ -5,6 +5,8 @@ Main orchestration component that coordinates adaptive batching, resource monito
 """
 
 import asyncio
+import heapq
+import itertools
 import time
 import logging
 from typing import Dict, List, Tuple, Optional, Any, Callable, Union
@@ -20,6 +22,7 @@ from pathlib import Path
 from .adaptive_batching import AdaptiveBatchingEngine, OperationType, PerformanceMetrics, BatchStrategy
 from .resource_monitor import ResourceMonitor, SystemResources, ApplicationMetrics
 from .performance_optimizer import PerformanceOptimizer, OptimizationTarget, PerformancePrediction
+from .execution_engine import BatchExecutionEngine, BatchHandler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -54,6 +57,60 @@ class BatchExecutionResult:
     error_details: Optional[List[str]] = None
     performance_metrics: Optional[PerformanceMetrics] = None
 
+class JobQueue:
+    """
+    Pending jobs ordered by (priority, created_at) in a binary heap.
+    Push and pop are O(log n); removal drops the job from the index in O(1)
+    and its heap entry is skipped when it surfaces.
+    """
+    
+    PRIORITY_ORDER = {'critical': 0, 'high': 1, 'normal': 2, 'low': 3}
+    
+    def __init__(self):
+        self.heap: List[Tuple[int, float, int, BatchJob]] = []
+        self.jobs: Dict[str, BatchJob] = {}
+        self.sequence = itertools.count()
+    
+    def __len__(self) -> int:
+        return len(self.jobs)
+    
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self.jobs
+    
+    def get(self, job_id: str) -> Optional[BatchJob]:
+        """Get a pending job by id"""
+        return self.jobs.get(job_id)
+    
+    def values(self) -> List[BatchJob]:
+        """Pending jobs in submission order"""
+        return list(self.jobs.values())
+    
+    def push(self, job: BatchJob):
+        """Add a job, replacing any pending job with the same id"""
+        self.jobs[job.job_id] = job
+        priority = self.PRIORITY_ORDER.get(job.priority, len(self.PRIORITY_ORDER))
+        heapq.heappush(self.heap, (priority, job.created_at, next(self.sequence), job))
+    
+    def pop(self) -> Optional[BatchJob]:
+        """Remove and return the highest priority, oldest job"""
+        while self.heap:
+            job = heapq.heappop(self.heap)[-1]
+            if self.jobs.get(job.job_id) is job:
+                del self.jobs[job.job_id]
+                return job
+        return None
+    
+    def remove(self, job_id: str) -> Optional[BatchJob]:
+        """Remove a pending job by id"""
+        job = self.jobs.pop(job_id, None)
+        
+        # Compact once removed entries dominate the heap, keeping removal amortized O(1)
+        if job and len(self.heap) > 2 * len(self.jobs) + 64:
+            self.heap = [entry for entry in self.heap if self.jobs.get(entry[-1].job_id) is entry[-1]]
+            heapq.heapify(self.heap)
+        
+        return job
+
 class BatchCoordinator:
     """
     Main coordinator that orchestrates intelligent batching operations,
@@ -67,16 +124,25 @@ class BatchCoordinator:
         # Initialize core components
         self.batching_engine = AdaptiveBatchingEngine(config_path)
         self.resource_monitor = ResourceMonitor(config_path, monitoring_interval=5.0)
-        self.performance_optimizer = PerformanceOptimizer("models/batching/")
+        self.performance_optimizer = PerformanceOptimizer(
+            "models/batching/",
+            streaming=self.config.get('streaming_optimizer', True),
+            buffer_size=self.config.get('optimizer_buffer_size', 10000),
+            save_interval=self.config.get('optimizer_save_interval', 60)
+        )
+        self.execution_engine = BatchExecutionEngine(config_path, self.batching_engine)
         
-        # Job management
-        self.job_queue: Dict[str, BatchJob] = {}
+        # Job management; queue_condition guards the queue and job collections
+        # and wakes the execution loop on submit, completion and stop
+        self.job_queue = JobQueue()
         self.active_jobs: Dict[str, BatchJob] = {}
         self.completed_jobs: List[BatchJob] = []
         self.job_counter = 0
+        self.queue_condition = threading.Condition()
         
         # Execution state
         self.coordinator_active = False
+        self.stop_event = threading.Event()
         self.max_concurrent_jobs = self.config.get('max_concurrent_jobs', 5)
         self.execution_thread: Optional[threading.Thread] = None
         self.executor = ThreadPoolExecutor(max_workers=self.max_concurrent_jobs)
@@ -110,7 +176,10 @@ class BatchCoordinator:
             'circuit_breaker_timeout': 300,
             'performance_tracking_enabled': True,
             'auto_optimization_enabled': True,
-            'dashboard_update_interval': 30
+            'dashboard_update_interval': 30,
+            'streaming_optimizer': True,
+            'optimizer_buffer_size': 10000,
+            'optimizer_save_interval': 60
         }
         
         if config_path and Path(config_path).exists():
@@ -137,11 +206,13 @@ class BatchCoordinator:
         
         logger.info("Starting batch coordinator...")
         
-        # Start resource monitoring
+        # Start resource monitoring and the batch execution loop
         self.resource_monitor.start_monitoring()
+        self.execution_engine.start()
         
         # Start coordinator execution loop
         self.coordinator_active = True
+        self.stop_event.clear()
         self.execution_thread = threading.Thread(target=self._execution_loop, daemon=True)
         self.execution_thread.start()
         
@@ -155,7 +226,10 @@ class BatchCoordinator:
         """Stop the batch coordinator"""
         logger.info("Stopping batch coordinator...")
         
-        self.coordinator_active = False
+        with self.queue_condition:
+            self.coordinator_active = False
+            self.queue_condition.notify_all()
+        self.stop_event.set()
         
         # Stop resource monitoring
         self.resource_monitor.stop_monitoring()
@@ -164,8 +238,12 @@ class BatchCoordinator:
         if self.execution_thread:
             self.execution_thread.join(timeout=30)
         
-        # Shutdown executor
+        # Shutdown executor, then the batch execution loop it waits on
         self.executor.shutdown(wait=True)
+        self.execution_engine.stop()
+        
+        # Keep the optimizer's online updates across restarts
+        self.performance_optimizer.save_streaming_state()
         
         logger.info("Batch coordinator stopped")
     
@@ -189,22 +267,21 @@ class BatchCoordinator:
             timeout_seconds=self.config.get('job_timeout_seconds', 300)
         )
         
-        # Add to queue
-        self.job_queue[job_id] = job
+        # Add to queue and wake the execution loop
+        with self.queue_condition:
+            self.job_queue.push(job)
+            self.queue_condition.notify()
         
         logger.info(f"Submitted job {job_id} with {len(operations)} operations")
         return job_id
     
     def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get status of a specific job"""
-        # Check active jobs
-        if job_id in self.active_jobs:
-            job = self.active_jobs[job_id]
-        # Check queue
-        elif job_id in self.job_queue:
-            job = self.job_queue[job_id]
+        with self.queue_condition:
+            # Check active jobs, then queue
+            job = self.active_jobs.get(job_id) or self.job_queue.get(job_id)
         # Check completed jobs
-        else:
+        if not job:
             completed_job = next((j for j in self.completed_jobs if j.job_id == job_id), None)
             if not completed_job:
                 return None
@@ -226,78 +303,70 @@ class BatchCoordinator:
     
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a pending or active job"""
-        # Cancel from queue
-        if job_id in self.job_queue:
-            job = self.job_queue.pop(job_id)
-            job.status = "cancelled"
-            self.completed_jobs.append(job)
-            logger.info(f"Cancelled queued job {job_id}")
-            return True
-        
-        # Cancel active job (more complex, would need execution framework support)
-        if job_id in self.active_jobs:
-            job = self.active_jobs[job_id]
-            job.status = "cancelled"
-            logger.info(f"Marked active job {job_id} for cancellation")
-            return True
+        with self.queue_condition:
+            # Cancel from queue
+            job = self.job_queue.remove(job_id)
+            if job:
+                job.status = "cancelled"
+                self.completed_jobs.append(job)
+                logger.info(f"Cancelled queued job {job_id}")
+                return True
+            
+            # Cancel active job (more complex, would need execution framework support)
+            if job_id in self.active_jobs:
+                job = self.active_jobs[job_id]
+                job.status = "cancelled"
+                logger.info(f"Marked active job {job_id} for cancellation")
+                return True
         
         return False
     
     def _execution_loop(self):
-        """Main execution loop for processing batch jobs"""
+        """Main execution loop, woken by submissions, completions and stop"""
         while self.coordinator_active:
             try:
-                # Check circuit breaker
-                if self._check_circuit_breaker():
-                    time.sleep(5)
-                    continue
+                with self.queue_condition:
+                    while self.coordinator_active and not self._can_dispatch():
+                        self.queue_condition.wait(timeout=self._circuit_breaker_remaining())
                 
-                # Process pending jobs if we have capacity
-                if len(self.active_jobs) < self.max_concurrent_jobs and self.job_queue:
+                if self.coordinator_active:
                     self._start_next_job()
                 
-                # Check for completed jobs
-                self._check_completed_jobs()
-                
-                # Update performance dashboard
-                if self.config.get('performance_tracking_enabled'):
-                    self._update_performance_dashboard()
-                
-                time.sleep(1)
-                
             except Exception as e:
                 logger.error(f"Execution loop error: {e}")
-                time.sleep(5)
+                self.stop_event.wait(5)
+    
+    def _can_dispatch(self) -> bool:
+        """Whether a queued job can start now; called holding queue_condition"""
+        if self._check_circuit_breaker():
+            return False
+        return len(self.active_jobs) < self.max_concurrent_jobs and len(self.job_queue) > 0
+    
+    def _circuit_breaker_remaining(self) -> Optional[float]:
+        """Seconds until an active circuit breaker resets, None to wait for a notification"""
+        if self.circuit_breaker_active and self.circuit_breaker_reset_time:
+            return max(0.0, self.circuit_breaker_reset_time - time.time())
+        return None
     
     def _start_next_job(self):
         """Start the next highest priority job"""
-        if not self.job_queue:
-            return
-        
-        # Sort jobs by priority and creation time
-        priority_order = {'critical': 0, 'high': 1, 'normal': 2, 'low': 3}
-        
-        sorted_jobs = sorted(
-            self.job_queue.values(),
-            key=lambda j: (priority_order.get(j.priority, 4), j.created_at)
-        )
-        
-        next_job = sorted_jobs[0]
-        
-        # Remove from queue and add to active jobs
-        del self.job_queue[next_job.job_id]
-        self.active_jobs[next_job.job_id] = next_job
+        with self.queue_condition:
+            next_job = self.job_queue.pop()
+            if not next_job:
+                return
+            
+            # Move to active jobs
+            self.active_jobs[next_job.job_id] = next_job
+            next_job.status = "running"
+            next_job.started_at = time.time()
         
-        # Start job execution
-        next_job.status = "running"
-        next_job.started_at = time.time()
+        # Trigger callbacks before execution so they precede completion callbacks
+        self._trigger_callbacks('job_started', next_job)
         
-        # Submit to executor
+        # Submit to executor; completion is handled on the worker thread
         future = self.executor.submit(self._execute_job, next_job)
         next_job.future = future
-        
-        # Trigger callbacks
-        self._trigger_callbacks('job_started', next_job)
+        future.add_done_callback(lambda done, job=next_job: self._complete_job(job, done))
         
         logger.info(f"Started job {next_job.job_id}")
     
@@ -325,14 +394,12 @@ class BatchCoordinator:
                     job.operation_type, current_metrics, len(job.operations)
                 )
             
-            # Split operations into optimized batches
-            batches = await self._create_optimized_batches(
-                job.operations, job.operation_type, recommended_batch_size
+            # Split operations into optimized batches and execute them on the engine loop
+            batches, execution_results = self.execution_engine.run(
+                self._run_batches(job, recommended_batch_size),
+                timeout=job.timeout_seconds
             )
             
-            # Execute batches
-            execution_results = await self._execute_batches(batches, job)
-            
             # Calculate final metrics
             execution_time = time.time() - start_time
             total_processed = sum(r['processed'] for r in execution_results)
@@ -381,90 +448,57 @@ class BatchCoordinator:
         """Create optimized batches using the batching engine"""
         return await self.batching_engine.optimize_batch_sequence(operations, operation_type)
     
+    async def _run_batches(self,
+                           job: BatchJob,
+                           batch_size: int) -> Tuple[List[List[Dict[str, Any]]], List[Dict[str, Any]]]:
+        """Create and execute a job's batches"""
+        batches = await self._create_optimized_batches(job.operations, job.operation_type, batch_size)
+        return batches, await self._execute_batches(batches, job)
+    
     async def _execute_batches(self,
                              batches: List[List[Dict[str, Any]]],
                              job: BatchJob) -> List[Dict[str, Any]]:
-        """Execute batches with performance monitoring"""
-        results = []
-        
-        for i, batch in enumerate(batches):
-            batch_start = time.time()
+        """Execute batches concurrently with performance monitoring"""
+        return await self.execution_engine.execute_batches(batches, job.operation_type)
+    
+    def _complete_job(self, job: BatchJob, future):
+        """Record a finished job's result and wake the execution loop"""
+        try:
+            result = future.result()
+            job.status = "completed" if result.success else "failed"
+            job.result = result.__dict__
+            job.metrics = result.performance_metrics
+        except Exception as e:
+            result = None
+            job.status = "failed"
+            job.error = str(e)
+        job.completed_at = time.time()
+        
+        with self.queue_condition:
+            # Move to completed jobs
+            self.active_jobs.pop(job.job_id, None)
+            self.completed_jobs.append(job)
+            if len(self.completed_jobs) > 1000:
+                self.completed_jobs = self.completed_jobs[-1000:]
             
-            try:
-                # Simulate batch execution (replace with actual MCP operations)
-                await asyncio.sleep(0.1)  # Simulate processing time
-                
-                # Record successful batch
-                batch_time = time.time() - batch_start
-                results.append({
-                    'batch_index': i,
-                    'processed': len(batch),
-                    'failed': 0,
-                    'execution_time': batch_time,
-                    'throughput': len(batch) / batch_time if batch_time > 0 else 0
-                })
-                
-            except Exception as e:
-                # Record failed batch
-                batch_time = time.time() - batch_start
-                results.append({
-                    'batch_index': i,
-                    'processed': 0,
-                    'failed': len(batch),
-                    'execution_time': batch_time,
-                    'throughput': 0,
-                    'error': str(e)
-                })
-        
-        return results
-    
-    def _check_completed_jobs(self):
-        """Check for completed active jobs and process results"""
-        completed_job_ids = []
-        
-        for job_id, job in self.active_jobs.items():
-            if hasattr(job, 'future') and job.future.done():
-                try:
-                    result = job.future.result()
-                    job.status = "completed" if result.success else "failed"
-                    job.completed_at = time.time()
-                    job.result = result.__dict__
-                    job.metrics = result.performance_metrics
-                    
-                    # Move to completed jobs
-                    self.completed_jobs.append(job)
-                    completed_job_ids.append(job_id)
-                    
-                    # Add to execution history
-                    self.execution_history.append(result)
-                    if len(self.execution_history) > 1000:
-                        self.execution_history = self.execution_history[-1000:]
-                    
-                    # Trigger callbacks
-                    if result.success:
-                        self._trigger_callbacks('job_completed', job)
-                    else:
-                        self._trigger_callbacks('job_failed', job)
-                    
-                    logger.info(f"Job {job_id} completed: {result.success}")
-                    
-                except Exception as e:
-                    job.status = "failed"
-                    job.completed_at = time.time()
-                    job.error = str(e)
-                    self.completed_jobs.append(job)
-                    completed_job_ids.append(job_id)
-                    
-                    self._trigger_callbacks('job_failed', job)
-                    logger.error(f"Job {job_id} failed: {e}")
-        
-        # Remove completed jobs from active jobs
-        for job_id in completed_job_ids:
-            del self.active_jobs[job_id]
-        
-        # Cleanup old completed jobs
-        if len(self.completed_jobs) > 1000:
-            self.completed_jobs = self.completed_jobs[-1000:]
+            # Add to execution history
+            if result:
+                self.execution_history.append(result)
+                if len(self.execution_history) > 1000:
+                    self.execution_history = self.execution_history[-1000:]
+            
+            self.queue_condition.notify()
+        
+        # Trigger callbacks
+        if job.status == "completed":
+            self._trigger_callbacks('job_completed', job)
+        else:
+            self._trigger_callbacks('job_failed', job)
+        
+        if job.error:
+            logger.error(f"Job {job.job_id} failed: {job.error}")
+        else:
+            logger.info(f"Job {job.job_id} completed: {job.status == 'completed'}")
     
     def _get_current_performance_metrics(self, operation_type: OperationType) -> PerformanceMetrics:
         """Get current performance metrics from resource monitor"""
@@ -592,10 +626,10 @@ class BatchCoordinator:
             while self.coordinator_active:
                 try:
                     self._update_performance_dashboard()
-                    time.sleep(self.config.get('dashboard_update_interval', 30))
+                    self.stop_event.wait(self.config.get('dashboard_update_interval', 30))
                 except Exception as e:
                     logger.error(f"Dashboard update error: {e}")
-                    time.sleep(30)
+                    self.stop_event.wait(30)
         
         dashboard_thread = threading.Thread(target=update_dashboard, daemon=True)
         dashboard_thread.start()
@@ -637,6 +671,7 @@ class BatchCoordinator:
                     'system_memory_usage': current_metrics['system']['memory_percent']
                 },
                 'batching_metrics': batching_summary,
+                'execution_metrics': self.execution_engine.get_statistics(),
                 'optimization_insights': self.performance_optimizer.get_optimization_insights() if self.config.get('auto_optimization_enabled') else {}
             }
             
@@ -654,12 +689,21 @@ class BatchCoordinator:
         else:
             logger.warning(f"Unknown event type: {event_type}")
     
+    def register_operation_handler(self, operation_type: OperationType, handler: BatchHandler):
+        """Register the async handler that executes batches of an operation type"""
+        self.execution_engine.register_handler(operation_type, handler)
+    
     def get_queue_status(self) -> Dict[str, Any]:
         """Get current queue status"""
+        with self.queue_condition:
+            queued_jobs = self.job_queue.values()
+            active_count = len(self.active_jobs)
+            completed_count = len(self.completed_jobs)
+        
         return {
-            'queued_jobs': len(self.job_queue),
-            'active_jobs': len(self.active_jobs),
-            'completed_jobs': len(self.completed_jobs),
+            'queued_jobs': len(queued_jobs),
+            'active_jobs': active_count,
+            'completed_jobs': completed_count,
             'queue_details': [
                 {
                     'job_id': job.job_id,
@@ -669,7 +713,7 @@ class BatchCoordinator:
                     'created_at': job.created_at,
                     'wait_time': time.time() - job.created_at
                 }
-                for job in self.job_queue.values()
+                for job in queued_jobs
             ]
         }
     
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Batch Execution Engine for Intelligent Batching System
+Runs batches on a long-lived asyncio event loop with pluggable operation handlers,
+bounded concurrency per operation type, per-batch timeouts and retries.
+"""
+
+import asyncio
+import concurrent.futures
+import random
+import statistics
+import threading
+import time
+import logging
+from typing import Dict, List, Optional, Any, Callable, Awaitable
+from dataclasses import dataclass
+import yaml
+from pathlib import Path
+
+from .adaptive_batching import AdaptiveBatchingEngine, OperationType, PerformanceMetrics
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# A handler processes one batch and raises to fail it; failed batches are retried whole
+BatchHandler = Callable[[OperationType, List[Dict[str, Any]]], Awaitable[Any]]
+
+@dataclass
+class ExecutionSettings:
+    """Execution limits for one operation type"""
+    max_concurrent_batches: int = 4
+    batch_timeout_seconds: float = 60.0
+    retry_attempts: int = 3
+    base_delay_ms: float = 100.0
+    max_delay_ms: float = 5000.0
+    exponential_backoff: bool = True
+    jitter_enabled: bool = True
+
+async def simulated_handler(operation_type: OperationType, batch: List[Dict[str, Any]]):
+    """Default handler: simulate processing time (replace with actual MCP operations)"""
+    await asyncio.sleep(0.1)
+
+class BatchExecutionEngine:
+    """
+    Executes batches concurrently on a dedicated event loop thread. Callers on
+    other threads submit coroutines with run(); each operation type has its own
+    semaphore bounding in-flight batches, and every batch attempt is timed out
+    and retried with backoff. Each execute_batches() call is reported to the
+    adaptive batching engine as one aggregated measurement of final outcomes, so
+    failures recovered by a retry do not count against the circuit breaker.
+    """
+    
+    def __init__(self,
+                 config_path: Optional[str] = None,
+                 batching_engine: Optional[AdaptiveBatchingEngine] = None):
+        """Initialize the execution engine"""
+        self.settings = self._load_config(config_path)
+        self.batching_engine = batching_engine
+        
+        # Operation handlers
+        self.handlers: Dict[OperationType, BatchHandler] = {}
+        self.default_handler: BatchHandler = simulated_handler
+        
+        # Event loop state
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread: Optional[threading.Thread] = None
+        self.loop_lock = threading.Lock()
+        self.semaphores: Dict[OperationType, asyncio.Semaphore] = {}
+        
+        # Execution statistics
+        self.stats = {
+            op_type: {
+                'batches_executed': 0,
+                'batches_failed': 0,
+                'retries': 0,
+                'timeouts': 0,
+                'in_flight': 0,
+                'peak_in_flight': 0
+            }
+            for op_type in OperationType
+        }
+    
+    def _load_config(self, config_path: Optional[str]) -> Dict[OperationType, ExecutionSettings]:
+        """Load per operation type settings from operation_configs and resilience"""
+        config_data = {}
+        if config_path and Path(config_path).exists():
+            try:
+                with open(config_path, 'r') as f:
+                    config_data = yaml.safe_load(f) or {}
+            except Exception as e:
+                logger.warning(f"Failed to load config from {config_path}: {e}")
+        
+        resilience = config_data.get('resilience', {})
+        retry_config = resilience.get('retry', {})
+        total_timeout_ms = resilience.get('timeouts', {}).get('total_timeout_ms', 60000)
+        
+        settings = {}
+        for op_type in OperationType:
+            op_config = config_data.get('operation_configs', {}).get(op_type.value, {})
+            settings[op_type] = ExecutionSettings(
+                max_concurrent_batches=op_config.get('max_concurrent_batches', 4),
+                batch_timeout_seconds=total_timeout_ms / 1000 * op_config.get('timeout_multiplier', 1.0),
+                retry_attempts=op_config.get('retry_attempts', retry_config.get('max_attempts', 3)),
+                base_delay_ms=retry_config.get('base_delay_ms', 100.0),
+                max_delay_ms=retry_config.get('max_delay_ms', 5000.0),
+                exponential_backoff=retry_config.get('exponential_backoff', True),
+                jitter_enabled=retry_config.get('jitter_enabled', True)
+            )
+        
+        return settings
+    
+    def register_handler(self, operation_type: OperationType, handler: BatchHandler):
+        """Register the async handler that executes batches of an operation type"""
+        self.handlers[operation_type] = handler
+    
+    def start(self):
+        """Start the event loop thread if it is not running"""
+        with self.loop_lock:
+            if self.loop_thread and self.loop_thread.is_alive():
+                return
+            
+            loop_ready = threading.Event()
+            self.loop = asyncio.new_event_loop()
+            self.loop_thread = threading.Thread(
+                target=self._run_loop, args=(loop_ready,), name="batch-execution-loop", daemon=True
+            )
+            self.loop_thread.start()
+            loop_ready.wait()
+    
+    def _run_loop(self, loop_ready: threading.Event):
+        """Event loop thread body"""
+        asyncio.set_event_loop(self.loop)
+        self.semaphores = {
+            op_type: asyncio.Semaphore(settings.max_concurrent_batches)
+            for op_type, settings in self.settings.items()
+        }
+        loop_ready.set()
+        self.loop.run_forever()
+    
+    def stop(self):
+        """Cancel outstanding batches and stop the event loop thread"""
+        with self.loop_lock:
+            if not self.loop_thread or not self.loop_thread.is_alive():
+                return
+            
+            asyncio.run_coroutine_threadsafe(self._cancel_tasks(), self.loop).result(timeout=30)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.loop_thread.join(timeout=30)
+            self.loop.close()
+            self.loop_thread = None
+    
+    async def _cancel_tasks(self):
+        """Cancel every task on the loop except the caller"""
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def run(self, coroutine: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the engine loop from another thread and wait for its result"""
+        self.start()
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Execution timed out after {timeout}s")
+    
+    async def execute_batches(self,
+                              batches: List[List[Dict[str, Any]]],
+                              operation_type: OperationType) -> List[Dict[str, Any]]:
+        """Execute batches concurrently, bounded by the operation type's semaphore"""
+        handler = self.handlers.get(operation_type, self.default_handler)
+        start_time = time.time()
+        results = await asyncio.gather(*(
+            self._execute_batch(i, batch, operation_type, handler)
+            for i, batch in enumerate(batches)
+        ))
+        self._record_results(operation_type, results, time.time() - start_time)
+        return results
+    
+    async def _execute_batch(self,
+                             batch_index: int,
+                             batch: List[Dict[str, Any]],
+                             operation_type: OperationType,
+                             handler: BatchHandler) -> Dict[str, Any]:
+        """Execute one batch with timeout and retries"""
+        settings = self.settings[operation_type]
+        stats = self.stats[operation_type]
+        batch_start = time.time()
+        error = None
+        
+        for attempt in range(settings.retry_attempts + 1):
+            if attempt > 0:
+                stats['retries'] += 1
+                await asyncio.sleep(self._retry_delay(settings, attempt))
+            
+            # Hold a slot only while the handler runs, not during backoff
+            async with self.semaphores[operation_type]:
+                stats['in_flight'] += 1
+                stats['peak_in_flight'] = max(stats['peak_in_flight'], stats['in_flight'])
+                try:
+                    await asyncio.wait_for(handler(operation_type, batch), settings.batch_timeout_seconds)
+                    error = None
+                except asyncio.TimeoutError:
+                    stats['timeouts'] += 1
+                    error = f"Batch timed out after {settings.batch_timeout_seconds:.1f}s"
+                except Exception as e:
+                    error = str(e)
+                finally:
+                    stats['in_flight'] -= 1
+            
+            if error is None:
+                break
+        
+        batch_time = time.time() - batch_start
+        result = {
+            'batch_index': batch_index,
+            'processed': len(batch) if error is None else 0,
+            'failed': 0 if error is None else len(batch),
+            'execution_time': batch_time,
+            'throughput': len(batch) / batch_time if error is None and batch_time > 0 else 0,
+            'attempts': attempt + 1
+        }
+        
+        if error is None:
+            stats['batches_executed'] += 1
+        else:
+            stats['batches_failed'] += 1
+            result['error'] = error
+            logger.warning(f"Batch {batch_index} ({operation_type.value}) failed after {attempt + 1} attempts: {error}")
+        
+        return result
+    
+    def _retry_delay(self, settings: ExecutionSettings, attempt: int) -> float:
+        """Seconds to wait before a retry attempt"""
+        delay_ms = settings.base_delay_ms * (2 ** (attempt - 1) if settings.exponential_backoff else 1)
+        delay_ms = min(delay_ms, settings.max_delay_ms)
+        if settings.jitter_enabled:
+            delay_ms *= random.uniform(0.5, 1.0)
+        return delay_ms / 1000
+    
+    def _record_results(self, operation_type: OperationType, results: List[Dict[str, Any]], seconds: float):
+        """Feed the final outcome of a set of batches into the adaptive batching engine"""
+        if not self.batching_engine or not results:
+            return
+        
+        processed = sum(r['processed'] for r in results)
+        total = processed + sum(r['failed'] for r in results)
+        success_rate = processed / total if total else 1.0
+        
+        # Resource usage is not measured here, so those fields stay unset
+        self.batching_engine.update_performance_metrics(operation_type, PerformanceMetrics(
+            success_rate=success_rate,
+            average_response_time=statistics.mean(r['execution_time'] for r in results) * 1000,
+            throughput=processed / seconds if seconds > 0 else 0.0,
+            error_rate=1.0 - success_rate
+        ))
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get execution statistics per operation type"""
+        return {
+            op_type.value: {
+                **stats,
+                'max_concurrent_batches': self.settings[op_type].max_concurrent_batches
+            }
+            for op_type, stats in self.stats.items()
+        }
+
+# Factory function
+def create_batch_execution_engine(config_path: Optional[str] = None,
+                                  batching_engine: Optional[AdaptiveBatchingEngine] = None) -> BatchExecutionEngine:
+    """Create and configure a batch execution engine"""
+    return BatchExecutionEngine(config_path, batching_engine)
@@ -20,7 +20,7 @@ import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 
-from .batch_coordinator import BatchCoordinator, OperationType
+from .batch_coordinator import BatchCoordinator, BatchJob, JobQueue, OperationType
 from .adaptive_batching import PerformanceMetrics
 from .performance_optimizer import OptimizationTarget
 
@@ -420,6 +420,107 @@ class LoadTestingFramework:
             'peak_memory': max(memory_values)
         }
     
+    async def run_dispatch_latency_test(self,
+                                        queued_jobs: int = 10000,
+                                        samples: int = 1000,
+                                        probes: int = 20) -> Dict[str, Any]:
+        """
+        Measure scheduling cost with a deep queue: per-operation submit, dispatch
+        and cancel time on a JobQueue holding queued_jobs jobs, the previous
+        sort-per-dispatch cost at the same depth, and submit-to-start latency of
+        critical jobs on the coordinator when it is running.
+        """
+        distribution = {"critical": 0.05, "high": 0.15, "normal": 0.6, "low": 0.2}
+        jobs = [
+            BatchJob(
+                job_id=f"dispatch_test_{i}",
+                operation_type=OperationType.READ,
+                operations=[],
+                priority=self._select_priority(distribution)
+            )
+            for i in range(queued_jobs + samples)
+        ]
+        
+        # Submit
+        queue = JobQueue()
+        start = time.perf_counter()
+        for job in jobs[:queued_jobs]:
+            queue.push(job)
+        submit_us = (time.perf_counter() - start) * 1e6 / queued_jobs
+        
+        # Dispatch at constant depth, refilling after each pop
+        start = time.perf_counter()
+        for job in jobs[queued_jobs:]:
+            queue.pop()
+            queue.push(job)
+        dispatch_us = (time.perf_counter() - start) * 1e6 / samples
+        
+        # Previous dispatch: sort every queued job to find the next one
+        pending = {job.job_id: job for job in queue.values()}
+        sorted_samples = min(samples, 100)
+        start = time.perf_counter()
+        for _ in range(sorted_samples):
+            next_job = sorted(
+                pending.values(),
+                key=lambda j: (JobQueue.PRIORITY_ORDER.get(j.priority, 4), j.created_at)
+            )[0]
+            del pending[next_job.job_id]
+            pending[next_job.job_id] = next_job
+        previous_dispatch_us = (time.perf_counter() - start) * 1e6 / sorted_samples
+        
+        # Cancel
+        cancelled = random.sample(queue.values(), min(samples, len(queue)))
+        start = time.perf_counter()
+        for job in cancelled:
+            queue.remove(job.job_id)
+        cancel_us = (time.perf_counter() - start) * 1e6 / len(cancelled)
+        
+        result = {
+            'queued_jobs': queued_jobs,
+            'submit_us': submit_us,
+            'dispatch_us': dispatch_us,
+            'previous_dispatch_us': previous_dispatch_us,
+            'cancel_us': cancel_us,
+            'start_latency_ms': None
+        }
+        
+        # Submit-to-start latency on the live coordinator, including any wait for a free slot
+        if self.coordinator.coordinator_active:
+            loop = asyncio.get_running_loop()
+            waiting: Dict[str, asyncio.Future] = {}
+            
+            def on_started(job):
+                future = waiting.get(job.job_id)
+                if future:
+                    loop.call_soon_threadsafe(future.set_result, job.started_at - job.created_at)
+            
+            self.coordinator.register_callback('job_started', on_started)
+            try:
+                latencies = []
+                for i in range(probes):
+                    job_id = f"dispatch_probe_{i}_{int(time.time())}"
+                    started = waiting[job_id] = loop.create_future()
+                    self.coordinator.submit_job([self._generate_test_data(64)], OperationType.READ,
+                                                "critical", job_id=job_id)
+                    latencies.append(await asyncio.wait_for(started, timeout=60) * 1000)
+                    del waiting[job_id]
+            finally:
+                self.coordinator.job_callbacks['job_started'].remove(on_started)
+            
+            result['start_latency_ms'] = {
+                'average': statistics.mean(latencies),
+                'p95': float(np.percentile(latencies, 95)),
+                'max': max(latencies)
+            }
+        
+        logger.info(f"Dispatch latency at {queued_jobs:,} queued jobs:")
+        logger.info(f"  Submit: {submit_us:.2f}µs, dispatch: {dispatch_us:.2f}µs "
+                    f"(previous sort: {previous_dispatch_us:.0f}µs), cancel: {cancel_us:.2f}µs")
+        if result['start_latency_ms']:
+            logger.info(f"  Submit-to-start: {result['start_latency_ms']['average']:.2f}ms average")
+        
+        return result
+    
     async def run_benchmark_suite(self, scenarios: Optional[List[str]] = None) -> BenchmarkResult:
         """Run a comprehensive benchmark suite"""
         if scenarios is None:
@@ -730,6 +831,8 @@ async def main():
     parser.add_argument('--scenario', choices=list(LoadTestingFramework._create_predefined_scenarios(None).keys()),
                        help="Predefined scenario to run")
     parser.add_argument('--benchmark', action='store_true', help="Run full benchmark suite")
+    parser.add_argument('--dispatch-latency', type=int, metavar='QUEUED_JOBS',
+                       help="Measure scheduling latency with this many queued jobs (e.g. 10000)")
     parser.add_argument('--results-dir', default="load_test_results/", help="Results directory")
     
     args = parser.parse_args()
@@ -747,6 +850,11 @@ async def main():
             benchmark_result = await framework.run_benchmark_suite()
             print(f"Benchmark completed. Best configuration: {benchmark_result.best_configuration}")
             
+        elif args.dispatch_latency:
+            print(f"Measuring dispatch latency with {args.dispatch_latency} queued jobs...")
+            result = await framework.run_dispatch_latency_test(args.dispatch_latency)
+            print(json.dumps(result, indent=2))
+            
         elif args.scenario:
             print(f"Running scenario: {args.scenario}")
             config = framework.predefined_scenarios[args.scenario]
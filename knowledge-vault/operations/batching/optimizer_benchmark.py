@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Performance Optimizer Benchmark
+Compares the batch PerformanceOptimizer, which refits scalers and every model on
+the full training set, with streaming mode, which updates them with partial_fit
+per completed job, at several training set sizes.
+
+Usage:
+    python optimizer_benchmark.py --sizes 10000,100000
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from performance_optimizer import OptimizationTarget, PerformanceOptimizer
+
+OPERATION_TYPES = ['read', 'write', 'delete', 'update', 'bulk_create', 'query']
+
+
+def make_point(rng: random.Random):
+    """Features and results of one completed job, loosely correlated"""
+    batch_size = rng.randint(10, 500)
+    cpu = rng.uniform(10, 95)
+    latency = rng.uniform(1, 100)
+    features = {
+        'current_batch_size': batch_size,
+        'pending_operations': rng.randint(1, 10000),
+        'cpu_usage': cpu,
+        'memory_usage': rng.uniform(20, 95),
+        'network_latency': latency,
+        'error_rate': rng.uniform(0, 0.1),
+        'rate_limit_hits': rng.randint(0, 5),
+        'operation_type': rng.choice(OPERATION_TYPES),
+        'historical_avg_throughput': rng.uniform(10, 200),
+        'historical_avg_response_time': rng.uniform(50, 1000),
+        'system_load': rng.uniform(0.1, 4.0)
+    }
+    results = {
+        'optimal_batch_size': max(10, 300 - 2.5 * cpu + rng.gauss(0, 20)),
+        'throughput': batch_size * 0.4 - latency * 0.5 + rng.gauss(0, 5),
+        'response_time': 50 + batch_size * 1.5 + latency * 2 + rng.gauss(0, 10),
+        'cpu_usage': cpu + batch_size * 0.02 + rng.gauss(0, 2),
+        'memory_usage': features['memory_usage'] + rng.gauss(0, 2)
+    }
+    return features, results
+
+
+def timed(fn, runs: int = 1) -> float:
+    """Average seconds per call"""
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - start) / runs
+
+
+def bench_size(size: int, updates: int, predictions: int):
+    """Retrain, per-job update and prediction cost with size training points"""
+    rng = random.Random(42)
+    points = [make_point(rng) for _ in range(size)]
+    extra = [make_point(rng) for _ in range(updates)]
+    query = points[0][0]
+    target = OptimizationTarget(priority="balanced")
+
+    print(f"\n📊 {size:,} training points")
+    print("=" * 60)
+
+    # Batch: the training list is capped at 10k by add_training_data, so set it
+    # directly to time a refit over the same number of points
+    batch = PerformanceOptimizer(tempfile.mkdtemp(), streaming=False)
+    batch.training_data = [{'timestamp': time.time(), 'features': f, 'results': r} for f, r in points]
+    refit = timed(batch.train_models)
+    print(f"Batch refit (train_models):        {refit:10.2f} s")
+
+    streaming = PerformanceOptimizer(tempfile.mkdtemp(), streaming=True, buffer_size=size)
+    for features, results in points:
+        streaming.training_buffer.append(streaming.prepare_features(features)[0],
+                                         streaming._target_vector(results))
+    retrain = timed(streaming.train_models)
+    print(f"Streaming one-pass retrain:        {retrain:10.2f} s")
+
+    start = time.perf_counter()
+    for features, results in extra:
+        streaming.add_training_data(features, results)
+    update_ms = (time.perf_counter() - start) * 1000 / updates
+    print(f"Streaming update per job:          {update_ms:10.2f} ms  (batch: refit, {refit:.2f} s)")
+
+    batch_predict = timed(lambda: batch.predict_optimal_batch_size(query, target), predictions) * 1000
+    streaming_predict = timed(lambda: streaming.predict_optimal_batch_size(query, target), predictions) * 1000
+    print(f"predict_optimal_batch_size:        {batch_predict:10.3f} ms batch, {streaming_predict:.3f} ms streaming")
+
+    accuracy = {name: round(float(scores['accuracy']), 2) for name, scores in streaming.model_performance.items()}
+    print(f"Streaming accuracy (prequential R²): {accuracy}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Performance optimizer benchmark")
+    parser.add_argument("--sizes", default="10000,100000",
+                        help="Comma separated training set sizes")
+    parser.add_argument("--updates", type=int, default=500,
+                        help="Streaming per-job updates to average")
+    parser.add_argument("--predictions", type=int, default=200,
+                        help="Predictions to average")
+    args = parser.parse_args()
+
+    for size in (int(s) for s in args.sizes.split(',')):
+        bench_size(size, args.updates, args.predictions)
+
+
+if __name__ == "__main__":
+    main()
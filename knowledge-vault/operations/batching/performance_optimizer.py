@@ -8,12 +8,13 @@ import asyncio
 import time
 import logging
 import pickle
+import threading
 from typing import Dict, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import numpy as np
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.linear_model import LinearRegression
+from sklearn.linear_model import LinearRegression, SGDRegressor
 from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error, r2_score
@@ -47,19 +48,91 @@ class OptimizationTarget:
     min_success_rate: float = 0.95
     priority: str = "balanced"  # balanced, throughput, latency, resource
 
+class TrainingRingBuffer:
+    """
+    Preallocated feature/target store for streaming training. Appends are O(1)
+    and overwrite the oldest row once the buffer is full.
+    """
+    
+    def __init__(self, capacity: int, n_features: int, n_targets: int):
+        self.capacity = capacity
+        self.features = np.zeros((capacity, n_features))
+        self.targets = np.zeros((capacity, n_targets))
+        self.timestamps = np.zeros(capacity)
+        self.next_index = 0
+        self.count = 0
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def append(self, features: np.ndarray, targets: np.ndarray):
+        """Store one row, overwriting the oldest when full"""
+        self.features[self.next_index] = features
+        self.targets[self.next_index] = targets
+        self.timestamps[self.next_index] = time.time()
+        self.next_index = (self.next_index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+    
+    def extend(self, features: np.ndarray, targets: np.ndarray):
+        """Store many rows, oldest first, keeping at most capacity of them"""
+        features, targets = features[-self.capacity:], targets[-self.capacity:]
+        indices = (self.next_index + np.arange(len(features))) % self.capacity
+        self.features[indices] = features
+        self.targets[indices] = targets
+        self.timestamps[indices] = time.time()
+        self.next_index = (self.next_index + len(features)) % self.capacity
+        self.count = min(self.count + len(features), self.capacity)
+    
+    def latest(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """The n most recent rows, oldest first"""
+        n = min(n, self.count)
+        indices = np.arange(self.next_index - n, self.next_index) % self.capacity
+        return self.features[indices], self.targets[indices]
+    
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """All stored rows, oldest first"""
+        return self.latest(self.count)
+
 class PerformanceOptimizer:
     """
     Advanced performance optimizer using machine learning for predictive
     batch sizing and performance optimization.
+    
+    In streaming mode, training points go into a TrainingRingBuffer and update
+    the scalers and SGD models with partial_fit as they arrive, and predictions
+    use the linear models' coefficients folded with the scaler statistics.
+    Online updates are saved at most every save_interval seconds and by
+    save_streaming_state(), together with the buffer and error averages.
+    
+    Updates, predictions, retraining and saving hold model_lock, so jobs
+    finishing on several executor threads can share one optimizer.
     """
     
-    def __init__(self, model_save_path: str = "models/"):
+    # Target model name -> (performance result key, default)
+    TARGET_RESULTS = {
+        'batch_size': ('optimal_batch_size', 50),
+        'throughput': ('throughput', 50.0),
+        'response_time': ('response_time', 200.0),
+        'cpu_usage': ('cpu_usage', 50.0),
+        'memory_usage': ('memory_usage', 60.0)
+    }
+    
+    def __init__(self,
+                 model_save_path: str = "models/",
+                 streaming: bool = False,
+                 buffer_size: int = 10000,
+                 update_batch_size: int = 1,
+                 save_interval: float = 60.0):
         """Initialize the performance optimizer"""
         self.model_save_path = Path(model_save_path)
         self.model_save_path.mkdir(parents=True, exist_ok=True)
+        self.streaming = streaming
+        self.model_file = self.model_save_path / (
+            'performance_models_streaming.pkl' if streaming else 'performance_models.pkl'
+        )
         
         # ML Models for different predictions
-        self.models = {
+        self.models = self._create_streaming_models() if streaming else {
             'batch_size': RandomForestRegressor(n_estimators=100, random_state=42),
             'throughput': GradientBoostingRegressor(n_estimators=100, random_state=42),
             'response_time': RandomForestRegressor(n_estimators=100, random_state=42),
@@ -82,6 +155,19 @@ class PerformanceOptimizer:
             'historical_avg_response_time', 'system_load'
         ]
         
+        # Streaming mode state: rows awaiting partial_fit, prequential error
+        # averages (None until a row has been scored before being learned),
+        # the folded prediction coefficients (None when stale) and saving
+        self.training_buffer = TrainingRingBuffer(buffer_size, len(self.feature_columns), len(self.models))
+        self.update_batch_size = update_batch_size
+        self.pending_updates = 0
+        self.streaming_mse: Optional[np.ndarray] = None
+        self.streaming_fitted = False
+        self.save_interval = save_interval
+        self.unsaved_updates = 0
+        self.last_saved = time.monotonic()
+        self.prediction_coefficients: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        
         # Model performance tracking
         self.model_performance: Dict[str, Dict[str, float]] = {}
         self.prediction_history: List[PerformancePrediction] = []
@@ -91,6 +177,9 @@ class PerformanceOptimizer:
         self.control_group_performance: List[float] = []
         self.test_group_performance: List[float] = []
         
+        # Guards models, scalers, buffers and saving across executor threads
+        self.model_lock = threading.RLock()
+        
         # Load existing models if available
         self._load_models()
     
@@ -98,6 +187,22 @@ class PerformanceOptimizer:
                          features: Dict[str, Any], 
                          performance_results: Dict[str, float]):
         """Add new training data point"""
+        with self.model_lock:
+            self._add_training_data(features, performance_results)
+    
+    def _add_training_data(self, features: Dict[str, Any], performance_results: Dict[str, float]):
+        """add_training_data with model_lock held"""
+        if self.streaming:
+            self.training_buffer.append(
+                self.prepare_features(features)[0], self._target_vector(performance_results)
+            )
+            self.pending_updates += 1
+            if self.pending_updates >= self.update_batch_size:
+                self._partial_fit(*self.training_buffer.latest(self.pending_updates))
+                if time.monotonic() - self.last_saved >= self.save_interval:
+                    self.save_streaming_state()
+            return
+        
         data_point = {
             'timestamp': time.time(),
             'features': features.copy(),
@@ -146,8 +251,94 @@ class PerformanceOptimizer:
         
         return np.array(features).reshape(1, -1)
     
+    def _target_vector(self, performance_results: Dict[str, float]) -> np.ndarray:
+        """Targets in model order"""
+        return np.array([
+            performance_results.get(key, default)
+            for key, default in (self.TARGET_RESULTS[target] for target in self.models)
+        ])
+    
+    def _create_streaming_models(self) -> Dict[str, SGDRegressor]:
+        """One incrementally trained linear model per target"""
+        return {target: SGDRegressor(random_state=42) for target in self.TARGET_RESULTS}
+    
+    def _partial_fit(self, X: np.ndarray, Y: np.ndarray):
+        """Update scalers and streaming models with new rows"""
+        # Prequential evaluation: score the rows before learning from them
+        if self.streaming_fitted:
+            squared_error = ((self._predict_targets(X) - Y) ** 2).mean(axis=0)
+            if self.streaming_mse is None:
+                self.streaming_mse = squared_error
+            else:
+                alpha = min(1.0, 0.05 * len(X))
+                self.streaming_mse = (1 - alpha) * self.streaming_mse + alpha * squared_error
+        
+        # Incremental scaler statistics
+        self.scalers['features'].partial_fit(X)
+        self.scalers['targets'].partial_fit(Y)
+        X_scaled = self.scalers['features'].transform(X)
+        Y_scaled = self.scalers['targets'].transform(Y)
+        
+        for i, model in enumerate(self.models.values()):
+            model.partial_fit(X_scaled, Y_scaled[:, i])
+        
+        self.streaming_fitted = True
+        self.prediction_coefficients = None
+        self.pending_updates = 0
+        self.unsaved_updates += len(X)
+        self._update_streaming_performance()
+    
+    def _update_streaming_performance(self):
+        """Accuracy as 1 - MSE / target variance, matching the batch R² metric"""
+        # No row has been scored yet: an error of zero would report perfect models
+        if self.streaming_mse is None:
+            return
+        
+        target_variance = self.scalers['targets'].var_
+        for i, target in enumerate(self.models):
+            r2 = 1 - self.streaming_mse[i] / target_variance[i] if target_variance[i] > 0 else 0.0
+            self.model_performance[target] = {
+                'r2_score': r2,
+                'mse': self.streaming_mse[i],
+                'accuracy': max(0, r2)
+            }
+    
+    def _predict_targets(self, X: np.ndarray) -> np.ndarray:
+        """Predict every target for each row of X, in model order (model_lock held)"""
+        if self.streaming:
+            if not self.streaming_fitted:
+                raise ValueError("Streaming models have no training data yet")
+            
+            # Fold feature and target scaling into the linear coefficients once per update
+            coefficients = self.prediction_coefficients
+            if coefficients is None:
+                feature_scaler = self.scalers['features']
+                target_scaler = self.scalers['targets']
+                weights = np.column_stack([model.coef_ for model in self.models.values()])
+                intercepts = np.array([model.intercept_[0] for model in self.models.values()])
+                
+                scaled_weights = weights / feature_scaler.scale_[:, None]
+                coefficients = self.prediction_coefficients = (
+                    scaled_weights * target_scaler.scale_,
+                    (intercepts - feature_scaler.mean_ @ scaled_weights) * target_scaler.scale_ + target_scaler.mean_
+                )
+            
+            weights, intercepts = coefficients
+            return X @ weights + intercepts
+        
+        X_scaled = self.scalers['features'].transform(X)
+        return np.column_stack([model.predict(X_scaled) for model in self.models.values()])
+    
     def train_models(self, min_data_points: int = 100) -> Dict[str, float]:
         """Train all ML models with available data"""
+        with self.model_lock:
+            return self._train_models(min_data_points)
+    
+    def _train_models(self, min_data_points: int) -> Dict[str, float]:
+        """train_models with model_lock held"""
+        if self.streaming:
+            return self._retrain_streaming_models(min_data_points)
+        
         if len(self.training_data) < min_data_points:
             logger.warning(f"Insufficient training data: {len(self.training_data)} < {min_data_points}")
             return {}
@@ -215,32 +406,72 @@ class PerformanceOptimizer:
         
         return {target: scores['accuracy'] for target, scores in model_scores.items()}
     
+    def _retrain_streaming_models(self, min_data_points: int, chunk_size: int = 1000) -> Dict[str, float]:
+        """Rebuild streaming models from scratch with one pass over the ring buffer"""
+        if len(self.training_buffer) < min_data_points:
+            logger.warning(f"Insufficient training data: {len(self.training_buffer)} < {min_data_points}")
+            return {}
+        
+        logger.info(f"Retraining streaming models with {len(self.training_buffer)} data points")
+        
+        self.models = self._create_streaming_models()
+        self.scalers = {'features': StandardScaler(), 'targets': StandardScaler()}
+        previous_mse, self.streaming_mse = self.streaming_mse, None
+        self.streaming_fitted = False
+        
+        # Each chunk after the first is scored before the rebuilt models learn it
+        X, Y = self.training_buffer.arrays()
+        for start in range(0, len(X), chunk_size):
+            self._partial_fit(X[start:start + chunk_size], Y[start:start + chunk_size])
+        
+        # A single chunk is never scored: keep the previous error estimate
+        if self.streaming_mse is None and previous_mse is not None:
+            self.streaming_mse = previous_mse
+            self._update_streaming_performance()
+        
+        self._save_models()
+        
+        return {target: scores['accuracy'] for target, scores in self.model_performance.items()}
+    
     def predict_optimal_batch_size(self, 
                                   features: Dict[str, Any],
                                   optimization_target: OptimizationTarget) -> PerformancePrediction:
         """Predict optimal batch size using trained ML models"""
+        with self.model_lock:
+            return self._predict_optimal_batch_size(features, optimization_target)
+    
+    def _predict_optimal_batch_size(self, features: Dict[str, Any],
+                                    optimization_target: OptimizationTarget) -> PerformancePrediction:
+        """predict_optimal_batch_size with model_lock held"""
         try:
             # Prepare features
             X = self.prepare_features(features)
-            X_scaled = self.scalers['features'].transform(X)
             
             # Make predictions
             predictions = {}
             confidences = {}
             
-            for target, model in self.models.items():
-                try:
-                    pred = model.predict(X_scaled)[0]
+            if self.streaming:
+                # All targets in one product with the cached folded coefficients
+                for target, pred in zip(self.models, self._predict_targets(X)[0]):
                     predictions[target] = max(0, pred)  # Ensure non-negative
-                    
-                    # Calculate confidence based on model accuracy
-                    confidence = self.model_performance.get(target, {}).get('accuracy', 0.5)
-                    confidences[target] = confidence
-                    
-                except Exception as e:
-                    logger.warning(f"Prediction failed for {target}: {e}")
-                    predictions[target] = 0
-                    confidences[target] = 0
+                    confidences[target] = self.model_performance.get(target, {}).get('accuracy', 0.5)
+            else:
+                X_scaled = self.scalers['features'].transform(X)
+                
+                for target, model in self.models.items():
+                    try:
+                        pred = model.predict(X_scaled)[0]
+                        predictions[target] = max(0, pred)  # Ensure non-negative
+                        
+                        # Calculate confidence based on model accuracy
+                        confidence = self.model_performance.get(target, {}).get('accuracy', 0.5)
+                        confidences[target] = confidence
+                        
+                    except Exception as e:
+                        logger.warning(f"Prediction failed for {target}: {e}")
+                        predictions[target] = 0
+                        confidences[target] = 0
             
             # Apply optimization constraints
             optimized_batch_size = self._apply_optimization_constraints(
@@ -581,8 +812,18 @@ class PerformanceOptimizer:
         
         return opportunities
     
+    def save_streaming_state(self):
+        """Persist online updates made since the last save"""
+        if not self.streaming:
+            return
+        with self.model_lock:
+            if self.pending_updates:
+                self._partial_fit(*self.training_buffer.latest(self.pending_updates))
+            if self.unsaved_updates:
+                self._save_models()
+    
     def _save_models(self):
-        """Save trained models to disk"""
+        """Save trained models to disk (model_lock held)"""
         try:
             model_data = {
                 'models': self.models,
@@ -591,10 +832,18 @@ class PerformanceOptimizer:
                 'feature_columns': self.feature_columns,
                 'timestamp': time.time()
             }
+            if self.streaming:
+                model_data['streaming_mse'] = self.streaming_mse
+                model_data['training_buffer'] = self.training_buffer.arrays()
             
-            with open(self.model_save_path / 'performance_models.pkl', 'wb') as f:
+            # Write then rename, so a crash mid-write leaves the previous models intact
+            temp_file = self.model_file.with_suffix('.tmp')
+            with open(temp_file, 'wb') as f:
                 pickle.dump(model_data, f)
+            temp_file.replace(self.model_file)
             
+            self.unsaved_updates = 0
+            self.last_saved = time.monotonic()
             logger.info("Models saved successfully")
             
         except Exception as e:
@@ -603,7 +852,7 @@ class PerformanceOptimizer:
     def _load_models(self):
         """Load trained models from disk"""
         try:
-            model_file = self.model_save_path / 'performance_models.pkl'
+            model_file = self.model_file
             if model_file.exists():
                 with open(model_file, 'rb') as f:
                     model_data = pickle.load(f)
@@ -612,6 +861,11 @@ class PerformanceOptimizer:
                 self.scalers = model_data.get('scalers', self.scalers)
                 self.model_performance = model_data.get('model_performance', {})
                 self.feature_columns = model_data.get('feature_columns', self.feature_columns)
+                self.streaming_fitted = self.streaming and hasattr(self.scalers['features'], 'mean_')
+                if self.streaming:
+                    self.streaming_mse = model_data.get('streaming_mse')
+                    if 'training_buffer' in model_data:
+                        self.training_buffer.extend(*model_data['training_buffer'])
                 
                 logger.info("Models loaded successfully")
             
@@ -619,9 +873,13 @@ class PerformanceOptimizer:
             logger.warning(f"Failed to load models: {e}")
 
 # Factory function
-def create_performance_optimizer(model_save_path: str = "models/") -> PerformanceOptimizer:
+def create_performance_optimizer(model_save_path: str = "models/",
+                                 streaming: bool = False,
+                                 buffer_size: int = 10000,
+                                 save_interval: float = 60.0) -> PerformanceOptimizer:
     """Create and configure a performance optimizer"""
-    return PerformanceOptimizer(model_save_path)
+    return PerformanceOptimizer(model_save_path, streaming=streaming, buffer_size=buffer_size,
+                                save_interval=save_interval)
 
 if __name__ == "__main__":
     # Example usage
@@ -5,10 +5,12 @@ Monitors system resources and provides real-time metrics for adaptive batching d
 """
 
 import asyncio
+import math
 import time
 import psutil
 import logging
-from typing import Dict, List, Optional, Callable, Any
+from collections import deque
+from typing import Dict, List, Tuple, Optional, Callable, Any
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import threading
@@ -16,6 +18,7 @@ from concurrent.futures import ThreadPoolExecutor
 import json
 import yaml
 from pathlib import Path
+import numpy as np
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -61,18 +64,297 @@ class ResourceThresholds:
     load_average_warning: float = 2.0
     load_average_critical: float = 4.0
 
+class MetricRingBuffer:
+    """
+    Fixed-capacity time series of several metrics sharing timestamps. Appends
+    are O(1); the count, sums and value histograms of samples inside the
+    trailing window are updated as samples enter and leave it, so the rolling
+    mean, least-squares slope and percentiles are read in constant time.
+    """
+    
+    HISTOGRAM_BINS = 200
+    LOG_SCALE_MAX = 1e7  # Upper bound of log-binned (unbounded) metrics
+    
+    def __init__(self,
+                 metrics: List[str],
+                 capacity: int,
+                 window_seconds: float,
+                 value_ranges: Optional[Dict[str, Tuple[float, float]]] = None):
+        self.metrics = metrics
+        self.metric_index = {name: i for i, name in enumerate(metrics)}
+        self.capacity = capacity
+        self.window_seconds = window_seconds
+        
+        # Sample storage, slot = sequence number % capacity
+        self.timestamps = np.zeros(capacity)
+        self.values = np.zeros((capacity, len(metrics)))
+        self.bins = np.zeros((capacity, len(metrics)), dtype=np.int16)
+        self.appended = 0
+        
+        # Histogram binning: linear over value_ranges, log1p scale for the rest
+        value_ranges = value_ranges or {}
+        self.log_scale = np.array([name not in value_ranges for name in metrics])
+        self.bin_low = np.array([value_ranges.get(name, (0.0, 0.0))[0] for name in metrics])
+        self.bin_width = np.array([
+            value_ranges[name][1] - value_ranges[name][0] if name in value_ranges else math.log1p(self.LOG_SCALE_MAX)
+            for name in metrics
+        ])
+        self.metric_rows = np.arange(len(metrics))
+        
+        # Trailing window state; times are relative to origin to keep sums well conditioned
+        self.window_start = 0
+        self.origin: Optional[float] = None
+        self._reset_window_sums()
+    
+    def __len__(self) -> int:
+        return min(self.appended, self.capacity)
+    
+    def _reset_window_sums(self):
+        self.window_count = 0
+        self.sum_t = 0.0
+        self.sum_tt = 0.0
+        self.sum_v = np.zeros(len(self.metrics))
+        self.sum_tv = np.zeros(len(self.metrics))
+        self.histogram = np.zeros((len(self.metrics), self.HISTOGRAM_BINS), dtype=np.int64)
+    
+    def _bin(self, row: np.ndarray) -> np.ndarray:
+        scaled = np.where(self.log_scale, np.log1p(np.maximum(row, 0.0)), row)
+        return np.clip(
+            ((scaled - self.bin_low) / self.bin_width * self.HISTOGRAM_BINS).astype(np.int64),
+            0, self.HISTOGRAM_BINS - 1
+        )
+    
+    def append(self, timestamp: float, row: np.ndarray):
+        """Add one sample of every metric"""
+        if self.origin is None:
+            self.origin = timestamp
+        
+        # The slot about to be overwritten leaves the window first
+        if self.appended - self.window_start >= self.capacity:
+            self._evict()
+        
+        slot = self.appended % self.capacity
+        bins = self._bin(row)
+        self.timestamps[slot] = timestamp
+        self.values[slot] = row
+        self.bins[slot] = bins
+        self.appended += 1
+        
+        t = timestamp - self.origin
+        self.window_count += 1
+        self.sum_t += t
+        self.sum_tt += t * t
+        self.sum_v += row
+        self.sum_tv += t * row
+        self.histogram[self.metric_rows, bins] += 1
+        
+        # Expire samples older than the window
+        cutoff = timestamp - self.window_seconds
+        while self.window_start < self.appended and self.timestamps[self.window_start % self.capacity] < cutoff:
+            self._evict()
+        
+        # Recompute the sums exactly once per buffer cycle to bound floating point drift
+        if self.appended % self.capacity == 0:
+            self._recompute_window()
+    
+    def _evict(self):
+        slot = self.window_start % self.capacity
+        t = self.timestamps[slot] - self.origin
+        row = self.values[slot]
+        self.window_count -= 1
+        self.sum_t -= t
+        self.sum_tt -= t * t
+        self.sum_v -= row
+        self.sum_tv -= t * row
+        self.histogram[self.metric_rows, self.bins[slot]] -= 1
+        self.window_start += 1
+    
+    def _window_slots(self) -> np.ndarray:
+        return np.arange(self.window_start, self.appended) % self.capacity
+    
+    def _recompute_window(self):
+        slots = self._window_slots()
+        self._reset_window_sums()
+        if not len(slots):
+            return
+        
+        self.origin = self.timestamps[slots[0]]
+        t = self.timestamps[slots] - self.origin
+        values = self.values[slots]
+        self.window_count = len(slots)
+        self.sum_t = t.sum()
+        self.sum_tt = (t * t).sum()
+        self.sum_v = values.sum(axis=0)
+        self.sum_tv = t @ values
+        np.add.at(self.histogram, (np.broadcast_to(self.metric_rows, values.shape), self.bins[slots]), 1)
+    
+    def latest(self, metric: str) -> Optional[float]:
+        """Most recent value"""
+        if not self.appended:
+            return None
+        return float(self.values[(self.appended - 1) % self.capacity, self.metric_index[metric]])
+    
+    def mean(self, metric: str) -> Optional[float]:
+        """Rolling mean over the window"""
+        if not self.window_count:
+            return None
+        return float(self.sum_v[self.metric_index[metric]] / self.window_count)
+    
+    def slope(self, metric: str, seconds: Optional[float] = None) -> Optional[float]:
+        """
+        Least-squares rate of change per second over the window, or over the
+        retained samples of the trailing `seconds` when another span is asked for
+        """
+        if seconds is not None and seconds != self.window_seconds:
+            timestamps, values = self.series(metric)
+            if not len(timestamps):
+                return None
+            start = int(np.searchsorted(timestamps, timestamps[-1] - seconds))
+            t = timestamps[start:] - timestamps[start]
+            v = values[start:]
+            return self._least_squares_slope(len(t), t.sum(), (t * t).sum(), v.sum(), t @ v)
+        
+        i = self.metric_index[metric]
+        return self._least_squares_slope(self.window_count, self.sum_t, self.sum_tt, self.sum_v[i], self.sum_tv[i])
+    
+    @staticmethod
+    def _least_squares_slope(n: int, sum_t: float, sum_tt: float, sum_v: float, sum_tv: float) -> Optional[float]:
+        denominator = n * sum_tt - sum_t ** 2
+        if n < 2 or denominator <= 1e-9 * max(1.0, n * sum_tt):
+            return None
+        return float((n * sum_tv - sum_t * sum_v) / denominator)
+    
+    def percentile(self, metric: str, q: float) -> Optional[float]:
+        """Rolling percentile over the window, to histogram bin resolution"""
+        if not self.window_count:
+            return None
+        i = self.metric_index[metric]
+        cumulative = np.cumsum(self.histogram[i])
+        bin_index = int(np.searchsorted(cumulative, q / 100 * self.window_count))
+        value = self.bin_low[i] + (min(bin_index, self.HISTOGRAM_BINS - 1) + 0.5) / self.HISTOGRAM_BINS * self.bin_width[i]
+        return float(math.expm1(value) if self.log_scale[i] else value)
+    
+    def series(self, metric: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Retained timestamps and values, oldest first"""
+        slots = np.arange(max(0, self.appended - self.capacity), self.appended) % self.capacity
+        return self.timestamps[slots], self.values[slots, self.metric_index[metric]]
+
+class MetricHistory:
+    """
+    Multi-resolution metric retention: raw samples plus 1 minute and 1 hour
+    means, each tier a MetricRingBuffer sized from the retention policy, so
+    memory stays constant however long monitoring runs.
+    """
+    
+    # Tier -> (resolution seconds, None for raw samples)
+    TIERS = {'raw': None, 'minute': 60, 'hour': 3600}
+    
+    def __init__(self,
+                 metrics: List[str],
+                 sample_interval: float,
+                 data_management: Optional[Dict[str, Any]] = None,
+                 value_ranges: Optional[Dict[str, Tuple[float, float]]] = None):
+        data_management = data_management or {}
+        retention = data_management.get('retention', {})
+        aggregation = data_management.get('aggregation', {})
+        
+        self.metrics = metrics
+        self.tiers = {
+            'raw': MetricRingBuffer(
+                metrics,
+                max(1, math.ceil(retention.get('raw_metrics_hours', 24) * 3600 / sample_interval)),
+                aggregation.get('short_term_minutes', 5) * 60,
+                value_ranges
+            ),
+            'minute': MetricRingBuffer(
+                metrics,
+                retention.get('aggregated_metrics_days', 7) * 24 * 60,
+                aggregation.get('medium_term_hours', 1) * 3600,
+                value_ranges
+            ),
+            'hour': MetricRingBuffer(
+                metrics,
+                retention.get('historical_data_days', 30) * 24,
+                aggregation.get('long_term_days', 1) * 86400,
+                value_ranges
+            )
+        }
+        
+        # Open downsampling buckets per aggregated tier
+        self.buckets = {tier: {'bucket': None, 'sum': np.zeros(len(metrics)), 'count': 0}
+                        for tier in ('minute', 'hour')}
+    
+    def append(self, timestamp: float, values: Dict[str, float]):
+        """Record one sample of every metric; missing metrics record 0"""
+        row = np.array([float(values.get(name, 0.0)) for name in self.metrics])
+        self.tiers['raw'].append(timestamp, row)
+        self._downsample('minute', timestamp, row)
+    
+    def _downsample(self, tier: str, timestamp: float, row: np.ndarray):
+        """Add a sample to the tier's open bucket, closing it into the tier when time moves on"""
+        resolution = self.TIERS[tier]
+        bucket = int(timestamp // resolution)
+        state = self.buckets[tier]
+        
+        if state['bucket'] is not None and bucket != state['bucket']:
+            bucket_time = state['bucket'] * resolution
+            bucket_mean = state['sum'] / state['count']
+            self.tiers[tier].append(bucket_time, bucket_mean)
+            if tier == 'minute':
+                self._downsample('hour', bucket_time, bucket_mean)
+            state['sum'] = np.zeros(len(self.metrics))
+            state['count'] = 0
+        
+        state['bucket'] = bucket
+        state['sum'] += row
+        state['count'] += 1
+    
+    def summary(self, tier: str = 'raw') -> Dict[str, Dict[str, Optional[float]]]:
+        """Rolling statistics for every metric in a tier"""
+        buffer = self.tiers[tier]
+        return {
+            name: {
+                'latest': buffer.latest(name),
+                'mean': buffer.mean(name),
+                'p50': buffer.percentile(name, 50),
+                'p95': buffer.percentile(name, 95),
+                'slope_per_second': buffer.slope(name)
+            }
+            for name in self.metrics
+        }
+
 class ResourceMonitor:
     """
     Comprehensive resource monitoring system that tracks system and application
     metrics for intelligent batching decisions.
     """
     
+    # Metrics kept in metric_history; bounded metrics are histogrammed linearly, the rest on a log scale
+    HISTORY_METRICS = [
+        'cpu_percent', 'memory_percent', 'memory_available_mb', 'disk_usage_percent',
+        'active_connections', 'load_average_1m', 'network_speed_mbps',
+        'average_response_time', 'error_rate', 'throughput', 'request_queue_size'
+    ]
+    METRIC_RANGES = {
+        'cpu_percent': (0.0, 100.0),
+        'memory_percent': (0.0, 100.0),
+        'disk_usage_percent': (0.0, 100.0),
+        'error_rate': (0.0, 1.0)
+    }
+    
+    # Resource name (as used by thresholds and results) -> history metric
+    RESOURCE_METRICS = {'cpu': 'cpu_percent', 'memory': 'memory_percent', 'disk': 'disk_usage_percent'}
+    
     def __init__(self, config_path: Optional[str] = None, monitoring_interval: float = 5.0):
         """Initialize the resource monitor"""
         self.monitoring_interval = monitoring_interval
         self.thresholds = self._load_thresholds(config_path)
-        self.system_history: List[SystemResources] = []
-        self.app_history: List[ApplicationMetrics] = []
+        self.system_history: deque = deque(maxlen=1000)
+        self.app_history: deque = deque(maxlen=1000)
+        self.metric_history = MetricHistory(
+            self.HISTORY_METRICS, monitoring_interval,
+            self._load_data_management(config_path), self.METRIC_RANGES
+        )
         self.monitoring_active = False
         self.monitoring_thread: Optional[threading.Thread] = None
         self.callbacks: List[Callable[[SystemResources, ApplicationMetrics], None]] = []
@@ -85,7 +367,7 @@ class ResourceMonitor:
         
         # Network monitoring state
         self.last_network_stats = None
-        self.network_speed_history: List[float] = []
+        self.network_speed_history: deque = deque(maxlen=100)
         
     def _load_thresholds(self, config_path: Optional[str]) -> ResourceThresholds:
         """Load resource thresholds from configuration file"""
@@ -100,6 +382,18 @@ class ResourceMonitor:
         
         return ResourceThresholds()
     
+    def _load_data_management(self, config_path: Optional[str]) -> Dict[str, Any]:
+        """Load metric retention and aggregation settings from configuration file"""
+        if config_path and Path(config_path).exists():
+            try:
+                with open(config_path, 'r') as f:
+                    config_data = yaml.safe_load(f)
+                return config_data.get('data_management', {})
+            except Exception as e:
+                logger.warning(f"Failed to load data management settings from {config_path}: {e}")
+        
+        return {}
+    
     def start_monitoring(self):
         """Start continuous resource monitoring"""
         if self.monitoring_active:
@@ -210,15 +504,27 @@ class ResourceMonitor:
     
     def _update_history(self, system_metrics: SystemResources, app_metrics: ApplicationMetrics):
         """Update metrics history with retention limits"""
-        # Add new metrics
+        # Add new metrics (deques keep the last 1000 measurements)
         self.system_history.append(system_metrics)
         self.app_history.append(app_metrics)
         
-        # Keep only recent history (last 1000 measurements)
-        if len(self.system_history) > 1000:
-            self.system_history = self.system_history[-1000:]
-        if len(self.app_history) > 1000:
-            self.app_history = self.app_history[-1000:]
+        # Calculate network speed
+        self._calculate_network_speed(system_metrics)
+        
+        # Record the time series used for rolling statistics and trends
+        self.metric_history.append(system_metrics.timestamp, {
+            'cpu_percent': system_metrics.cpu_percent,
+            'memory_percent': system_metrics.memory_percent,
+            'memory_available_mb': system_metrics.memory_available_mb,
+            'disk_usage_percent': system_metrics.disk_usage_percent,
+            'active_connections': system_metrics.active_connections,
+            'load_average_1m': system_metrics.load_average[0] if system_metrics.load_average else 0.0,
+            'network_speed_mbps': self.network_speed_history[-1] if self.network_speed_history else 0.0,
+            'average_response_time': app_metrics.average_response_time,
+            'error_rate': app_metrics.error_rate,
+            'throughput': app_metrics.throughput,
+            'request_queue_size': app_metrics.request_queue_size
+        })
         
         # Update baseline if not set
         if self.baseline_metrics is None and len(self.system_history) >= 10:
@@ -226,9 +532,6 @@ class ResourceMonitor:
         
         # Track peak usage
         self._update_peak_tracking(system_metrics)
-        
-        # Calculate network speed
-        self._calculate_network_speed(system_metrics)
     
     def _check_thresholds(self, system_metrics: SystemResources, app_metrics: ApplicationMetrics):
         """Check resource thresholds and trigger alerts"""
@@ -301,18 +604,17 @@ class ResourceMonitor:
                     logger.error(f"Alert callback error: {e}")
     
     def _calculate_baseline(self) -> SystemResources:
-        """Calculate baseline metrics from recent history"""
-        if len(self.system_history) < 10:
+        """Calculate baseline metrics from the rolling window means"""
+        raw = self.metric_history.tiers['raw']
+        if raw.window_count < 10:
             return SystemResources()
         
-        recent_metrics = self.system_history[-10:]
-        
         return SystemResources(
-            cpu_percent=sum(m.cpu_percent for m in recent_metrics) / len(recent_metrics),
-            memory_percent=sum(m.memory_percent for m in recent_metrics) / len(recent_metrics),
-            memory_available_mb=sum(m.memory_available_mb for m in recent_metrics) / len(recent_metrics),
-            disk_usage_percent=sum(m.disk_usage_percent for m in recent_metrics) / len(recent_metrics),
-            active_connections=sum(m.active_connections for m in recent_metrics) / len(recent_metrics)
+            cpu_percent=raw.mean('cpu_percent'),
+            memory_percent=raw.mean('memory_percent'),
+            memory_available_mb=raw.mean('memory_available_mb'),
+            disk_usage_percent=raw.mean('disk_usage_percent'),
+            active_connections=raw.mean('active_connections')
         )
     
     def _update_peak_tracking(self, metrics: SystemResources):
@@ -345,8 +647,6 @@ class ResourceMonitor:
         speed_mbps = (total_bytes * 8) / (time_diff * 1024 * 1024)
         
         self.network_speed_history.append(speed_mbps)
-        if len(self.network_speed_history) > 100:
-            self.network_speed_history = self.network_speed_history[-100:]
         
         self.last_network_stats = metrics
     
@@ -388,40 +688,37 @@ class ResourceMonitor:
         }
     
     def get_performance_trend(self, window_minutes: int = 5) -> Dict[str, str]:
-        """Analyze performance trend over specified time window"""
-        if len(self.system_history) < 2:
-            return {'cpu': 'stable', 'memory': 'stable', 'disk': 'stable'}
-        
-        cutoff_time = time.time() - (window_minutes * 60)
-        recent_metrics = [m for m in self.system_history if m.timestamp >= cutoff_time]
-        
-        if len(recent_metrics) < 2:
-            return {'cpu': 'stable', 'memory': 'stable', 'disk': 'stable'}
+        """
+        Analyze performance trend over specified time window, using the finest
+        history tier whose window covers it. The tier's rolling slope is used
+        when its window matches; otherwise the slope is fitted to the tier's
+        samples from the trailing window_minutes only.
+        """
+        window_seconds = window_minutes * 60
+        buffer = next(
+            (buffer for buffer in self.metric_history.tiers.values() if buffer.window_seconds >= window_seconds),
+            self.metric_history.tiers['hour']
+        )
         
-        # Calculate trends
+        # Calculate trends: change between the first and second half averages of a linear fit
         trends = {}
-        for metric in ['cpu_percent', 'memory_percent', 'disk_usage_percent']:
-            values = [getattr(m, metric) for m in recent_metrics]
-            if len(values) < 2:
-                trends[metric.replace('_percent', '')] = 'stable'
-                continue
-            
-            # Simple trend analysis
-            first_half = values[:len(values)//2]
-            second_half = values[len(values)//2:]
-            
-            first_avg = sum(first_half) / len(first_half)
-            second_avg = sum(second_half) / len(second_half)
+        for resource, metric in self.RESOURCE_METRICS.items():
+            slope = buffer.slope(metric, window_seconds)
+            half_window_change = slope * window_seconds / 2 if slope is not None else 0.0
             
-            if second_avg > first_avg + 5:
-                trends[metric.replace('_percent', '')] = 'increasing'
-            elif second_avg < first_avg - 5:
-                trends[metric.replace('_percent', '')] = 'decreasing'
+            if half_window_change > 5:
+                trends[resource] = 'increasing'
+            elif half_window_change < -5:
+                trends[resource] = 'decreasing'
             else:
-                trends[metric.replace('_percent', '')] = 'stable'
+                trends[resource] = 'stable'
         
         return trends
     
+    def get_metric_statistics(self, tier: str = 'raw') -> Dict[str, Dict[str, Optional[float]]]:
+        """Rolling latest/mean/p50/p95/slope per metric for a history tier (raw, minute or hour)"""
+        return self.metric_history.summary(tier)
+    
     def register_callback(self, callback: Callable[[SystemResources, ApplicationMetrics], None]):
         """Register callback for metric updates"""
         self.callbacks.append(callback)
@@ -432,38 +729,23 @@ class ResourceMonitor:
     
     def predict_resource_exhaustion(self) -> Dict[str, Optional[float]]:
         """Predict when resources might be exhausted based on current trends"""
-        if len(self.system_history) < 10:
+        raw = self.metric_history.tiers['raw']
+        if raw.window_count < 10:
             return {'cpu': None, 'memory': None, 'disk': None}
         
         predictions = {}
-        recent_metrics = self.system_history[-10:]
         
-        for resource in ['cpu_percent', 'memory_percent', 'disk_usage_percent']:
-            values = [getattr(m, resource) for m in recent_metrics]
-            timestamps = [m.timestamp for m in recent_metrics]
+        for resource, metric in self.RESOURCE_METRICS.items():
+            # Rolling least-squares rate of change
+            rate = raw.slope(metric)
+            current_value = raw.latest(metric)
+            critical_threshold = getattr(self.thresholds, f"{resource}_critical")
             
-            # Simple linear regression for trend prediction
-            if len(values) >= 3:
-                # Calculate rate of change
-                time_diffs = [timestamps[i] - timestamps[i-1] for i in range(1, len(timestamps))]
-                value_diffs = [values[i] - values[i-1] for i in range(1, len(values))]
-                
-                if time_diffs and all(td > 0 for td in time_diffs):
-                    avg_rate = sum(vd / td for vd, td in zip(value_diffs, time_diffs)) / len(value_diffs)
-                    
-                    current_value = values[-1]
-                    critical_threshold = getattr(self.thresholds, 
-                                                f"{resource.replace('_percent', '')}_critical")
-                    
-                    if avg_rate > 0:
-                        time_to_critical = (critical_threshold - current_value) / avg_rate
-                        predictions[resource.replace('_percent', '')] = time_to_critical if time_to_critical > 0 else None
-                    else:
-                        predictions[resource.replace('_percent', '')] = None
-                else:
-                    predictions[resource.replace('_percent', '')] = None
+            if rate is not None and rate > 0:
+                time_to_critical = (critical_threshold - current_value) / rate
+                predictions[resource] = time_to_critical if time_to_critical > 0 else None
             else:
-                predictions[resource.replace('_percent', '')] = None
+                predictions[resource] = None
         
         return predictions
     
@@ -505,7 +787,7 @@ class ResourceMonitor:
         
         # Network recommendations
         if self.network_speed_history:
-            avg_speed = sum(self.network_speed_history[-10:]) / len(self.network_speed_history[-10:])
+            avg_speed = self.metric_history.tiers['raw'].mean('network_speed_mbps')
             if avg_speed > self.thresholds.network_warning_mbps:
                 recommendations.append({
                     'type': 'network',
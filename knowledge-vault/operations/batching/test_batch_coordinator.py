@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Batch Coordinator Tests
+Job queue ordering, removal and cancellation, and shutdown of an idle coordinator
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from batching.adaptive_batching import OperationType
+from batching.batch_coordinator import BatchCoordinator, BatchJob, JobQueue
+
+
+def make_job(job_id: str, priority: str = "normal", created_at: float = 0.0) -> BatchJob:
+    return BatchJob(job_id=job_id, operation_type=OperationType.READ, operations=[{'id': job_id}],
+                    priority=priority, created_at=created_at)
+
+
+def drain(queue: JobQueue):
+    jobs = []
+    while (job := queue.pop()) is not None:
+        jobs.append(job.job_id)
+    return jobs
+
+
+@pytest.fixture
+def coordinator(tmp_path, monkeypatch):
+    """Coordinator writing its models under a temporary directory"""
+    monkeypatch.chdir(tmp_path)
+    coordinator = BatchCoordinator()
+    coordinator.resource_monitor.monitoring_interval = 0.05
+    yield coordinator
+    coordinator.stop()
+
+
+def test_queue_orders_by_priority_then_age():
+    """Higher priorities pop first, older jobs first within a priority, ties in submission order"""
+    queue = JobQueue()
+    queue.push(make_job("normal_old", "normal", created_at=1.0))
+    queue.push(make_job("low", "low", created_at=0.0))
+    queue.push(make_job("normal_new", "normal", created_at=5.0))
+    queue.push(make_job("critical", "critical", created_at=9.0))
+    queue.push(make_job("unknown", "urgent", created_at=0.0))
+    queue.push(make_job("high_a", "high", created_at=3.0))
+    queue.push(make_job("high_b", "high", created_at=3.0))
+
+    assert len(queue) == 7
+    assert [job.job_id for job in queue.values()][:2] == ["normal_old", "low"]
+    assert drain(queue) == ["critical", "high_a", "high_b", "normal_old", "normal_new", "low", "unknown"]
+    assert len(queue) == 0 and queue.pop() is None
+
+
+def test_pushing_an_existing_id_replaces_the_pending_job():
+    """Only the latest job with an id is returned, in its own position"""
+    queue = JobQueue()
+    queue.push(make_job("a", "low"))
+    queue.push(make_job("b", "normal"))
+    replacement = make_job("a", "critical")
+    queue.push(replacement)
+
+    assert len(queue) == 2 and queue.get("a") is replacement
+    assert drain(queue) == ["a", "b"]
+
+
+def test_removed_jobs_are_never_popped():
+    """remove() returns the pending job once, and the heap compacts under heavy removal"""
+    queue = JobQueue()
+    for i in range(500):
+        queue.push(make_job(f"job_{i}", created_at=float(i)))
+
+    removed = queue.remove("job_0")
+    assert removed.job_id == "job_0"
+    assert "job_0" not in queue and queue.get("job_0") is None
+    assert queue.remove("job_0") is None
+    assert queue.remove("never_submitted") is None
+
+    for i in range(1, 490):
+        queue.remove(f"job_{i}")
+    assert len(queue.heap) <= 2 * len(queue) + 64
+    assert drain(queue) == [f"job_{i}" for i in range(490, 500)]
+
+
+def test_cancelling_a_queued_job(coordinator):
+    """A cancelled queued job leaves the queue and is reported as cancelled"""
+    first = coordinator.submit_job([{'id': 1}], OperationType.READ, job_id="first")
+    second = coordinator.submit_job([{'id': 2}], OperationType.READ, job_id="second")
+
+    assert coordinator.cancel_job(first) is True
+    assert coordinator.get_job_status(first)['status'] == "cancelled"
+    assert coordinator.cancel_job(first) is False
+    assert coordinator.cancel_job("missing") is False
+
+    assert first not in coordinator.job_queue
+    assert [job.job_id for job in coordinator.completed_jobs] == [first]
+    assert coordinator.job_queue.pop().job_id == second
+
+
+def test_idle_coordinator_shuts_down_promptly(coordinator):
+    """stop() wakes an execution loop waiting on an empty queue"""
+    coordinator.start()
+    time.sleep(0.1)
+    assert coordinator.execution_thread.is_alive()
+
+    start = time.time()
+    coordinator.stop()
+    assert not coordinator.execution_thread.is_alive()
+    assert not coordinator.execution_engine.loop_thread
+    assert time.time() - start < 5
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Batch Execution Engine Tests
+Retries with backoff, per-batch timeouts, concurrency bounds and metric reporting
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from batching.adaptive_batching import AdaptiveBatchingEngine, OperationType
+from batching.execution_engine import BatchExecutionEngine, ExecutionSettings
+
+
+def make_engine(batching_engine=None, **settings) -> BatchExecutionEngine:
+    engine = BatchExecutionEngine(batching_engine=batching_engine)
+    engine.settings[OperationType.READ] = ExecutionSettings(**{
+        'base_delay_ms': 20.0,
+        'jitter_enabled': False,
+        **settings
+    })
+    return engine
+
+
+def make_batches(count: int, size: int = 5):
+    return [[{'id': f"{b}-{i}"} for i in range(size)] for b in range(count)]
+
+
+def test_retry_delay_backs_off_exponentially_up_to_the_cap():
+    """Delays double per attempt, stay under max_delay_ms and jitter only shortens them"""
+    engine = make_engine()
+    settings = ExecutionSettings(base_delay_ms=100.0, max_delay_ms=500.0, jitter_enabled=False)
+    assert [engine._retry_delay(settings, attempt) for attempt in range(1, 6)] == [0.1, 0.2, 0.4, 0.5, 0.5]
+
+    settings.exponential_backoff = False
+    assert engine._retry_delay(settings, 4) == 0.1
+
+    settings.jitter_enabled = True
+    assert all(0.05 <= engine._retry_delay(settings, 1) <= 0.1 for _ in range(50))
+
+
+def test_transient_failures_are_retried_and_reported_once():
+    """A batch that succeeds on its third attempt is a success after two backoff delays"""
+    batching_engine = AdaptiveBatchingEngine()
+    engine = make_engine(batching_engine, retry_attempts=3)
+    calls = []
+
+    async def flaky_handler(operation_type, batch):
+        calls.append(time.time())
+        if len(calls) < 3:
+            raise ConnectionError("transient")
+
+    engine.register_handler(OperationType.READ, flaky_handler)
+    try:
+        [result] = engine.run(engine.execute_batches(make_batches(1), OperationType.READ), timeout=10)
+    finally:
+        engine.stop()
+
+    assert result['attempts'] == 3
+    assert result['processed'] == 5 and 'error' not in result
+    assert calls[1] - calls[0] >= 0.02 and calls[2] - calls[1] >= 0.04
+    assert engine.stats[OperationType.READ]['retries'] == 2
+
+    # One aggregated measurement of the final outcome, without unmeasured resources
+    [metrics] = batching_engine.performance_history[OperationType.READ]
+    assert metrics.error_rate == 0.0 and metrics.success_rate == 1.0
+    assert metrics.cpu_usage is None and metrics.memory_usage is None
+    assert not batching_engine.circuit_breaker_active[OperationType.READ]
+
+
+def test_exhausted_retries_fail_the_batch():
+    """A batch that never succeeds stops after retry_attempts retries"""
+    batching_engine = AdaptiveBatchingEngine()
+    engine = make_engine(batching_engine, retry_attempts=2, base_delay_ms=1.0)
+
+    async def failing_handler(operation_type, batch):
+        raise ValueError("bad request")
+
+    engine.register_handler(OperationType.READ, failing_handler)
+    try:
+        results = engine.run(engine.execute_batches(make_batches(2), OperationType.READ), timeout=10)
+    finally:
+        engine.stop()
+
+    assert [r['attempts'] for r in results] == [3, 3]
+    assert all(r['failed'] == 5 and r['error'] == "bad request" for r in results)
+    assert engine.stats[OperationType.READ]['batches_failed'] == 2
+
+    [metrics] = batching_engine.performance_history[OperationType.READ]
+    assert metrics.error_rate == 1.0
+    assert batching_engine.circuit_breaker_active[OperationType.READ]
+
+
+def test_slow_batches_time_out():
+    """Attempts longer than batch_timeout_seconds are cancelled and counted as timeouts"""
+    engine = make_engine(retry_attempts=1, batch_timeout_seconds=0.05, base_delay_ms=1.0)
+    cancelled = []
+
+    async def slow_handler(operation_type, batch):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    engine.register_handler(OperationType.READ, slow_handler)
+    start = time.time()
+    try:
+        [result] = engine.run(engine.execute_batches(make_batches(1), OperationType.READ), timeout=10)
+    finally:
+        engine.stop()
+
+    assert time.time() - start < 2
+    assert result['attempts'] == 2 and result['processed'] == 0
+    assert "timed out" in result['error']
+    assert engine.stats[OperationType.READ]['timeouts'] == 2
+    assert len(cancelled) == 2
+
+
+def test_in_flight_batches_are_bounded():
+    """No more than max_concurrent_batches handlers run at once, and the bound is reached"""
+    engine = make_engine(max_concurrent_batches=3)
+    running = 0
+    peak = 0
+
+    async def tracking_handler(operation_type, batch):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+
+    engine.register_handler(OperationType.READ, tracking_handler)
+    try:
+        results = engine.run(engine.execute_batches(make_batches(12), OperationType.READ), timeout=10)
+    finally:
+        engine.stop()
+
+    assert all('error' not in r for r in results)
+    assert peak == 3
+    assert engine.stats[OperationType.READ]['peak_in_flight'] == 3
+    assert engine.stats[OperationType.READ]['in_flight'] == 0
+
+
+def test_backoff_does_not_hold_a_slot():
+    """A batch waiting to retry leaves its slot to other batches"""
+    engine = make_engine(max_concurrent_batches=1, retry_attempts=1, base_delay_ms=200.0)
+    order = []
+
+    async def handler(operation_type, batch):
+        order.append(batch[0]['id'])
+        if batch[0]['id'] == "0-0" and order.count("0-0") == 1:
+            raise ConnectionError("transient")
+
+    engine.register_handler(OperationType.READ, handler)
+    try:
+        engine.run(engine.execute_batches(make_batches(2), OperationType.READ), timeout=10)
+    finally:
+        engine.stop()
+
+    assert order == ["0-0", "1-0", "0-0"]
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Performance Optimizer Tests
+Streaming mode updates and predictions shared across executor threads
+"""
+
+import random
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from batching.performance_optimizer import PerformanceOptimizer, OptimizationTarget
+
+
+def make_point(rng: random.Random):
+    batch_size = rng.randint(10, 200)
+    features = {'current_batch_size': batch_size, 'cpu_usage': rng.random() * 100}
+    results = {
+        'optimal_batch_size': batch_size * 0.9 + rng.gauss(0, 5),
+        'throughput': batch_size * 2.0,
+        'response_time': 100 + batch_size,
+        'cpu_usage': 40.0,
+        'memory_usage': 50.0
+    }
+    return features, results
+
+
+def test_concurrent_updates_and_predictions():
+    """Jobs finishing on several threads update and query one streaming optimizer"""
+    optimizer = PerformanceOptimizer(tempfile.mkdtemp(), streaming=True, buffer_size=5000, save_interval=0.05)
+    optimizer.add_training_data(*make_point(random.Random(0)))
+    
+    # Predictions that fail fall back to the default batch size of 50 with confidence 0.1
+    failures = []
+    original_predict = optimizer._predict_targets
+    
+    def checked_predict(X):
+        try:
+            return original_predict(X)
+        except Exception as e:
+            failures.append(e)
+            raise
+    
+    optimizer._predict_targets = checked_predict
+    start = threading.Barrier(8)
+    
+    def job(worker: int):
+        rng = random.Random(worker)
+        start.wait()
+        for _ in range(150):
+            optimizer.add_training_data(*make_point(rng))
+            optimizer.predict_optimal_batch_size(make_point(rng)[0], OptimizationTarget())
+    
+    # Switch threads as often as possible so unguarded updates would interleave
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(job, range(8)))
+    finally:
+        sys.setswitchinterval(switch_interval)
+    optimizer.save_streaming_state()
+    
+    assert not failures
+    assert len(optimizer.training_buffer) == 1 + 8 * 150
+    assert optimizer.pending_updates == 0 and optimizer.unsaved_updates == 0
+    assert all(np.isfinite(model.coef_).all() for model in optimizer.models.values())
+    
+    # The saved state is complete and loads back with the same predictions
+    restarted = PerformanceOptimizer(optimizer.model_save_path, streaming=True, buffer_size=5000)
+    X = optimizer.training_buffer.arrays()[0][:5]
+    assert len(restarted.training_buffer) == len(optimizer.training_buffer)
+    assert np.allclose(restarted._predict_targets(X), original_predict(X))
+
+
+def test_first_chunk_is_not_reported_as_perfect():
+    """Accuracy appears only once rows were scored before being learned"""
+    optimizer = PerformanceOptimizer(tempfile.mkdtemp(), streaming=True, buffer_size=500)
+    rng = random.Random(1)
+    
+    optimizer.add_training_data(*make_point(rng))
+    assert optimizer.model_performance == {}
+    
+    for _ in range(100):
+        optimizer.add_training_data(*make_point(rng))
+    assert 0 < optimizer.model_performance['batch_size']['accuracy'] < 1
+    
+    # A rebuild that scores no chunk keeps the previous estimate
+    previous = optimizer.model_performance['batch_size']['mse']
+    optimizer.train_models(min_data_points=10)
+    assert optimizer.model_performance['batch_size']['mse'] == previous
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Resource Monitor Tests
+Rolling statistics and downsampling of the metric history, checked against NumPy
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from batching.resource_monitor import MetricHistory, MetricRingBuffer, ResourceMonitor
+
+
+def fill(buffer: MetricRingBuffer, timestamps: np.ndarray, values: np.ndarray):
+    for timestamp, row in zip(timestamps, values):
+        buffer.append(float(timestamp), row)
+
+
+def window_of(timestamps: np.ndarray, values: np.ndarray, window_seconds: float, capacity: int):
+    """Samples a ring buffer should consider in its trailing window"""
+    timestamps, values = timestamps[-capacity:], values[-capacity:]
+    keep = timestamps >= timestamps[-1] - window_seconds
+    return timestamps[keep], values[keep]
+
+
+@pytest.mark.parametrize("capacity,window_seconds", [(1000, 60.0), (150, 300.0), (64, 30.0)])
+def test_rolling_mean_and_slope_match_numpy(capacity, window_seconds):
+    """Incremental window sums agree with a direct fit, across evictions and buffer wrap-around"""
+    rng = np.random.default_rng(0)
+    timestamps = 1.7e9 + np.cumsum(rng.uniform(0.5, 1.5, 500))
+    values = np.column_stack([
+        50 + 0.05 * (timestamps - timestamps[0]) + rng.normal(0, 5, 500),
+        rng.lognormal(3, 1, 500)
+    ])
+    buffer = MetricRingBuffer(['cpu', 'latency'], capacity, window_seconds, {'cpu': (0.0, 100.0)})
+    fill(buffer, timestamps, values)
+
+    t, v = window_of(timestamps, values, window_seconds, capacity)
+    assert buffer.window_count == len(t)
+    for i, name in enumerate(['cpu', 'latency']):
+        assert buffer.mean(name) == pytest.approx(v[:, i].mean(), rel=1e-9)
+        assert buffer.slope(name) == pytest.approx(np.polyfit(t - t[0], v[:, i], 1)[0], rel=1e-6, abs=1e-9)
+        assert buffer.latest(name) == values[-1, i]
+
+
+def test_slope_over_a_shorter_span_uses_only_those_samples():
+    """slope(metric, seconds) fits the trailing span of retained samples, not the rolling window"""
+    timestamps = np.arange(0.0, 600.0, 5.0)
+    cpu = np.where(timestamps < 480, 90 - timestamps / 10, 42 + (timestamps - 480) / 2)
+    buffer = MetricRingBuffer(['cpu'], 1000, 600.0)
+    fill(buffer, timestamps, cpu[:, None])
+
+    recent = timestamps >= timestamps[-1] - 100
+    assert buffer.slope('cpu') < 0
+    assert buffer.slope('cpu', 100) == pytest.approx(np.polyfit(timestamps[recent], cpu[recent], 1)[0])
+    assert buffer.slope('cpu', 600) == buffer.slope('cpu')
+    assert MetricRingBuffer(['cpu'], 10, 60.0).slope('cpu', 30) is None
+
+
+def test_percentiles_match_numpy_to_bin_resolution():
+    """Histogram percentiles are within one bin of np.percentile, linear and log binned"""
+    rng = np.random.default_rng(1)
+    timestamps = np.arange(2000, dtype=float)
+    values = np.column_stack([rng.uniform(0, 100, 2000), rng.lognormal(4, 1.5, 2000)])
+    buffer = MetricRingBuffer(['cpu', 'latency'], 1500, 900.0, {'cpu': (0.0, 100.0)})
+    fill(buffer, timestamps, values)
+
+    _, v = window_of(timestamps, values, 900.0, 1500)
+    bins = MetricRingBuffer.HISTOGRAM_BINS
+    for q in (50, 95):
+        assert abs(buffer.percentile('cpu', q) - np.percentile(v[:, 0], q)) <= 100 / bins
+        log_error = abs(np.log1p(buffer.percentile('latency', q)) - np.log1p(np.percentile(v[:, 1], q)))
+        assert log_error <= np.log1p(MetricRingBuffer.LOG_SCALE_MAX) / bins
+
+
+def test_history_downsamples_into_minute_and_hour_means():
+    """Closed minute and hour buckets hold the mean of the samples that fell into them"""
+    rng = np.random.default_rng(2)
+    start = 1_700_000_400.0  # On an hour boundary
+    timestamps = start + np.arange(0, 3 * 3600 + 60, 5.0)
+    cpu = rng.uniform(0, 100, len(timestamps))
+    history = MetricHistory(['cpu'], 5.0)
+    for timestamp, value in zip(timestamps, cpu):
+        history.append(timestamp, {'cpu': value})
+
+    minutes = (timestamps // 60).astype(int)
+    closed_minutes = np.unique(minutes)[:-1]
+    minute_means = np.array([cpu[minutes == m].mean() for m in closed_minutes])
+    minute_times, minute_values = history.tiers['minute'].series('cpu')
+    np.testing.assert_allclose(minute_times, closed_minutes * 60.0)
+    np.testing.assert_allclose(minute_values, minute_means)
+
+    # Hours are means of minute means, closed once a later minute bucket closes
+    hours = closed_minutes * 60 // 3600
+    hour_times, hour_values = history.tiers['hour'].series('cpu')
+    np.testing.assert_allclose(hour_times, np.unique(hours)[:-1] * 3600.0)
+    np.testing.assert_allclose(hour_values, [minute_means[hours == h].mean() for h in np.unique(hours)[:-1]])
+    assert history.tiers['raw'].mean('cpu') == pytest.approx(cpu[timestamps >= timestamps[-1] - 300].mean())
+
+
+def test_performance_trend_covers_only_the_requested_window():
+    """A 10 minute trend reflects the last 10 minutes, not the minute tier's hour"""
+    monitor = ResourceMonitor(monitoring_interval=5.0)
+    start = 1_700_000_400.0
+    for second in range(0, 3660, 5):
+        minute = second / 60
+        cpu = 90 - minute * 1.4 if minute < 50 else 20 + (minute - 50) * 4
+        monitor.metric_history.append(start + second, {'cpu_percent': cpu, 'memory_percent': 50.0})
+
+    assert monitor.get_performance_trend(60)['cpu'] == 'decreasing'
+    assert monitor.get_performance_trend(10)['cpu'] == 'increasing'
+    assert monitor.get_performance_trend(10)['memory'] == 'stable'
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -12,12 +12,12 @@ import time
 import logging
 import hashlib
 import numpy as np
+from scipy import sparse
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set, Callable, Iterator
 from dataclasses import dataclass, asdict
 from collections import Counter, defaultdict
-import math
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +26,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Vocabulary of the simplified semantic vector (one dimension per word)
+SEMANTIC_WORDS = ['ai', 'data', 'web', 'development', 'business', 'tool', 'service', 
+                  'platform', 'software', 'app', 'api', 'database', 'cloud', 
+                  'analytics', 'automation', 'integration', 'framework', 'library',
+                  'productivity', 'collaboration', 'management', 'optimization',
+                  'security', 'design', 'mobile', 'enterprise', 'startup',
+                  'marketing', 'sales', 'customer', 'finance', 'insurance',
+                  'maritime', 'fintech', 'saas', 'marketplace', 'ecommerce',
+                  'education', 'health', 'legal', 'real', 'estate', 'property',
+                  'machine', 'learning', 'javascript', 'python', 'react',
+                  'node', 'vue', 'angular', 'docker', 'kubernetes'][:50]  # Limit to 50 dimensions
+
+# SimilarityAnalysis score fields computed by SimilarityMatrixEngine.components
+SIMILARITY_SCORES = ('semantic_similarity', 'tag_overlap_score', 'content_similarity', 'overall_similarity')
+
 @dataclass
 class RelationshipResult:
     """Result of relationship discovery analysis"""
@@ -51,6 +66,216 @@ class SimilarityAnalysis:
     overall_similarity: float
     shared_elements: Dict[str, List[str]]
 
+@dataclass
+class EncodedItems:
+    """Item collection encoded once into feature matrices for batch similarity"""
+    id_codes: np.ndarray             # Item ids as integers shared across encoded collections
+    words: sparse.csr_matrix         # Binary bag-of-words of title and description words
+    tags: sparse.csr_matrix          # Tag one-hot
+    semantic: np.ndarray             # Binary SEMANTIC_WORDS indicators
+    word_counts: np.ndarray
+    tag_counts: np.ndarray
+    semantic_norms: np.ndarray
+    content_lengths: np.ndarray
+    raw_tag_counts: np.ndarray
+    word_sets: List[Set[str]]
+    tag_sets: List[Set[str]]
+    url_domains: List[str]
+
+class SimilarityMatrixEngine:
+    """
+    Batch similarity between item collections. Each item is encoded once; the
+    components of SimilarityAnalysis are then computed for blocks of source items
+    against blocks of target items with sparse matrix products instead of
+    comparing feature dictionaries pair by pair.
+    """
+    
+    def __init__(self, tokenize: Callable[[str], List[str]], extract_domain: Callable[[str], str],
+                 text_weights: Dict[str, float], block_rows: int = 100,
+                 max_block_elements: int = 1000000):
+        """Initialize the engine with the discovery engine's text processing"""
+        self.tokenize = tokenize
+        self.extract_domain = extract_domain
+        self.title_weight = text_weights.get('title_weight', 0.4)
+        self.desc_weight = text_weights.get('description_weight', 0.4)
+        self.tags_weight = text_weights.get('tags_weight', 0.2)
+        self.block_rows = max(1, block_rows)
+        self.max_block_elements = max(1, max_block_elements)
+    
+    def encode(self, *collections: List[Dict[str, Any]]) -> List[EncodedItems]:
+        """Encode item collections over shared word, tag and id vocabularies"""
+        vocabularies = {'ids': {}, 'words': {}, 'tags': {}}
+        semantic_index = {word: i for i, word in enumerate(SEMANTIC_WORDS)}
+        
+        tokenized = []
+        for items in collections:
+            word_sets, tag_sets, semantic_hits, id_codes = [], [], [], []
+            for item in items:
+                title_words = self.tokenize(item.get('name', ''))
+                description_words = self.tokenize(item.get('description', ''))
+                word_sets.append(set(title_words).union(description_words))
+                tag_sets.append({tag.lower() for tag in item.get('tags', [])})
+                semantic_hits.append({semantic_index[w] for w in title_words + description_words
+                                      if w in semantic_index})
+                id_codes.append(vocabularies['ids'].setdefault(item.get('id', 'unknown'),
+                                                               len(vocabularies['ids'])))
+                for word in word_sets[-1]:
+                    vocabularies['words'].setdefault(word, len(vocabularies['words']))
+                for tag in tag_sets[-1]:
+                    vocabularies['tags'].setdefault(tag, len(vocabularies['tags']))
+            tokenized.append((items, word_sets, tag_sets, semantic_hits, id_codes))
+        
+        encoded = []
+        for items, word_sets, tag_sets, semantic_hits, id_codes in tokenized:
+            words = self._one_hot(word_sets, vocabularies['words'])
+            tags = self._one_hot(tag_sets, vocabularies['tags'])
+            semantic = np.zeros((len(items), len(SEMANTIC_WORDS)))
+            for i, hits in enumerate(semantic_hits):
+                semantic[i, list(hits)] = 1.0
+            
+            encoded.append(EncodedItems(
+                id_codes=np.array(id_codes, dtype=np.int64),
+                words=words,
+                tags=tags,
+                semantic=semantic,
+                word_counts=np.asarray(words.sum(axis=1), dtype=float).ravel(),
+                tag_counts=np.asarray(tags.sum(axis=1), dtype=float).ravel(),
+                semantic_norms=np.sqrt(semantic.sum(axis=1)),
+                content_lengths=np.array([len(item.get('description', '')) for item in items], dtype=np.int64),
+                raw_tag_counts=np.array([len(item.get('tags', [])) for item in items], dtype=np.int64),
+                word_sets=word_sets,
+                tag_sets=tag_sets,
+                url_domains=[self.extract_domain(item.get('url', '')) for item in items]
+            ))
+        
+        return encoded
+    
+    def _one_hot(self, value_sets: List[Set[str]], vocabulary: Dict[str, int]) -> sparse.csr_matrix:
+        """Binary item x vocabulary matrix"""
+        indptr = np.zeros(len(value_sets) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(values) for values in value_sets])
+        indices = np.fromiter((vocabulary[v] for values in value_sets for v in values),
+                              dtype=np.int64, count=indptr[-1])
+        return sparse.csr_matrix((np.ones(len(indices)), indices, indptr),
+                                 shape=(len(value_sets), len(vocabulary)))
+    
+    def similarity_blocks(self, source: EncodedItems, target: EncodedItems,
+                          target_indices: np.ndarray) -> Iterator[Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]]:
+        """
+        Yield (source rows, target rows, components) for every block of the
+        source x target_indices similarity matrix, where components maps each
+        SimilarityAnalysis score field to a rows x targets array
+        """
+        source_count = len(source.id_codes)
+        block_rows = min(self.block_rows, max(source_count, 1))
+        block_cols = max(1, self.max_block_elements // block_rows)
+        
+        # Slice and transpose each target block once for all source blocks
+        target_blocks = []
+        for start in range(0, len(target_indices), block_cols):
+            cols = target_indices[start:start + block_cols]
+            target_blocks.append((cols, target.words[cols].T.tocsc(), target.tags[cols].T.tocsc()))
+        
+        for start in range(0, source_count, block_rows):
+            rows = np.arange(start, min(start + block_rows, source_count))
+            source_words = source.words[rows]
+            source_tags = source.tags[rows]
+            
+            for cols, target_words, target_tags in target_blocks:
+                yield rows, cols, self._block_components(
+                    source, rows, source_words, source_tags, target, cols, target_words, target_tags
+                )
+    
+    def _block_components(self, source: EncodedItems, rows: np.ndarray,
+                          source_words: sparse.csr_matrix, source_tags: sparse.csr_matrix,
+                          target: EncodedItems, cols: np.ndarray,
+                          target_words: sparse.csc_matrix, target_tags: sparse.csc_matrix) -> Dict[str, np.ndarray]:
+        """
+        Similarity components for one block; structural similarity does not
+        affect strength and is left to structural_similarity for the selected pairs
+        """
+        return self.components(
+            source.semantic[rows] @ target.semantic[cols].T,
+            source.semantic_norms[rows], target.semantic_norms[cols],
+            (source_tags @ target_tags).toarray(), source.tag_counts[rows], target.tag_counts[cols],
+            (source_words @ target_words).toarray(), source.word_counts[rows], target.word_counts[cols]
+        )
+    
+    def components(self, semantic_dots: np.ndarray, source_norms: np.ndarray, target_norms: np.ndarray,
+                   tag_intersections: np.ndarray, source_tag_counts: np.ndarray, target_tag_counts: np.ndarray,
+                   word_intersections: np.ndarray, source_word_counts: np.ndarray,
+                   target_word_counts: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        SimilarityAnalysis score fields of a rows x targets block, from semantic
+        vector dot products and norms and from tag and word set intersection
+        counts and set sizes. Both the block path and _calculate_similarity (as a
+        1 x 1 block) score pairs here.
+        """
+        # Semantic similarity: cosine of the semantic vectors
+        norms = np.outer(source_norms, target_norms)
+        semantic_sim = np.divide(semantic_dots, norms, out=np.zeros(norms.shape), where=norms > 0)
+        
+        # Tag overlap and content similarity: Jaccard from intersection counts
+        tag_overlap = self._jaccard(tag_intersections, source_tag_counts, target_tag_counts)
+        content_sim = self._jaccard(word_intersections, source_word_counts, target_word_counts)
+        
+        return {
+            'semantic_similarity': semantic_sim,
+            'tag_overlap_score': tag_overlap,
+            'content_similarity': content_sim,
+            'overall_similarity': (semantic_sim * self.title_weight +
+                                   content_sim * self.desc_weight +
+                                   tag_overlap * self.tags_weight)
+        }
+    
+    def _jaccard(self, intersections: np.ndarray, source_counts: np.ndarray,
+                 target_counts: np.ndarray) -> np.ndarray:
+        """Jaccard similarity from set intersection counts and set sizes"""
+        unions = source_counts[:, None] + target_counts[None, :] - intersections
+        return intersections / np.maximum(unions, 1)
+    
+    def structural_similarity(self, source: EncodedItems, row: int,
+                              target: EncodedItems, col: int) -> float:
+        """Content length and tag count similarity of one item pair"""
+        return self.size_similarity(
+            int(source.content_lengths[row]), int(target.content_lengths[col]),
+            int(source.raw_tag_counts[row]), int(target.raw_tag_counts[col])
+        )
+    
+    @staticmethod
+    def size_similarity(source_length: int, target_length: int,
+                        source_tag_count: int, target_tag_count: int) -> float:
+        """Structural similarity from content lengths and tag counts"""
+        len_diff = abs(source_length - target_length)
+        max_len = max(source_length, target_length, 1)
+        len_sim = 1.0 - (len_diff / max_len)
+        
+        tag_count_diff = abs(source_tag_count - target_tag_count)
+        max_tags = max(source_tag_count, target_tag_count, 1)
+        tag_count_sim = 1.0 - (tag_count_diff / max_tags)
+        
+        return (len_sim + tag_count_sim) / 2
+    
+    def shared_elements(self, source: EncodedItems, row: int,
+                        target: EncodedItems, col: int) -> Dict[str, List[str]]:
+        """Shared tags, words and URL domain of one item pair"""
+        return self.shared_sets(source.tag_sets[row], target.tag_sets[col],
+                                source.word_sets[row], target.word_sets[col],
+                                source.url_domains[row], target.url_domains[col])
+    
+    @staticmethod
+    def shared_sets(source_tags: Set[str], target_tags: Set[str],
+                    source_words: Set[str], target_words: Set[str],
+                    source_domain: str, target_domain: str) -> Dict[str, List[str]]:
+        """Shared tags, words and URL domain from each item's sets"""
+        return {
+            'tags': list(source_tags.intersection(target_tags)),
+            'words': list(source_words.intersection(target_words)),
+            'url_domain': [source_domain] if (
+                source_domain and source_domain == target_domain
+            ) else []
+        }
+
 class IntelligentRelationshipDiscovery:
     """
     AI-powered relationship discovery engine with cross-database intelligence
@@ -69,6 +294,7 @@ class IntelligentRelationshipDiscovery:
         self.relationship_types = self._build_relationship_types()
         self.cross_db_rules = self._build_cross_database_rules()
         self.similarity_algorithms = self._initialize_similarity_algorithms()
+        self.similarity_engine = self._initialize_similarity_engine()
         
         # Relationship storage and caching
         self.discovered_relationships = {}
@@ -346,6 +572,17 @@ class IntelligentRelationshipDiscovery:
         """Initialize similarity analysis algorithms"""
         return self.config.get('semantic_similarity', {})
     
+    def _initialize_similarity_engine(self) -> SimilarityMatrixEngine:
+        """Initialize the batch similarity engine used for database pair analysis"""
+        batch_config = self.config.get('performance_optimization', {}).get('batch_processing', {})
+        return SimilarityMatrixEngine(
+            self._tokenize_text,
+            self._extract_url_domain,
+            self.similarity_algorithms.get('text_analysis', {}),
+            block_rows=batch_config.get('batch_size', 100),
+            max_block_elements=batch_config.get('max_block_elements', 1000000)
+        )
+    
     def _extract_item_features(self, item_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract features from item data for relationship analysis"""
         features = {
@@ -375,7 +612,7 @@ class IntelligentRelationshipDiscovery:
         
         # Convert to lowercase and extract words
         text = text.lower()
-        words = re.findall(r'\\b\\w{3,}\\b', text)  # Words with 3+ characters
+        words = re.findall(r'\b\w{3,}\b', text)  # Words with 3+ characters
         
         # Basic stopword removal
         stopwords = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
@@ -401,25 +638,10 @@ class IntelligentRelationshipDiscovery:
         # In practice, you might use word embeddings or other NLP techniques
         
         text_content = f"{item_data.get('name', '')} {item_data.get('description', '')}"
-        words = self._tokenize_text(text_content)
-        
-        # Create a simple bag-of-words vector (first 50 dimensions)
-        common_words = ['ai', 'data', 'web', 'development', 'business', 'tool', 'service', 
-                       'platform', 'software', 'app', 'api', 'database', 'cloud', 
-                       'analytics', 'automation', 'integration', 'framework', 'library',
-                       'productivity', 'collaboration', 'management', 'optimization',
-                       'security', 'design', 'mobile', 'enterprise', 'startup',
-                       'marketing', 'sales', 'customer', 'finance', 'insurance',
-                       'maritime', 'fintech', 'saas', 'marketplace', 'ecommerce',
-                       'education', 'health', 'legal', 'real', 'estate', 'property',
-                       'machine', 'learning', 'javascript', 'python', 'react',
-                       'node', 'vue', 'angular', 'docker', 'kubernetes']
-        
-        vector = []
-        for word in common_words[:50]:  # Limit to 50 dimensions
-            vector.append(1.0 if word in words else 0.0)
-        
-        return vector
+        words = set(self._tokenize_text(text_content))
+        
+        # Create a simple bag-of-words vector over SEMANTIC_WORDS
+        return [1.0 if word in words else 0.0 for word in SEMANTIC_WORDS]
     
     def _determine_target_database(self, target_item: Dict[str, Any], 
                                  target_databases: List[str]) -> Optional[str]:
@@ -499,82 +721,37 @@ class IntelligentRelationshipDiscovery:
     
     def _calculate_similarity(self, source_features: Dict[str, Any], 
                             target_features: Dict[str, Any]) -> SimilarityAnalysis:
-        """Calculate comprehensive similarity between two items"""
+        """Calculate comprehensive similarity between two items, as a 1 x 1 similarity block"""
+        engine = self.similarity_engine
         
-        # Semantic similarity (using simple cosine similarity of vectors)
-        semantic_sim = self._cosine_similarity(
-            source_features['semantic_vector'], 
-            target_features['semantic_vector']
-        )
+        source_vector = np.array(source_features['semantic_vector'], dtype=float)
+        target_vector = np.array(target_features['semantic_vector'], dtype=float)
         
-        # Tag overlap similarity
         source_tags = set(source_features['tags'])
         target_tags = set(target_features['tags'])
-        tag_overlap = len(source_tags.intersection(target_tags)) / max(len(source_tags.union(target_tags)), 1)
-        
-        # Content similarity (Jaccard similarity of words)
         source_words = source_features['title_words'].union(source_features['description_words'])
         target_words = target_features['title_words'].union(target_features['description_words'])
-        content_sim = len(source_words.intersection(target_words)) / max(len(source_words.union(target_words)), 1)
-        
-        # Structural similarity (based on content length, tag count, etc.)
-        len_diff = abs(source_features['content_length'] - target_features['content_length'])
-        max_len = max(source_features['content_length'], target_features['content_length'], 1)
-        len_sim = 1.0 - (len_diff / max_len)
         
-        tag_count_diff = abs(source_features['tag_count'] - target_features['tag_count'])
-        max_tags = max(source_features['tag_count'], target_features['tag_count'], 1)
-        tag_count_sim = 1.0 - (tag_count_diff / max_tags)
-        
-        structural_sim = (len_sim + tag_count_sim) / 2
-        
-        # Overall similarity (weighted combination)
-        weights = self.similarity_algorithms.get('text_analysis', {})
-        title_weight = weights.get('title_weight', 0.4)
-        desc_weight = weights.get('description_weight', 0.4)
-        tags_weight = weights.get('tags_weight', 0.2)
-        
-        overall_sim = (semantic_sim * title_weight + 
-                      content_sim * desc_weight + 
-                      tag_overlap * tags_weight)
-        
-        # Identify shared elements
-        shared_elements = {
-            'tags': list(source_tags.intersection(target_tags)),
-            'words': list(source_words.intersection(target_words)),
-            'url_domain': [source_features['url_domain']] if (
-                source_features['url_domain'] and 
-                source_features['url_domain'] == target_features['url_domain']
-            ) else []
-        }
+        components = engine.components(
+            np.array([[source_vector @ target_vector]]),
+            np.sqrt([source_vector @ source_vector]), np.sqrt([target_vector @ target_vector]),
+            np.array([[len(source_tags & target_tags)]]), np.array([len(source_tags)]), np.array([len(target_tags)]),
+            np.array([[len(source_words & target_words)]]), np.array([len(source_words)]), np.array([len(target_words)])
+        )
         
         return SimilarityAnalysis(
-            semantic_similarity=semantic_sim,
-            tag_overlap_score=tag_overlap,
-            content_similarity=content_sim,
-            structural_similarity=structural_sim,
-            overall_similarity=overall_sim,
-            shared_elements=shared_elements
+            semantic_similarity=float(components['semantic_similarity'][0, 0]),
+            tag_overlap_score=float(components['tag_overlap_score'][0, 0]),
+            content_similarity=float(components['content_similarity'][0, 0]),
+            structural_similarity=engine.size_similarity(
+                source_features['content_length'], target_features['content_length'],
+                source_features['tag_count'], target_features['tag_count']
+            ),
+            overall_similarity=float(components['overall_similarity'][0, 0]),
+            shared_elements=engine.shared_sets(source_tags, target_tags, source_words, target_words,
+                                               source_features['url_domain'], target_features['url_domain'])
         )
     
-    def _cosine_similarity(self, vector1: List[float], vector2: List[float]) -> float:
-        """Calculate cosine similarity between two vectors"""
-        if not vector1 or not vector2 or len(vector1) != len(vector2):
-            return 0.0
-        
-        # Calculate dot product
-        dot_product = sum(a * b for a, b in zip(vector1, vector2))
-        
-        # Calculate magnitudes
-        magnitude1 = math.sqrt(sum(a * a for a in vector1))
-        magnitude2 = math.sqrt(sum(b * b for b in vector2))
-        
-        # Avoid division by zero
-        if magnitude1 == 0 or magnitude2 == 0:
-            return 0.0
-        
-        return dot_product / (magnitude1 * magnitude2)
-    
     def _get_applicable_relationship_types(self, source_db: str, target_db: str) -> List[str]:
         """Get applicable relationship types for database pair"""
         pair_key = f"{source_db}_to_{target_db}"
@@ -593,29 +770,8 @@ class IntelligentRelationshipDiscovery:
                                        rel_type: str, source_features: Dict[str, Any],
                                        target_features: Dict[str, Any]) -> float:
         """Calculate relationship strength score for specific type"""
-        base_score = 0.0
-        
-        if rel_type == 'semantic_similarity':
-            base_score = similarity.overall_similarity
-        elif rel_type == 'tag_overlap':
-            base_score = similarity.tag_overlap_score
-        elif rel_type == 'complementary':
-            # Items are complementary if they're related but not too similar
-            base_score = similarity.overall_similarity * (1.0 - similarity.overall_similarity) * 2
-        elif rel_type == 'alternative':
-            # Items are alternatives if they're very similar
-            base_score = similarity.overall_similarity if similarity.overall_similarity > 0.8 else 0.0
-        elif rel_type == 'dependency':
-            # Simplified dependency detection based on content patterns
-            base_score = similarity.content_similarity * 0.8
-        else:
-            base_score = similarity.overall_similarity
-        
-        # Apply relationship type weight
-        rel_config = self.relationship_types.get(rel_type, {})
-        weight = rel_config.get('weight', 1.0)
-        
-        return min(base_score * weight, 1.0)
+        components = {name: getattr(similarity, name) for name in SIMILARITY_SCORES}
+        return float(self._calculate_relationship_strength_matrix(components, rel_type))
     
     def _calculate_confidence_level(self, strength_score: float, 
                                   similarity: SimilarityAnalysis, 
@@ -685,24 +841,178 @@ class IntelligentRelationshipDiscovery:
     
     def _analyze_database_pair_relationships(self, source_items: List[Dict[str, Any]], source_db: str,
                                            target_items: List[Dict[str, Any]], target_db: str) -> List[RelationshipResult]:
-        """Analyze relationships between two database collections"""
-        pair_relationships = []
-        
-        # Sample items if collections are too large (for performance)
-        max_items_per_db = 100
-        if len(source_items) > max_items_per_db:
-            source_items = source_items[:max_items_per_db]
-        if len(target_items) > max_items_per_db:
-            target_items = target_items[:max_items_per_db]
-        
-        # Analyze each source item against target items
-        for source_item in source_items:
-            relationships = self.discover_relationships(
-                source_item, source_db, target_items, [target_db]
+        """
+        Analyze relationships between two database collections
+        
+        Both collections are encoded once and compared in blocks of the full
+        similarity matrix; only the top maximum_relationships_per_item candidates
+        of each source item are turned into RelationshipResult objects.
+        """
+        start_time = time.time()
+        
+        validation_rules = self.config.get('validation_rules', {})
+        min_strength = validation_rules.get('minimum_relationship_strength', 0.6)
+        max_per_item = validation_rules.get('maximum_relationships_per_item', 20)
+        
+        try:
+            source, target = self.similarity_engine.encode(source_items, target_items)
+            
+            # Group target items by the database they resolve to
+            target_groups = defaultdict(list)
+            for index, target_item in enumerate(target_items):
+                item_db = self._determine_target_database(target_item, [target_db])
+                if item_db and self._is_cross_database_analysis_applicable(source_db, item_db):
+                    target_groups[item_db].append(index)
+            
+            # (target database, relationship type) of each candidate type code
+            type_keys = []
+            candidate_blocks = []
+            comparisons = 0
+            
+            for group_db, indices in target_groups.items():
+                rel_types = self._get_applicable_relationship_types(source_db, group_db)
+                first_code = len(type_keys)
+                type_keys.extend((group_db, rel_type) for rel_type in rel_types)
+                
+                for rows, cols, components in self.similarity_engine.similarity_blocks(
+                        source, target, np.array(indices, dtype=np.int64)):
+                    # Skip self-comparison
+                    if group_db == source_db:
+                        valid = source.id_codes[rows][:, None] != target.id_codes[cols][None, :]
+                    else:
+                        valid = np.ones((len(rows), len(cols)), dtype=bool)
+                    comparisons += int(valid.sum())
+                    
+                    block = defaultdict(list)
+                    for offset, rel_type in enumerate(rel_types):
+                        strength = self._calculate_relationship_strength_matrix(components, rel_type)
+                        threshold = max(self.relationship_types.get(rel_type, {}).get('threshold', 0.7), min_strength)
+                        row_hits, col_hits = np.nonzero(valid & (strength >= threshold))
+                        
+                        block['source_index'].append(rows[row_hits])
+                        block['target_index'].append(cols[col_hits])
+                        block['type_code'].append(np.full(len(row_hits), first_code + offset))
+                        block['strength'].append(strength[row_hits, col_hits])
+                        for name, values in components.items():
+                            block[name].append(values[row_hits, col_hits])
+                    
+                    # Keep the block small: an item's overall top-k is within its per-block top-k
+                    block = {name: np.concatenate(parts) for name, parts in block.items()}
+                    candidate_blocks.append(self._select_top_candidates(block, max_per_item))
+            
+            self.discovery_metrics['total_comparisons'] += comparisons
+            if not candidate_blocks:
+                return []
+            
+            candidates = self._select_top_candidates(
+                {name: np.concatenate([block[name] for block in candidate_blocks]) for name in candidate_blocks[0]},
+                max_per_item
+            )
+            pair_relationships = self._build_candidate_relationships(
+                candidates, source_items, source, source_db, target_items, target, type_keys
+            )
+            
+            # Store in discovery cache
+            source_groups = defaultdict(list)
+            for rel in pair_relationships:
+                source_groups[f"{rel.source_database}:{rel.source_item_id}"].append(rel)
+            self.discovered_relationships.update(source_groups)
+            
+            processing_time = (time.time() - start_time) * 1000
+            self.discovery_metrics['relationships_discovered'] += len(pair_relationships)
+            self.discovery_metrics['processing_time_total'] += processing_time
+            
+            logger.debug(f"Discovered {len(pair_relationships)} relationships for {source_db} <-> {target_db} "
+                        f"({comparisons} comparisons, {processing_time:.1f}ms)")
+            
+            return pair_relationships
+            
+        except Exception as e:
+            logger.error(f"Error analyzing relationships for {source_db} <-> {target_db}: {e}")
+            return []
+    
+    def _calculate_relationship_strength_matrix(self, components: Dict[str, np.ndarray],
+                                                rel_type: str) -> np.ndarray:
+        """Relationship strength of one type over a block (or a single pair) of similarity components"""
+        overall = components['overall_similarity']
+        
+        if rel_type == 'semantic_similarity':
+            base_score = overall
+        elif rel_type == 'tag_overlap':
+            base_score = components['tag_overlap_score']
+        elif rel_type == 'complementary':
+            # Items are complementary if they're related but not too similar
+            base_score = overall * (1.0 - overall) * 2
+        elif rel_type == 'alternative':
+            # Items are alternatives if they're very similar
+            base_score = np.where(overall > 0.8, overall, 0.0)
+        elif rel_type == 'dependency':
+            # Simplified dependency detection based on content patterns
+            base_score = components['content_similarity'] * 0.8
+        else:
+            base_score = overall
+        
+        # Apply relationship type weight
+        weight = self.relationship_types.get(rel_type, {}).get('weight', 1.0)
+        return np.minimum(base_score * weight, 1.0)
+    
+    def _select_top_candidates(self, candidates: Dict[str, np.ndarray], k: int) -> Dict[str, np.ndarray]:
+        """
+        Keep the k strongest candidates of each source item, ordered by source item
+        then strength; ties keep target order, then relationship type order
+        """
+        if len(candidates['strength']) == 0:
+            return candidates
+        
+        order = np.lexsort((candidates['type_code'], candidates['target_index'],
+                            -candidates['strength'], candidates['source_index']))
+        sources = candidates['source_index'][order]
+        
+        # Rank of each candidate within its source item's run
+        run_starts = np.flatnonzero(np.r_[True, sources[1:] != sources[:-1]])
+        run_lengths = np.diff(np.r_[run_starts, len(sources)])
+        ranks = np.arange(len(sources)) - np.repeat(run_starts, run_lengths)
+        
+        keep = order[ranks < k]
+        return {name: values[keep] for name, values in candidates.items()}
+    
+    def _build_candidate_relationships(self, candidates: Dict[str, np.ndarray],
+                                       source_items: List[Dict[str, Any]], source: EncodedItems, source_db: str,
+                                       target_items: List[Dict[str, Any]], target: EncodedItems,
+                                       type_keys: List[Tuple[str, str]]) -> List[RelationshipResult]:
+        """Create RelationshipResult objects for selected similarity matrix candidates"""
+        relationships = []
+        
+        for i in range(len(candidates['strength'])):
+            row = int(candidates['source_index'][i])
+            col = int(candidates['target_index'][i])
+            target_db, rel_type = type_keys[candidates['type_code'][i]]
+            strength_score = float(candidates['strength'][i])
+            
+            similarity_analysis = SimilarityAnalysis(
+                semantic_similarity=float(candidates['semantic_similarity'][i]),
+                tag_overlap_score=float(candidates['tag_overlap_score'][i]),
+                content_similarity=float(candidates['content_similarity'][i]),
+                structural_similarity=self.similarity_engine.structural_similarity(source, row, target, col),
+                overall_similarity=float(candidates['overall_similarity'][i]),
+                shared_elements=self.similarity_engine.shared_elements(source, row, target, col)
             )
-            pair_relationships.extend(relationships)
+            
+            relationships.append(RelationshipResult(
+                source_item_id=source_items[row].get('id', 'unknown'),
+                source_database=source_db,
+                target_item_id=target_items[col].get('id', 'unknown'),
+                target_database=target_db,
+                relationship_type=rel_type,
+                strength_score=strength_score,
+                confidence_level=self._calculate_confidence_level(strength_score, similarity_analysis, rel_type),
+                discovery_reason=self._generate_discovery_reason(similarity_analysis, rel_type, strength_score),
+                bidirectional=self.relationship_types.get(rel_type, {}).get('bidirectional', True),
+                validation_passed=True,
+                created_timestamp=datetime.now().isoformat()
+            ))
         
-        return pair_relationships
+        return relationships
     
     def _generate_comprehensive_analysis(self, all_relationships: List[RelationshipResult],
                                        database_items: Dict[str, List[Dict[str, Any]]],
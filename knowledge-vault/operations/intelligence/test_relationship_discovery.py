@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Relationship Discovery Parity Tests
+Checks that batch database pair analysis finds exactly the relationships of
+the per-item discover_relationships path
+"""
+
+import random
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from relationship_discovery import IntelligentRelationshipDiscovery, SEMANTIC_WORDS
+
+VOCABULARY = SEMANTIC_WORDS + [f"word{i}" for i in range(40)]
+TAGS = [f"Tag{i}" for i in range(15)]
+URLS = ['', 'https://www.a.com/x', 'https://b.org', 'http://c.io/y']
+
+
+def make_item(rng: random.Random, item_id: str, base: dict = None) -> dict:
+    """Random item, or a near copy of base so that strong relationships exist"""
+    if base and rng.random() < 0.5:
+        item = dict(base, id=item_id)
+        if rng.random() < 0.5:
+            item['tags'] = base['tags'][:-1] or ['x']
+        return item
+    return {
+        'id': item_id,
+        'name': ' '.join(rng.sample(VOCABULARY, 2)),
+        'description': ' '.join(rng.choices(VOCABULARY, k=rng.randint(0, 6))),
+        'tags': rng.sample(TAGS, rng.randint(0, 4)),
+        'url': rng.choice(URLS)
+    }
+
+
+def make_engine(threshold: float) -> IntelligentRelationshipDiscovery:
+    """Engine with every relationship type in play and small blocks"""
+    engine = IntelligentRelationshipDiscovery()
+    engine.cross_db_rules['notes_ideas_to_notes_ideas'] = {
+        'relationship_types': ['semantic_similarity', 'tag_overlap', 'alternative']
+    }
+    engine.cross_db_rules['notes_ideas_to_business_ideas'] = {
+        'relationship_types': ['tag_overlap', 'complementary', 'dependency']
+    }
+    for rel_config in engine.relationship_types.values():
+        rel_config['threshold'] = min(rel_config.get('threshold', 0.7), threshold)
+    engine.config.setdefault('validation_rules', {})['minimum_relationship_strength'] = threshold
+    engine.similarity_engine.block_rows = 16
+    engine.similarity_engine.max_block_elements = 997  # Several source and target blocks
+    return engine
+
+
+def relationship_key(relationship) -> tuple:
+    return (relationship.source_item_id, relationship.source_database,
+            relationship.target_item_id, relationship.target_database,
+            relationship.relationship_type, relationship.strength_score,
+            relationship.confidence_level, relationship.bidirectional,
+            sorted(re.split(r'[:;,] ', relationship.discovery_reason)))  # Shared tags come from sets
+
+
+def check_parity(seed: int, threshold: float, count: int = 80):
+    rng = random.Random(seed)
+    source_items = [make_item(rng, f"s{i}") for i in range(count)]
+    target_items = [make_item(rng, f"t{i}", rng.choice(source_items)) for i in range(count)]
+    for item in target_items[::7]:
+        item['database_id'] = 'tools_services'
+    for item in target_items[::13]:
+        item['id'] = rng.choice(source_items)['id']  # Self-comparisons must be skipped
+        item['database_id'] = 'notes_ideas'
+    
+    for source_db in ('knowledge_vault', 'notes_ideas'):
+        per_item = make_engine(threshold)
+        expected = []
+        for source_item in source_items:
+            expected.extend(per_item.discover_relationships(source_item, source_db, target_items, ['business_ideas']))
+        
+        batch = make_engine(threshold)
+        found = batch._analyze_database_pair_relationships(source_items, source_db, target_items, 'business_ideas')
+        
+        assert expected, "Fixture should produce relationships"
+        assert [relationship_key(r) for r in found] == [relationship_key(r) for r in expected]
+        assert batch.discovery_metrics['total_comparisons'] == per_item.discovery_metrics['total_comparisons']
+
+
+def test_batch_matches_per_item_discovery():
+    """Default thresholds: strong semantic and tag relationships only"""
+    check_parity(seed=5, threshold=0.6)
+
+
+def test_batch_matches_per_item_for_every_relationship_type():
+    """Low thresholds exercise complementary, alternative and dependency scores"""
+    check_parity(seed=6, threshold=0.2)
+
+
+def test_single_pair_uses_block_components():
+    """The scalar similarity equals the 1 x 1 block of the batch engine"""
+    engine = make_engine(0.6)
+    rng = random.Random(7)
+    items = [make_item(rng, f"i{i}") for i in range(12)]
+    source, target = engine.similarity_engine.encode(items, items)
+    
+    for rows, cols, components in engine.similarity_engine.similarity_blocks(source, target, np.arange(len(items))):
+        for r, row in enumerate(rows):
+            for c, col in enumerate(cols):
+                analysis = engine._calculate_similarity(engine._extract_item_features(items[row]),
+                                                        engine._extract_item_features(items[col]))
+                for name, values in components.items():
+                    assert getattr(analysis, name) == values[r, c]
+                assert analysis.structural_similarity == engine.similarity_engine.structural_similarity(source, row, target, col)
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
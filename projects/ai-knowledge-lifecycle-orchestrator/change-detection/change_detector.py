@@ -20,9 +20,9 @@ import re
 import semver
 from pathlib import Path
 
-from .config_manager import ConfigManager
-from .mcp_integrator import MCPIntegrator
-from .storage_interface import StorageInterface
+from config_manager import ConfigManager
+from mcp_integrator import MCPIntegrator
+from storage_interface import StorageInterface
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
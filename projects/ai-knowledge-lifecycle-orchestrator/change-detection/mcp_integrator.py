@@ -85,37 +85,97 @@ class MCPResponse:
     response_time: float = 0.0
     server_used: Optional[MCPServerType] = None
     from_cache: bool = False
+    stale: bool = False
 
 
 class RateLimiter:
-    """Rate limiter for MCP server requests"""
+    """
+    Token bucket rate limiter for MCP server requests
+    
+    The bucket holds up to max_requests tokens and refills continuously at
+    max_requests / time_window tokens per second, so bookkeeping is O(1) per
+    call. acquire() waits for a token instead of failing; waiters queue on a
+    lock and are served in arrival order.
+    """
     
     def __init__(self, max_requests: int, time_window: int):
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests = []
+        self.rate = max_requests / time_window
+        self.tokens = float(max_requests)
+        self.updated_at = time.monotonic()
+        self.waiting = 0
+        self._lock = asyncio.Lock()
+        self.reset_statistics()
+    
+    def reset_statistics(self):
+        """Reset queue-wait statistics"""
+        self.stats = {
+            'acquired': 0,
+            'waited': 0,
+            'timeouts': 0,
+            'total_wait_time': 0.0,
+            'max_wait_time': 0.0
+        }
     
-    async def acquire(self) -> bool:
-        """Acquire rate limit token"""
-        current_time = time.time()
-        
-        # Clean old requests
-        self.requests = [req_time for req_time in self.requests 
-                        if current_time - req_time < self.time_window]
+    def _refill(self):
+        """Add the tokens accrued since the last refill"""
+        now = time.monotonic()
+        self.tokens = min(float(self.max_requests), self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+    
+    async def _take_token(self):
+        """Wait in line for the next token"""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    async def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire rate limit token
         
-        if len(self.requests) >= self.max_requests:
+        Args:
+            timeout: Maximum seconds to wait, None to wait indefinitely
+            
+        Returns:
+            True once a token is taken, False if the timeout expired first
+        """
+        start_time = time.monotonic()
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._take_token(), timeout)
+        except asyncio.TimeoutError:
+            self.stats['timeouts'] += 1
             return False
-        
-        self.requests.append(current_time)
+        finally:
+            self.waiting -= 1
+        
+        wait_time = time.monotonic() - start_time
+        self.stats['acquired'] += 1
+        if wait_time > 0.001:
+            self.stats['waited'] += 1
+            self.stats['total_wait_time'] += wait_time
+            self.stats['max_wait_time'] = max(self.stats['max_wait_time'], wait_time)
         return True
     
     def get_wait_time(self) -> float:
         """Get time to wait before next request is allowed"""
-        if len(self.requests) < self.max_requests:
-            return 0.0
-        
-        oldest_request = min(self.requests)
-        return max(0.0, self.time_window - (time.time() - oldest_request))
+        self._refill()
+        return max(0.0, (self.waiting + 1 - self.tokens) / self.rate)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Token and queue-wait statistics"""
+        self._refill()
+        return {
+            **self.stats,
+            'average_wait_time': self.stats['total_wait_time'] / self.stats['waited'] if self.stats['waited'] else 0.0,
+            'available_tokens': self.tokens,
+            'queue_depth': self.waiting
+        }
 
 
 class CircuitBreaker:
@@ -192,12 +252,20 @@ class MCPIntegrator:
             'failed_requests': 0,
             'average_response_time': 0.0,
             'cache_hits': 0,
-            'fallback_uses': 0
+            'fallback_uses': 0,
+            'coalesced_requests': 0,
+            'stale_hits': 0,
+            'background_refreshes': 0
         }
         
         # Response cache
         self.response_cache = {}
         self.cache_ttl = 300  # 5 minutes default
+        self.stale_ttl = 300  # Expired responses served this much longer while refreshing
+        
+        # Upstream calls in flight, shared by identical concurrent requests
+        self.in_flight: Dict[str, asyncio.Task] = {}
+        self.rate_limit_timeout = 10.0  # Longest wait for a rate limit token
         
         self._initialize_server_configs()
         logger.info("MCP Integrator initialized successfully")
@@ -417,6 +485,46 @@ class MCPIntegrator:
         return fallback_map.get(primary_server, [])
     
     async def _execute_request_with_fallback(self, request: MCPRequest) -> MCPResponse:
+        """
+        Execute MCP request, sharing upstream calls between identical requests
+        
+        Fresh cached responses are returned directly. Expired responses within
+        stale_ttl are returned as stale while one background call refreshes
+        them. Otherwise concurrent requests with the same cache key await a
+        single upstream call.
+        """
+        cache_key = self._get_cache_key(request.server_type, request)
+        
+        cached_response = self._get_cached_response(cache_key)
+        if cached_response:
+            self.performance_stats['cache_hits'] += 1
+            return cached_response
+        
+        stale_response = self._get_stale_response(cache_key)
+        if stale_response:
+            self.performance_stats['stale_hits'] += 1
+            if cache_key not in self.in_flight:
+                self.performance_stats['background_refreshes'] += 1
+                self._start_request(cache_key, request)
+            return stale_response
+        
+        task = self.in_flight.get(cache_key)
+        if task is not None:
+            self.performance_stats['coalesced_requests'] += 1
+        else:
+            task = self._start_request(cache_key, request)
+        
+        # Shield so one cancelled caller does not cancel the shared call
+        return await asyncio.shield(task)
+    
+    def _start_request(self, cache_key: str, request: MCPRequest) -> asyncio.Task:
+        """Start the upstream call for cache_key and track it until done"""
+        task = asyncio.ensure_future(self._execute_servers(request))
+        self.in_flight[cache_key] = task
+        task.add_done_callback(lambda _: self.in_flight.pop(cache_key, None))
+        return task
+    
+    async def _execute_servers(self, request: MCPRequest) -> MCPResponse:
         """Execute MCP request with fallback mechanism"""
         servers_to_try = [request.server_type]
         if request.fallback_servers:
@@ -431,21 +539,20 @@ class MCPIntegrator:
                     logger.warning(f"Circuit breaker open for {server_type.value}")
                     continue
                 
-                # Check rate limiting
-                if not await self.rate_limiters[server_type].acquire():
-                    wait_time = self.rate_limiters[server_type].get_wait_time()
-                    if wait_time > 0:
-                        logger.info(f"Rate limited for {server_type.value}, waiting {wait_time:.1f}s")
-                        await asyncio.sleep(min(wait_time, 10))  # Cap wait time
-                        continue
-                
-                # Check cache first
+                # Check cache first, so fallback cache hits spend no rate limit token
                 cache_key = self._get_cache_key(server_type, request)
                 cached_response = self._get_cached_response(cache_key)
                 if cached_response:
                     self.performance_stats['cache_hits'] += 1
                     return cached_response
                 
+                # Wait for a rate limit token, falling back if it takes too long
+                timeout = min(request.timeout, self.rate_limit_timeout)
+                if not await self.rate_limiters[server_type].acquire(timeout=timeout):
+                    logger.info(f"Rate limited for {server_type.value}, no token within {timeout:.1f}s")
+                    last_error = "Rate limit wait timed out"
+                    continue
+                
                 # Execute request
                 response = await self._execute_single_request(server_type, request)
                 
@@ -641,15 +748,33 @@ class MCPIntegrator:
             return None
         
         cached_data, cached_at = self.response_cache[cache_key]
+        age = (datetime.utcnow() - cached_at).total_seconds()
         
         # Check if cache is still valid
-        if (datetime.utcnow() - cached_at).total_seconds() < self.cache_ttl:
+        if age < self.cache_ttl:
             response = MCPResponse(**cached_data)
             response.from_cache = True
             return response
         
-        # Remove stale cache entry
-        del self.response_cache[cache_key]
+        # Keep expired entries for stale-while-revalidate, drop older ones
+        if age >= self.cache_ttl + self.stale_ttl:
+            del self.response_cache[cache_key]
+        return None
+    
+    def _get_stale_response(self, cache_key: str) -> Optional[MCPResponse]:
+        """Get an expired cached response still within the stale window"""
+        if cache_key not in self.response_cache:
+            return None
+        
+        cached_data, cached_at = self.response_cache[cache_key]
+        age = (datetime.utcnow() - cached_at).total_seconds()
+        
+        if self.cache_ttl <= age < self.cache_ttl + self.stale_ttl:
+            response = MCPResponse(**cached_data)
+            response.from_cache = True
+            response.stale = True
+            return response
+        
         return None
     
     def _cache_response(self, cache_key: str, response: MCPResponse):
@@ -729,10 +854,22 @@ class MCPIntegrator:
         """Get current performance statistics"""
         stats = self.performance_stats.copy()
         stats['cache_size'] = len(self.response_cache)
+        stats['in_flight_requests'] = len(self.in_flight)
         stats['success_rate'] = (
             stats['successful_requests'] / stats['total_requests']
             if stats['total_requests'] > 0 else 0.0
         )
+        
+        # Rate limit queue waits, per server and in total
+        limiter_stats = {
+            server_type.value: limiter.get_statistics()
+            for server_type, limiter in self.rate_limiters.items()
+        }
+        stats['rate_limiters'] = limiter_stats
+        stats['rate_limit_waits'] = sum(entry['waited'] for entry in limiter_stats.values())
+        stats['rate_limit_timeouts'] = sum(entry['timeouts'] for entry in limiter_stats.values())
+        stats['rate_limit_wait_time'] = sum(entry['total_wait_time'] for entry in limiter_stats.values())
+        stats['rate_limit_queue_depth'] = sum(entry['queue_depth'] for entry in limiter_stats.values())
         return stats
     
     async def reset_performance_stats(self):
@@ -743,8 +880,13 @@ class MCPIntegrator:
             'failed_requests': 0,
             'average_response_time': 0.0,
             'cache_hits': 0,
-            'fallback_uses': 0
+            'fallback_uses': 0,
+            'coalesced_requests': 0,
+            'stale_hits': 0,
+            'background_refreshes': 0
         }
+        for limiter in self.rate_limiters.values():
+            limiter.reset_statistics()
         logger.info("MCP Integrator performance statistics reset")
     
     async def clear_cache(self):
@@ -21,10 +21,10 @@ import schedule
 import threading
 from concurrent.futures import ThreadPoolExecutor
 
-from .config_manager import ConfigManager
-from .mcp_integrator import MCPIntegrator
-from .storage_interface import StorageInterface
-from .change_detector import ChangeDetectionEngine, ChangeValidator, TechnologyChange
+from config_manager import ConfigManager
+from mcp_integrator import MCPIntegrator
+from storage_interface import StorageInterface
+from change_detector import ChangeDetectionEngine, ChangeValidator, TechnologyChange
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -459,11 +459,11 @@ class ChangeDetectionOrchestrator:
                     change.confidence_score = adjusted_confidence
                     validated_changes.append(change)
             
-            # Store validated changes
-            for change in validated_changes:
-                success = await self.storage.store_change(change)
+            # Store validated changes in one transaction
+            if validated_changes:
+                success = await self.storage.store_changes(validated_changes)
                 if not success:
-                    logger.error(f"Failed to store change for {tech_name}")
+                    logger.error(f"Failed to store changes for {tech_name}")
             
             # Update monitoring status
             await self.storage.update_monitoring_status(
@@ -743,46 +743,29 @@ class ChangeDetectionOrchestrator:
                 current_time = datetime.utcnow()
                 
                 # Orchestrator metrics
-                await self.storage.store_performance_metric(
-                    "orchestrator_total_detections",
-                    float(self.orchestration_stats['total_detections'])
-                )
-                
-                await self.storage.store_performance_metric(
-                    "orchestrator_success_rate",
-                    (self.orchestration_stats['successful_detections'] / 
-                     max(1, self.orchestration_stats['total_detections']))
-                )
-                
-                await self.storage.store_performance_metric(
-                    "orchestrator_average_detection_time",
-                    self.orchestration_stats['average_detection_time']
-                )
-                
-                await self.storage.store_performance_metric(
-                    "orchestrator_active_tasks",
-                    float(len(self.active_tasks))
-                )
-                
-                await self.storage.store_performance_metric(
-                    "orchestrator_pending_tasks",
-                    float(self.task_queue.qsize())
-                )
+                metrics = [
+                    ("orchestrator_total_detections",
+                     float(self.orchestration_stats['total_detections']), None),
+                    ("orchestrator_success_rate",
+                     (self.orchestration_stats['successful_detections'] / 
+                      max(1, self.orchestration_stats['total_detections'])), None),
+                    ("orchestrator_average_detection_time",
+                     self.orchestration_stats['average_detection_time'], None),
+                    ("orchestrator_active_tasks", float(len(self.active_tasks)), None),
+                    ("orchestrator_pending_tasks", float(self.task_queue.qsize()), None)
+                ]
                 
                 # Component metrics
                 mcp_stats = await self.mcp_integrator.get_performance_stats()
                 for metric_name, value in mcp_stats.items():
                     if isinstance(value, (int, float)):
-                        await self.storage.store_performance_metric(
-                            f"mcp_{metric_name}",
-                            float(value)
-                        )
+                        metrics.append((f"mcp_{metric_name}", float(value), None))
                 
                 storage_stats = await self.storage.get_storage_stats()
-                await self.storage.store_performance_metric(
-                    "storage_cache_hit_rate",
-                    storage_stats.cache_hit_rate
-                )
+                metrics.append(("storage_cache_hit_rate", storage_stats.cache_hit_rate, None))
+                
+                # One transaction per monitoring cycle
+                await self.storage.store_performance_metrics(metrics)
                 
                 # Wait for next monitoring cycle
                 await asyncio.sleep(300)  # 5 minutes
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Storage Benchmark
+AI Knowledge Lifecycle Orchestrator - Change detection storage microbenchmarks
+
+Measures MemoryCache set/get throughput at a given number of entries and
+estimates the per-set cost of the previous implementation, which re-pickled
+every cached value and rebuilt a Python list on each set.
+
+Also measures SQLiteStorage changes stored per second: the previous
+connect-per-statement path with a read-modify-write of monitoring statistics,
+store_change on persistent connections, and store_changes_batch.
+
+Usage:
+    python storage_benchmark.py --entries 100000 --changes 2000
+"""
+
+import argparse
+import asyncio
+import pickle
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from storage_interface import MemoryCache, SQLiteStorage
+
+
+def make_value(i: int) -> dict:
+    """Cached value shaped like monitoring status"""
+    return {
+        'technology_name': f"technology-{i}",
+        'total_checks': i,
+        'health_status': 'healthy',
+        'last_checked_at': '2024-05-01T12:00:00',
+        'current_version': f"{i % 20}.{i % 7}.0"
+    }
+
+
+def bench_cache(entries: int) -> MemoryCache:
+    """Fill a cache and time set, get and get_stats"""
+    cache = MemoryCache(max_size_mb=1024, default_ttl_seconds=3600)
+    values = [make_value(i) for i in range(entries)]
+
+    start = time.perf_counter()
+    for i, value in enumerate(values):
+        cache.set(f"monitoring_status:{i}", value)
+    set_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(entries):
+        cache.get(f"monitoring_status:{i}")
+    get_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    stats = cache.get_stats()
+    stats_ms = (time.perf_counter() - start) * 1000
+
+    print(f"set:       {entries / set_seconds:12,.0f} ops/sec ({set_seconds * 1e6 / entries:.1f} µs/op)")
+    print(f"get:       {entries / get_seconds:12,.0f} ops/sec ({get_seconds * 1e6 / entries:.1f} µs/op)")
+    print(f"get_stats: {stats_ms:12.2f} ms ({stats['entries']:,} entries, {stats['size_mb']:.1f} MB)")
+    return cache
+
+
+def estimate_previous_set(cache: MemoryCache) -> float:
+    """Seconds per set at this size for the pickle-everything + list LRU approach"""
+    access_order = list(cache.cache.keys())
+    start = time.perf_counter()
+    sum(len(pickle.dumps(entry.data)) for entry in cache.cache.values())
+    access_order.remove(access_order[-1])
+    return time.perf_counter() - start
+
+
+def make_change(i: int) -> SimpleNamespace:
+    """Object with the TechnologyChange fields SQLiteStorage reads"""
+    return SimpleNamespace(
+        technology_name=f"technology-{i % 20}",
+        change_type=SimpleNamespace(value='bug_fix'),
+        old_version='1.0.0',
+        new_version=f"1.0.{i}",
+        source_url='https://example.com/releases',
+        detection_timestamp=datetime.utcnow(),
+        impact_level=SimpleNamespace(value='low'),
+        urgency_level=SimpleNamespace(value='low'),
+        confidence_score=0.9,
+        change_description=f"Patch release {i}",
+        evidence=['release notes'],
+        affected_files=None
+    )
+
+
+def previous_store_change(storage: SQLiteStorage, change: SimpleNamespace):
+    """Connect per statement and read, then rewrite, monitoring statistics"""
+    with sqlite3.connect(storage.db_path) as conn:
+        conn.execute(storage.CHANGE_SQL, storage._change_params(change))
+    with sqlite3.connect(storage.db_path) as conn:
+        row = conn.execute(
+            "SELECT total_changes FROM monitoring_status WHERE technology_name = ?",
+            (change.technology_name,)
+        ).fetchone()
+    with sqlite3.connect(storage.db_path) as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO monitoring_status (technology_name, total_changes, last_change_detected_at) "
+            "VALUES (?, ?, ?)",
+            (change.technology_name, (row[0] if row else 0) + 1, datetime.utcnow().isoformat())
+        )
+
+
+async def bench_changes(count: int):
+    """Changes stored per second through each write path"""
+    changes = [make_change(i) for i in range(count)]
+    loop = asyncio.get_running_loop()
+
+    async def previous(storage):
+        for change in changes:
+            await loop.run_in_executor(storage.executor, previous_store_change, storage, change)
+
+    async def persistent(storage):
+        for change in changes:
+            await storage.store_change(change)
+            await storage.increment_change_count(change.technology_name)
+
+    async def batched(storage):
+        await storage.store_changes_batch(changes)
+
+    for label, run in (("connect per statement", previous),
+                       ("persistent connection", persistent),
+                       ("batched transaction", batched)):
+        storage = SQLiteStorage(Path(tempfile.mkdtemp()) / "changes.db")
+        start = time.perf_counter()
+        await run(storage)
+        seconds = time.perf_counter() - start
+        await storage.close()
+        print(f"{label + ':':23}{count / seconds:12,.0f} changes/sec")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Change detection storage benchmark")
+    parser.add_argument("--entries", type=int, default=100000,
+                        help="Cache entries")
+    parser.add_argument("--changes", type=int, default=2000,
+                        help="Changes stored per SQLite write path")
+    args = parser.parse_args()
+
+    print(f"📊 MemoryCache with {args.entries:,} entries")
+    print("=" * 60)
+
+    cache = bench_cache(args.entries)
+    previous = estimate_previous_set(cache)
+    print(f"\n🐢 Previous set at this size: ~{previous * 1000:.0f} ms/op (extrapolated)")
+
+    print(f"\n📊 SQLiteStorage storing {args.changes:,} changes")
+    print("=" * 60)
+    asyncio.run(bench_changes(args.changes))
+
+
+if __name__ == "__main__":
+    main()
@@ -12,10 +12,12 @@ import json
 import logging
 import asyncio
 import hashlib
+import heapq
 import pickle
 from pathlib import Path
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple, Set
+from typing import Dict, List, Optional, Any, Tuple, Set, Iterable
 from dataclasses import dataclass, asdict
 from enum import Enum
 import aiosqlite
@@ -43,6 +45,8 @@ class CacheEntry:
     expires_at: datetime
     access_count: int = 0
     last_accessed: datetime = None
+    size_bytes: int = 0
+    tags: Tuple[str, ...] = ()
     
     def is_expired(self) -> bool:
         """Check if cache entry is expired"""
@@ -66,6 +70,7 @@ class StorageStats:
     total_writes: int = 0
     cache_hits: int = 0
     cache_misses: int = 0
+    cache_evictions: int = 0
     total_storage_size_bytes: int = 0
     cache_size_bytes: int = 0
     average_read_time_ms: float = 0.0
@@ -79,46 +84,73 @@ class StorageStats:
 
 
 class MemoryCache:
-    """High-performance in-memory cache with LRU eviction"""
+    """
+    High-performance in-memory cache with LRU eviction
+    
+    Entry sizes are estimated once when an entry is stored and kept in a
+    running total, entries are kept in LRU order in an OrderedDict, and
+    expiry times sit in a min-heap, so every operation is O(1) or O(log n)
+    rather than a scan of the whole cache. Entries may carry tags (such as
+    "technology:react"); a tag -> keys index lets invalidate_tags remove
+    every entry with given tags in time proportional to the entries removed.
+    """
     
     def __init__(self, max_size_mb: int = 100, default_ttl_seconds: int = 300):
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.default_ttl = default_ttl_seconds
-        self.cache: Dict[str, CacheEntry] = {}
-        self.access_order: List[str] = []  # For LRU tracking
+        self.cache: "OrderedDict[str, CacheEntry]" = OrderedDict()  # LRU order, oldest first
+        self.expiry_heap: List[Tuple[datetime, str]] = []  # May hold superseded entries
+        self.current_size_bytes = 0
+        self.tag_index: Dict[str, Set[str]] = {}
         self.lock = threading.RLock()
         
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        
         logger.info(f"Memory cache initialized: {max_size_mb}MB max, {default_ttl_seconds}s TTL")
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
         with self.lock:
-            if key not in self.cache:
+            entry = self.cache.get(key)
+            if entry is None:
+                self.misses += 1
                 return None
             
-            entry = self.cache[key]
-            
             # Check expiration
             if entry.is_expired():
                 self._remove_entry(key)
+                self.expirations += 1
+                self.misses += 1
                 return None
             
             # Update access info
             entry.touch()
-            self._update_access_order(key)
+            self.cache.move_to_end(key)
+            self.hits += 1
             
             return entry.data
     
-    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> bool:
-        """Set value in cache"""
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None,
+            tags: Optional[Iterable[str]] = None) -> bool:
+        """Set value in cache, optionally tagged for group invalidation"""
         with self.lock:
             ttl = ttl_seconds or self.default_ttl
-            expires_at = datetime.utcnow() + timedelta(seconds=ttl)
+            now = datetime.utcnow()
+            expires_at = now + timedelta(seconds=ttl)
             
-            # Estimate size
+            # Estimate size once; it is reused until the entry is removed
             estimated_size = self._estimate_size(value)
             
-            # Check if we need to evict entries
+            # Replacing a key frees its old size first
+            self._remove_entry(key)
+            
+            # Check if we need to evict entries, expired ones first
+            if self._should_evict(estimated_size):
+                self._purge_expired(now)
             while self._should_evict(estimated_size):
                 if not self._evict_lru():
                     logger.warning("Could not evict entries to make space")
@@ -128,13 +160,19 @@ class MemoryCache:
             entry = CacheEntry(
                 key=key,
                 data=value,
-                created_at=datetime.utcnow(),
-                expires_at=expires_at
+                created_at=now,
+                expires_at=expires_at,
+                size_bytes=estimated_size,
+                tags=tuple(tags) if tags else ()
             )
             
             # Store entry
             self.cache[key] = entry
-            self._update_access_order(key)
+            self.current_size_bytes += estimated_size
+            for tag in entry.tags:
+                self.tag_index.setdefault(tag, set()).add(key)
+            heapq.heappush(self.expiry_heap, (expires_at, key))
+            self._compact_expiry_heap()
             
             return True
     
@@ -146,29 +184,52 @@ class MemoryCache:
                 return True
             return False
     
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        Remove every entry carrying all of the given tags
+        
+        Returns:
+            Number of entries removed
+        """
+        with self.lock:
+            tag_sets = [self.tag_index.get(tag) for tag in tags]
+            if not tag_sets or any(not keys for keys in tag_sets):
+                return 0
+            
+            # Start from the smallest set so the cost follows the entries affected
+            tag_sets.sort(key=len)
+            keys = set(tag_sets[0]).intersection(*tag_sets[1:])
+            for key in keys:
+                self._remove_entry(key)
+            return len(keys)
+    
+    def delete_matching(self, pattern: str) -> int:
+        """Remove entries whose key contains pattern (full scan; prefer invalidate_tags)"""
+        with self.lock:
+            keys = [key for key in self.cache if pattern in key]
+            for key in keys:
+                self._remove_entry(key)
+            return len(keys)
+    
     def clear(self):
         """Clear all cache entries"""
         with self.lock:
             self.cache.clear()
-            self.access_order.clear()
+            self.expiry_heap.clear()
+            self.tag_index.clear()
+            self.current_size_bytes = 0
     
     def cleanup_expired(self) -> int:
         """Remove expired entries and return count removed"""
         with self.lock:
-            expired_keys = [
-                key for key, entry in self.cache.items()
-                if entry.is_expired()
-            ]
-            
-            for key in expired_keys:
-                self._remove_entry(key)
-            
-            return len(expired_keys)
+            return self._purge_expired(datetime.utcnow())
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get cache statistics"""
+        """Get cache statistics (expired entries are removed and counted)"""
         with self.lock:
-            total_size = sum(self._estimate_size(entry.data) for entry in self.cache.values())
+            expired_entries = self._purge_expired(datetime.utcnow())
+            total_size = self.current_size_bytes
+            total_requests = self.hits + self.misses
             
             return {
                 'entries': len(self.cache),
@@ -176,7 +237,12 @@ class MemoryCache:
                 'size_mb': total_size / (1024 * 1024),
                 'max_size_mb': self.max_size_bytes / (1024 * 1024),
                 'utilization': total_size / self.max_size_bytes,
-                'expired_entries': sum(1 for entry in self.cache.values() if entry.is_expired())
+                'expired_entries': expired_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total_requests if total_requests > 0 else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations
             }
     
     def _estimate_size(self, value: Any) -> int:
@@ -194,39 +260,112 @@ class MemoryCache:
     
     def _should_evict(self, new_entry_size: int) -> bool:
         """Check if we need to evict entries"""
-        current_size = sum(self._estimate_size(entry.data) for entry in self.cache.values())
-        return (current_size + new_entry_size) > self.max_size_bytes
+        return (self.current_size_bytes + new_entry_size) > self.max_size_bytes
     
     def _evict_lru(self) -> bool:
         """Evict least recently used entry"""
-        if not self.access_order:
+        if not self.cache:
             return False
         
-        lru_key = self.access_order[0]
+        lru_key = next(iter(self.cache))
         self._remove_entry(lru_key)
+        self.evictions += 1
         return True
     
+    def _purge_expired(self, now: datetime) -> int:
+        """Pop expired entries off the expiry heap"""
+        removed = 0
+        while self.expiry_heap and self.expiry_heap[0][0] < now:
+            expires_at, key = heapq.heappop(self.expiry_heap)
+            entry = self.cache.get(key)
+            # Skip heap items left behind by replaced or deleted entries
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove_entry(key)
+                removed += 1
+        self.expirations += removed
+        return removed
+    
+    def _compact_expiry_heap(self):
+        """Drop superseded heap items once they outnumber live entries"""
+        if len(self.expiry_heap) > 2 * len(self.cache) + 64:
+            self.expiry_heap = [(entry.expires_at, key) for key, entry in self.cache.items()]
+            heapq.heapify(self.expiry_heap)
+    
     def _remove_entry(self, key: str):
-        """Remove entry from cache and access order"""
-        if key in self.cache:
-            del self.cache[key]
-        if key in self.access_order:
-            self.access_order.remove(key)
-    
-    def _update_access_order(self, key: str):
-        """Update access order for LRU tracking"""
-        if key in self.access_order:
-            self.access_order.remove(key)
-        self.access_order.append(key)
+        """Remove entry from cache, size total and tag index"""
+        entry = self.cache.pop(key, None)
+        if entry is None:
+            return
+        self.current_size_bytes -= entry.size_bytes
+        for tag in entry.tags:
+            keys = self.tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tag_index[tag]
 
 
 class SQLiteStorage:
-    """SQLite-based persistent storage"""
+    """
+    SQLite-based persistent storage
+    
+    Statements run on a small thread pool; each worker thread opens one
+    connection on first use and keeps it for the lifetime of the storage,
+    instead of connecting per statement.
+    """
+    
+    SOURCE_DATA_SQL = """
+    INSERT OR REPLACE INTO source_data 
+    (technology_name, source_name, url, content_hash, content, retrieved_at, source_type, extraction_metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    CHANGE_SQL = """
+    INSERT INTO change_history 
+    (technology_name, change_type, old_version, new_version, source_url, 
+     detection_timestamp, impact_level, urgency_level, confidence_score,
+     change_description, evidence, affected_files)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    PERFORMANCE_METRIC_SQL = """
+    INSERT INTO performance_metrics (metric_name, metric_value, measurement_timestamp, additional_data)
+    VALUES (?, ?, ?, ?)
+    """
+    
+    # Single-statement read-modify-write of monitoring statistics
+    CHANGE_COUNT_SQL = """
+    INSERT INTO monitoring_status (technology_name, total_changes, last_change_detected_at, updated_at)
+    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(technology_name) DO UPDATE SET
+        total_changes = total_changes + excluded.total_changes,
+        last_change_detected_at = excluded.last_change_detected_at,
+        updated_at = CURRENT_TIMESTAMP
+    """
+    
+    MONITORING_CHECK_SQL = """
+    INSERT INTO monitoring_status
+    (technology_name, last_checked_at, last_change_detected_at, total_checks, total_changes,
+     health_status, error_count, last_error, updated_at)
+    VALUES (?, ?, ?, 1, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(technology_name) DO UPDATE SET
+        last_checked_at = excluded.last_checked_at,
+        last_change_detected_at = COALESCE(excluded.last_change_detected_at, last_change_detected_at),
+        total_checks = total_checks + 1,
+        total_changes = total_changes + excluded.total_changes,
+        health_status = excluded.health_status,
+        error_count = error_count + excluded.error_count,
+        last_error = COALESCE(excluded.last_error, last_error),
+        updated_at = CURRENT_TIMESTAMP
+    """
     
     def __init__(self, db_path: Path, enable_wal: bool = True):
         self.db_path = db_path
         self.enable_wal = enable_wal
         self.executor = ThreadPoolExecutor(max_workers=4)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         
         # Ensure directory exists
         db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -316,22 +455,8 @@ class SQLiteStorage:
                                source_data: 'SourceData') -> bool:
         """Store source data"""
         try:
-            sql = """
-            INSERT OR REPLACE INTO source_data 
-            (technology_name, source_name, url, content_hash, content, retrieved_at, source_type, extraction_metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            
-            params = (
-                technology_name,
-                source_name,
-                source_data.url,
-                source_data.content_hash,
-                source_data.content,
-                source_data.retrieved_at.isoformat(),
-                source_data.source_type,
-                json.dumps(source_data.extraction_metadata)
-            )
+            sql = self.SOURCE_DATA_SQL
+            params = self._source_data_params(technology_name, source_name, source_data)
             
             loop = asyncio.get_event_loop()
             await loop.run_in_executor(self.executor, self._execute_sql, sql, params)
@@ -342,6 +467,35 @@ class SQLiteStorage:
             logger.error(f"Error storing source data: {e}")
             return False
     
+    async def store_source_data_batch(self, entries: List[Tuple[str, str, 'SourceData']]) -> bool:
+        """Store (technology_name, source_name, source_data) entries in one transaction"""
+        try:
+            params = [self._source_data_params(*entry) for entry in entries]
+            
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                self.executor, self._execute_transaction, [(self.SOURCE_DATA_SQL, params)]
+            )
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error storing source data batch: {e}")
+            return False
+    
+    @staticmethod
+    def _source_data_params(technology_name: str, source_name: str, source_data: 'SourceData') -> Tuple:
+        return (
+            technology_name,
+            source_name,
+            source_data.url,
+            source_data.content_hash,
+            source_data.content,
+            source_data.retrieved_at.isoformat(),
+            source_data.source_type,
+            json.dumps(source_data.extraction_metadata)
+        )
+    
     async def get_source_data(self, technology_name: str, source_name: str) -> Optional['SourceData']:
         """Get latest source data"""
         try:
@@ -381,28 +535,8 @@ class SQLiteStorage:
     async def store_change(self, change: 'TechnologyChange') -> bool:
         """Store detected change"""
         try:
-            sql = """
-            INSERT INTO change_history 
-            (technology_name, change_type, old_version, new_version, source_url, 
-             detection_timestamp, impact_level, urgency_level, confidence_score,
-             change_description, evidence, affected_files)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            
-            params = (
-                change.technology_name,
-                change.change_type.value,
-                change.old_version,
-                change.new_version,
-                change.source_url,
-                change.detection_timestamp.isoformat(),
-                change.impact_level.value,
-                change.urgency_level.value,
-                change.confidence_score,
-                change.change_description,
-                json.dumps(change.evidence),
-                json.dumps(change.affected_files) if change.affected_files else None
-            )
+            sql = self.CHANGE_SQL
+            params = self._change_params(change)
             
             loop = asyncio.get_event_loop()
             await loop.run_in_executor(self.executor, self._execute_sql, sql, params)
@@ -413,6 +547,64 @@ class SQLiteStorage:
             logger.error(f"Error storing change: {e}")
             return False
     
+    async def store_changes_batch(self, changes: List['TechnologyChange']) -> bool:
+        """
+        Store changes and bump each technology's change statistics in one transaction
+        
+        Args:
+            changes: Detected changes, for any number of technologies
+        """
+        if not changes:
+            return True
+        try:
+            detected_at = datetime.utcnow().isoformat()
+            counts: Dict[str, int] = {}
+            for change in changes:
+                counts[change.technology_name] = counts.get(change.technology_name, 0) + 1
+            
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(self.executor, self._execute_transaction, [
+                (self.CHANGE_SQL, [self._change_params(change) for change in changes]),
+                (self.CHANGE_COUNT_SQL, [(name, count, detected_at) for name, count in counts.items()])
+            ])
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error storing change batch: {e}")
+            return False
+    
+    async def increment_change_count(self, technology_name: str, count: int = 1) -> bool:
+        """Add to a technology's total_changes and stamp last_change_detected_at"""
+        try:
+            params = (technology_name, count, datetime.utcnow().isoformat())
+            
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(self.executor, self._execute_sql, self.CHANGE_COUNT_SQL, params)
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error updating change statistics: {e}")
+            return False
+    
+    @staticmethod
+    def _change_params(change: 'TechnologyChange') -> Tuple:
+        return (
+            change.technology_name,
+            change.change_type.value,
+            change.old_version,
+            change.new_version,
+            change.source_url,
+            change.detection_timestamp.isoformat(),
+            change.impact_level.value,
+            change.urgency_level.value,
+            change.confidence_score,
+            change.change_description,
+            json.dumps(change.evidence),
+            json.dumps(change.affected_files) if change.affected_files else None
+        )
+    
     async def get_changes_for_technology(self, technology_name: str, 
                                        limit: int = 100) -> List['TechnologyChange']:
         """Get recent changes for technology"""
@@ -492,6 +684,29 @@ class SQLiteStorage:
             logger.error(f"Error updating monitoring status: {e}")
             return False
     
+    async def record_monitoring_check(self, technology_name: str, checked_at: datetime,
+                                      changes_detected: int = 0, error: Optional[str] = None) -> bool:
+        """Count one monitoring check with a single upsert, without reading the row first"""
+        try:
+            params = (
+                technology_name,
+                checked_at.isoformat(),
+                datetime.utcnow().isoformat() if changes_detected > 0 else None,
+                changes_detected,
+                'error' if error else 'healthy',
+                1 if error else 0,
+                error
+            )
+            
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(self.executor, self._execute_sql, self.MONITORING_CHECK_SQL, params)
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error recording monitoring check: {e}")
+            return False
+    
     async def get_monitoring_status(self, technology_name: str) -> Optional[Dict[str, Any]]:
         """Get monitoring status"""
         try:
@@ -533,11 +748,7 @@ class SQLiteStorage:
                                      additional_data: Dict[str, Any] = None) -> bool:
         """Store performance metric"""
         try:
-            sql = """
-            INSERT INTO performance_metrics (metric_name, metric_value, measurement_timestamp, additional_data)
-            VALUES (?, ?, ?, ?)
-            """
-            
+            sql = self.PERFORMANCE_METRIC_SQL
             params = (
                 metric_name,
                 metric_value,
@@ -554,6 +765,26 @@ class SQLiteStorage:
             logger.error(f"Error storing performance metric: {e}")
             return False
     
+    async def store_performance_metrics_batch(self, metrics: List[Tuple[str, float, Optional[Dict[str, Any]]]]) -> bool:
+        """Store (metric_name, metric_value, additional_data) entries in one transaction"""
+        try:
+            measured_at = datetime.utcnow().isoformat()
+            params = [
+                (name, value, measured_at, json.dumps(additional_data) if additional_data else None)
+                for name, value, additional_data in metrics
+            ]
+            
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                self.executor, self._execute_transaction, [(self.PERFORMANCE_METRIC_SQL, params)]
+            )
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error storing performance metric batch: {e}")
+            return False
+    
     async def get_performance_metrics(self, metric_name: str, 
                                     hours_back: int = 24) -> List[Tuple[datetime, float]]:
         """Get performance metrics"""
@@ -581,34 +812,57 @@ class SQLiteStorage:
             logger.error(f"Error getting performance metrics: {e}")
             return []
     
+    def _connection(self) -> sqlite3.Connection:
+        """Persistent connection of the current executor thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
     def _execute_sql(self, sql: str, params: Tuple = None):
         """Execute SQL in thread executor"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             if params:
                 conn.execute(sql, params)
             else:
                 conn.execute(sql)
-            conn.commit()
+    
+    def _execute_transaction(self, statements: List[Tuple[str, List[Tuple]]]):
+        """Run executemany for each (sql, rows) pair in a single transaction"""
+        with self._connection() as conn:
+            for sql, rows in statements:
+                if rows:
+                    conn.executemany(sql, rows)
     
     def _fetch_one(self, sql: str, params: Tuple = None):
         """Fetch one result in thread executor"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            if params:
-                cursor.execute(sql, params)
-            else:
-                cursor.execute(sql)
-            return cursor.fetchone()
+        cursor = self._connection().cursor()
+        if params:
+            cursor.execute(sql, params)
+        else:
+            cursor.execute(sql)
+        return cursor.fetchone()
     
     def _fetch_all(self, sql: str, params: Tuple = None):
         """Fetch all results in thread executor"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            if params:
-                cursor.execute(sql, params)
-            else:
-                cursor.execute(sql)
-            return cursor.fetchall()
+        cursor = self._connection().cursor()
+        if params:
+            cursor.execute(sql, params)
+        else:
+            cursor.execute(sql)
+        return cursor.fetchall()
+    
+    async def close(self):
+        """Finish queued statements and close every thread's connection"""
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self.executor.shutdown, True)
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
 
 
 class StorageInterface:
@@ -678,7 +932,8 @@ class StorageInterface:
             if success:
                 # Cache the data
                 cache_key = f"source_data:{technology_name}:{source_name}"
-                self.memory_cache.set(cache_key, source_data, ttl_seconds=600)  # 10 minutes
+                self.memory_cache.set(cache_key, source_data, ttl_seconds=600,  # 10 minutes
+                                      tags=self._cache_tags('source_data', technology_name, source_name))
                 
                 # Update stats
                 self.stats.total_writes += 1
@@ -693,7 +948,25 @@ class StorageInterface:
         except Exception as e:
             logger.error(f"Error storing source data: {e}")
             return False
-    
+
+    async def store_source_data_batch(self, entries: List[Tuple[str, str, 'SourceData']]) -> bool:
+        """Store (technology_name, source_name, source_data) entries in one transaction and cache them"""
+        try:
+            success = await self.backend.store_source_data_batch(entries)
+
+            if success:
+                for technology_name, source_name, source_data in entries:
+                    cache_key = f"source_data:{technology_name}:{source_name}"
+                    self.memory_cache.set(cache_key, source_data, ttl_seconds=600,
+                                          tags=self._cache_tags('source_data', technology_name, source_name))
+                self.stats.total_writes += len(entries)
+
+            return success
+
+        except Exception as e:
+            logger.error(f"Error storing source data batch: {e}")
+            return False
+
     async def get_cached_source_data(self, technology_name: str, source_name: str) -> Optional['SourceData']:
         """Get cached source data with fallback to storage"""
         import time
@@ -705,16 +978,15 @@ class StorageInterface:
             cached_data = self.memory_cache.get(cache_key)
             
             if cached_data:
-                self.stats.cache_hits += 1
                 return cached_data
             
             # Cache miss - get from backend
-            self.stats.cache_misses += 1
             source_data = await self.backend.get_source_data(technology_name, source_name)
             
             if source_data:
                 # Cache for future use
-                self.memory_cache.set(cache_key, source_data, ttl_seconds=600)
+                self.memory_cache.set(cache_key, source_data, ttl_seconds=600,
+                                      tags=self._cache_tags('source_data', technology_name, source_name))
             
             # Update stats
             self.stats.total_reads += 1
@@ -737,8 +1009,9 @@ class StorageInterface:
             
             if success:
                 # Invalidate related caches
-                cache_pattern = f"changes:{change.technology_name}"
-                self._invalidate_cache_pattern(cache_pattern)
+                self.memory_cache.invalidate_tags(
+                    self._technology_tag(change.technology_name), self._kind_tag('changes')
+                )
                 
                 # Update monitoring status
                 await self._update_change_statistics(change.technology_name)
@@ -749,6 +1022,24 @@ class StorageInterface:
             logger.error(f"Error storing change: {e}")
             return False
     
+    async def store_changes(self, changes: List['TechnologyChange']) -> bool:
+        """Store detected changes and their statistics in one backend transaction"""
+        try:
+            success = await self.backend.store_changes_batch(changes)
+            
+            if success:
+                for technology_name in {change.technology_name for change in changes}:
+                    self.memory_cache.invalidate_tags(
+                        self._technology_tag(technology_name), self._kind_tag('changes')
+                    )
+                    self.memory_cache.delete(f"monitoring_status:{technology_name}")
+            
+            return success
+            
+        except Exception as e:
+            logger.error(f"Error storing changes: {e}")
+            return False
+    
     async def get_changes_for_technology(self, technology_name: str, 
                                        limit: int = 100) -> List['TechnologyChange']:
         """Get changes for technology with caching"""
@@ -758,16 +1049,15 @@ class StorageInterface:
             cached_changes = self.memory_cache.get(cache_key)
             
             if cached_changes:
-                self.stats.cache_hits += 1
                 return cached_changes
             
             # Get from backend
-            self.stats.cache_misses += 1
             changes = await self.backend.get_changes_for_technology(technology_name, limit)
             
             if changes:
                 # Cache for 5 minutes
-                self.memory_cache.set(cache_key, changes, ttl_seconds=300)
+                self.memory_cache.set(cache_key, changes, ttl_seconds=300,
+                                      tags=self._cache_tags('changes', technology_name))
             
             return changes
             
@@ -781,24 +1071,9 @@ class StorageInterface:
                                      error: str = None) -> bool:
         """Update monitoring status"""
         try:
-            # Get current status
-            current_status = await self.backend.get_monitoring_status(technology_name) or {}
-            
-            # Update fields
-            status_data = {
-                'last_checked_at': (last_checked or datetime.utcnow()).isoformat(),
-                'total_checks': current_status.get('total_checks', 0) + 1,
-                'total_changes': current_status.get('total_changes', 0) + (changes_detected or 0),
-                'current_version': current_status.get('current_version'),
-                'health_status': 'error' if error else 'healthy',
-                'error_count': current_status.get('error_count', 0) + (1 if error else 0),
-                'last_error': error or current_status.get('last_error')
-            }
-            
-            if changes_detected and changes_detected > 0:
-                status_data['last_change_detected_at'] = datetime.utcnow().isoformat()
-            
-            success = await self.backend.update_monitoring_status(technology_name, status_data)
+            success = await self.backend.record_monitoring_check(
+                technology_name, last_checked or datetime.utcnow(), changes_detected or 0, error
+            )
             
             if success:
                 # Invalidate cache
@@ -819,16 +1094,15 @@ class StorageInterface:
             cached_status = self.memory_cache.get(cache_key)
             
             if cached_status:
-                self.stats.cache_hits += 1
                 return cached_status
             
             # Get from backend
-            self.stats.cache_misses += 1
             status = await self.backend.get_monitoring_status(technology_name)
             
             if status:
                 # Cache for 2 minutes
-                self.memory_cache.set(cache_key, status, ttl_seconds=120)
+                self.memory_cache.set(cache_key, status, ttl_seconds=120,
+                                      tags=self._cache_tags('monitoring_status', technology_name))
             
             return status
             
@@ -851,6 +1125,14 @@ class StorageInterface:
             logger.error(f"Error storing performance metric: {e}")
             return False
     
+    async def store_performance_metrics(self, metrics: List[Tuple[str, float, Optional[Dict[str, Any]]]]) -> bool:
+        """Store (metric_name, metric_value, additional_data) entries in one transaction"""
+        try:
+            return await self.backend.store_performance_metrics_batch(metrics)
+        except Exception as e:
+            logger.error(f"Error storing performance metrics: {e}")
+            return False
+    
     async def get_performance_metrics(self, metric_name: str, 
                                     hours_back: int = 24) -> List[Tuple[datetime, float]]:
         """Get performance metrics"""
@@ -879,11 +1161,17 @@ class StorageInterface:
     
     async def get_storage_stats(self) -> StorageStats:
         """Get current storage statistics"""
-        # Update cache size
+        self._sync_cache_stats()
+        return self.stats
+    
+    def _sync_cache_stats(self) -> Dict[str, Any]:
+        """Copy the memory cache's size and hit/miss/eviction counters into stats"""
         cache_stats = self.memory_cache.get_stats()
         self.stats.cache_size_bytes = cache_stats['size_bytes']
-        
-        return self.stats
+        self.stats.cache_hits = cache_stats['hits']
+        self.stats.cache_misses = cache_stats['misses']
+        self.stats.cache_evictions = cache_stats['evictions']
+        return cache_stats
     
     async def health_check(self) -> Dict[str, Any]:
         """Perform storage health check"""
@@ -913,7 +1201,7 @@ class StorageInterface:
             except Exception:
                 storage_healthy = False
             
-            cache_stats = self.memory_cache.get_stats()
+            cache_stats = self._sync_cache_stats()
             
             return {
                 'cache_healthy': cache_healthy,
@@ -933,22 +1221,37 @@ class StorageInterface:
                 'error': str(e)
             }
     
+    def invalidate_technology(self, technology_name: str, kind: Optional[str] = None) -> int:
+        """Invalidate cached entries for a technology, optionally of one kind only"""
+        tags = [self._technology_tag(technology_name)]
+        if kind:
+            tags.append(self._kind_tag(kind))
+        return self.memory_cache.invalidate_tags(*tags)
+    
+    @staticmethod
+    def _technology_tag(technology_name: str) -> str:
+        return f"technology:{technology_name}"
+    
+    @staticmethod
+    def _kind_tag(kind: str) -> str:
+        return f"kind:{kind}"
+    
+    def _cache_tags(self, kind: str, technology_name: str, source_name: Optional[str] = None) -> List[str]:
+        """Tags for a cache entry: its kind, technology and (optionally) source"""
+        tags = [self._kind_tag(kind), self._technology_tag(technology_name)]
+        if source_name:
+            tags.append(f"source:{source_name}")
+        return tags
+    
     def _invalidate_cache_pattern(self, pattern: str):
-        """Invalidate cache entries matching pattern"""
-        # Simple pattern matching for now
-        keys_to_delete = [key for key in self.memory_cache.cache.keys() if pattern in key]
-        for key in keys_to_delete:
-            self.memory_cache.delete(key)
+        """Invalidate cache entries whose key contains pattern (full scan)"""
+        self.memory_cache.delete_matching(pattern)
     
     async def _update_change_statistics(self, technology_name: str):
         """Update change statistics after storing a change"""
         try:
-            current_status = await self.backend.get_monitoring_status(technology_name) or {}
-            status_data = current_status.copy()
-            status_data['total_changes'] = status_data.get('total_changes', 0) + 1
-            status_data['last_change_detected_at'] = datetime.utcnow().isoformat()
-            
-            await self.backend.update_monitoring_status(technology_name, status_data)
+            await self.backend.increment_change_count(technology_name)
+            self.memory_cache.delete(f"monitoring_status:{technology_name}")
         except Exception as e:
             logger.error(f"Error updating change statistics: {e}")
     
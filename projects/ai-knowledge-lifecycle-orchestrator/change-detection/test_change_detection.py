@@ -18,13 +18,17 @@ from typing import Dict, List, Any, Optional
 import sys
 import os
 
+import pytest
+
 # Add current directory to path to import modules
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config_manager import ConfigManager
-from mcp_integrator import MCPIntegrator
-from storage_interface import StorageInterface
-from change_detector import ChangeDetectionEngine, ChangeValidator, TechnologyChange, ChangeType
+from mcp_integrator import MCPIntegrator, MCPResponse, RateLimiter
+from storage_interface import StorageInterface, MemoryCache, SQLiteStorage
+from change_detector import (
+    ChangeDetectionEngine, ChangeValidator, TechnologyChange, ChangeType, ImpactLevel, UrgencyLevel
+)
 from orchestrator import ChangeDetectionOrchestrator, AlertNotification
 
 # Configure logging
@@ -64,7 +68,12 @@ class ChangeDetectionTestSuite:
             # Run component tests
             await self.test_config_manager()
             await self.test_mcp_integrator()
+            await self.test_rate_limiter()
+            await self.test_request_coalescing()
             await self.test_storage_interface()
+            await self.test_memory_cache()
+            await self.test_cache_tag_invalidation()
+            await self.test_sqlite_batched_writes()
             await self.test_change_detector()
             await self.test_change_validator()
             await self.test_orchestrator()
@@ -452,6 +461,89 @@ class ChangeDetectionTestSuite:
         except Exception as e:
             self.record_test_result(test_name, False, f"MCP integrator test failed: {e}")
     
+    async def test_rate_limiter(self):
+        """Test token bucket waiting, fairness and timeouts"""
+        test_name = "Rate Limiter Tests"
+        logger.info(f"Running {test_name}")
+        
+        try:
+            limiter = RateLimiter(max_requests=2, time_window=1)  # 2 tokens, one every 0.5s
+            order = []
+            
+            async def request(index: int):
+                await limiter.acquire()
+                order.append(index)
+            
+            start_time = time.monotonic()
+            await asyncio.gather(*(request(i) for i in range(4)))
+            elapsed = time.monotonic() - start_time
+            
+            self.assert_true(order == [0, 1, 2, 3], "Waiters should be served in arrival order")
+            self.assert_true(0.9 <= elapsed < 1.5, f"Two queued requests should wait for refills, took {elapsed:.2f}s")
+            
+            stats = limiter.get_statistics()
+            self.assert_true(stats['acquired'] == 4 and stats['waited'] == 2, "Queue waits should be counted")
+            self.assert_true(stats['max_wait_time'] >= 0.9, "Longest wait should be recorded")
+            
+            self.assert_true(not await limiter.acquire(timeout=0.05), "Acquire should give up at its timeout")
+            self.assert_true(limiter.get_statistics()['timeouts'] == 1, "Timeouts should be counted")
+            self.assert_true(limiter.get_statistics()['queue_depth'] == 0, "Timed out waiters should leave the queue")
+            
+            perf_stats = await self.components['mcp_integrator'].get_performance_stats()
+            self.assert_true('rate_limit_waits' in perf_stats, "Integrator should report rate limit waits")
+            
+            self.record_test_result(test_name, True, "Rate limiter tests passed")
+            
+        except Exception as e:
+            self.record_test_result(test_name, False, f"Rate limiter test failed: {e}")
+    
+    async def test_request_coalescing(self):
+        """Test single-flight requests and stale-while-revalidate caching"""
+        test_name = "Request Coalescing Tests"
+        logger.info(f"Running {test_name}")
+        
+        mcp_integrator = self.components['mcp_integrator']
+        upstream_calls = []
+        
+        async def slow_request(server_type, request):
+            upstream_calls.append(request.parameters['url'])
+            await asyncio.sleep(0.05)
+            return MCPResponse(success=True, data=f"content {len(upstream_calls)}", server_used=server_type)
+        
+        try:
+            await mcp_integrator.clear_cache()
+            await mcp_integrator.reset_performance_stats()
+            mcp_integrator._execute_single_request = slow_request
+            url = "https://example.com/releases/coalesce"
+            
+            results = await asyncio.gather(*(mcp_integrator.fetch_content(url) for _ in range(5)))
+            self.assert_true(len(upstream_calls) == 1, "Concurrent identical fetches should share one upstream call")
+            self.assert_true(results == ["content 1"] * 5, "Every caller should get the shared result")
+            self.assert_true(not mcp_integrator.in_flight, "Finished calls should leave the in-flight table")
+            
+            # Age the cached response past its TTL but within the stale window
+            cache_key, (cached_data, cached_at) = next(iter(mcp_integrator.response_cache.items()))
+            mcp_integrator.response_cache[cache_key] = (
+                cached_data, cached_at - timedelta(seconds=mcp_integrator.cache_ttl + 1)
+            )
+            self.assert_true(await mcp_integrator.fetch_content(url) == "content 1", "Stale content should be served")
+            self.assert_true(await mcp_integrator.fetch_content(url) == "content 1", "Refresh should not be repeated")
+            await asyncio.gather(*mcp_integrator.in_flight.values())
+            self.assert_true(await mcp_integrator.fetch_content(url) == "content 2", "Background refresh should update the cache")
+            
+            stats = await mcp_integrator.get_performance_stats()
+            self.assert_true(stats['coalesced_requests'] == 4, "Coalesced requests should be counted")
+            self.assert_true(stats['stale_hits'] == 2 and stats['background_refreshes'] == 1, "Stale serving should be counted")
+            self.assert_true(len(upstream_calls) == 2, "Only the refresh should reach upstream again")
+            
+            self.record_test_result(test_name, True, "Request coalescing tests passed")
+            
+        except Exception as e:
+            self.record_test_result(test_name, False, f"Request coalescing test failed: {e}")
+        finally:
+            del mcp_integrator._execute_single_request
+            await mcp_integrator.clear_cache()
+    
     async def test_storage_interface(self):
         """Test storage interface functionality"""
         test_name = "Storage Interface Tests"
@@ -489,6 +581,139 @@ class ChangeDetectionTestSuite:
         except Exception as e:
             self.record_test_result(test_name, False, f"Storage interface test failed: {e}")
     
+    async def test_memory_cache(self):
+        """Test memory cache size accounting, LRU eviction and TTL expiry"""
+        test_name = "Memory Cache Tests"
+        logger.info(f"Running {test_name}")
+        
+        try:
+            cache = MemoryCache(max_size_mb=1, default_ttl_seconds=60)
+            value = "x" * 100_000
+            
+            for i in range(12):
+                cache.set(f"key_{i}", value)
+                if i == 5:
+                    cache.get("key_0")  # key_0 becomes most recently used
+            
+            stats = cache.get_stats()
+            self.assert_true(
+                stats['size_bytes'] == sum(entry.size_bytes for entry in cache.cache.values()),
+                "Running size total should match the stored entry sizes"
+            )
+            self.assert_true(stats['size_bytes'] <= cache.max_size_bytes, "Cache should stay within its size limit")
+            self.assert_not_none(cache.get("key_0"), "Recently used entry should survive eviction")
+            self.assert_true(cache.get("key_1") is None, "Least recently used entry should be evicted")
+            self.assert_true(stats['evictions'] == 12 - stats['entries'], "Evictions should be counted")
+            
+            # Replacing a key does not double count its size
+            size_before = cache.current_size_bytes
+            cache.set("key_11", value)
+            self.assert_true(cache.current_size_bytes == size_before, "Replacing a key should keep the size total")
+            
+            # Expired entries are removed from the expiry heap
+            cache.set("short_lived", "value", ttl_seconds=-1)
+            self.assert_true(cache.cleanup_expired() == 1, "Expired entry should be cleaned up")
+            self.assert_true("short_lived" not in cache.cache, "Expired entry should be gone")
+            
+            stats = cache.get_stats()
+            self.assert_true(stats['hits'] >= 2 and stats['misses'] >= 1, "Hits and misses should be counted")
+            
+            self.record_test_result(test_name, True, f"Memory cache tests passed ({stats['evictions']} evictions)")
+            
+        except Exception as e:
+            self.record_test_result(test_name, False, f"Memory cache test failed: {e}")
+    
+    async def test_cache_tag_invalidation(self):
+        """Test tag-indexed cache invalidation"""
+        test_name = "Cache Tag Invalidation Tests"
+        logger.info(f"Running {test_name}")
+        
+        try:
+            cache = MemoryCache(max_size_mb=10, default_ttl_seconds=60)
+            for technology in ['react', 'react-native', 'vue']:
+                cache.set(f"changes:{technology}:100", [technology], tags=['kind:changes', f'technology:{technology}'])
+                cache.set(f"monitoring_status:{technology}", {}, tags=['kind:monitoring_status', f'technology:{technology}'])
+            
+            removed = cache.invalidate_tags('technology:react', 'kind:changes')
+            self.assert_true(removed == 1, "Only the react changes entry should be invalidated")
+            self.assert_not_none(cache.get("changes:react-native:100"), "Similarly named technology should be untouched")
+            self.assert_not_none(cache.get("monitoring_status:react"), "Other kinds should be untouched")
+            
+            self.assert_true(cache.invalidate_tags('technology:vue') == 2, "All vue entries should be invalidated")
+            self.assert_true('technology:vue' not in cache.tag_index, "Empty tags should leave the index")
+            self.assert_true(cache.invalidate_tags('technology:unknown') == 0, "Unknown tags invalidate nothing")
+            
+            # Overwriting or evicting an entry keeps the index consistent
+            cache.set("monitoring_status:react", {}, tags=['kind:monitoring_status'])
+            self.assert_true(
+                "monitoring_status:react" not in cache.tag_index.get('technology:react', set()),
+                "Replaced entry should drop its old tags"
+            )
+            
+            self.record_test_result(test_name, True, "Cache tag invalidation tests passed")
+            
+        except Exception as e:
+            self.record_test_result(test_name, False, f"Cache tag invalidation test failed: {e}")
+    
+    async def test_sqlite_batched_writes(self):
+        """Test batched change writes and upserted monitoring statistics"""
+        test_name = "SQLite Batched Write Tests"
+        logger.info(f"Running {test_name}")
+        
+        try:
+            storage = SQLiteStorage(Path(tempfile.mkdtemp()) / "batched.db")
+            changes = [
+                TechnologyChange(
+                    technology_name=technology,
+                    change_type=ChangeType.BUG_FIX,
+                    old_version='1.0.0',
+                    new_version='1.0.1',
+                    source_url='https://example.com/releases',
+                    detection_timestamp=datetime.utcnow(),
+                    impact_level=ImpactLevel.LOW,
+                    urgency_level=UrgencyLevel.LOW,
+                    confidence_score=0.9,
+                    change_description='Patch release',
+                    evidence=['release notes']
+                )
+                for technology in ['react', 'react', 'vue']
+            ]
+            
+            self.assert_true(await storage.store_changes_batch(changes), "Should store a change batch")
+            row = storage._fetch_one("SELECT COUNT(*) FROM change_history WHERE technology_name = ?", ('react',))
+            self.assert_true(row[0] == 2, "Batch should insert every change")
+            await storage.increment_change_count('vue')
+            
+            react_status = await storage.get_monitoring_status('react')
+            self.assert_true(react_status['total_changes'] == 2, "Batch should count changes per technology")
+            self.assert_true((await storage.get_monitoring_status('vue'))['total_changes'] == 2, "Upsert should add to totals")
+            
+            await storage.record_monitoring_check('react', datetime.utcnow(), changes_detected=1)
+            await storage.record_monitoring_check('react', datetime.utcnow(), error='timeout')
+            react_status = await storage.get_monitoring_status('react')
+            self.assert_true(react_status['total_checks'] == 2, "Checks should be counted")
+            self.assert_true(react_status['total_changes'] == 3, "Detected changes should add to totals")
+            self.assert_true(
+                react_status['error_count'] == 1 and react_status['last_error'] == 'timeout',
+                "Errors should be counted and kept"
+            )
+            self.assert_true(react_status['last_change_detected_at'] is not None, "Last change time should survive checks")
+            
+            self.assert_true(
+                await storage.store_performance_metrics_batch([('batch_metric', 1.0, None), ('batch_metric', 2.0, {'a': 1})]),
+                "Should store a metric batch"
+            )
+            self.assert_true(len(await storage.get_performance_metrics('batch_metric', hours_back=1)) == 2, "Metric batch should be stored")
+            
+            self.assert_true(len(storage._connections) <= 4, "Connections should be reused per executor thread")
+            await storage.close()
+            self.assert_true(not storage._connections, "Close should release every connection")
+            
+            self.record_test_result(test_name, True, "SQLite batched write tests passed")
+            
+        except Exception as e:
+            self.record_test_result(test_name, False, f"SQLite batched write test failed: {e}")
+    
     async def test_change_detector(self):
         """Test change detection engine functionality"""
         test_name = "Change Detector Tests"
@@ -805,6 +1030,31 @@ class ChangeDetectionTestSuite:
             logger.error(f"Error during cleanup: {e}")
 
 
+SUITE_TESTS = [
+    'test_config_manager', 'test_mcp_integrator', 'test_rate_limiter', 'test_request_coalescing',
+    'test_storage_interface', 'test_memory_cache', 'test_cache_tag_invalidation',
+    'test_sqlite_batched_writes', 'test_change_detector', 'test_change_validator', 'test_orchestrator',
+    'test_end_to_end_workflow', 'test_performance_requirements', 'test_error_handling', 'test_concurrency'
+]
+
+
+@pytest.mark.parametrize("test_method", SUITE_TESTS)
+def test_suite_component(test_method: str):
+    """Run one suite test in a fresh environment under pytest"""
+    async def run() -> List[Dict[str, Any]]:
+        test_suite = ChangeDetectionTestSuite()
+        await test_suite.setup_test_environment()
+        try:
+            await getattr(test_suite, test_method)()
+        finally:
+            await test_suite.cleanup_test_environment()
+        return test_suite.test_results['test_details']
+    
+    details = asyncio.run(run())
+    assert details, f"{test_method} recorded no result"
+    assert all(detail['passed'] for detail in details), details
+
+
 async def main():
     """Main entry point for running the test suite"""
     print("🧪 Change Detection Engine - Integration Test Suite")
@@ -6,7 +6,8 @@ This script scans AI instruction files to automatically detect technology depend
 building a comprehensive registry for automated knowledge lifecycle management.
 
 Usage:
-    python dependency-scanner.py [--config CONFIG_FILE] [--output OUTPUT_FILE] [--debug]
+    python dependency-scanner.py [--config CONFIG_FILE] [--output OUTPUT_FILE] [--debug] [--full-scan]
+                                 [--backend {thread,process}]
 """
 
 import os
@@ -16,7 +17,9 @@ import json
 import hashlib
 import logging
 import argparse
+import threading
 import concurrent.futures
+from bisect import bisect_left
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional, Any
@@ -24,6 +27,11 @@ from dataclasses import dataclass, asdict
 from glob import glob
 import time
 
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -35,6 +43,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Use the libyaml loader when available, registries run to tens of thousands of lines
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Non-ASCII characters IGNORECASE matches to ASCII letters that str.lower() leaves alone
+CASE_FOLD_EXTRAS = (('\u0131', 'i'), ('\u017f', 's'))
+
+
+def literal_prefixes(items) -> Optional[Set[str]]:
+    """
+    Lowercase literal prefixes of a parsed regex, one of which starts every match.
+    
+    Returns None when some match may not start with an ASCII literal, in which case
+    the pattern cannot be anchored on a substring search.
+    """
+    items = list(items)
+    if not items:
+        return None
+        
+    op, av = items[0]
+    if op == sre_parse.BRANCH:
+        prefixes = set()
+        for branch in av[1]:
+            branch_prefixes = literal_prefixes(branch)
+            if branch_prefixes is None:
+                return None
+            prefixes.update(branch_prefixes)
+        return prefixes
+    if op == sre_parse.SUBPATTERN:
+        return literal_prefixes(av[-1])
+        
+    chars = []
+    for op, av in items:
+        if op != sre_parse.LITERAL or av > 127:
+            break
+        chars.append(chr(av))
+    return {''.join(chars).lower()} if chars else None
+
 @dataclass
 class TechnologyReference:
     """Represents a detected technology reference in a file."""
@@ -63,22 +108,30 @@ class FileAnalysis:
     last_scanned: str
     scan_confidence: float
     technologies: List[TechnologyReference]
+    file_size: int = 0
     
 class DependencyScanner:
     """Main scanner class for detecting technology dependencies in AI files."""
     
-    def __init__(self, config_path: str = "dependency-registry/scanner-config.yaml"):
-        """Initialize the scanner with configuration."""
-        self.config = self._load_config(config_path)
+    def __init__(self, config_path: str = "dependency-registry/scanner-config.yaml",
+                 config: Optional[Dict[str, Any]] = None):
+        """Initialize the scanner with configuration, loaded from config_path unless given."""
+        self.config = config if config is not None else self._load_config(config_path)
         self.setup_logging()
         self.technology_patterns = self._compile_patterns()
+        self.detection_config_hash = self._get_detection_config_hash()
+        self.version_regexes = {}
         self.scanned_files = {}
         self.stats = {
             'files_scanned': 0,
+            'files_skipped': 0,
+            'files_rehashed': 0,
             'technologies_detected': 0,
             'high_confidence_detections': 0,
             'processing_time': 0
         }
+        self.stats_lock = threading.Lock()
+        self.scan_backend = self.config['scanner_configuration']['performance_settings'].get('scan_backend', 'thread')
         
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load scanner configuration from YAML file."""
@@ -104,21 +157,33 @@ class DependencyScanner:
         
         for tech_name, tech_config in detection_config.items():
             compiled_patterns = []
+            pattern_prefixes = []
             for pattern in tech_config['patterns']:
                 try:
-                    compiled_patterns.append(re.compile(pattern, re.IGNORECASE | re.MULTILINE))
+                    compiled = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
                 except re.error as e:
                     logger.warning(f"Invalid regex pattern for {tech_name}: {pattern} - {e}")
                     continue
+                compiled_patterns.append(compiled)
+                pattern_prefixes.append(literal_prefixes(sre_parse.parse(pattern, compiled.flags)))
                     
             patterns[tech_name] = {
                 'patterns': compiled_patterns,
+                'prefixes': pattern_prefixes,
                 'context_keywords': tech_config.get('context_keywords', []),
                 'minimum_confidence': tech_config.get('minimum_confidence', 0.7)
             }
             
         return patterns
         
+    def _get_detection_config_hash(self) -> str:
+        """Hash the settings that determine analysis results, so stale registries are rescanned."""
+        detection_settings = {
+            'technology_detection': self.config['scanner_configuration']['technology_detection'],
+            'technology_definitions': self.config.get('technology_definitions', {})
+        }
+        return hashlib.sha256(json.dumps(detection_settings, sort_keys=True).encode('utf-8')).hexdigest()
+        
     def discover_files(self) -> List[str]:
         """Discover AI instruction files to scan based on configuration."""
         discovered_files = []
@@ -219,29 +284,35 @@ class DependencyScanner:
         """Detect version information for a technology in text."""
         version_patterns = self.config['scanner_configuration']['technology_detection']['version_patterns']
         
+        if tech_name not in self.version_regexes:
+            self.version_regexes[tech_name] = tuple(
+                re.compile(rf"\b{re.escape(tech_name)}\b.*?{version_patterns[key]}", re.IGNORECASE)
+                for key in ('semantic_version', 'major_version', 'range_version')
+            )
+        tech_pattern, major_pattern, range_pattern = self.version_regexes[tech_name]
+        
         # Look for semantic version pattern near technology name
-        tech_pattern = re.compile(rf"\b{re.escape(tech_name)}\b.*?{version_patterns['semantic_version']}", re.IGNORECASE)
         match = tech_pattern.search(text)
         if match:
             return match.group(1) + '.' + match.group(2) + '.' + match.group(3)
             
         # Look for major version pattern
-        major_pattern = re.compile(rf"\b{re.escape(tech_name)}\b.*?{version_patterns['major_version']}", re.IGNORECASE)
         match = major_pattern.search(text)
         if match:
             return match.group(1) or match.group(2)
             
         # Look for range version pattern
-        range_pattern = re.compile(rf"\b{re.escape(tech_name)}\b.*?{version_patterns['range_version']}", re.IGNORECASE)
         match = range_pattern.search(text)
         if match:
             return match.group(1)
             
         return None
         
-    def analyze_context(self, text: str, line_num: int, tech_name: str) -> Tuple[List[str], float]:
+    def analyze_context(self, text: str, line_num: int, tech_name: str,
+                        lines: Optional[List[str]] = None) -> Tuple[List[str], float]:
         """Analyze context around a technology reference for usage patterns and confidence."""
-        lines = text.split('\n')
+        if lines is None:
+            lines = text.split('\n')
         context_window = self.config['scanner_configuration']['technology_detection']['context_analysis']['context_window_lines']
         
         # Get context lines
@@ -284,25 +355,70 @@ class DependencyScanner:
             
         return usage_context, confidence_boost
         
+    def find_pattern_matches(self, pattern: re.Pattern, prefixes: Optional[Set[str]],
+                             content: str, lowered: str) -> List[re.Match]:
+        """
+        Return the same matches as pattern.finditer(content), trying the pattern only where it can start.
+        
+        When every match must begin with one of the pattern's literal prefixes, the prefixes are
+        located with substring search in the lowercased content and the pattern is matched at those
+        offsets only, in order, skipping offsets inside the previous match.
+        """
+        if prefixes is None:
+            return list(pattern.finditer(content))
+            
+        starts = []
+        for prefix in prefixes:
+            index = lowered.find(prefix)
+            while index != -1:
+                starts.append(index)
+                index = lowered.find(prefix, index + 1)
+        if not starts:
+            return []
+            
+        # Lowercasing changed some offsets, match the whole content instead
+        if len(lowered) != len(content):
+            return list(pattern.finditer(content))
+            
+        matches = []
+        position = 0
+        for start in sorted(set(starts)):
+            if start < position:
+                continue
+            match = pattern.match(content, start)
+            if match:
+                matches.append(match)
+                position = match.end()
+        return matches
+        
     def detect_technologies(self, content: str, file_path: str) -> List[TechnologyReference]:
         """Detect technology dependencies in file content."""
         detected_technologies = []
         lines = content.split('\n')
+        lowered = content.lower()
+        for char, ascii_char in CASE_FOLD_EXTRAS:
+            lowered = lowered.replace(char, ascii_char)
+        newline_offsets = None
         
         for tech_name, tech_config in self.technology_patterns.items():
             references = []
             total_confidence = 0.0
             pattern_matches = 0
+            context_cache = {}
             
             # Check each pattern for this technology
-            for pattern in tech_config['patterns']:
-                for match in pattern.finditer(content):
+            for pattern, prefixes in zip(tech_config['patterns'], tech_config['prefixes']):
+                for match in self.find_pattern_matches(pattern, prefixes, content, lowered):
                     pattern_matches += 1
-                    line_num = content[:match.start()].count('\n')
+                    if newline_offsets is None:
+                        newline_offsets = [newline.start() for newline in re.finditer('\n', content)]
+                    line_num = bisect_left(newline_offsets, match.start())
                     context_line = lines[line_num] if line_num < len(lines) else ""
                     
-                    # Analyze context around the match
-                    usage_context, confidence_boost = self.analyze_context(content, line_num, tech_name)
+                    # Analyze context around the match, once per line
+                    if line_num not in context_cache:
+                        context_cache[line_num] = self.analyze_context(content, line_num, tech_name, lines)
+                    usage_context, confidence_boost = context_cache[line_num]
                     
                     # Calculate confidence for this reference
                     base_confidence = self.config['scanner_configuration']['technology_detection']['confidence_calculation']['base_confidence']
@@ -344,7 +460,7 @@ class DependencyScanner:
                     # Determine usage context from all references
                     all_usage_contexts = set()
                     for ref in references:
-                        usage_context, _ = self.analyze_context(content, ref['line_number'] - 1, tech_name)
+                        usage_context, _ = context_cache[ref['line_number'] - 1]
                         all_usage_contexts.update(usage_context)
                         
                     tech_ref = TechnologyReference(
@@ -354,7 +470,7 @@ class DependencyScanner:
                         version_constraint=None,  # Will be populated by version detection
                         current_version=tech_def.get('current_stable'),
                         criticality=tech_def.get('criticality_default', 'medium'),
-                        usage_context=list(all_usage_contexts),
+                        usage_context=sorted(all_usage_contexts),
                         references=references
                     )
                     
@@ -392,18 +508,22 @@ class DependencyScanner:
                 last_modified=mod_time.isoformat(),
                 last_scanned=datetime.now(timezone.utc).isoformat(),
                 scan_confidence=scan_confidence,
-                technologies=technologies
+                technologies=technologies,
+                file_size=os.path.getsize(file_path)
             )
             
             # Update statistics
             processing_time = time.time() - start_time
-            self.stats['files_scanned'] += 1
-            self.stats['technologies_detected'] += len(technologies)
-            self.stats['high_confidence_detections'] += sum(1 for tech in technologies if tech.confidence >= 0.9)
-            self.stats['processing_time'] += processing_time
+            with self.stats_lock:
+                self.stats['files_scanned'] += 1
+                self.stats['technologies_detected'] += len(technologies)
+                self.stats['high_confidence_detections'] += sum(1 for tech in technologies if tech.confidence >= 0.9)
+                self.stats['processing_time'] += processing_time
+                files_scanned = self.stats['files_scanned']
+                technologies_detected = self.stats['technologies_detected']
             
-            if self.stats['files_scanned'] % 10 == 0:
-                logger.info(f"Processed {self.stats['files_scanned']} files, found {self.stats['technologies_detected']} technologies")
+            if files_scanned % 10 == 0:
+                logger.info(f"Processed {files_scanned} files, found {technologies_detected} technologies")
                 
             return analysis
             
@@ -413,6 +533,9 @@ class DependencyScanner:
             
     def scan_files(self, file_paths: List[str]) -> Dict[str, FileAnalysis]:
         """Scan multiple files for technology dependencies using concurrent processing."""
+        if self.scan_backend == 'process':
+            return self.scan_files_in_processes(file_paths)
+            
         results = {}
         max_workers = self.config['scanner_configuration']['performance_settings']['max_concurrent_files']
         
@@ -436,31 +559,142 @@ class DependencyScanner:
         logger.info(f"Scan completed. Analyzed {len(results)} files successfully")
         return results
         
-    def generate_registry(self, analyses: Dict[str, FileAnalysis]) -> Dict[str, Any]:
+    def scan_files_in_processes(self, file_paths: List[str]) -> Dict[str, FileAnalysis]:
+        """
+        Scan files in a process pool so regex matching uses every core instead of sharing the GIL.
+        
+        Files are sent in chunks of performance_settings.chunk_size. Each worker compiles the
+        patterns once in its initializer, and results and statistics are merged here.
+        """
+        results = {}
+        performance_settings = self.config['scanner_configuration']['performance_settings']
+        max_workers = min(performance_settings['max_concurrent_files'], os.cpu_count() or 1)
+        chunk_size = max(1, performance_settings.get('chunk_size', 50))
+        chunks = [file_paths[i:i + chunk_size] for i in range(0, len(file_paths), chunk_size)]
+        
+        logger.info(f"Starting scan of {len(file_paths)} files in {len(chunks)} chunks with {max_workers} processes")
+        
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers,
+                                                    initializer=_init_scan_worker,
+                                                    initargs=(self.config,)) as executor:
+            future_to_chunk = {executor.submit(_scan_chunk, chunk): chunk for chunk in chunks}
+            
+            for future in concurrent.futures.as_completed(future_to_chunk):
+                try:
+                    chunk_results, chunk_stats = future.result()
+                except Exception as e:
+                    logger.error(f"Error processing chunk starting at {future_to_chunk[future][0]}: {e}")
+                    continue
+                    
+                results.update(chunk_results)
+                for key, value in chunk_stats.items():
+                    self.stats[key] += value
+                logger.info(f"Processed {self.stats['files_scanned']} files, found {self.stats['technologies_detected']} technologies")
+                
+        logger.info(f"Scan completed. Analyzed {len(results)} files successfully")
+        return results
+        
+    def load_previous_registry(self, registry_path: str) -> Dict[str, Any]:
+        """Load file entries from an existing registry for incremental scanning."""
+        if not os.path.exists(registry_path):
+            return {}
+            
+        try:
+            with open(registry_path, 'r') as f:
+                registry = yaml.load(f, Loader=YAML_LOADER) or {}
+        except (OSError, yaml.YAMLError) as e:
+            logger.warning(f"Could not load previous registry {registry_path}, running full scan: {e}")
+            return {}
+            
+        if registry.get('scan_metadata', {}).get('detection_config_hash') != self.detection_config_hash:
+            logger.info("Detection configuration changed since the previous registry, running full scan")
+            return {}
+            
+        return registry.get('files') or {}
+        
+    def plan_incremental_scan(self, file_paths: List[str],
+                              previous_files: Dict[str, Any]) -> Tuple[Dict[str, FileAnalysis], List[str]]:
+        """
+        Split files into unchanged analyses reused from the previous registry and files to scan.
+        
+        A file is unchanged when its mtime and size match the registry entry, or failing that
+        when its SHA-256 hash does. Only the remaining files are read and matched again.
+        """
+        reused = {}
+        to_scan = []
+        
+        for file_path in file_paths:
+            previous = previous_files.get(file_path)
+            if not previous:
+                to_scan.append(file_path)
+                continue
+                
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                to_scan.append(file_path)
+                continue
+                
+            last_modified = datetime.fromtimestamp(file_stat.st_mtime, tz=timezone.utc).isoformat()
+            if previous.get('last_modified') == last_modified and previous.get('file_size') == file_stat.st_size:
+                self.stats['files_skipped'] += 1
+            elif previous.get('file_hash') and self.get_file_hash(file_path) == previous['file_hash']:
+                self.stats['files_rehashed'] += 1
+            else:
+                to_scan.append(file_path)
+                continue
+                
+            reused[file_path] = FileAnalysis(
+                file_path=previous['file_path'],
+                file_type=previous['file_type'],
+                file_hash=previous['file_hash'],
+                last_modified=last_modified,
+                last_scanned=previous['last_scanned'],
+                scan_confidence=previous['scan_confidence'],
+                technologies=[TechnologyReference(**tech) for tech in previous.get('technologies', [])],
+                file_size=file_stat.st_size
+            )
+            
+        logger.info(f"Incremental scan: {len(reused)} files unchanged "
+                    f"({self.stats['files_rehashed']} by content hash), {len(to_scan)} files to scan")
+        return reused, to_scan
+        
+    def generate_registry(self, analyses: Dict[str, FileAnalysis],
+                          previous_files: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Generate the complete dependency registry from file analyses."""
+        previous_files = previous_files or {}
+        total_technologies = sum(len(analysis.technologies) for analysis in analyses.values())
         registry = {
             'version': '1.0.0',
             'generated': datetime.now(timezone.utc).isoformat(),
+            'scan_metadata': {
+                'scan_mode': 'incremental' if previous_files else 'full',
+                'detection_config_hash': self.detection_config_hash
+            },
             'statistics': {
                 'total_files_scanned': len(analyses),
-                'total_technologies_detected': sum(len(analysis.technologies) for analysis in analyses.values()),
+                'total_technologies_detected': total_technologies,
                 'high_confidence_detections': sum(
                     sum(1 for tech in analysis.technologies if tech.confidence >= 0.9)
                     for analysis in analyses.values()
                 ),
-                'average_technologies_per_file': self.stats['technologies_detected'] / max(1, self.stats['files_scanned']),
+                'average_technologies_per_file': total_technologies / max(1, len(analyses)),
+                'files_analyzed': self.stats['files_scanned'],
+                'files_skipped': self.stats['files_skipped'] + self.stats['files_rehashed'],
+                'files_removed': sum(1 for file_path in previous_files if file_path not in analyses),
                 'processing_time_seconds': self.stats['processing_time'],
-                'files_per_second': len(analyses) / max(1, self.stats['processing_time'])
+                'files_per_second': self.stats['files_scanned'] / max(1, self.stats['processing_time'])
             },
             'files': {}
         }
         
         # Convert analyses to registry format
         for file_path, analysis in analyses.items():
-            registry['files'][file_path] = {
+            entry = {
                 'file_path': analysis.file_path,
                 'file_type': analysis.file_type,
                 'file_hash': analysis.file_hash,
+                'file_size': analysis.file_size,
                 'last_modified': analysis.last_modified,
                 'last_scanned': analysis.last_scanned,
                 'scan_confidence': analysis.scan_confidence,
@@ -478,6 +712,15 @@ class DependencyScanner:
                 }
             }
             
+            # Unchanged files keep their relationship and update tracking state
+            previous = previous_files.get(file_path)
+            if previous and previous.get('file_hash') == analysis.file_hash:
+                for section in ('dependency_relationships', 'update_tracking'):
+                    if section in previous:
+                        entry[section] = previous[section]
+                        
+            registry['files'][file_path] = entry
+            
         return registry
         
     def save_registry(self, registry: Dict[str, Any], output_path: str):
@@ -499,11 +742,20 @@ class DependencyScanner:
             logger.error(f"Error saving registry: {e}")
             raise
             
-    def run_scan(self, output_path: str = "dependency-registry/registry.yaml"):
-        """Execute the complete dependency scanning process."""
+    def run_scan(self, output_path: str = "dependency-registry/registry.yaml", incremental: Optional[bool] = None):
+        """
+        Execute the complete dependency scanning process.
+        
+        Args:
+            output_path: Registry file to write
+            incremental: Reuse unchanged files from the existing registry; defaults to
+                performance_settings.incremental_scanning
+        """
         logger.info("Starting AI Knowledge Lifecycle Orchestrator dependency scan")
         
         start_time = time.time()
+        if incremental is None:
+            incremental = self.config['scanner_configuration']['performance_settings'].get('incremental_scanning', False)
         
         try:
             # Discover files to scan
@@ -512,11 +764,23 @@ class DependencyScanner:
                 logger.warning("No files found to scan")
                 return
                 
-            # Scan all files
-            analyses = self.scan_files(file_paths)
+            # Reuse analyses of unchanged files from the previous registry
+            previous_files = self.load_previous_registry(output_path) if incremental else {}
+            if previous_files:
+                reused, to_scan = self.plan_incremental_scan(file_paths, previous_files)
+            else:
+                reused, to_scan = {}, file_paths
+                
+            # Scan new and changed files, keeping discovery order in the registry
+            scanned = self.scan_files(to_scan) if to_scan else {}
+            analyses = {}
+            for file_path in file_paths:
+                analysis = scanned.get(file_path) or reused.get(file_path)
+                if analysis:
+                    analyses[file_path] = analysis
             
             # Generate registry
-            registry = self.generate_registry(analyses)
+            registry = self.generate_registry(analyses, previous_files)
             
             # Save registry
             self.save_registry(registry, output_path)
@@ -526,7 +790,11 @@ class DependencyScanner:
             logger.info("="*60)
             logger.info("DEPENDENCY SCAN SUMMARY")
             logger.info("="*60)
+            logger.info(f"Scan mode: {registry['scan_metadata']['scan_mode']}")
             logger.info(f"Files scanned: {registry['statistics']['total_files_scanned']}")
+            logger.info(f"Files re-analyzed: {registry['statistics']['files_analyzed']}")
+            logger.info(f"Files skipped (unchanged): {registry['statistics']['files_skipped']}")
+            logger.info(f"Files removed: {registry['statistics']['files_removed']}")
             logger.info(f"Technologies detected: {registry['statistics']['total_technologies_detected']}")
             logger.info(f"High confidence detections: {registry['statistics']['high_confidence_detections']}")
             logger.info(f"Average technologies per file: {registry['statistics']['average_technologies_per_file']:.2f}")
@@ -538,6 +806,28 @@ class DependencyScanner:
             logger.error(f"Scan failed: {e}")
             raise
 
+# Scanner of the current process pool worker, created once by _init_scan_worker
+_worker_scanner: Optional[DependencyScanner] = None
+
+def _init_scan_worker(config: Dict[str, Any]):
+    """Process pool initializer: compile the detection patterns once per worker."""
+    global _worker_scanner
+    _worker_scanner = DependencyScanner(config=config)
+    
+def _scan_chunk(file_paths: List[str]) -> Tuple[Dict[str, FileAnalysis], Dict[str, Any]]:
+    """Analyze a chunk of files in a worker, returning analyses and the chunk's statistics."""
+    chunk_stats = {key: 0 for key in ('files_scanned', 'technologies_detected',
+                                      'high_confidence_detections', 'processing_time')}
+    _worker_scanner.stats.update(chunk_stats)
+    
+    results = {}
+    for file_path in file_paths:
+        analysis = _worker_scanner.analyze_file(file_path)
+        if analysis:
+            results[file_path] = analysis
+            
+    return results, {key: _worker_scanner.stats[key] for key in chunk_stats}
+
 def main():
     """Main entry point for the dependency scanner."""
     parser = argparse.ArgumentParser(description="AI Knowledge Lifecycle Orchestrator Dependency Scanner")
@@ -547,6 +837,10 @@ def main():
                        help='Path to output registry file')
     parser.add_argument('--debug', action='store_true',
                        help='Enable debug logging')
+    parser.add_argument('--full-scan', action='store_true',
+                       help='Re-analyze every file instead of only files changed since the last registry')
+    parser.add_argument('--backend', choices=['thread', 'process'],
+                       help='Scanning backend, overriding performance_settings.scan_backend')
     
     args = parser.parse_args()
     
@@ -555,7 +849,9 @@ def main():
         
     try:
         scanner = DependencyScanner(args.config)
-        scanner.run_scan(args.output)
+        if args.backend:
+            scanner.scan_backend = args.backend
+        scanner.run_scan(args.output, incremental=False if args.full_scan else None)
         logger.info("Dependency scan completed successfully")
         
     except KeyboardInterrupt:
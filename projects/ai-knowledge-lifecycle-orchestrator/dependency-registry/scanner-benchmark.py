@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+AI Knowledge Lifecycle Orchestrator - Dependency Scanner Benchmark
+
+Times DependencyScanner.detect_technologies over the repository's own markdown
+corpus against the previous implementation, which ran every pattern over the whole
+file, counted newlines in content[:match.start()] for each match and re-split the
+file for every context analysis. Both must produce the same detections.
+
+Then compares scan_files throughput with the thread and process backends.
+
+Usage (from the project directory, like the scanner):
+    python dependency-registry/scanner-benchmark.py [--root REPO_ROOT] [--config CONFIG_FILE]
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import time
+from glob import glob
+from pathlib import Path
+from typing import Any, Dict, List
+
+SCANNER_PATH = Path(__file__).parent / "dependency-scanner.py"
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+def load_scanner_module():
+    """Import dependency-scanner.py, whose file name is not a valid module name."""
+    spec = importlib.util.spec_from_file_location("dependency_scanner", SCANNER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # Process pool workers look functions up by module name
+    spec.loader.exec_module(module)
+    return module
+
+
+def previous_detect_technologies(scanner, content: str) -> List[Dict[str, Any]]:
+    """The previous per-pattern full-file scan, reduced to what the comparison needs."""
+    detection_config = scanner.config['scanner_configuration']['technology_detection']
+    base_confidence = detection_config['confidence_calculation']['base_confidence']
+    detected = []
+    lines = content.split('\n')
+
+    for tech_name, tech_config in scanner.technology_patterns.items():
+        references = []
+        for pattern in tech_config['patterns']:
+            for match in pattern.finditer(content):
+                line_num = content[:match.start()].count('\n')
+                context_line = lines[line_num] if line_num < len(lines) else ""
+                usage_context, confidence_boost = scanner.analyze_context(content, line_num, tech_name)
+                reference_confidence = base_confidence + confidence_boost
+                if scanner.detect_version(context_line, tech_name):
+                    reference_confidence += detection_config['confidence_calculation']['version_reference_bonus']
+                references.append({
+                    'line_number': line_num + 1,
+                    'context': context_line.strip()[:200],
+                    'confidence': min(1.0, reference_confidence)
+                })
+        for ref in references:
+            scanner.analyze_context(content, ref['line_number'] - 1, tech_name)
+        if references:
+            detected.append({'name': tech_name, 'references': references})
+
+    return detected
+
+
+def current_detect_technologies(scanner, content: str) -> List[Dict[str, Any]]:
+    """detect_technologies with references in the same reduced form, before confidence filtering."""
+    minimums = {}
+    for tech_config in scanner.technology_patterns.values():
+        minimums[id(tech_config)] = tech_config['minimum_confidence']
+        tech_config['minimum_confidence'] = 0.0
+    try:
+        technologies = scanner.detect_technologies(content, "benchmark")
+    finally:
+        for tech_config in scanner.technology_patterns.values():
+            tech_config['minimum_confidence'] = minimums[id(tech_config)]
+    return [
+        {
+            'name': tech.name,
+            'references': [
+                {key: ref[key] for key in ('line_number', 'context', 'confidence')}
+                for ref in tech.references
+            ]
+        }
+        for tech in technologies
+    ]
+
+
+def compare_backends(scanner, file_paths: List[str]) -> bool:
+    """Time scan_files with each backend and check both find the same technologies."""
+    print(f"\n📊 scan_files over {len(file_paths):,} files, {os.cpu_count()} CPU cores")
+    print("=" * 60)
+
+    detections = {}
+    for backend in ('thread', 'process'):
+        scanner.scan_backend = backend
+        start = time.perf_counter()
+        results = scanner.scan_files(file_paths)
+        seconds = time.perf_counter() - start
+        print(f"{backend:8} backend: {seconds:7.2f} s  {len(results) / seconds:8.1f} files/s")
+        detections[backend] = {
+            file_path: [(tech.name, tech.confidence, len(tech.references)) for tech in analysis.technologies]
+            for file_path, analysis in results.items()
+        }
+
+    if detections['thread'] != detections['process']:
+        print("❌ Backends detected different technologies")
+        return False
+    print("✅ Identical detections")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dependency scanner detection benchmark")
+    parser.add_argument('--root', default=str(REPO_ROOT),
+                        help='Directory whose markdown files form the corpus')
+    parser.add_argument('--config', default='dependency-registry/scanner-config.yaml',
+                        help='Path to configuration file')
+    args = parser.parse_args()
+
+    scanner_module = load_scanner_module()
+    scanner_module.logger.setLevel('WARNING')
+    scanner = scanner_module.DependencyScanner(args.config)
+
+    corpus = []
+    file_paths = glob(str(Path(args.root) / '**' / '*.md'), recursive=True)
+    for file_path in file_paths:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                corpus.append(f.read())
+        except (OSError, UnicodeDecodeError):
+            continue
+    corpus_mb = sum(len(content) for content in corpus) / (1024 * 1024)
+
+    print(f"📊 detect_technologies over {len(corpus):,} markdown files ({corpus_mb:.1f} MB)")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    previous = [previous_detect_technologies(scanner, content) for content in corpus]
+    previous_seconds = time.perf_counter() - start
+    print(f"Previous (pattern x file scan):  {previous_seconds:8.2f} s  {corpus_mb / previous_seconds:6.2f} MB/s")
+
+    start = time.perf_counter()
+    for content in corpus:
+        scanner.detect_technologies(content, "benchmark")
+    current_seconds = time.perf_counter() - start
+    print(f"Current (literal-prefix anchors): {current_seconds:7.2f} s  {corpus_mb / current_seconds:6.2f} MB/s")
+    print(f"Speedup: {previous_seconds / current_seconds:.1f}x")
+
+    current = [current_detect_technologies(scanner, content) for content in corpus]
+    references = sum(len(tech['references']) for detected in previous for tech in detected)
+    if current == previous:
+        print(f"✅ Identical detections ({references:,} references)")
+    else:
+        mismatches = sum(1 for a, b in zip(previous, current) if a != b)
+        print(f"❌ Detections differ in {mismatches} files")
+        return 1
+
+    return 0 if compare_backends(scanner, file_paths) else 1
+
+
+if __name__ == "__main__":
+    exit(main())
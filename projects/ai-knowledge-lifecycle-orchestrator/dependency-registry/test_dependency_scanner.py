@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+AI Knowledge Lifecycle Orchestrator - Dependency Scanner Tests
+
+Checks the incremental scan plan against a full scan of a small temporary corpus:
+modified files are analyzed again, files whose mtime changed but whose content did
+not are only re-hashed, and deleted files leave the registry.
+"""
+
+import copy
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+SCANNER_PATH = Path(__file__).parent / "dependency-scanner.py"
+CONFIG_PATH = Path(__file__).parent / "scanner-config.yaml"
+
+# Lines far enough apart that each reference sees its own usage contexts
+SPACER = "\n" * 8
+CORPUS = {
+    "unchanged.md": SPACER.join([
+        "npm install React 18 with the recommended settings.",
+        "Write a unit test for each React component.",
+        "Fix the error when React hooks run in production builds.",
+        "Integrate TypeScript 5.3 through the editor plugin."
+    ]),
+    "touched.md": SPACER.join([
+        "Deploy the React 18 app with docker.",
+        "Configure TypeScript 5.3 options, see the example snippet."
+    ]),
+    "modified.md": "React 18 components should avoid deep props drilling.\n",
+    "deleted.md": "Debug the React 18 hooks issue with a test.\n"
+}
+
+# The shipped patterns target the repository corpus; these match the files above
+DETECTION_PATTERNS = {
+    'React': {'patterns': [r"React\s*\d*", r"hooks"], 'context_keywords': ["component"], 'minimum_confidence': 0.6},
+    'TypeScript': {'patterns': [r"TypeScript\s*[\d.]*"], 'context_keywords': ["options"], 'minimum_confidence': 0.6}
+}
+
+
+def load_scanner_module():
+    """Import dependency-scanner.py, which opens its log file relative to the project directory."""
+    cwd = os.getcwd()
+    os.chdir(PROJECT_DIR)
+    try:
+        spec = importlib.util.spec_from_file_location("dependency_scanner", SCANNER_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        return module
+    finally:
+        os.chdir(cwd)
+
+
+dependency_scanner = load_scanner_module()
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Temporary corpus and a scanner configuration that discovers only its files"""
+    for name, content in CORPUS.items():
+        (tmp_path / name).write_text(content)
+
+    with open(CONFIG_PATH) as f:
+        config = yaml.safe_load(f)
+    settings = config['scanner_configuration']
+    settings['file_discovery']['base_directories'] = [str(tmp_path)]
+    settings['file_discovery']['include_patterns'] = ["*.md"]
+    settings['performance_settings']['scan_backend'] = "thread"
+    settings['technology_detection']['detection_patterns'] = copy.deepcopy(DETECTION_PATTERNS)
+    return tmp_path, config
+
+
+def run_scan(config, registry_path, incremental):
+    """Scan with a fresh scanner, returning the registry and the files it analyzed"""
+    scanner = dependency_scanner.DependencyScanner(config=copy.deepcopy(config))
+    analyzed = []
+    analyze_file = scanner.analyze_file
+
+    def recording_analyze_file(file_path):
+        analyzed.append(os.path.basename(file_path))
+        return analyze_file(file_path)
+
+    scanner.analyze_file = recording_analyze_file
+    scanner.run_scan(str(registry_path), incremental=incremental)
+    with open(registry_path) as f:
+        return yaml.safe_load(f), scanner.stats, sorted(analyzed)
+
+
+def comparable(entry):
+    """Registry entry without the time it was scanned"""
+    return {key: value for key, value in entry.items() if key != 'last_scanned'}
+
+
+def test_incremental_plan_matches_a_full_scan(corpus):
+    directory, config = corpus
+    registry_path = directory / "registry.yaml"
+    _, _, analyzed = run_scan(config, registry_path, incremental=False)
+    assert analyzed == sorted(CORPUS)
+
+    (directory / "modified.md").write_text("React 18 components should avoid deep props drilling.\nTypeScript 5.4 types.\n")
+    touched_stat = os.stat(directory / "touched.md")
+    os.utime(directory / "touched.md", (touched_stat.st_atime, touched_stat.st_mtime + 60))
+    (directory / "deleted.md").unlink()
+
+    registry, stats, analyzed = run_scan(config, registry_path, incremental=True)
+    assert analyzed == ["modified.md"]
+    assert stats['files_skipped'] == 1 and stats['files_rehashed'] == 1
+    assert registry['scan_metadata']['scan_mode'] == "incremental"
+    assert registry['statistics']['files_removed'] == 1
+    assert sorted(os.path.basename(path) for path in registry['files']) == ["modified.md", "touched.md", "unchanged.md"]
+
+    # The touched file keeps its analysis under the new modification time
+    touched = registry['files'][str(directory / "touched.md")]
+    assert touched['last_modified'] == dependency_scanner.datetime.fromtimestamp(
+        touched_stat.st_mtime + 60, tz=dependency_scanner.timezone.utc).isoformat()
+
+    modified = registry['files'][str(directory / "modified.md")]
+    assert [tech['name'] for tech in modified['technologies']] == ["React", "TypeScript"]
+
+    # Reused and re-analyzed entries are exactly what a full scan of the same files produces
+    full_registry, _, _ = run_scan(config, directory / "full.yaml", incremental=False)
+    assert registry['files'].keys() == full_registry['files'].keys()
+    for file_path, entry in registry['files'].items():
+        assert comparable(entry) == comparable(full_registry['files'][file_path])
+
+    # Usage contexts are listed in a stable order
+    unchanged = registry['files'][str(directory / "unchanged.md")]
+    react = next(tech for tech in unchanged['technologies'] if tech['name'] == "React")
+    assert react['usage_context'] == [
+        'best_practices', 'configuration', 'deployment', 'installation', 'testing', 'troubleshooting'
+    ]
+
+
+def test_changed_detection_config_forces_a_full_scan(corpus):
+    directory, config = corpus
+    registry_path = directory / "registry.yaml"
+    run_scan(config, registry_path, incremental=False)
+
+    patterns = config['scanner_configuration']['technology_detection']['detection_patterns']
+    patterns['React']['minimum_confidence'] = 0.7
+    registry, _, analyzed = run_scan(config, registry_path, incremental=True)
+    assert analyzed == sorted(CORPUS)
+    assert registry['scan_metadata']['scan_mode'] == "full"
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
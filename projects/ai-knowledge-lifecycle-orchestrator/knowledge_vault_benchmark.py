@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Knowledge Vault Query Benchmark
+AI Knowledge Lifecycle Orchestrator
+
+Compares analyze_technology_impact latency of the original YAML-per-file
+scan against the in-process item index, cold (new instance, with and
+without the SQLite snapshot) and warm.
+
+Usage:
+    python knowledge_vault_benchmark.py --items 5000
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.append(str(Path(__file__).parent))
+
+from knowledge_vault_integration import KnowledgeVaultIntegration
+
+SCHEMAS = ['technology-tracking-schema.yaml', 'dependency-mapping-schema.yaml',
+           'knowledge-update-schema.yaml', 'change-event-schema.yaml']
+TECHNOLOGIES = [f"Technology {i}" for i in range(50)]
+
+
+def build_vault(base_path: str, items: int):
+    """Write items spread over the four databases as YAML files"""
+    schemas_path = Path(base_path) / "knowledge-vault" / "schemas"
+    schemas_path.mkdir(parents=True)
+    for schema_name in SCHEMAS:
+        with open(schemas_path / schema_name, 'w') as f:
+            yaml.dump({'configuration': {'validation': {'required_fields': ['id']}}}, f)
+
+    integration = KnowledgeVaultIntegration(base_path=base_path)
+    for i in range(items):
+        technology = TECHNOLOGIES[i % len(TECHNOLOGIES)]
+        database_name = ['technology_tracking', 'dependency_mapping', 'knowledge_updates', 'change_events'][i % 4]
+        item = {
+            'id': f"item-{i}",
+            'technology_name': technology,
+            'related_technology': technology,
+            'dependency_criticality': ['essential', 'important', 'optional'][i % 3],
+            'change_classification': ['critical', 'high', 'low'][i % 3],
+            'workflow_status': ['detected', 'approved', 'completed'][i % 3],
+            'update_priority': ['critical', 'medium'][i % 2],
+            'usage_context': ['setup', 'api'],
+            'description': f"Benchmark item {i} " * 5
+        }
+        items_path = integration.databases[database_name]['database_path'] / 'items'
+        with open(items_path / f"{item['id']}.yaml", 'w') as f:
+            yaml.dump(item, f, default_flow_style=False, sort_keys=False)
+
+
+def yaml_per_file_query(integration: KnowledgeVaultIntegration, database_name: str, filters: dict):
+    """The original query path: glob and safe_load every item file"""
+    results = []
+    for item_file in (integration.databases[database_name]['database_path'] / 'items').glob('*.yaml'):
+        with open(item_file, 'r') as f:
+            item_data = yaml.safe_load(f)
+        if all(key in item_data and item_data[key] == value for key, value in filters.items()):
+            results.append(item_data)
+    return results
+
+
+def yaml_per_file_impact(integration: KnowledgeVaultIntegration, technology: str):
+    """The four scans analyze_technology_impact used to make"""
+    yaml_per_file_query(integration, 'technology_tracking', {'technology_name': technology})
+    yaml_per_file_query(integration, 'dependency_mapping', {'technology_name': technology})
+    yaml_per_file_query(integration, 'change_events', {'technology_name': technology})
+    yaml_per_file_query(integration, 'knowledge_updates', {'related_technology': technology})
+
+
+def timed(fn, runs: int = 1) -> float:
+    """Average milliseconds per call"""
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - start) * 1000 / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Knowledge vault query benchmark")
+    parser.add_argument("--items", type=int, default=5000,
+                        help="Items across all four databases")
+    parser.add_argument("--runs", type=int, default=20,
+                        help="Warm query repetitions")
+    args = parser.parse_args()
+
+    base_path = tempfile.mkdtemp()
+    try:
+        build_vault(base_path, args.items)
+        technology = TECHNOLOGIES[3]
+
+        print(f"📊 analyze_technology_impact over {args.items:,} YAML items")
+        print("=" * 60)
+
+        integration = KnowledgeVaultIntegration(base_path=base_path)
+        print(f"YAML per file (original):     {timed(lambda: yaml_per_file_impact(integration, technology)):9.1f} ms")
+
+        cold = timed(lambda: KnowledgeVaultIntegration(base_path=base_path).analyze_technology_impact(technology))
+        print(f"Index, cold, no snapshot:     {cold:9.1f} ms")
+
+        snapshot_build = timed(lambda: KnowledgeVaultIntegration(
+            base_path=base_path, use_snapshots=True).analyze_technology_impact(technology))
+        print(f"Index, cold, snapshot build:  {snapshot_build:9.1f} ms")
+
+        cold_snapshot = timed(lambda: KnowledgeVaultIntegration(
+            base_path=base_path, use_snapshots=True).analyze_technology_impact(technology))
+        print(f"Index, cold, from snapshot:   {cold_snapshot:9.1f} ms")
+
+        integration = KnowledgeVaultIntegration(base_path=base_path, use_snapshots=True)
+        integration.analyze_technology_impact(technology)
+        warm = timed(lambda: integration.analyze_technology_impact(technology), args.runs)
+        print(f"Index, warm:                  {warm:9.1f} ms")
+
+        health = timed(integration.get_system_health_summary, args.runs)
+        print(f"Health summary, warm:         {health:9.1f} ms")
+    finally:
+        shutil.rmtree(base_path)
+
+
+if __name__ == "__main__":
+    main()
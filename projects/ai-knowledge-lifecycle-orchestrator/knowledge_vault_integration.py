@@ -9,15 +9,23 @@ and managing technology tracking, dependency mapping, knowledge updates, and cha
 
 import os
 import sys
+import copy
+import time
 import yaml
 import json
 import uuid
+import sqlite3
 from datetime import datetime, date
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+# libyaml's C parser when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+SNAPSHOT_FILE = 'items_snapshot.sqlite'
+
 class ValidationError(Exception):
     """Custom exception for validation errors"""
     pass
@@ -150,11 +158,293 @@ class ChangeEvent:
         """Convert to dictionary for YAML serialization"""
         return {k: v for k, v in asdict(self).items() if v is not None}
 
+class ItemSnapshot:
+    """
+    Compacted SQLite snapshot of one database's item files
+    
+    Stores each item as JSON next to the (mtime, size) signature of the YAML
+    file it was parsed from, so a cold ItemIndex can load unchanged items
+    without running the YAML parser. Items whose data does not survive a
+    JSON round trip unchanged (dates, non-string keys) are stored without
+    data and always re-parsed from YAML. The YAML files stay authoritative.
+    """
+    
+    def __init__(self, snapshot_path: Path):
+        """Initialize the snapshot file"""
+        self.snapshot_path = snapshot_path
+        with sqlite3.connect(self.snapshot_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS items (
+                    item_id TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    data TEXT
+                )
+            """)
+    
+    def load(self) -> Dict[str, Tuple[Tuple[int, int], Any]]:
+        """All snapshotted items as item_id -> (signature, data or None)"""
+        with sqlite3.connect(self.snapshot_path) as conn:
+            rows = conn.execute("SELECT item_id, mtime_ns, size, data FROM items").fetchall()
+        return {
+            item_id: ((mtime_ns, size), json.loads(data) if data is not None else None)
+            for item_id, mtime_ns, size, data in rows
+        }
+    
+    @staticmethod
+    def _encode(item_data: Any) -> Optional[str]:
+        """JSON for the item, or None if JSON would not reproduce it exactly"""
+        try:
+            encoded = json.dumps(item_data)
+        except (TypeError, ValueError):
+            return None
+        return encoded if json.loads(encoded) == item_data else None
+    
+    def write(self, upserts: Dict[str, Tuple[Tuple[int, int], Any]], deletes: List[str]):
+        """Apply changed and removed items in one transaction"""
+        if not upserts and not deletes:
+            return
+        with sqlite3.connect(self.snapshot_path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO items (item_id, mtime_ns, size, data) VALUES (?, ?, ?, ?)",
+                [(item_id, signature[0], signature[1], self._encode(item_data))
+                 for item_id, (signature, item_data) in upserts.items()]
+            )
+            conn.executemany("DELETE FROM items WHERE item_id = ?", [(item_id,) for item_id in deletes])
+
+class ItemIndex:
+    """
+    In-process index over one database's items directory
+    
+    Each item file is parsed once and kept in memory together with its
+    (mtime, size) signature. A refresh stats the directory and re-parses
+    only files whose signature changed; the directory is re-scanned at most
+    once per refresh_interval seconds, so a burst of queries costs one scan.
+    Per-field hash indexes (value -> item ids) are built lazily the first
+    time a field is used in a filter and kept up to date on every change.
+    """
+    
+    def __init__(self, items_path: Path, refresh_interval: float = 1.0,
+                 snapshot: Optional[ItemSnapshot] = None):
+        """Initialize the index for an items directory"""
+        self.items_path = items_path
+        self.refresh_interval = refresh_interval
+        self.snapshot = snapshot
+        self._snapshot_items: Optional[Dict[str, Tuple[Tuple[int, int], Any]]] = None
+        self.items: Dict[str, Any] = {}
+        self.signatures: Dict[str, Tuple[int, int]] = {}
+        self.field_indexes: Dict[str, Dict[Any, Set[str]]] = {}
+        self.unindexable_fields: Set[str] = set()
+        self.last_scan: Optional[float] = None
+        self.stats = {'scans': 0, 'files_parsed': 0, 'snapshot_hits': 0, 'index_lookups': 0, 'full_scans': 0}
+    
+    @staticmethod
+    def _signature(stat_result: os.stat_result) -> Tuple[int, int]:
+        return stat_result.st_mtime_ns, stat_result.st_size
+    
+    def _parse_file(self, item_file: Path) -> Any:
+        """Parse one item file"""
+        self.stats['files_parsed'] += 1
+        with open(item_file, 'r') as f:
+            return yaml.load(f, Loader=YAML_LOADER)
+    
+    def invalidate(self):
+        """Force a directory scan on the next access"""
+        self.last_scan = None
+    
+    def refresh(self, force: bool = False):
+        """Pick up files added, changed or removed since the last scan"""
+        now = time.monotonic()
+        if not force and self.last_scan is not None and now - self.last_scan < self.refresh_interval:
+            return
+        self.last_scan = now
+        self.stats['scans'] += 1
+        
+        # Cold start: unchanged files are served from the snapshot
+        if self.snapshot is not None and self._snapshot_items is None:
+            self._snapshot_items = self.snapshot.load()
+        snapshot_items = self._snapshot_items or {}
+        upserts = {}
+        
+        seen = set()
+        if self.items_path.exists():
+            with os.scandir(self.items_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.yaml') or not entry.is_file():
+                        continue
+                    item_id = entry.name[:-len('.yaml')]
+                    seen.add(item_id)
+                    signature = self._signature(entry.stat())
+                    if self.signatures.get(item_id) == signature:
+                        continue
+                    
+                    snapshotted = snapshot_items.get(item_id)
+                    if snapshotted is not None and snapshotted[0] == signature and snapshotted[1] is not None:
+                        self.stats['snapshot_hits'] += 1
+                        self._set(item_id, snapshotted[1], signature)
+                    else:
+                        self._set(item_id, self._parse_file(Path(entry.path)), signature)
+                        upserts[item_id] = (signature, self.items[item_id])
+        
+        for item_id in [item_id for item_id in self.items if item_id not in seen]:
+            self._remove(item_id)
+        
+        if self.snapshot is not None:
+            deletes = [item_id for item_id in snapshot_items if item_id not in seen]
+            self.snapshot.write(upserts, deletes)
+            for item_id in deletes:
+                del snapshot_items[item_id]
+            snapshot_items.update(upserts)
+    
+    def get(self, item_id: str) -> Any:
+        """Current data of one item, re-parsed only if its file changed"""
+        item_file = self.items_path / f"{item_id}.yaml"
+        try:
+            signature = self._signature(item_file.stat())
+        except FileNotFoundError:
+            self._remove(item_id)
+            return None
+        
+        if self.signatures.get(item_id) != signature:
+            self._set(item_id, self._parse_file(item_file), signature)
+            self._write_snapshot(item_id)
+        return self.items[item_id]
+    
+    def put(self, item_id: str, item_data: Dict[str, Any]):
+        """Write-through update after the item file has been saved"""
+        item_file = self.items_path / f"{item_id}.yaml"
+        self._set(item_id, copy.deepcopy(item_data), self._signature(item_file.stat()))
+        self._write_snapshot(item_id)
+    
+    def _write_snapshot(self, item_id: str):
+        """Record one freshly parsed or saved item in the snapshot"""
+        if self.snapshot is None:
+            return
+        entry = (self.signatures[item_id], self.items[item_id])
+        self.snapshot.write({item_id: entry}, [])
+        if self._snapshot_items is not None:
+            self._snapshot_items[item_id] = entry
+    
+    def query(self, filters: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """Items whose fields equal every filter value"""
+        self.refresh()
+        if not filters:
+            return list(self.items.values())
+        
+        candidates = None
+        remaining = {}
+        for key, value in filters.items():
+            field_index = self._field_index(key)
+            try:
+                ids = field_index.get(value, set()) if field_index is not None else None
+            except TypeError:
+                ids = None  # Unhashable filter value
+            if ids is None:
+                remaining[key] = value
+                continue
+            self.stats['index_lookups'] += 1
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+        
+        if candidates is None:
+            self.stats['full_scans'] += 1
+            candidates = self.items.keys()
+        
+        results = []
+        for item_id in candidates:
+            item_data = self.items[item_id]
+            if remaining and not self._matches(item_data, remaining):
+                continue
+            results.append(item_data)
+        return results
+    
+    def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Number of items query() would return"""
+        return len(self.query(filters))
+    
+    @staticmethod
+    def _matches(item_data: Any, filters: Dict[str, Any]) -> bool:
+        if not isinstance(item_data, dict):
+            return False
+        for key, value in filters.items():
+            if key not in item_data or item_data[key] != value:
+                return False
+        return True
+    
+    def _field_index(self, field: str) -> Optional[Dict[Any, Set[str]]]:
+        """Hash index for a field, or None if some value is unhashable"""
+        if field in self.unindexable_fields:
+            return None
+        if field not in self.field_indexes:
+            field_index: Dict[Any, Set[str]] = {}
+            try:
+                for item_id, item_data in self.items.items():
+                    if isinstance(item_data, dict) and field in item_data:
+                        field_index.setdefault(item_data[field], set()).add(item_id)
+            except TypeError:
+                self.unindexable_fields.add(field)
+                return None
+            self.field_indexes[field] = field_index
+        return self.field_indexes[field]
+    
+    def _set(self, item_id: str, item_data: Any, signature: Tuple[int, int]):
+        self._remove(item_id)
+        self.items[item_id] = item_data
+        self.signatures[item_id] = signature
+        if not isinstance(item_data, dict):
+            return
+        for field in list(self.field_indexes):
+            if field not in item_data:
+                continue
+            try:
+                self.field_indexes[field].setdefault(item_data[field], set()).add(item_id)
+            except TypeError:
+                del self.field_indexes[field]
+                self.unindexable_fields.add(field)
+    
+    def _remove(self, item_id: str):
+        item_data = self.items.pop(item_id, None)
+        self.signatures.pop(item_id, None)
+        if not isinstance(item_data, dict):
+            return
+        for field, field_index in self.field_indexes.items():
+            if field not in item_data:
+                continue
+            ids = field_index.get(item_data[field])
+            if ids is not None:
+                ids.discard(item_id)
+                if not ids:
+                    del field_index[item_data[field]]
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Index size and activity counters"""
+        return {
+            **self.stats,
+            'items': len(self.items),
+            'indexed_fields': sorted(self.field_indexes)
+        }
+
 class KnowledgeVaultIntegration:
     """Main interface for Knowledge Vault integration"""
     
-    def __init__(self, base_path: str = None):
-        """Initialize the integration interface"""
+    PENDING_STATUSES = ['detected', 'analysis_pending', 'impact_assessed', 'approval_pending', 'approved']
+    
+    def __init__(self, base_path: str = None, index_refresh_interval: float = 1.0,
+                 use_snapshots: bool = False):
+        """
+        Initialize the integration interface
+        
+        Args:
+            base_path: Repository root containing knowledge-vault/
+            index_refresh_interval: Seconds between checks of item files for
+                changes made outside this instance (0 checks on every query)
+            use_snapshots: Keep a compacted SQLite snapshot of each database in
+                its indexes/ directory so new instances skip YAML parsing
+        """
+        self.index_refresh_interval = index_refresh_interval
+        self.use_snapshots = use_snapshots
+        self._indexes: Dict[str, ItemIndex] = {}
         self.base_path = Path(base_path or "/Users/georgiospilitsoglou/Developer/projects/mypromptflow")
         self.knowledge_vault_path = self.base_path / "knowledge-vault"
         self.schemas_path = self.knowledge_vault_path / "schemas"
@@ -207,6 +497,26 @@ class KnowledgeVaultIntegration:
             for subdir in ['items', 'relations', 'metadata', 'indexes', 'views']:
                 (config['database_path'] / subdir).mkdir(exist_ok=True)
     
+    def _get_index(self, database_name: str) -> ItemIndex:
+        """In-process item index for a database"""
+        if database_name not in self.databases:
+            raise ValidationError(f"Unknown database: {database_name}")
+        
+        if database_name not in self._indexes:
+            database_path = self.databases[database_name]['database_path']
+            snapshot = ItemSnapshot(database_path / 'indexes' / SNAPSHOT_FILE) if self.use_snapshots else None
+            self._indexes[database_name] = ItemIndex(database_path / 'items', self.index_refresh_interval, snapshot)
+        return self._indexes[database_name]
+    
+    def refresh_indexes(self):
+        """Re-check every database for files changed outside this instance"""
+        for index in self._indexes.values():
+            index.invalidate()
+    
+    def get_index_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-database index statistics"""
+        return {name: index.get_statistics() for name, index in self._indexes.items()}
+    
     def _generate_id(self) -> str:
         """Generate a unique UUID for database items"""
         return str(uuid.uuid4())
@@ -257,52 +567,25 @@ class KnowledgeVaultIntegration:
         with open(item_file, 'w') as f:
             yaml.dump(item_data, f, default_flow_style=False, sort_keys=False)
         
+        # Write-through so the index never serves the previous version
+        self._get_index(database_name).put(item_data['id'], item_data)
+        
         return item_data['id']
     
     def _load_item(self, database_name: str, item_id: str) -> Optional[Dict[str, Any]]:
         """Load item from database"""
-        if database_name not in self.databases:
-            raise ValidationError(f"Unknown database: {database_name}")
-        
-        database_path = self.databases[database_name]['database_path']
-        items_path = database_path / 'items'
-        item_file = items_path / f"{item_id}.yaml"
-        
-        if not item_file.exists():
-            return None
+        item_data = self._get_index(database_name).get(item_id)
         
-        with open(item_file, 'r') as f:
-            return yaml.safe_load(f)
+        # Callers may modify the result, so never hand out the indexed object
+        return copy.deepcopy(item_data)
     
     def _query_items(self, database_name: str, filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Query items from database with optional filters"""
-        if database_name not in self.databases:
-            raise ValidationError(f"Unknown database: {database_name}")
-        
-        database_path = self.databases[database_name]['database_path']
-        items_path = database_path / 'items'
-        
-        if not items_path.exists():
-            return []
-        
-        items = []
-        for item_file in items_path.glob('*.yaml'):
-            with open(item_file, 'r') as f:
-                item_data = yaml.safe_load(f)
-                
-            # Apply filters if provided
-            if filters:
-                match = True
-                for key, value in filters.items():
-                    if key not in item_data or item_data[key] != value:
-                        match = False
-                        break
-                if not match:
-                    continue
-            
-            items.append(item_data)
-        
-        return items
+        return copy.deepcopy(self._get_index(database_name).query(filters))
+    
+    def _count_items(self, database_name: str, filters: Dict[str, Any] = None) -> int:
+        """Count items matching optional filters without copying them"""
+        return self._get_index(database_name).count(filters)
     
     # Technology Tracking Operations
     def create_technology_tracking(self, technology_data: Union[TechnologyTracking, Dict[str, Any]]) -> str:
@@ -396,9 +679,8 @@ class KnowledgeVaultIntegration:
     
     def get_pending_updates(self) -> List[Dict[str, Any]]:
         """Get updates pending approval or implementation"""
-        pending_statuses = ['detected', 'analysis_pending', 'impact_assessed', 'approval_pending', 'approved']
         pending_updates = []
-        for status in pending_statuses:
+        for status in self.PENDING_STATUSES:
             pending_updates.extend(self.query_updates({'workflow_status': status}))
         return pending_updates
     
@@ -492,19 +774,25 @@ class KnowledgeVaultIntegration:
     def get_system_health_summary(self) -> Dict[str, Any]:
         """Get overall system health summary"""
         # Count items in each database
-        tech_count = len(self.query_technologies())
-        dep_count = len(self.query_dependencies())
-        update_count = len(self.query_updates())
-        change_count = len(self.query_change_events())
+        tech_count = self._count_items('technology_tracking')
+        dep_count = self._count_items('dependency_mapping')
+        update_count = self._count_items('knowledge_updates')
+        change_count = self._count_items('change_events')
         
         # Get critical items
-        critical_tech = len(self.get_critical_technologies())
-        critical_deps = len(self.get_critical_dependencies())
-        critical_updates = len(self.get_critical_updates())
-        critical_changes = len(self.get_critical_changes())
+        critical_tech = self._count_items('technology_tracking', {'monitoring_priority': 'critical'})
+        critical_deps = sum(
+            self._count_items('dependency_mapping', {'dependency_criticality': criticality})
+            for criticality in ('essential', 'important')
+        )
+        critical_updates = self._count_items('knowledge_updates', {'update_priority': 'critical'})
+        critical_changes = self._count_items('change_events', {'change_classification': 'critical'})
         
         # Get pending items
-        pending_updates = len(self.get_pending_updates())
+        pending_updates = sum(
+            self._count_items('knowledge_updates', {'workflow_status': status})
+            for status in self.PENDING_STATUSES
+        )
         
         return {
             'database_counts': {
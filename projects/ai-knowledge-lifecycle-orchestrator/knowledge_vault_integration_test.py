@@ -593,6 +593,150 @@ class TestIntegrationPerformance(unittest.TestCase):
         self.assertEqual(len(critical_techs), 10)  # First 10 are critical
 
 
+class TestItemIndex(unittest.TestCase):
+    """Tests for the in-process item index"""
+    
+    setup_test_environment = TestIntegrationPerformance.setup_test_environment
+    
+    def setUp(self):
+        """Set up index test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.setup_test_environment()
+        self.integration = KnowledgeVaultIntegration(base_path=self.test_dir, index_refresh_interval=0)
+        self.items_path = self.integration.databases['technology_tracking']['database_path'] / 'items'
+        
+        for i in range(20):
+            self.integration.create_technology_tracking({
+                'id': f'tech-{i}',
+                'technology_name': f'Technology {i}',
+                'category': 'database' if i % 2 == 0 else 'frontend_framework',
+                'current_version': f'{i}.0.0',
+                'monitoring_priority': 'critical' if i < 5 else 'medium',
+                'tags': ['indexed']
+            })
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def test_repeated_queries_parse_files_once(self):
+        """Files are parsed once across many queries and health summaries"""
+        for _ in range(3):
+            self.integration.get_system_health_summary()
+            self.integration.query_technologies({'category': 'database', 'monitoring_priority': 'critical'})
+        
+        stats = self.integration.get_index_statistics()['technology_tracking']
+        self.assertEqual(stats['files_parsed'], 0)
+        self.assertIn('category', stats['indexed_fields'])
+        
+        health = self.integration.get_system_health_summary()
+        self.assertEqual(health['database_counts']['technology_tracking'], 20)
+        self.assertEqual(health['critical_items']['technologies'], 5)
+    
+    def test_filters_match_linear_scan(self):
+        """Indexed and unhashable filters return the same items as a full scan"""
+        db_critical = self.integration.query_technologies({'category': 'database', 'monitoring_priority': 'critical'})
+        self.assertEqual(sorted(t['id'] for t in db_critical), ['tech-0', 'tech-2', 'tech-4'])
+        
+        self.assertEqual(len(self.integration.query_technologies({'tags': ['indexed']})), 20)
+        self.assertEqual(self.integration.query_technologies({'category': 'missing'}), [])
+        self.assertEqual(self.integration.query_technologies({'unknown_field': 1}), [])
+    
+    def test_external_changes_invalidate_by_mtime(self):
+        """Files edited, added or removed on disk are picked up"""
+        self.integration.get_technologies_by_category('database')
+        
+        item_file = self.items_path / 'tech-0.yaml'
+        with open(item_file, 'r') as f:
+            data = yaml.safe_load(f)
+        data['category'] = 'ai_ml'
+        with open(item_file, 'w') as f:
+            yaml.dump(data, f)
+        os.utime(item_file, ns=(0, 1))  # Guarantee a new signature
+        (self.items_path / 'tech-1.yaml').unlink()
+        with open(self.items_path / 'tech-new.yaml', 'w') as f:
+            yaml.dump({'id': 'tech-new', 'technology_name': 'New', 'category': 'database'}, f)
+        
+        database_ids = sorted(t['id'] for t in self.integration.get_technologies_by_category('database'))
+        self.assertNotIn('tech-0', database_ids)
+        self.assertIn('tech-new', database_ids)
+        self.assertEqual(self.integration.get_technologies_by_category('ai_ml')[0]['id'], 'tech-0')
+        self.assertIsNone(self.integration.get_technology_tracking('tech-1'))
+        self.assertEqual(self.integration.get_index_statistics()['technology_tracking']['files_parsed'], 2)
+    
+    def test_results_are_copies_and_saves_write_through(self):
+        """Modifying a result does not leak into the index; saves do"""
+        tech = self.integration.get_technology_tracking('tech-3')
+        tech['category'] = 'changed'
+        self.assertEqual(self.integration.get_technology_tracking('tech-3')['category'], 'frontend_framework')
+        
+        self.integration.create_technology_tracking(tech)
+        self.assertEqual(len(self.integration.get_technologies_by_category('changed')), 1)
+        self.assertEqual(len(self.integration.get_technologies_by_category('frontend_framework')), 9)
+
+
+class TestItemSnapshot(unittest.TestCase):
+    """Tests for the compacted item snapshot"""
+    
+    setup_test_environment = TestIntegrationPerformance.setup_test_environment
+    
+    def setUp(self):
+        """Create items through a snapshot-enabled integration"""
+        self.test_dir = tempfile.mkdtemp()
+        self.setup_test_environment()
+        integration = self.new_integration()
+        self.items_path = integration.databases['change_events']['database_path'] / 'items'
+        
+        for i in range(10):
+            integration.create_change_event({
+                'id': f'event-{i}',
+                'technology_name': 'React' if i < 4 else 'Vue',
+                'change_classification': 'critical' if i % 2 == 0 else 'low'
+            })
+        integration.query_change_events()
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def new_integration(self) -> KnowledgeVaultIntegration:
+        return KnowledgeVaultIntegration(base_path=self.test_dir, index_refresh_interval=0, use_snapshots=True)
+    
+    def test_cold_start_reads_snapshot(self):
+        """A new instance answers queries without parsing unchanged YAML files"""
+        integration = self.new_integration()
+        
+        react_events = integration.query_change_events({'technology_name': 'React'})
+        self.assertEqual(len(react_events), 4)
+        self.assertEqual(integration.get_change_event('event-0')['change_classification'], 'critical')
+        
+        stats = integration.get_index_statistics()['change_events']
+        self.assertEqual(stats['files_parsed'], 0)
+        self.assertEqual(stats['snapshot_hits'], 10)
+        
+        snapshot_file = integration.databases['change_events']['database_path'] / 'indexes' / 'items_snapshot.sqlite'
+        self.assertTrue(snapshot_file.exists())
+    
+    def test_snapshot_rebuilds_changed_files(self):
+        """Edited, removed and non-JSON items come from YAML and update the snapshot"""
+        item_file = self.items_path / 'event-1.yaml'
+        with open(item_file, 'w') as f:
+            f.write("id: event-1\ntechnology_name: React\nchange_classification: critical\ndetected_date: 2024-05-01\n")
+        os.utime(item_file, ns=(0, 1))  # Guarantee a new signature
+        (self.items_path / 'event-2.yaml').unlink()
+        
+        integration = self.new_integration()
+        self.assertEqual(len(integration.get_critical_changes()), 5)
+        self.assertEqual(integration.get_change_event('event-1')['detected_date'].isoformat(), '2024-05-01')
+        self.assertEqual(integration.get_index_statistics()['change_events']['files_parsed'], 1)
+        
+        # The date-valued item cannot be stored as JSON and is parsed again
+        integration = self.new_integration()
+        self.assertEqual(len(integration.query_change_events()), 9)
+        self.assertEqual(integration.get_index_statistics()['change_events']['files_parsed'], 1)
+        self.assertEqual(integration.get_index_statistics()['change_events']['snapshot_hits'], 8)
+
+
 def run_integration_tests():
     """Run all integration tests"""
     print("Running Knowledge Vault Integration Tests")
@@ -605,6 +749,8 @@ def run_integration_tests():
     # Add test cases
     suite.addTests(loader.loadTestsFromTestCase(TestKnowledgeVaultIntegration))
     suite.addTests(loader.loadTestsFromTestCase(TestIntegrationPerformance))
+    suite.addTests(loader.loadTestsFromTestCase(TestItemIndex))
+    suite.addTests(loader.loadTestsFromTestCase(TestItemSnapshot))
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
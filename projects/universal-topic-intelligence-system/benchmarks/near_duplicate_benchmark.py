@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Detection Benchmark
+Compares the linear SequenceMatcher scan against the MinHash LSH index
+at 1k/10k/100k cached items
+
+Usage:
+    python benchmarks/near_duplicate_benchmark.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import ContentItem
+from core.noise_reduction_engine import NoiseReductionEngine
+
+VOCABULARY = [
+    "react", "typescript", "hooks", "server", "components", "release", "performance",
+    "compiler", "streaming", "suspense", "router", "bundle", "cache", "testing",
+    "deployment", "framework", "library", "migration", "feature", "update", "security",
+    "patch", "version", "runtime", "module", "state", "render", "effect", "context",
+    "api", "database", "query", "index", "latency", "throughput", "memory", "build",
+    "vite", "webpack", "node", "python", "rust", "agent", "model", "prompt", "token"
+]
+
+
+def make_item(item_id: str, words) -> ContentItem:
+    return ContentItem(
+        item_id=item_id,
+        source_id="bench",
+        title=" ".join(words[:8]).title(),
+        content=" ".join(words),
+        url=f"https://example.com/{item_id}",
+        published_date=datetime.now(),
+        author="Benchmark",
+        topics=["react"],
+        metadata={}
+    )
+
+
+def make_near_duplicate(item_id: str, words, rng: random.Random) -> ContentItem:
+    """Copy a document with ~5% of words substituted"""
+    mutated = list(words)
+    for _ in range(max(1, len(mutated) // 20)):
+        mutated[rng.randrange(len(mutated))] = rng.choice(VOCABULARY)
+    return make_item(item_id, mutated)
+
+
+def build_engine(documents, use_index: bool) -> NoiseReductionEngine:
+    """Engine with the documents pre-cached (and pre-indexed)"""
+    config = NoiseReductionEngine()._default_config()
+    config["cache_limits"]["max_content_cache"] = len(documents) + 1000
+    config["near_duplicate_index"] = {"enabled": use_index}
+    engine = NoiseReductionEngine(config)
+
+    for item_id, words in documents:
+        item = make_item(item_id, words)
+        engine.content_cache[item_id] = item
+        if engine.near_duplicate_index is not None:
+            engine.near_duplicate_index.add(item_id, f"{item.title} {item.content}")
+    return engine
+
+
+def run_size(size: int, queries: int, linear_cap: int, rng: random.Random):
+    """Benchmark one cache size"""
+    documents = [
+        (f"doc_{i}", [rng.choice(VOCABULARY) for _ in range(60)])
+        for i in range(size)
+    ]
+    planted = rng.sample(range(size), queries)
+    probes = [make_near_duplicate(f"probe_{i}", documents[i][1], rng) for i in planted]
+
+    # MinHash LSH
+    start = time.perf_counter()
+    engine = build_engine(documents, use_index=True)
+    build_seconds = time.perf_counter() - start
+
+    hits = 0
+    start = time.perf_counter()
+    for idx, probe in zip(planted, probes):
+        engine.content_cache[probe.item_id] = probe
+        _, similar, _ = engine._check_near_duplicates(probe)
+        hits += documents[idx][0] in similar
+    lsh_ms = (time.perf_counter() - start) * 1000 / queries
+
+    # Linear SequenceMatcher scan over at most linear_cap items, extrapolated
+    scanned = min(size, linear_cap)
+    linear_engine = build_engine(documents[:scanned], use_index=False)
+    linear_queries = min(queries, 3)
+    start = time.perf_counter()
+    for probe in probes[:linear_queries]:
+        linear_engine._check_near_duplicates_linear(probe)
+    linear_ms = (time.perf_counter() - start) * 1000 / linear_queries * (size / scanned)
+    extrapolated = " (extrapolated)" if scanned < size else ""
+
+    print(f"{size:>8,} cached | linear {linear_ms:>10,.1f} ms/query{extrapolated:<15} | "
+          f"LSH {lsh_ms:>7.2f} ms/query | speedup {linear_ms / lsh_ms:>8,.0f}x | "
+          f"recall {hits}/{queries} | index build {build_seconds:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Near-duplicate detection benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Cached item counts to benchmark")
+    parser.add_argument("--queries", type=int, default=20,
+                        help="Near-duplicate probes per size")
+    parser.add_argument("--linear-cap", type=int, default=2000,
+                        help="Scan at most this many items linearly and extrapolate")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    print("📊 Near-duplicate detection: SequenceMatcher scan vs MinHash LSH")
+    print("=" * 100)
+    for size in args.sizes:
+        run_size(size, args.queries, args.linear_cap, rng)
+
+
+if __name__ == "__main__":
+    main()
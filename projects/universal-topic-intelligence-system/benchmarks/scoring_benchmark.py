@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Scoring Benchmark
+Compares per-item prioritize() against the vectorized prioritize_batch()
+when rescoring a whole database of MCP content
+
+Usage:
+    python benchmarks/scoring_benchmark.py --items 50000
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import UniversalContentPrioritizer, ContentItem
+
+TEXT = ("Step by step tutorial on the React framework: learn how to build a component library "
+        "with useState and useEffect. ## Installation\n- npm install\nconst api = import('api'); ")
+
+
+def make_items(count: int, rng: random.Random):
+    """Synthetic YouTube / GitHub / web search / RSS items"""
+    items = []
+    for i in range(count):
+        kind = i % 4
+        if kind == 0:
+            metadata = {"mcp_source_type": "youtube_transcript",
+                        "youtube_view_count": rng.randrange(0, 2000000),
+                        "youtube_like_count": rng.randrange(0, 50000),
+                        "youtube_channel": rng.choice(["Fireship", "React", "Some Channel"]),
+                        "youtube_duration": f"PT{rng.randrange(1, 90)}M{rng.randrange(60)}S",
+                        "youtube_language": "en"}
+        elif kind == 1:
+            metadata = {"mcp_source_type": "github_repository",
+                        "github_stars": rng.randrange(0, 100000),
+                        "github_forks": rng.randrange(0, 20000),
+                        "github_open_issues": rng.randrange(0, 3000),
+                        "github_language": rng.choice(["TypeScript", "Rust", "Ruby"]),
+                        "github_license": "MIT",
+                        "github_repo_name": f"org/repo-{i}"}
+        elif kind == 2:
+            metadata = {"mcp_source_type": "web_search",
+                        "search_query": "react compiler tutorial",
+                        "search_rank": rng.randrange(1, 30),
+                        "search_relevance_score": rng.random(),
+                        "search_domain": rng.choice(["react.dev", "dev.to", "example.com"])}
+        else:
+            metadata = {"engagement_score": rng.random(), "social_signals": rng.random()}
+
+        items.append(ContentItem(
+            item_id=f"item_{i}",
+            source_id=f"source_{i % 50}",
+            title=f"React Compiler Guide part {i}",
+            content=TEXT * rng.randrange(1, 20),
+            url=f"https://example.com/{i}",
+            published_date=datetime.now() - timedelta(hours=rng.randrange(1, 2000)),
+            author="Benchmark",
+            topics=["react", "typescript"][:rng.randrange(1, 3)],
+            metadata=metadata
+        ))
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch scoring benchmark")
+    parser.add_argument("--items", type=int, default=50000,
+                        help="Items to rescore")
+    parser.add_argument("--strategy", default="intelligent",
+                        help="Prioritization strategy")
+    args = parser.parse_args()
+
+    logging.getLogger("ContentPrioritizer").setLevel(logging.WARNING)
+    items = make_items(args.items, random.Random(3))
+
+    print(f"📊 Rescoring {args.items:,} items with the {args.strategy} strategy")
+    print("=" * 60)
+
+    prioritizer = UniversalContentPrioritizer()
+    start = time.perf_counter()
+    for item in items:
+        prioritizer.prioritize(item, args.strategy)
+    per_item = time.perf_counter() - start
+    print(f"per-item prioritize(): {per_item:6.2f}s ({args.items / per_item:,.0f} items/sec)")
+
+    prioritizer = UniversalContentPrioritizer()
+    start = time.perf_counter()
+    prioritizer.prioritize_batch(items, args.strategy, use_cache=False)
+    batch = time.perf_counter() - start
+    print(f"prioritize_batch():    {batch:6.2f}s ({args.items / batch:,.0f} items/sec)")
+
+    print(f"\n🚀 Speedup: {per_item / batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Storage Benchmark
+Measures items/sec stored by StorageManager with per-call connections,
+the pooled WAL connection layer, and the bulk ingestion path
+
+Usage:
+    python benchmarks/storage_benchmark.py --items 10000
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import ContentItem
+from storage.database import StorageManager
+
+
+def make_items(count: int, prefix: str):
+    """Create synthetic content items resembling a monitoring cycle"""
+    return [
+        ContentItem(
+            item_id=f"{prefix}_{i}",
+            source_id=f"source_{i % 200}",
+            title=f"Benchmark article {i} about React and TypeScript",
+            content="Synthetic benchmark content " * 20,
+            url=f"https://example.com/{prefix}/{i}",
+            published_date=datetime.now(),
+            author="Benchmark",
+            topics=["react", "typescript"],
+            metadata={"source": "benchmark", "domain": "example.com"}
+        )
+        for i in range(count)
+    ]
+
+
+async def store_per_item(storage: StorageManager, items) -> float:
+    """Store items one at a time the way monitor.py does, return seconds taken"""
+    start = time.perf_counter()
+    for item in items:
+        await storage.store_content(item, priority_score=0.5, priority_level="medium")
+    return time.perf_counter() - start
+
+
+def store_bulk(storage: StorageManager, items) -> float:
+    """Store items with one bulk transaction per source, return seconds taken"""
+    by_source = {}
+    for item in items:
+        by_source.setdefault(item.source_id, []).append((item, 0.5, "medium"))
+
+    start = time.perf_counter()
+    for batch in by_source.values():
+        storage.save_content_items_bulk(batch)
+    return time.perf_counter() - start
+
+
+def run_mode(label: str, items_count: int, pooled: bool, bulk: bool = False):
+    """Run one benchmark mode in a fresh database"""
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = StorageManager(db_path=str(Path(tmp) / "bench.db"), pooled=pooled)
+        items = make_items(items_count, label)
+
+        if bulk:
+            elapsed = store_bulk(storage, items)
+        else:
+            elapsed = asyncio.run(store_per_item(storage, items))
+
+        # Mix in the reads a cycle performs so the reader pool is exercised too
+        read_start = time.perf_counter()
+        for _ in range(100):
+            storage.get_recent_items(limit=20)
+            storage.get_item_count()
+        read_elapsed = time.perf_counter() - read_start
+
+        stored = storage.get_item_count()
+        pool_stats = storage.get_pool_stats()
+        storage.close()
+
+    print(f"{label:>10}: {stored} items in {elapsed:.2f}s "
+          f"({stored / elapsed:,.0f} items/sec), "
+          f"200 reads in {read_elapsed * 1000:.0f}ms")
+    if pool_stats:
+        print(f"{'':>10}  pool: {pool_stats['connections_opened']} connections opened, "
+              f"{pool_stats['write_checkouts']} write / {pool_stats['read_checkouts']} read checkouts")
+
+    return stored / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="StorageManager connection benchmark")
+    parser.add_argument("--items", type=int, default=10000,
+                        help="Items stored per simulated cycle")
+    parser.add_argument("--skip-unpooled", action="store_true",
+                        help="Only run the pooled mode")
+    args = parser.parse_args()
+
+    print(f"📊 Storing {args.items:,} items per cycle")
+    print("=" * 60)
+
+    bulk_rate = run_mode("bulk", args.items, pooled=True, bulk=True)
+    pooled_rate = run_mode("pooled", args.items, pooled=True)
+    if not args.skip_unpooled:
+        per_call_rate = run_mode("per-call", args.items, pooled=False)
+        print(f"\n🚀 Pooled speedup: {pooled_rate / per_call_rate:.1f}x, "
+              f"bulk speedup: {bulk_rate / per_call_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
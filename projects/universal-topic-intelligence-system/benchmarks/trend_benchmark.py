@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Trend Detection Benchmark
+Measures signal ingestion and trend summary latency of the bucketed signal
+store, and estimates the cost of the old list-rebuild approach
+
+Usage:
+    python benchmarks/trend_benchmark.py --signals 1000000
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.trend_detection_engine import TrendDetectionEngine, TrendSignal
+
+TOPICS = [
+    "react", "typescript", "python", "rust", "kubernetes", "llm", "agents", "webassembly",
+    "postgres", "htmx", "svelte", "vue", "nextjs", "deno", "bun", "go", "java", "swift",
+    "kotlin", "flutter", "terraform", "docker", "security", "observability", "vector-db"
+]
+
+
+def make_signals(count: int, rng: random.Random):
+    """Yield signals spread over the last 29 days, newest last"""
+    now = datetime.now()
+    span_seconds = 29 * 86400
+    for i in range(count):
+        yield TrendSignal(
+            timestamp=now - timedelta(seconds=span_seconds * (1 - i / count)),
+            topic=rng.choice(TOPICS),
+            value=rng.uniform(0.1, 2.0),
+            source_type="rss",
+            source_id=f"source_{rng.randrange(200)}",
+            content_id=f"content_{i}"
+        )
+
+
+def bench_ingest(engine: TrendDetectionEngine, count: int, rng: random.Random) -> float:
+    """Add count signals, return signals/sec"""
+    start = time.perf_counter()
+    for signal in make_signals(count, rng):
+        engine.add_signal(signal)
+    return count / (time.perf_counter() - start)
+
+
+def estimate_list_rebuild(history, total: int) -> float:
+    """
+    Estimated seconds per add for the old approach, which rebuilt the whole
+    history list with a comprehension on every add_content_signal
+    """
+    cutoff = datetime.now() - timedelta(days=30)
+    sample = list(history)
+    runs = 5
+    start = time.perf_counter()
+    for _ in range(runs):
+        [s for s in sample if s.timestamp >= cutoff]
+    per_rebuild = (time.perf_counter() - start) / runs
+    return per_rebuild * (total / len(sample))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Trend detection benchmark")
+    parser.add_argument("--signals", type=int, default=1000000,
+                        help="Signals to ingest")
+    parser.add_argument("--summaries", type=int, default=20,
+                        help="get_trend_summary calls per window")
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    engine = TrendDetectionEngine()
+
+    print(f"📊 Trend detection with {args.signals:,} signals across {len(TOPICS)} topics")
+    print("=" * 60)
+
+    rate = bench_ingest(engine, args.signals, rng)
+    stats = engine.signal_store.get_statistics()
+    print(f"Ingest: {rate:,.0f} signals/sec ({stats['backend']} backend, "
+          f"{stats['buckets_per_topic']} buckets/topic, {len(engine.signal_history):,} raw signals kept)")
+
+    for window in ["immediate", "short", "medium", "long"]:
+        start = time.perf_counter()
+        for _ in range(args.summaries):
+            summary = engine.get_trend_summary(window)
+        summary_ms = (time.perf_counter() - start) * 1000 / args.summaries
+        print(f"get_trend_summary({window!r:>11}): {summary_ms:7.2f} ms, "
+              f"{summary['total_signals_analyzed']:>9,} signals, {summary['total_trends']} trends")
+
+    start = time.perf_counter()
+    engine.analyze_trends("medium")
+    print(f"analyze_trends('medium') on the raw history: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    rebuild_seconds = estimate_list_rebuild(engine.signal_history, args.signals)
+    print(f"\n🐢 Old list rebuild at {args.signals:,} signals: ~{rebuild_seconds * 1000:.0f} ms per add "
+          f"(~{1 / rebuild_seconds:,.0f} signals/sec, extrapolated)")
+    print(f"🚀 Ingest speedup at this size: ~{rate * rebuild_seconds:,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ Universal Content Prioritizer
 Topic-agnostic content scoring and prioritization system
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, astuple, fields, replace
 from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime, timedelta
 from enum import Enum
@@ -12,7 +12,14 @@ import json
 import logging
 from abc import ABC, abstractmethod
 
+# Optional imports (batch scoring falls back to per-item scoring without NumPy)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from .universal_source_monitor import ContentItem, ContentPriority, SourceMetadata
+from .priority_cache import PriorityCache, content_hash
 
 @dataclass
 class PriorityFactors:
@@ -26,6 +33,9 @@ class PriorityFactors:
     actionability: float         # 0-1: How actionable the content is
     cross_topic_value: float     # 0-1: Value across multiple topics
 
+# Column order of factor matrices produced by PriorityStrategy.calculate_factors_matrix
+FACTOR_NAMES = tuple(f.name for f in fields(PriorityFactors))
+
 @dataclass
 class PriorityResult:
     """Result of priority calculation"""
@@ -68,6 +78,21 @@ class PriorityStrategy(ABC):
     def get_strategy_name(self) -> str:
         """Get strategy name"""
         pass
+    
+    def calculate_factors_matrix(self, contents: List[ContentItem], context: Dict[str, Any]) -> "np.ndarray":
+        """
+        Calculate priority factors for many items at once
+        
+        Strategies that can vectorize their scoring override this; the default
+        calls calculate_factors per item.
+        
+        Returns:
+            (len(contents), 8) array with columns in FACTOR_NAMES order
+        """
+        matrix = np.empty((len(contents), len(FACTOR_NAMES)), dtype=np.float64)
+        for row, content in enumerate(contents):
+            matrix[row] = astuple(self.calculate_factors(content, context))
+        return matrix
 
 class UniversalContentPrioritizer:
     """
@@ -87,9 +112,15 @@ class UniversalContentPrioritizer:
         self.strategies: Dict[str, PriorityStrategy] = {}
         self.topic_preferences: Dict[str, float] = {}
         self.source_scores: Dict[str, float] = {}
+        self.preferences_snapshot = self._preferences_snapshot()
         
-        # Cache for recent prioritizations
-        self.priority_cache = {}
+        # Bounded LRU cache for recent prioritizations
+        self.priority_cache = PriorityCache(
+            max_entries=self.config.get("cache_max_entries", 10000),
+            ttl_seconds=self.config.get("cache_ttl_minutes", 60) * 60
+        )
+        self.cache_key_mode = self.config.get("cache_key", "item_id")
+        self.total_prioritized = 0
         
         # Initialize default strategies
         self._init_default_strategies()
@@ -117,7 +148,9 @@ class UniversalContentPrioritizer:
                 "half_life_hours": 48,  # Content value halves every 48 hours
                 "max_age_days": 30      # Content older than 30 days gets minimal recency score
             },
-            "cache_ttl_minutes": 60
+            "cache_ttl_minutes": 60,
+            "cache_max_entries": 10000,
+            "cache_key": "item_id"  # or "content_hash" so re-fetched identical items hit
         }
     
     def _setup_logging(self) -> logging.Logger:
@@ -152,6 +185,9 @@ class UniversalContentPrioritizer:
     
     def register_strategy(self, name: str, strategy: PriorityStrategy):
         """Register a prioritization strategy"""
+        if name in self.strategies:
+            # Results cached under the replaced strategy are stale
+            self.invalidate_cache()
         self.strategies[name] = strategy
         self.logger.info(f"Registered strategy: {name}")
     
@@ -159,19 +195,55 @@ class UniversalContentPrioritizer:
         """
         Set topic preferences for relevance scoring
         
+        The mapping is copied, so later edits to the caller's dict have no
+        effect; call this again to change preferences rather than mutating
+        topic_preferences in place.
+        
         Args:
             preferences: Topic -> weight mapping (0-1)
         """
-        self.topic_preferences = preferences
+        self.topic_preferences = dict(preferences)
+        self._check_preferences()
     
     def set_source_authorities(self, authorities: Dict[str, float]):
         """
         Set source authority scores
         
+        The mapping is copied like in set_topic_preferences.
+        
         Args:
             authorities: Source ID -> authority score mapping (0-1)
         """
-        self.source_scores = authorities
+        self.source_scores = dict(authorities)
+        self._check_preferences()
+    
+    def _preferences_snapshot(self) -> tuple:
+        """Copy of the topic preferences and source authorities cached results depend on"""
+        return dict(self.topic_preferences), dict(self.source_scores)
+    
+    def _check_preferences(self):
+        """Invalidate the cache if preferences changed, including edits made in place"""
+        if (self.topic_preferences, self.source_scores) != self.preferences_snapshot:
+            self.preferences_snapshot = self._preferences_snapshot()
+            self.invalidate_cache()
+    
+    def invalidate_cache(self):
+        """Drop all cached results (call after changing weights or thresholds)"""
+        self.priority_cache.clear()
+        self.logger.debug("Priority cache invalidated")
+    
+    def _cache_key(self, content: ContentItem, strategy: str) -> str:
+        """Cache key for an item under a strategy"""
+        if self.cache_key_mode == "content_hash":
+            return f"{content_hash(content)}_{strategy}"
+        return f"{content.item_id}_{strategy}"
+    
+    def _get_cached(self, cache_key: str, content: ContentItem) -> Optional[PriorityResult]:
+        """Cached result for an item, re-pointed at this ContentItem if it is a re-fetched copy"""
+        result = self.priority_cache.get(cache_key)
+        if result is not None and result.content_item is not content:
+            result = replace(result, content_item=content)
+        return result
     
     def prioritize(
         self,
@@ -191,11 +263,11 @@ class UniversalContentPrioritizer:
             PriorityResult with score and reasoning
         """
         # Check cache
-        cache_key = f"{content.item_id}_{strategy}"
-        if cache_key in self.priority_cache:
-            cached = self.priority_cache[cache_key]
-            if self._is_cache_valid(cached["timestamp"]):
-                return cached["result"]
+        self._check_preferences()
+        cache_key = self._cache_key(content, strategy)
+        cached = self._get_cached(cache_key, content)
+        if cached is not None:
+            return cached
         
         # Prepare context
         full_context = {
@@ -234,10 +306,8 @@ class UniversalContentPrioritizer:
         )
         
         # Cache result
-        self.priority_cache[cache_key] = {
-            "result": result,
-            "timestamp": datetime.now()
-        }
+        self.priority_cache.put(cache_key, result)
+        self.total_prioritized += 1
         
         return result
     
@@ -245,24 +315,32 @@ class UniversalContentPrioritizer:
         self,
         content_items: List[ContentItem],
         strategy: str = "default",
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
     ) -> List[PriorityResult]:
         """
         Prioritize multiple content items and sort by priority
         
+        With NumPy installed, uncached items are scored together: the strategy
+        builds one factor matrix and the weighted totals and priority levels are
+        computed on whole arrays. Results match prioritize() item for item.
+        
         Args:
             content_items: List of content items
             strategy: Strategy to use
             context: Additional context
+            use_cache: Reuse cached results (disable to rescore after a weight change)
             
         Returns:
             Sorted list of PriorityResults (highest priority first)
         """
-        results = []
-        
-        for item in content_items:
-            result = self.prioritize(item, strategy, context)
-            results.append(result)
+        if np is None:
+            if not use_cache:
+                for item in content_items:
+                    self.priority_cache.pop(self._cache_key(item, strategy))
+            results = [self.prioritize(item, strategy, context) for item in content_items]
+        else:
+            results = self._prioritize_vectorized(content_items, strategy, context, use_cache)
         
         # Sort by total score (highest first)
         results.sort(key=lambda x: x.total_score, reverse=True)
@@ -271,6 +349,64 @@ class UniversalContentPrioritizer:
         
         return results
     
+    def _prioritize_vectorized(
+        self,
+        content_items: List[ContentItem],
+        strategy: str,
+        context: Optional[Dict[str, Any]],
+        use_cache: bool
+    ) -> List[PriorityResult]:
+        """Score uncached items with one factor matrix, in input order"""
+        self._check_preferences()
+        results: List[Optional[PriorityResult]] = [None] * len(content_items)
+        pending: Dict[str, List[int]] = {}
+        
+        for index, item in enumerate(content_items):
+            cache_key = self._cache_key(item, strategy)
+            if use_cache:
+                cached = self._get_cached(cache_key, item)
+                if cached is not None:
+                    results[index] = cached
+                    continue
+            pending.setdefault(cache_key, []).append(index)
+        
+        if pending:
+            full_context = {
+                "topic_preferences": self.topic_preferences,
+                "source_scores": self.source_scores,
+                "config": self.config,
+                **(context or {})
+            }
+            priority_strategy = self.strategies.get(strategy, self.strategies["default"])
+            
+            # Score each distinct item once, like the per-item cache would
+            first_indices = [indices[0] for indices in pending.values()]
+            items = [content_items[index] for index in first_indices]
+            matrix = priority_strategy.calculate_factors_matrix(items, full_context)
+            
+            scores = self._calculate_weighted_scores(matrix)
+            levels = self._determine_priority_levels(scores)
+            
+            for (cache_key, indices), item, row, score, level in zip(
+                pending.items(), items, matrix.tolist(), scores.tolist(), levels
+            ):
+                factors = PriorityFactors(*row)
+                result = PriorityResult(
+                    content_item=item,
+                    total_score=score,
+                    priority_level=level,
+                    factors=factors,
+                    reasoning=self._generate_reasoning(factors, level, strategy),
+                    recommendations=self._generate_recommendations(item, factors, level)
+                )
+                self.priority_cache.put(cache_key, result)
+                self.total_prioritized += 1
+                for index in indices:
+                    duplicate = content_items[index]
+                    results[index] = result if duplicate is item else replace(result, content_item=duplicate)
+        
+        return results
+    
     def _calculate_weighted_score(self, factors: PriorityFactors) -> float:
         """Calculate weighted total score from factors"""
         weights = self.config["weights"]
@@ -288,6 +424,31 @@ class UniversalContentPrioritizer:
         
         return min(1.0, max(0.0, score))  # Clamp to 0-1
     
+    def _calculate_weighted_scores(self, matrix: "np.ndarray") -> "np.ndarray":
+        """Vectorized _calculate_weighted_score over a factor matrix"""
+        weights = self.config["weights"]
+        
+        # Accumulate column by column in the same order as the scalar version
+        scores = np.zeros(matrix.shape[0], dtype=np.float64)
+        for column, name in enumerate(FACTOR_NAMES):
+            scores = scores + matrix[:, column] * weights[name]
+        
+        return np.clip(scores, 0.0, 1.0)  # Clamp to 0-1
+    
+    def _determine_priority_levels(self, scores: "np.ndarray") -> List[ContentPriority]:
+        """Vectorized _determine_priority_level"""
+        thresholds = self.config["thresholds"]
+        levels = [ContentPriority.CRITICAL, ContentPriority.HIGH, ContentPriority.MEDIUM,
+                  ContentPriority.LOW, ContentPriority.ARCHIVE]
+        
+        codes = np.select(
+            [scores >= thresholds["critical"], scores >= thresholds["high"],
+             scores >= thresholds["medium"], scores >= thresholds["low"]],
+            [0, 1, 2, 3],
+            default=4
+        )
+        return [levels[code] for code in codes.tolist()]
+    
     def _determine_priority_level(self, score: float) -> ContentPriority:
         """Determine priority level from score"""
         thresholds = self.config["thresholds"]
@@ -359,19 +520,15 @@ class UniversalContentPrioritizer:
         
         return recommendations
     
-    def _is_cache_valid(self, timestamp: datetime) -> bool:
-        """Check if cache entry is still valid"""
-        ttl = timedelta(minutes=self.config["cache_ttl_minutes"])
-        return datetime.now() - timestamp < ttl
-    
     def get_statistics(self) -> Dict[str, Any]:
         """Get prioritization statistics"""
         return {
-            "total_prioritized": len(self.priority_cache),
+            "total_prioritized": self.total_prioritized,
             "strategies_available": list(self.strategies.keys()),
             "topic_preferences_set": len(self.topic_preferences) > 0,
             "source_authorities_set": len(self.source_scores) > 0,
-            "cache_size": len(self.priority_cache)
+            "cache_size": len(self.priority_cache),
+            "cache": self.priority_cache.get_statistics()
         }
 
 
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Client Manager
+One pooled aiohttp session for every source monitor, with global and
+per-host connection limits, DNS caching and connection reuse statistics
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+
+class HTTPClientManager:
+    """
+    Owns the process-wide aiohttp ClientSession
+
+    The session is created lazily on the running event loop and shared by all
+    monitors, so requests to the same host reuse kept-alive connections and
+    resolved addresses. ``limit`` caps concurrent connections overall and
+    ``limit_per_host`` caps them per host, which keeps a cycle that gathers
+    hundreds of sources from opening hundreds of sockets at once. A session
+    bound to another loop, or to one that has since closed, is closed and
+    replaced on the next request.
+    """
+
+    def __init__(self,
+                 limit: int = 100,
+                 limit_per_host: int = 4,
+                 ttl_dns_cache: int = 300,
+                 keepalive_timeout: float = 30.0,
+                 timeout: float = 30.0):
+        """
+        Initialize HTTP client manager
+
+        Args:
+            limit: Maximum concurrent connections across all hosts
+            limit_per_host: Maximum concurrent connections to one host
+            ttl_dns_cache: Seconds a resolved address is cached
+            keepalive_timeout: Seconds an idle connection is kept open
+            timeout: Default total request timeout in seconds
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.logger = logging.getLogger("HTTPClientManager")
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.stats = {
+            'sessions_created': 0,
+            'requests': 0,
+            'connections_created': 0,
+            'connections_reused': 0,
+            'connection_queued': 0,
+            'dns_cache_hits': 0,
+            'dns_cache_misses': 0
+        }
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        """Trace hooks that feed the connection statistics"""
+        trace_config = aiohttp.TraceConfig()
+
+        def counter(name: str):
+            async def hook(session, context, params):
+                self.stats[name] += 1
+            return hook
+
+        trace_config.on_request_start.append(counter('requests'))
+        trace_config.on_connection_create_end.append(counter('connections_created'))
+        trace_config.on_connection_reuseconn.append(counter('connections_reused'))
+        trace_config.on_connection_queued_start.append(counter('connection_queued'))
+        trace_config.on_dns_cache_hit.append(counter('dns_cache_hits'))
+        trace_config.on_dns_cache_miss.append(counter('dns_cache_misses'))
+        return trace_config
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Shared session for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._loop is loop:
+            return self._session
+
+        if self._session is not None and not self._session.closed:
+            if self._loop is not None and not self._loop.is_closed():
+                self.logger.warning("HTTP session requested from a different event loop, creating a new one")
+            await self._close_stale_session()
+
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=True,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            trace_configs=[self._trace_config()]
+        )
+        self._loop = loop
+        self.stats['sessions_created'] += 1
+        return self._session
+
+    async def _close_stale_session(self):
+        """Release a session left behind by another (possibly closed) event loop"""
+        session, self._session = self._session, None
+        self._loop = None
+        try:
+            await session.close()
+        except Exception as e:
+            # Transports of a closed loop may no longer shut down cleanly
+            self.logger.debug(f"Error closing stale HTTP session: {e}")
+
+    async def close(self):
+        """Close the shared session and its pooled connections"""
+        session, self._session = self._session, None
+        self._loop = None
+        if session is not None and not session.closed:
+            await session.close()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Request, connection reuse and DNS cache counters"""
+        connections = self.stats['connections_created'] + self.stats['connections_reused']
+        return {
+            **self.stats,
+            'connection_reuse_rate': self.stats['connections_reused'] / connections if connections else 0.0,
+            'limit': self.limit,
+            'limit_per_host': self.limit_per_host,
+            'session_open': self._session is not None and not self._session.closed
+        }
+
+
+_shared_client: Optional[HTTPClientManager] = None
+
+
+def get_http_client() -> HTTPClientManager:
+    """Process-wide HTTPClientManager for callers that want to share one across monitors"""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = HTTPClientManager()
+    return _shared_client
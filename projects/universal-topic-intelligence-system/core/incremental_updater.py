@@ -31,7 +31,7 @@ class IncrementalUpdateManager:
         self._ensure_schema_updates()
         
     def _ensure_schema_updates(self):
-        """Add last_fetched column to sources table if it doesn't exist"""
+        """Add last_fetched and HTTP validator columns to sources table if they don't exist"""
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
@@ -47,6 +47,13 @@ class IncrementalUpdateManager:
                     """)
                     conn.commit()
                     self.logger.info("Added last_fetched column to sources table")
+                
+                # ETag / Last-Modified validators for conditional GET
+                for column in ('etag', 'last_modified'):
+                    if column not in columns:
+                        cursor.execute(f"ALTER TABLE sources ADD COLUMN {column} TEXT")
+                        conn.commit()
+                        self.logger.info(f"Added {column} column to sources table")
                     
                 # Add index for better performance
                 cursor.execute("""
@@ -118,6 +125,57 @@ class IncrementalUpdateManager:
             self.logger.error(f"Error updating last fetch time for {source_id}: {e}")
             raise
     
+    def get_http_validators(self, source_id: str) -> Dict[str, Optional[str]]:
+        """
+        Get the ETag and Last-Modified values from the last full fetch of a source
+        
+        Args:
+            source_id: ID of the source to check
+            
+        Returns:
+            Dictionary with 'etag' and 'last_modified' (None when unknown)
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT etag, last_modified FROM sources WHERE source_id = ?
+                """, (source_id,))
+                
+                result = cursor.fetchone()
+                if result:
+                    return {'etag': result[0], 'last_modified': result[1]}
+                
+        except Exception as e:
+            self.logger.error(f"Error getting HTTP validators for {source_id}: {e}")
+        
+        return {'etag': None, 'last_modified': None}
+    
+    def update_http_validators(self, source_id: str, etag: Optional[str], last_modified: Optional[str]):
+        """
+        Store the ETag and Last-Modified values returned by a source
+        
+        Args:
+            source_id: ID of the source
+            etag: ETag response header, or None
+            last_modified: Last-Modified response header, or None
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    UPDATE sources 
+                    SET etag = ?, last_modified = ?
+                    WHERE source_id = ?
+                """, (etag, last_modified, source_id))
+                
+                conn.commit()
+                
+        except Exception as e:
+            self.logger.error(f"Error updating HTTP validators for {source_id}: {e}")
+    
     def filter_new_items(self, source_id: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Filter items to only include those newer than the last fetch
@@ -336,13 +394,21 @@ class IncrementalUpdateManager:
                 """)
                 oldest, newest = cursor.fetchone()
                 
+                # Sources that can be polled with a conditional GET
+                cursor.execute("""
+                    SELECT COUNT(*) FROM sources 
+                    WHERE etag IS NOT NULL OR last_modified IS NOT NULL
+                """)
+                conditional_sources = cursor.fetchone()[0]
+                
                 return {
                     'total_sources': total_sources,
                     'sources_ever_fetched': fetched_sources,
                     'sources_updated_24h': recent_updates,
                     'oldest_fetch': oldest,
                     'newest_fetch': newest,
-                    'never_fetched': total_sources - fetched_sources
+                    'never_fetched': total_sources - fetched_sources,
+                    'sources_with_validators': conditional_sources
                 }
                 
         except Exception as e:
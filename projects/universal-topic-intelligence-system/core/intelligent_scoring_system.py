@@ -4,34 +4,161 @@ Intelligent Multi-Factor Scoring System
 Leverages MCP metadata for sophisticated content analysis and prioritization
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field, astuple
+from typing import Dict, List, Any, Optional, Tuple, Callable, Sequence
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import reduce
 import json
 import logging
 import re
 import math
+import time
 from abc import ABC, abstractmethod
 
+# Optional imports (batch scoring falls back to per-item scoring without NumPy)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from .universal_source_monitor import ContentItem, ContentPriority, SourceMetadata
-from .content_prioritizer import PriorityFactors, PriorityResult, PriorityStrategy
+from .content_prioritizer import FACTOR_NAMES, PriorityFactors, PriorityResult, PriorityStrategy
+
+
+# Scoring helpers
+#
+# Every analysis formula is written once against these helpers. They take a
+# single value (per-item scoring) or a NumPy column with one entry per item
+# (batch scoring), and text helpers take a string or a list of strings.
+
+_ARRAY_TYPES = (np.ndarray,) if np is not None else ()
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float))
+
+def _is_array(value: Any) -> bool:
+    return isinstance(value, _ARRAY_TYPES)
+
+def _is_numeric(value: Any) -> bool:
+    return isinstance(value, (int, float) + _ARRAY_TYPES)
+
+def _minimum(a, b):
+    if isinstance(a, _ARRAY_TYPES) or isinstance(b, _ARRAY_TYPES):
+        return np.minimum(a, b)
+    return min(a, b)
+
+def _maximum(a, b):
+    if isinstance(a, _ARRAY_TYPES) or isinstance(b, _ARRAY_TYPES):
+        return np.maximum(a, b)
+    return max(a, b)
+
+def _max_of(values: Sequence):
+    return reduce(_maximum, values)
+
+def _isnan(value):
+    return np.isnan(value) if _is_array(value) else math.isnan(value)
+
+def _where(condition, if_true, if_false):
+    if isinstance(condition, _ARRAY_TYPES):
+        return np.where(condition, if_true, if_false)
+    return if_true if condition else if_false
+
+def _divide(numerator, denominator):
+    """numerator / denominator, 0.0 where the denominator is 0"""
+    if _is_array(numerator) or _is_array(denominator):
+        numerator, denominator = np.broadcast_arrays(
+            np.asarray(numerator, dtype=np.float64), np.asarray(denominator, dtype=np.float64)
+        )
+        return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator != 0)
+    return numerator / denominator if denominator != 0 else 0.0
+
+def _tiered(value, tiers: Sequence[Tuple[Callable, float]], default: float):
+    """Score of the first (test, score) tier whose test passes, else default"""
+    if _is_array(value):
+        return np.select([test(value) for test, _ in tiers], [score for _, score in tiers], default=default)
+    for test, score in tiers:
+        if test(value):
+            return score
+    return default
+
+def _conditional_mean(values: Sequence, keep: Callable, default: float):
+    """Mean of the values passing keep, default when none do"""
+    if not any(isinstance(value, _ARRAY_TYPES) for value in values):
+        kept = [value for value in values if keep(value)]
+        return sum(kept) / len(kept) if kept else default
+    
+    total, count = 0.0, 0
+    for value in values:
+        mask = keep(value)
+        total = total + np.where(mask, value, 0.0)
+        count = count + mask
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(count > 0, total / count, default)
+
+def _lower(texts):
+    return texts.lower() if isinstance(texts, str) else [text.lower() for text in texts]
+
+def _length(texts):
+    return len(texts) if isinstance(texts, str) else np.array([len(text) for text in texts], dtype=np.float64)
+
+def _joined(first, second):
+    """f"{first} {second}" for one text or for each pair of texts"""
+    if isinstance(first, str):
+        return f"{first} {second or ''}"
+    return [f"{a} {b or ''}" for a, b in zip(first, second)]
+
+def _indicator_count(texts, indicators: Sequence[str]):
+    """How many indicators occur in a text, or in each text of a list (one pass per indicator)"""
+    if isinstance(texts, str):
+        return sum(1 for indicator in indicators if indicator in texts)
+    
+    counts = np.zeros(len(texts), dtype=np.float64)
+    for indicator in indicators:
+        counts += [indicator in text for text in texts]
+    return counts
+
+def _score_each(scorer: Callable, *columns):
+    """scorer(*values) for one item, or an array of scores for each row of the columns"""
+    if isinstance(columns[0], list):
+        return np.array([scorer(*row) for row in zip(*columns)], dtype=np.float64)
+    return scorer(*columns)
+
+def _score_distinct(values, scorer: Callable):
+    """scorer(value) for one value, or an array of scores computed once per distinct value"""
+    if isinstance(values, list):
+        scores = {value: scorer(value) for value in set(values)}
+        return np.array([scores[value] for value in values], dtype=np.float64)
+    return scorer(values)
 
 @dataclass
 class MCPAnalysisResult:
-    """Results from MCP-specific content analysis"""
+    """
+    Results from MCP-specific content analysis
+    
+    From analyze_mcp_batch() every value is a column with one entry per item.
+    """
     source_type: str
     quality_indicators: Dict[str, float]  # Specific quality metrics
     engagement_metrics: Dict[str, Any]    # Engagement data
     technical_metrics: Dict[str, Any]     # Technical indicators
     trending_signals: Dict[str, float]    # Trend indicators
     authority_signals: Dict[str, float]   # Authority indicators
-    
+
 class IntelligentAnalysisEngine:
     """
     Core engine for intelligent content analysis using MCP metadata
     """
     
+    # Analysis inputs that batch analysis stores as numeric columns; items whose
+    # metadata has anything else there are left to per-item analysis
+    NUMERIC_INPUTS = {
+        "youtube_transcript": ("age_hours", "views", "likes", "duration_seconds"),
+        "github_repository": ("age_hours", "stars", "forks", "open_issues"),
+        "web_search": ("age_hours", "search_rank", "relevance_score"),
+        "generic": ("age_hours", "engagement_score", "social_signals")
+    }
+    
     def __init__(self):
         self.logger = logging.getLogger("IntelligentAnalysis")
         
@@ -62,47 +189,139 @@ class IntelligentAnalysisEngine:
                 }
             }
         }
+        
+        # Source type -> (input extraction for one item, analysis of those inputs)
+        self.analyzers = {
+            "youtube_transcript": (self._youtube_inputs, self._analyze_youtube_content),
+            "github_repository": (self._github_inputs, self._analyze_github_content),
+            "web_search": (self._search_inputs, self._analyze_search_content),
+            "generic": (self._generic_inputs, self._analyze_generic_content)
+        }
     
     def analyze_mcp_content(self, content: ContentItem) -> MCPAnalysisResult:
         """
         Perform intelligent analysis of MCP content using metadata
         """
-        mcp_source_type = content.metadata.get("mcp_source_type")
+        extract_inputs, analyze = self.analyzers[self._analysis_type(content)]
+        return analyze(extract_inputs(content))
+    
+    def analyze_mcp_batch(self, contents: List[ContentItem]) -> Tuple[List[Tuple[List[int], MCPAnalysisResult]], List[int]]:
+        """
+        Analyze many items with the formulas of analyze_mcp_content()
         
-        if not mcp_source_type:
-            # Fallback for non-MCP content
-            return self._analyze_generic_content(content)
+        Items are grouped by source type and each group is analyzed once on
+        columns of its inputs. Requires NumPy.
         
-        if mcp_source_type == "youtube_transcript":
-            return self._analyze_youtube_content(content)
-        elif mcp_source_type == "github_repository":
-            return self._analyze_github_content(content)
-        elif mcp_source_type == "web_search":
-            return self._analyze_search_content(content)
-        else:
-            return self._analyze_generic_content(content)
+        Returns:
+            ([(item indices, analysis with one column entry per index)],
+             indices of items with non-numeric metadata that need analyze_mcp_content())
+        """
+        groups: Dict[str, List[int]] = {}
+        for index, content in enumerate(contents):
+            groups.setdefault(self._analysis_type(content), []).append(index)
+        
+        results = []
+        fallback = []
+        
+        for source_type, indices in groups.items():
+            extract_inputs, analyze = self.analyzers[source_type]
+            numeric = self.NUMERIC_INPUTS[source_type]
+            
+            rows, kept = [], []
+            for index in indices:
+                inputs = extract_inputs(contents[index])
+                if all(_is_number(inputs[name]) for name in numeric):
+                    rows.append(inputs)
+                    kept.append(index)
+                else:
+                    fallback.append(index)
+            
+            if not rows:
+                continue
+            
+            columns = {
+                name: np.array([row[name] for row in rows], dtype=np.float64) if name in numeric
+                else [row[name] for row in rows]
+                for name in rows[0]
+            }
+            with np.errstate(divide="ignore", invalid="ignore"):
+                results.append((kept, analyze(columns)))
+        
+        return results, fallback
     
-    def _analyze_youtube_content(self, content: ContentItem) -> MCPAnalysisResult:
-        """Analyze YouTube content using video metadata"""
+    def _analysis_type(self, content: ContentItem) -> str:
+        """Analyzer key for an item (non-MCP and unknown sources get the generic analysis)"""
+        mcp_source_type = content.metadata.get("mcp_source_type")
+        return mcp_source_type if mcp_source_type in self.analyzers else "generic"
+    
+    def _common_inputs(self, content: ContentItem) -> Dict[str, Any]:
+        """Analysis inputs shared by every source type"""
+        published_date = content.published_date
+        return {
+            "title": content.title or "",
+            "text": content.content or "",
+            "age_hours": (time.time() - published_date.timestamp()) / 3600 if published_date else math.nan,
+            "topics": content.topics
+        }
+    
+    def _youtube_inputs(self, content: ContentItem) -> Dict[str, Any]:
+        """Extract YouTube-specific data"""
         metadata = content.metadata
-        
-        # Extract YouTube-specific data
-        view_count = metadata.get("youtube_view_count", 0)
-        like_count = metadata.get("youtube_like_count", 0)
-        channel = metadata.get("youtube_channel", "")
-        duration = metadata.get("youtube_duration", "")
-        video_id = metadata.get("youtube_video_id", "")
-        language = metadata.get("youtube_language", "")
-        
-        # Calculate duration in seconds
-        duration_seconds = self._parse_youtube_duration(duration)
+        return {
+            **self._common_inputs(content),
+            "views": metadata.get("youtube_view_count", 0),
+            "likes": metadata.get("youtube_like_count", 0),
+            "channel": metadata.get("youtube_channel", ""),
+            "duration_seconds": self._parse_youtube_duration(metadata.get("youtube_duration", "")),
+            "language": metadata.get("youtube_language", "")
+        }
+    
+    def _github_inputs(self, content: ContentItem) -> Dict[str, Any]:
+        """Extract GitHub-specific data"""
+        metadata = content.metadata
+        return {
+            **self._common_inputs(content),
+            "stars": metadata.get("github_stars", 0),
+            "forks": metadata.get("github_forks", 0),
+            "language": metadata.get("github_language", ""),
+            "license": metadata.get("github_license", ""),
+            "open_issues": metadata.get("github_open_issues", 0),
+            "repo_name": metadata.get("github_repo_name", "")
+        }
+    
+    def _search_inputs(self, content: ContentItem) -> Dict[str, Any]:
+        """Extract search-specific data"""
+        metadata = content.metadata
+        return {
+            **self._common_inputs(content),
+            "url": content.url,
+            "search_query": metadata.get("search_query", ""),
+            "search_rank": metadata.get("search_rank", 0),
+            "relevance_score": metadata.get("search_relevance_score", 0.0),
+            "domain": metadata.get("search_domain", "")
+        }
+    
+    def _generic_inputs(self, content: ContentItem) -> Dict[str, Any]:
+        """Extract the engagement hints available for non-MCP content"""
+        metadata = content.metadata
+        return {
+            **self._common_inputs(content),
+            "engagement_score": metadata.get("engagement_score", 0.3),
+            "social_signals": metadata.get("social_signals", 0.3)
+        }
+    
+    def _analyze_youtube_content(self, item: Dict[str, Any]) -> MCPAnalysisResult:
+        """Analyze YouTube content using video metadata"""
+        view_count = item["views"]
+        like_count = item["likes"]
+        duration_seconds = item["duration_seconds"]
         
         # Quality indicators
         quality_indicators = {
-            "channel_authority": self._calculate_channel_authority(channel),
+            "channel_authority": _score_distinct(item["channel"], self._calculate_channel_authority),
             "content_length": self._score_video_length(duration_seconds),
             "production_quality": self._estimate_production_quality(view_count, like_count),
-            "language_quality": 1.0 if language == "en" else 0.7
+            "language_quality": _score_distinct(item["language"], self._score_video_language)
         }
         
         # Engagement metrics
@@ -116,22 +335,22 @@ class IntelligentAnalysisEngine:
         # Technical metrics
         technical_metrics = {
             "duration_seconds": duration_seconds,
-            "is_tutorial": self._detect_tutorial_content(content.title, content.content),
-            "has_code_examples": self._detect_code_content(content.content),
-            "technical_depth": self._assess_technical_depth(content.content)
+            "is_tutorial": self._detect_tutorial_content(item["title"], item["text"]),
+            "has_code_examples": self._detect_code_content(item["text"]),
+            "technical_depth": self._assess_technical_depth(item["text"])
         }
         
         # Trending signals
         trending_signals = {
-            "view_velocity": self._estimate_view_velocity(view_count, content.published_date),
-            "recency_boost": self._calculate_recency_boost(content.published_date),
-            "topic_momentum": self._assess_topic_momentum(content.topics)
+            "view_velocity": self._estimate_view_velocity(view_count, item["age_hours"]),
+            "recency_boost": self._calculate_recency_boost(item["age_hours"]),
+            "topic_momentum": self._assess_topic_momentum(item["topics"])
         }
         
         # Authority signals
         authority_signals = {
             "channel_reputation": quality_indicators["channel_authority"],
-            "view_authority": min(1.0, view_count / 50000),
+            "view_authority": _minimum(1.0, view_count / 50000),
             "engagement_authority": engagement_metrics["engagement_rate"]
         }
         
@@ -144,52 +363,46 @@ class IntelligentAnalysisEngine:
             authority_signals=authority_signals
         )
     
-    def _analyze_github_content(self, content: ContentItem) -> MCPAnalysisResult:
+    def _analyze_github_content(self, item: Dict[str, Any]) -> MCPAnalysisResult:
         """Analyze GitHub repository using repository metadata"""
-        metadata = content.metadata
-        
-        # Extract GitHub-specific data
-        stars = metadata.get("github_stars", 0)
-        forks = metadata.get("github_forks", 0)
-        language = metadata.get("github_language", "")
-        license = metadata.get("github_license", "")
-        open_issues = metadata.get("github_open_issues", 0)
-        repo_name = metadata.get("github_repo_name", "")
+        stars = item["stars"]
+        forks = item["forks"]
+        open_issues = item["open_issues"]
         
         # Quality indicators
         quality_indicators = {
             "star_quality": self._score_repository_stars(stars),
-            "language_relevance": self._score_programming_language(language),
+            "language_relevance": _score_distinct(item["language"], self._score_programming_language),
             "maintenance_quality": self._assess_maintenance_quality(open_issues, forks),
-            "license_compliance": self._score_license_quality(license)
+            "license_compliance": _score_distinct(item["license"], self._score_license_quality)
         }
         
         # Engagement metrics
         engagement_metrics = {
             "stars": stars,
             "forks": forks,
-            "fork_ratio": forks / max(1, stars),
+            "fork_ratio": forks / _maximum(1, stars),
             "community_engagement": self._calculate_github_engagement(stars, forks, open_issues)
         }
         
         # Technical metrics
         technical_metrics = {
-            "is_framework": self._detect_framework_repo(repo_name, content.title),
-            "is_library": self._detect_library_repo(repo_name, content.title),
-            "has_documentation": self._detect_documentation_quality(content.content),
-            "code_quality_indicators": self._assess_code_quality_signals(metadata)
+            "is_framework": self._detect_framework_repo(item["repo_name"], item["title"]),
+            "is_library": self._detect_library_repo(item["repo_name"], item["title"]),
+            "has_documentation": self._detect_documentation_quality(item["text"]),
+            "code_quality_indicators": self._assess_code_quality_signals(stars, forks)
         }
         
         # Trending signals
         trending_signals = {
             "star_velocity": self._estimate_star_velocity(stars),
-            "activity_level": self._assess_repository_activity(content.published_date),
-            "ecosystem_relevance": self._assess_ecosystem_relevance(language, content.topics)
+            "activity_level": self._assess_repository_activity(item["age_hours"]),
+            "ecosystem_relevance": _score_each(self._assess_ecosystem_relevance, item["language"], item["topics"])
         }
         
         # Authority signals
         authority_signals = {
-            "community_authority": min(1.0, stars / 5000),
+            "community_authority": _minimum(1.0, stars / 5000),
             "technical_authority": quality_indicators["language_relevance"],
             "ecosystem_authority": trending_signals["ecosystem_relevance"]
         }
@@ -203,44 +416,39 @@ class IntelligentAnalysisEngine:
             authority_signals=authority_signals
         )
     
-    def _analyze_search_content(self, content: ContentItem) -> MCPAnalysisResult:
+    def _analyze_search_content(self, item: Dict[str, Any]) -> MCPAnalysisResult:
         """Analyze web search content using search metadata"""
-        metadata = content.metadata
-        
-        # Extract search-specific data
-        search_query = metadata.get("search_query", "")
-        search_rank = metadata.get("search_rank", 0)
-        search_engine = metadata.get("search_engine", "")
-        relevance_score = metadata.get("search_relevance_score", 0.0)
-        domain = metadata.get("search_domain", "")
+        search_query = item["search_query"]
+        search_rank = item["search_rank"]
+        domain = item["domain"]
         
         # Quality indicators
         quality_indicators = {
-            "domain_authority": self._score_domain_authority(domain),
-            "search_relevance": relevance_score,
+            "domain_authority": _score_distinct(domain, self._score_domain_authority),
+            "search_relevance": item["relevance_score"],
             "rank_quality": self._score_search_rank(search_rank),
-            "content_completeness": self._assess_content_completeness(content.content)
+            "content_completeness": self._assess_content_completeness(item["text"])
         }
         
         # Engagement metrics (limited for search content)
         engagement_metrics = {
             "search_rank": search_rank,
-            "query_relevance": self._calculate_query_relevance(search_query, content.title),
-            "click_worthiness": self._assess_click_worthiness(content.title, content.url)
+            "query_relevance": _score_each(self._calculate_query_relevance, search_query, item["title"]),
+            "click_worthiness": self._assess_click_worthiness(item["title"], item["url"])
         }
         
         # Technical metrics
         technical_metrics = {
-            "is_documentation": self._detect_documentation_content(domain, content.title),
-            "is_tutorial": self._detect_tutorial_content(content.title, content.content),
-            "technical_depth": self._assess_technical_depth(content.content)
+            "is_documentation": self._detect_documentation_content(domain, item["title"]),
+            "is_tutorial": self._detect_tutorial_content(item["title"], item["text"]),
+            "technical_depth": self._assess_technical_depth(item["text"])
         }
         
         # Trending signals
         trending_signals = {
             "query_momentum": self._assess_query_momentum(search_query),
-            "domain_freshness": self._assess_domain_freshness(domain),
-            "content_recency": self._calculate_recency_boost(content.published_date)
+            "domain_freshness": _score_distinct(domain, self._assess_domain_freshness),
+            "content_recency": self._calculate_recency_boost(item["age_hours"])
         }
         
         # Authority signals
@@ -259,33 +467,33 @@ class IntelligentAnalysisEngine:
             authority_signals=authority_signals
         )
     
-    def _analyze_generic_content(self, content: ContentItem) -> MCPAnalysisResult:
+    def _analyze_generic_content(self, item: Dict[str, Any]) -> MCPAnalysisResult:
         """Fallback analysis for non-MCP content"""
         
         # Basic quality indicators
         quality_indicators = {
-            "content_length": min(1.0, len(content.content or "") / 1000),
-            "title_quality": self._assess_title_quality(content.title),
+            "content_length": _minimum(1.0, _length(item["text"]) / 1000),
+            "title_quality": self._assess_title_quality(item["title"]),
             "source_reliability": 0.5,  # Default
             "language_quality": 0.8    # Assume good
         }
         
         # Basic engagement metrics
         engagement_metrics = {
-            "estimated_engagement": content.metadata.get("engagement_score", 0.3),
-            "social_signals": content.metadata.get("social_signals", 0.3)
+            "estimated_engagement": item["engagement_score"],
+            "social_signals": item["social_signals"]
         }
         
         # Basic technical metrics
         technical_metrics = {
-            "is_technical": self._detect_technical_content(content.title, content.content),
-            "has_examples": self._detect_code_content(content.content),
-            "technical_depth": self._assess_technical_depth(content.content)
+            "is_technical": self._detect_technical_content(item["title"], item["text"]),
+            "has_examples": self._detect_code_content(item["text"]),
+            "technical_depth": self._assess_technical_depth(item["text"])
         }
         
         # Basic trending signals
         trending_signals = {
-            "recency_factor": self._calculate_recency_boost(content.published_date),
+            "recency_factor": self._calculate_recency_boost(item["age_hours"]),
             "topic_relevance": 0.5
         }
         
@@ -339,63 +547,49 @@ class IntelligentAnalysisEngine:
         
         return 0.5  # Default authority
     
+    def _score_video_language(self, language: str) -> float:
+        """Score video language (English content preferred)"""
+        return 1.0 if language == "en" else 0.7
+    
     def _score_video_length(self, duration_seconds: int) -> float:
         """Score video based on optimal length for educational content"""
-        if duration_seconds == 0:
-            return 0.3
-        
-        # Optimal length for tutorials: 5-30 minutes
-        if 300 <= duration_seconds <= 1800:  # 5-30 minutes
-            return 1.0
-        elif 60 <= duration_seconds <= 300:   # 1-5 minutes
-            return 0.7
-        elif 1800 < duration_seconds <= 3600: # 30-60 minutes
-            return 0.8
-        else:
-            return 0.4  # Too short or too long
+        return _tiered(duration_seconds, (
+            (lambda s: s == 0, 0.3),
+            # Optimal length for tutorials: 5-30 minutes
+            (lambda s: (300 <= s) & (s <= 1800), 1.0),
+            (lambda s: (60 <= s) & (s <= 300), 0.7),     # 1-5 minutes
+            (lambda s: (1800 < s) & (s <= 3600), 0.8)    # 30-60 minutes
+        ), 0.4)  # Too short or too long
     
     def _estimate_production_quality(self, views: int, likes: int) -> float:
         """Estimate production quality from engagement metrics"""
-        if views == 0:
-            return 0.3
-        
-        like_ratio = likes / views if views > 0 else 0
+        like_ratio = _divide(likes, views)
         
         # High like ratio indicates good production quality
-        if like_ratio > 0.05:  # 5% like ratio is excellent
-            return 1.0
-        elif like_ratio > 0.02:  # 2% is good
-            return 0.8
-        elif like_ratio > 0.01:  # 1% is average
-            return 0.6
-        else:
-            return 0.4
+        return _where(views == 0, 0.3, _tiered(like_ratio, (
+            (lambda r: r > 0.05, 1.0),  # 5% like ratio is excellent
+            (lambda r: r > 0.02, 0.8),  # 2% is good
+            (lambda r: r > 0.01, 0.6)   # 1% is average
+        ), 0.4))
     
     def _calculate_youtube_engagement(self, views: int, likes: int) -> float:
         """Calculate YouTube engagement rate"""
-        if views == 0:
-            return 0.0
-        
-        return min(1.0, likes / views * 100)  # Like rate as percentage
+        return _where(views == 0, 0.0, _minimum(1.0, _divide(likes, views) * 100))  # Like rate as percentage
     
     def _calculate_viral_factor(self, views: int) -> float:
         """Calculate viral factor based on view count"""
         viral_threshold = self.quality_thresholds["youtube_transcript"]["viral_views"]
-        return min(1.0, views / viral_threshold)
+        return _minimum(1.0, views / viral_threshold)
     
     # Helper methods for GitHub analysis
     def _score_repository_stars(self, stars: int) -> float:
         """Score repository based on star count"""
-        if stars >= 10000:
-            return 1.0
-        elif stars >= 1000:
-            return 0.8
-        elif stars >= 100:
-            return 0.6
-        elif stars >= 10:
-            return 0.4
-        else:
-            return 0.2
+        return _tiered(stars, (
+            (lambda s: s >= 10000, 1.0),
+            (lambda s: s >= 1000, 0.8),
+            (lambda s: s >= 100, 0.6),
+            (lambda s: s >= 10, 0.4)
+        ), 0.2)
     
     def _score_programming_language(self, language: str) -> float:
         """Score based on programming language relevance"""
@@ -415,20 +609,14 @@ class IntelligentAnalysisEngine:
     
     def _assess_maintenance_quality(self, open_issues: int, forks: int) -> float:
         """Assess repository maintenance quality"""
-        if forks == 0:
-            return 0.3  # No community engagement
-        
         # Low issue-to-fork ratio indicates good maintenance
-        issue_ratio = open_issues / max(1, forks)
-        
-        if issue_ratio < 0.1:
-            return 1.0  # Excellent maintenance
-        elif issue_ratio < 0.3:
-            return 0.8  # Good maintenance
-        elif issue_ratio < 0.5:
-            return 0.6  # Average maintenance
-        else:
-            return 0.4  # Poor maintenance
+        issue_ratio = open_issues / _maximum(1, forks)
+        
+        return _where(forks == 0, 0.3, _tiered(issue_ratio, (  # No community engagement
+            (lambda r: r < 0.1, 1.0),  # Excellent maintenance
+            (lambda r: r < 0.3, 0.8),  # Good maintenance
+            (lambda r: r < 0.5, 0.6)   # Average maintenance
+        ), 0.4))  # Poor maintenance
     
     def _score_license_quality(self, license: str) -> float:
         """Score license based on openness and adoption"""
@@ -467,18 +655,13 @@ class IntelligentAnalysisEngine:
     
     def _score_search_rank(self, rank: int) -> float:
         """Score based on search result ranking"""
-        if rank <= 0:
-            return 0.5
-        
         # Higher ranks (lower numbers) are better
-        if rank <= 3:
-            return 1.0
-        elif rank <= 10:
-            return 0.8
-        elif rank <= 20:
-            return 0.6
-        else:
-            return 0.4
+        return _tiered(rank, (
+            (lambda r: r <= 0, 0.5),
+            (lambda r: r <= 3, 1.0),
+            (lambda r: r <= 10, 0.8),
+            (lambda r: r <= 20, 0.6)
+        ), 0.4)
     
     # Common helper methods
     def _detect_tutorial_content(self, title: str, content: str) -> float:
@@ -488,100 +671,73 @@ class IntelligentAnalysisEngine:
             "introduction", "getting started", "walkthrough", "course"
         ]
         
-        text = f"{title} {content or ''}".lower()
-        matches = sum(1 for indicator in tutorial_indicators if indicator in text)
+        matches = _indicator_count(_lower(_joined(title, content)), tutorial_indicators)
         
-        return min(1.0, matches / 3)  # Normalize to 0-1
+        return _minimum(1.0, matches / 3)  # Normalize to 0-1
     
     def _detect_code_content(self, content: str) -> float:
         """Detect presence of code examples"""
-        if not content:
-            return 0.0
-        
         code_indicators = [
             "```", "function", "const ", "import ", "from ", "class ",
             "def ", "return ", "console.log", "useState", "useEffect"
         ]
         
-        matches = sum(1 for indicator in code_indicators if indicator in content)
-        return min(1.0, matches / 5)  # Normalize to 0-1
+        matches = _indicator_count(content, code_indicators)
+        return _minimum(1.0, matches / 5)  # Normalize to 0-1
     
     def _assess_technical_depth(self, content: str) -> float:
         """Assess technical depth of content"""
-        if not content:
-            return 0.0
-        
         technical_terms = [
             "api", "algorithm", "architecture", "performance", "optimization",
             "security", "scalability", "database", "backend", "frontend",
             "framework", "library", "component", "interface", "implementation"
         ]
         
-        content_lower = content.lower()
-        matches = sum(1 for term in technical_terms if term in content_lower)
+        matches = _indicator_count(_lower(content), technical_terms)
         
         # Also consider content length as depth indicator
-        length_factor = min(1.0, len(content) / 2000)
+        length_factor = _minimum(1.0, _length(content) / 2000)
         
-        return min(1.0, (matches / 10) * 0.7 + length_factor * 0.3)
+        return _minimum(1.0, (matches / 10) * 0.7 + length_factor * 0.3)
     
-    def _calculate_recency_boost(self, published_date: Optional[datetime]) -> float:
-        """Calculate recency boost factor"""
-        if not published_date:
-            return 0.3
-        
-        now = datetime.now(published_date.tzinfo) if published_date.tzinfo else datetime.now()
-        age_hours = (now - published_date).total_seconds() / 3600
-        
+    def _calculate_recency_boost(self, age_hours: float) -> float:
+        """Calculate recency boost factor (age_hours is NaN for undated content)"""
         # Boost recent content
-        if age_hours < 24:
-            return 1.0
-        elif age_hours < 168:  # 1 week
-            return 0.8
-        elif age_hours < 720:  # 1 month
-            return 0.6
-        else:
-            return 0.4
+        return _where(_isnan(age_hours), 0.3, _tiered(age_hours, (
+            (lambda h: h < 24, 1.0),
+            (lambda h: h < 168, 0.8),  # 1 week
+            (lambda h: h < 720, 0.6)   # 1 month
+        ), 0.4))
     
     def _assess_title_quality(self, title: str) -> float:
         """Assess title quality and descriptiveness"""
-        if not title:
-            return 0.1
-        
-        # Good title indicators
-        quality_indicators = 0.0
+        title_lower = _lower(title)
+        length = _length(title)
         
         # Reasonable length
-        if 20 <= len(title) <= 100:
-            quality_indicators += 0.3
+        quality_indicators = _where((20 <= length) & (length <= 100), 0.3, 0.0)
         
         # Contains action words
         action_words = ["how", "guide", "tutorial", "learn", "build", "create", "develop"]
-        if any(word in title.lower() for word in action_words):
-            quality_indicators += 0.3
+        quality_indicators = quality_indicators + _where(_indicator_count(title_lower, action_words) > 0, 0.3, 0.0)
         
         # Contains technical terms
-        if any(char.isupper() for char in title):  # Has capitalization
-            quality_indicators += 0.2
+        has_capitals = _score_each(lambda text: any(char.isupper() for char in text), title)  # Has capitalization
+        quality_indicators = quality_indicators + _where(has_capitals > 0, 0.2, 0.0)
         
         # Not clickbait
         clickbait_words = ["you won't believe", "shocking", "amazing", "incredible"]
-        if not any(word in title.lower() for word in clickbait_words):
-            quality_indicators += 0.2
+        quality_indicators = quality_indicators + _where(_indicator_count(title_lower, clickbait_words) == 0, 0.2, 0.0)
         
-        return min(1.0, quality_indicators)
+        return _where(length == 0, 0.1, _minimum(1.0, quality_indicators))
     
     # Placeholder methods for complex analysis (can be enhanced later)
-    def _estimate_view_velocity(self, views: int, published_date: Optional[datetime]) -> float:
+    def _estimate_view_velocity(self, views: int, age_hours: float) -> float:
         """Estimate view velocity (views per day)"""
-        if not published_date or views == 0:
-            return 0.0
-        
-        now = datetime.now(published_date.tzinfo) if published_date.tzinfo else datetime.now()
-        age_days = max(1, (now - published_date).days)
+        age_days = _maximum(1, age_hours // 24)
         
         velocity = views / age_days
-        return min(1.0, velocity / 1000)  # Normalize to daily views
+        return _where(_isnan(age_hours) | (views == 0), 0.0, _minimum(1.0, velocity / 1000))  # Normalize to daily views
     
     def _assess_topic_momentum(self, topics: List[str]) -> float:
         """Assess momentum of topics (placeholder)"""
@@ -591,11 +747,11 @@ class IntelligentAnalysisEngine:
     def _estimate_star_velocity(self, stars: int) -> float:
         """Estimate star velocity (placeholder)"""
         # Could be enhanced with historical data
-        return min(1.0, stars / 5000)
+        return _minimum(1.0, stars / 5000)
     
-    def _assess_repository_activity(self, published_date: Optional[datetime]) -> float:
+    def _assess_repository_activity(self, age_hours: float) -> float:
         """Assess repository activity level"""
-        return self._calculate_recency_boost(published_date)
+        return self._calculate_recency_boost(age_hours)
     
     def _assess_ecosystem_relevance(self, language: str, topics: List[str]) -> float:
         """Assess relevance to current ecosystem trends"""
@@ -620,15 +776,12 @@ class IntelligentAnalysisEngine:
     
     def _calculate_github_engagement(self, stars: int, forks: int, issues: int) -> float:
         """Calculate GitHub community engagement"""
-        if stars == 0:
-            return 0.0
-        
         # Engagement formula: consider forks and active issues relative to stars
-        fork_ratio = forks / stars
-        issue_activity = min(1.0, issues / max(1, stars))
+        fork_ratio = _divide(forks, stars)
+        issue_activity = _minimum(1.0, issues / _maximum(1, stars))
         
         engagement = (fork_ratio * 0.6 + issue_activity * 0.4)
-        return min(1.0, engagement)
+        return _where(stars == 0, 0.0, _minimum(1.0, engagement))
     
     def _calculate_query_relevance(self, query: str, title: str) -> float:
         """Calculate relevance between search query and result title"""
@@ -659,72 +812,58 @@ class IntelligentAnalysisEngine:
     
     def _assess_content_completeness(self, content: str) -> float:
         """Assess how complete the content appears"""
-        if not content:
-            return 0.2
-        
         # Simple completeness indicators
-        length_score = min(1.0, len(content) / 1500)
-        has_structure = any(indicator in content for indicator in ["##", "- ", "1.", "* "])
-        structure_score = 0.3 if has_structure else 0.0
+        length = _length(content)
+        length_score = _minimum(1.0, length / 1500)
+        has_structure = _indicator_count(content, ["##", "- ", "1.", "* "]) > 0
+        structure_score = _where(has_structure, 0.3, 0.0)
         
-        return min(1.0, length_score * 0.7 + structure_score)
+        return _where(length == 0, 0.2, _minimum(1.0, length_score * 0.7 + structure_score))
     
     def _detect_documentation_content(self, domain: str, title: str) -> float:
         """Detect if content is documentation"""
         doc_indicators = ["docs", "documentation", "api", "reference", "guide"]
-        text = f"{domain} {title}".lower()
         
-        matches = sum(1 for indicator in doc_indicators if indicator in text)
-        return min(1.0, matches / 2)
+        matches = _indicator_count(_lower(_joined(domain, title)), doc_indicators)
+        return _minimum(1.0, matches / 2)
     
     def _detect_technical_content(self, title: str, content: str) -> float:
         """Detect if content is technical"""
-        return self._assess_technical_depth(f"{title} {content or ''}")
+        return self._assess_technical_depth(_joined(title, content))
     
     def _detect_framework_repo(self, repo_name: str, title: str) -> float:
         """Detect if repository is a framework"""
         framework_indicators = ["framework", "react", "vue", "angular", "next", "nuxt"]
-        text = f"{repo_name} {title}".lower()
+        matches = _indicator_count(_lower(_joined(repo_name, title)), framework_indicators)
         
-        return 1.0 if any(indicator in text for indicator in framework_indicators) else 0.0
+        return _where(matches > 0, 1.0, 0.0)
     
     def _detect_library_repo(self, repo_name: str, title: str) -> float:
         """Detect if repository is a library"""
         library_indicators = ["library", "lib", "package", "component", "util"]
-        text = f"{repo_name} {title}".lower()
+        matches = _indicator_count(_lower(_joined(repo_name, title)), library_indicators)
         
-        return 1.0 if any(indicator in text for indicator in library_indicators) else 0.0
+        return _where(matches > 0, 1.0, 0.0)
     
     def _detect_documentation_quality(self, content: str) -> float:
         """Detect quality of documentation"""
-        if not content:
-            return 0.2
-        
         doc_quality_indicators = [
             "## ", "### ", "installation", "usage", "example", 
             "api", "getting started", "documentation"
         ]
         
-        matches = sum(1 for indicator in doc_quality_indicators if indicator in content.lower())
-        return min(1.0, matches / 5)
+        matches = _indicator_count(_lower(content), doc_quality_indicators)
+        return _where(_length(content) == 0, 0.2, _minimum(1.0, matches / 5))
     
-    def _assess_code_quality_signals(self, metadata: Dict[str, Any]) -> float:
+    def _assess_code_quality_signals(self, stars: int, forks: int) -> float:
         """Assess code quality from repository signals"""
-        # Basic assessment from available metadata
-        stars = metadata.get("github_stars", 0)
-        forks = metadata.get("github_forks", 0)
-        
         # High star-to-fork ratio suggests quality
-        if forks > 0:
-            ratio = stars / forks
-            if ratio > 10:
-                return 0.9
-            elif ratio > 5:
-                return 0.7
-            else:
-                return 0.5
-        
-        return 0.4
+        ratio = _divide(stars, forks)
+        
+        return _where(forks > 0, _tiered(ratio, (
+            (lambda r: r > 10, 0.9),
+            (lambda r: r > 5, 0.7)
+        ), 0.5), 0.4)
 
 
 class IntelligentPriorityStrategy(PriorityStrategy):
@@ -742,27 +881,58 @@ class IntelligentPriorityStrategy(PriorityStrategy):
         # Perform intelligent analysis
         analysis = self.analysis_engine.analyze_mcp_content(content)
         
-        # Extract factors from analysis
-        source_authority = self._calculate_source_authority(analysis, context)
-        content_recency = self._calculate_content_recency(analysis, content)
-        topic_relevance = self._calculate_topic_relevance(analysis, content, context)
-        engagement_signals = self._calculate_engagement_signals(analysis)
-        uniqueness_score = self._calculate_uniqueness_score(analysis)
-        completeness = self._calculate_completeness(analysis)
-        actionability = self._calculate_actionability(analysis)
-        cross_topic_value = self._calculate_cross_topic_value(analysis, content)
-        
-        return PriorityFactors(
-            source_authority=source_authority,
-            content_recency=content_recency,
-            topic_relevance=topic_relevance,
-            engagement_signals=engagement_signals,
-            uniqueness_score=uniqueness_score,
-            completeness=completeness,
-            actionability=actionability,
-            cross_topic_value=cross_topic_value
+        topic_count = len(content.topics) if content.topics else 0
+        return PriorityFactors(*self._calculate_factor_values(
+            analysis, self._topic_preference(content.topics, context), topic_count, context
+        ))
+    
+    def calculate_factors_matrix(self, contents: List[ContentItem], context: Dict[str, Any]) -> "np.ndarray":
+        """
+        Calculate priority factors for many items with array arithmetic
+        
+        Runs the calculate_factors() formulas once per source type on the
+        column-wise analysis from analyze_mcp_batch().
+        
+        Returns:
+            (len(contents), 8) array with columns in FACTOR_NAMES order
+        """
+        matrix = np.empty((len(contents), len(FACTOR_NAMES)), dtype=np.float64)
+        groups, fallback = self.analysis_engine.analyze_mcp_batch(contents)
+        
+        for indices, analysis in groups:
+            topics = [contents[index].topics for index in indices]
+            topic_preference = np.array([self._topic_preference(item_topics, context) for item_topics in topics])
+            topic_count = np.array([len(item_topics) if item_topics else 0 for item_topics in topics], dtype=np.float64)
+            
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values = self._calculate_factor_values(analysis, topic_preference, topic_count, context)
+            matrix[indices] = np.column_stack([np.broadcast_to(value, len(indices)) for value in values])
+        
+        # Items with unexpected metadata types go through the per-item path
+        for index in fallback:
+            matrix[index] = astuple(self.calculate_factors(contents[index], context))
+        
+        return matrix
+    
+    def _calculate_factor_values(self, analysis: MCPAnalysisResult, topic_preference: float,
+                                 topic_count: int, context: Dict[str, Any]) -> Tuple[float, ...]:
+        """Priority factors from an analysis, in FACTOR_NAMES order"""
+        return (
+            self._calculate_source_authority(analysis, context),
+            self._calculate_content_recency(analysis),
+            self._calculate_topic_relevance(analysis, topic_preference),
+            self._calculate_engagement_signals(analysis),
+            self._calculate_uniqueness_score(analysis),
+            self._calculate_completeness(analysis),
+            self._calculate_actionability(analysis),
+            self._calculate_cross_topic_value(analysis, topic_count)
         )
     
+    def _topic_preference(self, topics: List[str], context: Dict[str, Any]) -> float:
+        """Base relevance from topic preferences"""
+        topic_prefs = context.get("topic_preferences", {})
+        return max([topic_prefs.get(topic, 0.5) for topic in topics], default=0.5)
+    
     def _calculate_source_authority(self, analysis: MCPAnalysisResult, context: Dict[str, Any]) -> float:
         """Calculate source authority from analysis"""
         # Combine multiple authority signals
@@ -774,26 +944,22 @@ class IntelligentPriorityStrategy(PriorityStrategy):
         # Weighted average of authority signals
         return sum(authority_scores) / len(authority_scores)
     
-    def _calculate_content_recency(self, analysis: MCPAnalysisResult, content: ContentItem) -> float:
+    def _calculate_content_recency(self, analysis: MCPAnalysisResult) -> float:
         """Calculate content recency with trending signals"""
         base_recency = analysis.trending_signals.get("recency_factor", 0.5)
         
         # Boost for trending content
-        trending_boost = max(analysis.trending_signals.values()) if analysis.trending_signals else 0.0
+        trending_boost = _max_of(list(analysis.trending_signals.values())) if analysis.trending_signals else 0.0
         
-        return min(1.0, base_recency + trending_boost * 0.2)
+        return _minimum(1.0, base_recency + trending_boost * 0.2)
     
-    def _calculate_topic_relevance(self, analysis: MCPAnalysisResult, content: ContentItem, context: Dict[str, Any]) -> float:
+    def _calculate_topic_relevance(self, analysis: MCPAnalysisResult, topic_preference: float) -> float:
         """Calculate topic relevance using intelligent analysis"""
-        # Base relevance from topic preferences
-        topic_prefs = context.get("topic_preferences", {})
-        base_relevance = max([topic_prefs.get(topic, 0.5) for topic in content.topics], default=0.5)
-        
         # Boost from technical depth and quality
         technical_boost = analysis.technical_metrics.get("technical_depth", 0.0) * 0.2
-        quality_boost = max(analysis.quality_indicators.values()) * 0.1 if analysis.quality_indicators else 0.0
+        quality_boost = _max_of(list(analysis.quality_indicators.values())) * 0.1 if analysis.quality_indicators else 0.0
         
-        return min(1.0, base_relevance + technical_boost + quality_boost)
+        return _minimum(1.0, topic_preference + technical_boost + quality_boost)
     
     def _calculate_engagement_signals(self, analysis: MCPAnalysisResult) -> float:
         """Calculate engagement signals from MCP analysis"""
@@ -807,7 +973,7 @@ class IntelligentPriorityStrategy(PriorityStrategy):
             # YouTube: focus on engagement rate and viral factor
             engagement_rate = engagement_metrics.get("engagement_rate", 0.0)
             viral_factor = engagement_metrics.get("viral_factor", 0.0)
-            return min(1.0, engagement_rate * 0.7 + viral_factor * 0.3)
+            return _minimum(1.0, engagement_rate * 0.7 + viral_factor * 0.3)
         
         elif analysis.source_type == "github_repository":
             # GitHub: focus on community engagement
@@ -815,7 +981,7 @@ class IntelligentPriorityStrategy(PriorityStrategy):
         
         else:
             # Web search: average of available metrics
-            metrics = [v for v in engagement_metrics.values() if isinstance(v, (int, float))]
+            metrics = [v for v in engagement_metrics.values() if _is_numeric(v)]
             return sum(metrics) / len(metrics) if metrics else 0.5
     
     def _calculate_uniqueness_score(self, analysis: MCPAnalysisResult) -> float:
@@ -824,19 +990,17 @@ class IntelligentPriorityStrategy(PriorityStrategy):
         quality_scores = list(analysis.quality_indicators.values())
         
         # Filter technical scores to only include 0-1 normalized values
-        technical_scores = []
-        for key, value in analysis.technical_metrics.items():
-            if isinstance(value, (int, float)) and key != "duration_seconds":
-                # Only include normalized metrics
-                if 0 <= value <= 1:
-                    technical_scores.append(value)
+        technical_scores = [
+            value for key, value in analysis.technical_metrics.items()
+            if _is_numeric(value) and key != "duration_seconds"
+        ]
         
         avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0.5
-        avg_technical = sum(technical_scores) / len(technical_scores) if technical_scores else 0.5
+        avg_technical = _conditional_mean(technical_scores, lambda value: (0 <= value) & (value <= 1), 0.5)
         
         # Ensure result is bounded 0-1
         result = (avg_quality * 0.6 + avg_technical * 0.4)
-        return min(1.0, max(0.0, result))
+        return _minimum(1.0, _maximum(0.0, result))
     
     def _calculate_completeness(self, analysis: MCPAnalysisResult) -> float:
         """Calculate completeness from quality indicators"""
@@ -847,8 +1011,7 @@ class IntelligentPriorityStrategy(PriorityStrategy):
             analysis.technical_metrics.get("has_documentation", 0.0)
         ]
         
-        valid_indicators = [score for score in completeness_indicators if score > 0]
-        return sum(valid_indicators) / len(valid_indicators) if valid_indicators else 0.5
+        return _conditional_mean(completeness_indicators, lambda score: score > 0, 0.5)
     
     def _calculate_actionability(self, analysis: MCPAnalysisResult) -> float:
         """Calculate actionability from technical metrics"""
@@ -859,18 +1022,17 @@ class IntelligentPriorityStrategy(PriorityStrategy):
             analysis.technical_metrics.get("is_documentation", 0.0)
         ]
         
-        valid_factors = [factor for factor in actionability_factors if factor > 0]
-        base_actionability = sum(valid_factors) / len(valid_factors) if valid_factors else 0.4
+        base_actionability = _conditional_mean(actionability_factors, lambda factor: factor > 0, 0.4)
         
         # Boost for technical depth
         technical_boost = analysis.technical_metrics.get("technical_depth", 0.0) * 0.3
         
-        return min(1.0, base_actionability + technical_boost)
+        return _minimum(1.0, base_actionability + technical_boost)
     
-    def _calculate_cross_topic_value(self, analysis: MCPAnalysisResult, content: ContentItem) -> float:
+    def _calculate_cross_topic_value(self, analysis: MCPAnalysisResult, topic_count: int) -> float:
         """Calculate cross-topic value"""
         # Base on number of topics
-        base_value = min(1.0, len(content.topics) / 3) if content.topics else 0.1
+        base_value = _where(topic_count > 0, _minimum(1.0, topic_count / 3), 0.1)
         
         # Boost for frameworks and libraries (useful across projects)
         if analysis.source_type == "github_repository":
@@ -879,9 +1041,9 @@ class IntelligentPriorityStrategy(PriorityStrategy):
             base_value += framework_boost + library_boost
         
         # Boost for high authority content
-        authority_boost = max(analysis.authority_signals.values()) * 0.2 if analysis.authority_signals else 0.0
+        authority_boost = _max_of(list(analysis.authority_signals.values())) * 0.2 if analysis.authority_signals else 0.0
         
-        return min(1.0, base_value + authority_boost)
+        return _minimum(1.0, base_value + authority_boost)
     
     def get_strategy_name(self) -> str:
         return "intelligent_mcp"
\ No newline at end of file
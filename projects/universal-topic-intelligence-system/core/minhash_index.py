@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+MinHash Locality-Sensitive Hashing Index
+Sub-linear near-duplicate candidate lookup for the Noise Reduction Engine
+"""
+
+import hashlib
+import logging
+import random
+import re
+import sqlite3
+from array import array
+from collections import defaultdict
+from itertools import islice
+from typing import Dict, List, Optional, Set, Tuple
+
+# Optional imports (pure Python fallback when NumPy is not installed)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Mersenne prime 2^31 - 1 keeps (a * x + b) within 62 bits for 31-bit shingle hashes
+_MERSENNE_PRIME = (1 << 31) - 1
+_HASH_MASK = (1 << 31) - 1
+
+
+class MinHashLSHIndex:
+    """
+    Shingle + MinHash signature index with banded LSH buckets
+
+    Each document is reduced to a ``num_perm``-value MinHash signature over its
+    word shingles. Signatures are split into ``bands`` bands; documents sharing
+    any band bucket become candidates, so a query touches only the buckets its
+    own bands land in rather than every indexed document. With ``r`` rows per
+    band the candidate probability crosses 50% around Jaccard ``(1/bands)^(1/r)``.
+
+    ``signatures`` keeps insertion order, including the order of loaded ids, so
+    ``trim()`` can bound the index by dropping the oldest documents.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32, shingle_size: int = 3, seed: int = 42):
+        """
+        Initialize MinHash LSH index
+
+        Args:
+            num_perm: Number of hash permutations per signature
+            bands: Number of LSH bands (must divide num_perm)
+            shingle_size: Words per shingle
+            seed: Seed for the permutation coefficients (fixed for persistence)
+        """
+        if num_perm % bands != 0:
+            raise ValueError(f"bands ({bands}) must divide num_perm ({num_perm})")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.seed = seed
+        self.logger = logging.getLogger("MinHashLSHIndex")
+
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, _MERSENNE_PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _MERSENNE_PRIME) for _ in range(num_perm)]
+        if np is not None:
+            self._a_np = np.array(self._a, dtype=np.uint64)
+            self._b_np = np.array(self._b, dtype=np.uint64)
+
+        self.signatures: Dict[str, Tuple[int, ...]] = {}  # Oldest first
+        self._buckets: List[Dict[Tuple[int, ...], Set[str]]] = [defaultdict(set) for _ in range(bands)]
+
+        # Changes since the last save()/load(), so saves only write what changed
+        self._dirty: Set[str] = set()
+        self._evicted: Set[str] = set()
+        self._persisted_to: Optional[Tuple[str, str]] = None
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self.signatures
+
+    def shingles(self, text: str) -> Set[str]:
+        """Split normalized text into word shingles"""
+        words = re.sub(r'[^\w\s]', '', text.lower()).split()
+        if len(words) < self.shingle_size:
+            return {' '.join(words)} if words else set()
+        k = self.shingle_size
+        return {' '.join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+    @staticmethod
+    def _hash_shingle(shingle: str) -> int:
+        """Stable 31-bit hash of a shingle (Python's hash() is salted per process)"""
+        return int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), 'little') & _HASH_MASK
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        """Compute the MinHash signature of a text"""
+        hashes = [self._hash_shingle(s) for s in self.shingles(text)]
+        if not hashes:
+            return tuple([_MERSENNE_PRIME] * self.num_perm)
+
+        if np is not None:
+            x = np.array(hashes, dtype=np.uint64)
+            permuted = (np.outer(x, self._a_np) + self._b_np) % _MERSENNE_PRIME
+            return tuple(int(v) for v in permuted.min(axis=0))
+
+        return tuple(
+            min((a * x + b) % _MERSENNE_PRIME for x in hashes)
+            for a, b in zip(self._a, self._b)
+        )
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, signature[band * rows:(band + 1) * rows]
+
+    def add(self, item_id: str, text: str = "", signature: Optional[Tuple[int, ...]] = None):
+        """Index a document by text or precomputed signature"""
+        if item_id in self.signatures:
+            self.remove(item_id)
+
+        signature = signature or self.signature(text)
+        self.signatures[item_id] = signature
+        for band, key in self._band_keys(signature):
+            self._buckets[band][key].add(item_id)
+
+        self._dirty.add(item_id)
+        self._evicted.discard(item_id)
+
+    def remove(self, item_id: str):
+        """Drop a document from the index"""
+        signature = self.signatures.pop(item_id, None)
+        if signature is None:
+            return
+
+        self._evicted.add(item_id)
+        self._dirty.discard(item_id)
+
+        for band, key in self._band_keys(signature):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(item_id)
+                if not bucket:
+                    del self._buckets[band][key]
+
+    def trim(self, max_items: int) -> int:
+        """
+        Remove the oldest documents beyond max_items
+
+        Returns:
+            Number of documents removed
+        """
+        overflow = len(self.signatures) - max(max_items, 0)
+        if overflow <= 0:
+            return 0
+        for item_id in list(islice(self.signatures, overflow)):
+            self.remove(item_id)
+        return overflow
+
+    def candidates(self, signature: Tuple[int, ...]) -> Set[str]:
+        """IDs sharing at least one band bucket with the signature"""
+        found: Set[str] = set()
+        for band, key in self._band_keys(signature):
+            bucket = self._buckets[band].get(key)
+            if bucket:
+                found.update(bucket)
+        return found
+
+    def estimate_similarity(self, sig1: Tuple[int, ...], sig2: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity: fraction of matching signature slots"""
+        return sum(1 for a, b in zip(sig1, sig2) if a == b) / self.num_perm
+
+    def query(self, text: str = "", signature: Optional[Tuple[int, ...]] = None,
+              threshold: float = 0.0) -> List[Tuple[str, float]]:
+        """
+        Find likely near-duplicates
+
+        Args:
+            text: Document text (ignored if signature is given)
+            signature: Precomputed MinHash signature
+            threshold: Minimum estimated Jaccard similarity to report
+
+        Returns:
+            (item_id, estimated_similarity) pairs, most similar first
+        """
+        signature = signature or self.signature(text)
+        results = []
+        for item_id in self.candidates(signature):
+            similarity = self.estimate_similarity(signature, self.signatures[item_id])
+            if similarity >= threshold:
+                results.append((item_id, similarity))
+        results.sort(key=lambda pair: pair[1], reverse=True)
+        return results
+
+    def save(self, db_path: str, table: str = "minhash_signatures") -> int:
+        """
+        Persist signatures into a table of the given SQLite database
+
+        Only signatures added since the last save or load are upserted and only
+        removed ones deleted, so the cost follows the churn rather than the index
+        size. The first save to a table this index was not loaded from rewrites it.
+
+        Returns:
+            Number of signatures written
+        """
+        target = (str(db_path), table)
+        full_rewrite = self._persisted_to != target
+        item_ids = list(self.signatures) if full_rewrite else list(self._dirty)
+
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    item_id TEXT PRIMARY KEY,
+                    signature BLOB NOT NULL,
+                    num_perm INTEGER NOT NULL,
+                    seed INTEGER NOT NULL
+                )
+            """)
+            if full_rewrite:
+                conn.execute(f"DELETE FROM {table}")
+            elif self._evicted:
+                conn.executemany(f"DELETE FROM {table} WHERE item_id = ?",
+                                 ((item_id,) for item_id in self._evicted))
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table} (item_id, signature, num_perm, seed) VALUES (?, ?, ?, ?)",
+                (
+                    (item_id, array('I', self.signatures[item_id]).tobytes(), self.num_perm, self.seed)
+                    for item_id in item_ids
+                )
+            )
+            conn.commit()
+
+        self.logger.debug(f"Saved {len(item_ids)} of {len(self.signatures)} MinHash signatures "
+                          f"({len(self._evicted)} evicted) to {db_path}")
+        self._dirty.clear()
+        self._evicted.clear()
+        self._persisted_to = target
+        return len(item_ids)
+
+    def load(self, db_path: str, table: str = "minhash_signatures") -> int:
+        """
+        Load signatures persisted by save()
+
+        Signatures created with a different num_perm or seed are skipped since
+        they are not comparable with this index. Rows are read in the order they
+        were written, so loaded ids keep their age for trim().
+
+        Returns:
+            Number of signatures loaded
+        """
+        loaded = 0
+        try:
+            with sqlite3.connect(db_path) as conn:
+                rows = conn.execute(
+                    f"SELECT item_id, signature FROM {table} WHERE num_perm = ? AND seed = ? ORDER BY rowid",
+                    (self.num_perm, self.seed)
+                ).fetchall()
+        except sqlite3.OperationalError:
+            return 0  # Nothing persisted yet
+
+        # An index filled only from this table can save back to it incrementally
+        if not self.signatures and self._persisted_to is None:
+            self._persisted_to = (str(db_path), table)
+
+        for item_id, blob in rows:
+            signature = array('I')
+            signature.frombytes(blob)
+            self.add(item_id, signature=tuple(signature))
+            self._dirty.discard(item_id)  # Already stored
+            loaded += 1
+
+        self.logger.debug(f"Loaded {loaded} MinHash signatures from {db_path}")
+        return loaded
+
+    def get_statistics(self) -> Dict[str, float]:
+        """Index size and bucket occupancy"""
+        bucket_count = sum(len(b) for b in self._buckets)
+        return {
+            "indexed_items": len(self.signatures),
+            "bands": self.bands,
+            "rows_per_band": self.rows,
+            "buckets": bucket_count,
+            "avg_bucket_size": (len(self.signatures) * self.bands / bucket_count) if bucket_count else 0.0
+        }
@@ -12,11 +12,15 @@ import logging
 import hashlib
 import re
 import math
+import sqlite3
 from collections import Counter, defaultdict
+from itertools import islice
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 from difflib import SequenceMatcher
 from enum import Enum
 
 from .universal_source_monitor import ContentItem
+from .minhash_index import MinHashLSHIndex
 
 class NoiseType(Enum):
     """Types of noise that can be detected"""
@@ -63,21 +67,29 @@ class NoiseReductionEngine:
     Core engine for noise reduction and content filtering
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, index_db_path: Optional[str] = None,
+                 warm_from_db: bool = False):
         """
         Initialize noise reduction engine
         
         Args:
             config: Configuration for noise reduction parameters
+            index_db_path: SQLite database to load/save the near-duplicate
+                           index signatures (None keeps the index in memory only)
+            warm_from_db: Seed the exact-duplicate indexes from the content_items
+                          table of index_db_path so dedup survives restarts
         """
         self.config = config or self._default_config()
         self.logger = logging.getLogger("NoiseReduction")
+        self.index_db_path = index_db_path
         
         # Content storage and duplicate tracking
         self.content_cache: Dict[str, ContentItem] = {}
         self.duplicate_clusters: Dict[str, DuplicateCluster] = {}
-        self.content_fingerprints: Dict[str, str] = {}  # content_id -> fingerprint
-        self.url_seen: Set[str] = set()
+        self.content_fingerprints: Dict[str, str] = {}  # content_id -> fingerprint (insertion ordered)
+        self.content_urls: Dict[str, str] = {}  # content_id -> normalized URL
+        self.fingerprint_index: Dict[str, Set[str]] = defaultdict(set)  # fingerprint -> content_ids
+        self.url_index: Dict[str, Set[str]] = defaultdict(set)  # normalized URL -> content_ids
         self.title_patterns: Dict[str, List[str]] = defaultdict(list)  # pattern -> content_ids
         
         # Noise detection history
@@ -87,6 +99,56 @@ class NoiseReductionEngine:
         # Initialize filters
         self._init_spam_patterns()
         self._init_quality_patterns()
+        
+        # Near-duplicate candidate index (None = linear SequenceMatcher scan)
+        self.index_config = {
+            **self._default_config()["near_duplicate_index"],
+            **self.config.get("near_duplicate_index", {})
+        }
+        self.near_duplicate_index = self._init_near_duplicate_index()
+        
+        if warm_from_db and index_db_path:
+            self.warm_duplicate_indexes(index_db_path)
+    
+    def _init_near_duplicate_index(self) -> Optional[MinHashLSHIndex]:
+        """Create the MinHash LSH index and warm it from disk if configured"""
+        if not self.index_config["enabled"]:
+            return None
+        
+        index = MinHashLSHIndex(
+            num_perm=self.index_config["num_perm"],
+            bands=self.index_config["bands"],
+            shingle_size=self.index_config["shingle_size"]
+        )
+        
+        if self.index_db_path:
+            try:
+                loaded = index.load(self.index_db_path)
+                index.trim(self.config["cache_limits"]["max_content_cache"])
+                self.logger.info(f"Loaded {loaded} near-duplicate signatures from {self.index_db_path}")
+            except Exception as e:
+                self.logger.warning(f"Could not load near-duplicate index: {e}")
+        
+        return index
+    
+    def save_near_duplicate_index(self) -> bool:
+        """
+        Persist near-duplicate index signatures alongside the database
+        
+        Returns:
+            True if the index was saved
+        """
+        if self.near_duplicate_index is None or not self.index_db_path:
+            return False
+        
+        try:
+            # Loaded signatures are not in the content cache, so bound the index itself
+            self.near_duplicate_index.trim(self.config["cache_limits"]["max_content_cache"])
+            self.near_duplicate_index.save(self.index_db_path)
+            return True
+        except Exception as e:
+            self.logger.error(f"Error saving near-duplicate index: {e}")
+            return False
     
     def _default_config(self) -> Dict[str, Any]:
         """Default configuration for noise reduction"""
@@ -116,8 +178,17 @@ class NoiseReductionEngine:
             },
             "cache_limits": {
                 "max_content_cache": 10000,    # Maximum content items to cache
+                "max_dedup_entries": 100000,   # Maximum fingerprint/URL index entries
                 "max_clusters": 1000,          # Maximum duplicate clusters
                 "history_days": 30              # Keep noise history for 30 days
+            },
+            "near_duplicate_index": {
+                "enabled": True,               # MinHash LSH candidates instead of a full scan
+                "num_perm": 128,               # MinHash signature length
+                "bands": 32,                   # LSH bands (4 rows each)
+                "shingle_size": 3,             # Words per shingle
+                "jaccard_threshold": 0.5,      # Estimated Jaccard for a near duplicate
+                "verify_with_sequence_matcher": False  # Re-check candidates with SequenceMatcher
             }
         }
     
@@ -244,39 +315,157 @@ class NoiseReductionEngine:
         return result
     
     def _check_exact_duplicates(self, content: ContentItem) -> Tuple[bool, List[str]]:
-        """Check for exact duplicates"""
-        similar_items = []
+        """Check for exact duplicates via the URL and fingerprint reverse indexes"""
+        url_key = self._normalize_url(content.url) if content.url else None
+        fingerprint = self._generate_content_fingerprint(content)
         
-        # Check URL duplicates
-        if content.url and content.url in self.url_seen:
-            # Find items with same URL
-            for cached_id, cached_content in self.content_cache.items():
-                if cached_content.url == content.url and cached_id != content.item_id:
-                    similar_items.append(cached_id)
-            
-            if similar_items:
-                return True, similar_items
+        url_matches = self.url_index.get(url_key, ()) if url_key else ()
+        fingerprint_matches = self.fingerprint_index.get(fingerprint, ())
+        
+        self._register_duplicate_keys(content.item_id, fingerprint, url_key)
         
-        # Add URL to seen set
-        if content.url:
-            self.url_seen.add(content.url)
+        # Check URL duplicates
+        similar_items = [item_id for item_id in url_matches if item_id != content.item_id]
+        if similar_items:
+            return True, similar_items
         
         # Check content fingerprint
-        fingerprint = self._generate_content_fingerprint(content)
+        similar_items = [item_id for item_id in fingerprint_matches if item_id != content.item_id]
         
-        if fingerprint in self.content_fingerprints.values():
-            # Find items with same fingerprint
-            for cached_id, cached_fingerprint in self.content_fingerprints.items():
-                if cached_fingerprint == fingerprint and cached_id != content.item_id:
-                    similar_items.append(cached_id)
+        return len(similar_items) > 0, similar_items
+    
+    def _register_duplicate_keys(self, content_id: str, fingerprint: str, url_key: Optional[str]):
+        """Record an item's fingerprint and URL in the reverse indexes"""
+        self._unregister_duplicate_keys(content_id)
+        
+        self.content_fingerprints[content_id] = fingerprint
+        self.fingerprint_index[fingerprint].add(content_id)
+        if url_key:
+            self.content_urls[content_id] = url_key
+            self.url_index[url_key].add(content_id)
+    
+    def _unregister_duplicate_keys(self, content_id: str):
+        """Remove an item from the reverse indexes"""
+        fingerprint = self.content_fingerprints.pop(content_id, None)
+        if fingerprint is not None:
+            ids = self.fingerprint_index.get(fingerprint)
+            if ids is not None:
+                ids.discard(content_id)
+                if not ids:
+                    del self.fingerprint_index[fingerprint]
+        
+        url_key = self.content_urls.pop(content_id, None)
+        if url_key is not None:
+            ids = self.url_index.get(url_key)
+            if ids is not None:
+                ids.discard(content_id)
+                if not ids:
+                    del self.url_index[url_key]
+    
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """Normalize a URL so trivially different links to the same page match"""
+        try:
+            parts = urlsplit(url.strip())
+        except ValueError:
+            return url.strip().lower()
+        
+        query = urlencode(sorted(
+            (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith('utm_')
+        ))
+        netloc = parts.netloc.lower()
+        if netloc.startswith('www.'):
+            netloc = netloc[4:]
+        path = parts.path.rstrip('/') or '/'
+        
+        return urlunsplit((parts.scheme.lower(), netloc, path, query, ''))
+    
+    def warm_duplicate_indexes(self, db_path: str, limit: Optional[int] = None) -> int:
+        """
+        Seed the fingerprint and URL indexes from stored content items
         
-        # Store fingerprint
-        self.content_fingerprints[content.item_id] = fingerprint
+        Args:
+            db_path: SQLite database with a content_items table
+            limit: Most recent items to load (defaults to max_dedup_entries)
+            
+        Returns:
+            Number of items loaded
+        """
+        limit = limit or self.config["cache_limits"].get("max_dedup_entries", 100000)
+        
+        try:
+            with sqlite3.connect(db_path) as conn:
+                rows = conn.execute("""
+                    SELECT item_id, title, content, url FROM content_items
+                    ORDER BY collected_date DESC
+                    LIMIT ?
+                """, (limit,)).fetchall()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not warm duplicate indexes from {db_path}: {e}")
+            return 0
+        
+        # Oldest first so insertion order matches eviction order
+        for item_id, title, content_text, url in reversed(rows):
+            self._register_duplicate_keys(
+                item_id,
+                self._fingerprint_text(title or "", content_text or ""),
+                self._normalize_url(url) if url else None
+            )
         
-        return len(similar_items) > 0, similar_items
+        self.logger.info(f"Warmed duplicate indexes with {len(rows)} stored items")
+        return len(rows)
     
     def _check_near_duplicates(self, content: ContentItem) -> Tuple[bool, List[str], float]:
-        """Check for near duplicates using similarity analysis"""
+        """Check for near duplicates using the MinHash LSH index"""
+        index = self.near_duplicate_index
+        if index is None:
+            return self._check_near_duplicates_linear(content)
+        
+        thresholds = self.config["duplicate_thresholds"]
+        
+        # Skip if content is too short
+        content_text = content.content or ""
+        if len(content_text) < thresholds["content_min_length"]:
+            return False, [], 0.0
+        
+        verify = self.index_config["verify_with_sequence_matcher"]
+        signature = index.signature(f"{content.title} {content_text}")
+        candidates = index.query(
+            signature=signature,
+            threshold=0.0 if verify else self.index_config["jaccard_threshold"]
+        )
+        
+        similar_items = []
+        max_similarity = 0.0
+        for cached_id, estimated_similarity in candidates:
+            if cached_id == content.item_id:
+                continue
+            
+            if verify:
+                # Candidates evicted from the cache cannot be verified
+                cached_content = self.content_cache.get(cached_id)
+                if cached_content is None:
+                    continue
+                is_similar, similarity = self._compare_near_duplicate(content, cached_content)
+            else:
+                is_similar, similarity = True, estimated_similarity
+            
+            max_similarity = max(max_similarity, similarity)
+            if is_similar:
+                similar_items.append(cached_id)
+        
+        index.add(content.item_id, signature=signature)
+        # Signatures loaded from disk have no cache entry to evict them with
+        index.trim(self.config["cache_limits"]["max_content_cache"])
+        
+        is_duplicate = len(similar_items) > 0
+        confidence = max_similarity if is_duplicate else 0.0
+        
+        return is_duplicate, similar_items, confidence
+    
+    def _check_near_duplicates_linear(self, content: ContentItem) -> Tuple[bool, List[str], float]:
+        """Check for near duplicates by comparing against every cached item"""
         thresholds = self.config["duplicate_thresholds"]
         similar_items = []
         max_similarity = 0.0
@@ -291,28 +480,10 @@ class NoiseReductionEngine:
             if cached_id == content.item_id:
                 continue
             
-            # Calculate similarity scores
-            title_similarity = self._calculate_text_similarity(content.title, cached_content.title)
-            content_similarity = self._calculate_text_similarity(content_text, cached_content.content or "")
-            
-            # Check URL similarity (for different URLs pointing to same content)
-            url_similarity = 0.0
-            if content.url and cached_content.url:
-                url_similarity = self._calculate_text_similarity(content.url, cached_content.url)
-            
-            # Weighted similarity score
-            overall_similarity = (
-                title_similarity * 0.4 +
-                content_similarity * 0.5 +
-                url_similarity * 0.1
-            )
-            
+            is_similar, overall_similarity = self._compare_near_duplicate(content, cached_content)
             max_similarity = max(max_similarity, overall_similarity)
             
-            # Check thresholds
-            if (title_similarity >= thresholds["title_similarity"] or
-                content_similarity >= thresholds["near_similarity"] or
-                overall_similarity >= thresholds["near_similarity"]):
+            if is_similar:
                 similar_items.append(cached_id)
         
         is_duplicate = len(similar_items) > 0
@@ -320,6 +491,33 @@ class NoiseReductionEngine:
         
         return is_duplicate, similar_items, confidence
     
+    def _compare_near_duplicate(self, content: ContentItem, cached_content: ContentItem) -> Tuple[bool, float]:
+        """Compare two items with SequenceMatcher, returning (is_near_duplicate, overall_similarity)"""
+        thresholds = self.config["duplicate_thresholds"]
+        
+        # Calculate similarity scores
+        title_similarity = self._calculate_text_similarity(content.title, cached_content.title)
+        content_similarity = self._calculate_text_similarity(content.content or "", cached_content.content or "")
+        
+        # Check URL similarity (for different URLs pointing to same content)
+        url_similarity = 0.0
+        if content.url and cached_content.url:
+            url_similarity = self._calculate_text_similarity(content.url, cached_content.url)
+        
+        # Weighted similarity score
+        overall_similarity = (
+            title_similarity * 0.4 +
+            content_similarity * 0.5 +
+            url_similarity * 0.1
+        )
+        
+        # Check thresholds
+        is_similar = (title_similarity >= thresholds["title_similarity"] or
+                      content_similarity >= thresholds["near_similarity"] or
+                      overall_similarity >= thresholds["near_similarity"])
+        
+        return is_similar, overall_similarity
+    
     def _check_spam_content(self, content: ContentItem) -> Dict[NoiseType, float]:
         """Check for various types of spam content"""
         spam_results = {}
@@ -370,9 +568,14 @@ class NoiseReductionEngine:
     
     def _generate_content_fingerprint(self, content: ContentItem) -> str:
         """Generate a fingerprint for content deduplication"""
+        return self._fingerprint_text(content.title, content.content or "")
+    
+    @staticmethod
+    def _fingerprint_text(title: str, content_text: str) -> str:
+        """Fingerprint normalized title and leading content"""
         # Normalize content for fingerprinting
-        title = re.sub(r'[^\w\s]', '', content.title.lower())
-        content_text = re.sub(r'[^\w\s]', '', (content.content or "").lower())
+        title = re.sub(r'[^\w\s]', '', title.lower())
+        content_text = re.sub(r'[^\w\s]', '', content_text.lower())
         
         # Create fingerprint from normalized content
         fingerprint_text = f"{title}|{content_text[:500]}"  # First 500 chars of content
@@ -638,13 +841,20 @@ class NoiseReductionEngine:
         
         if len(self.content_cache) > max_cache:
             # Remove oldest entries
-            items = list(self.content_cache.items())
-            items_to_remove = items[:len(items) - max_cache]
+            items_to_remove = list(islice(self.content_cache, len(self.content_cache) - max_cache))
             
-            for content_id, _ in items_to_remove:
+            for content_id in items_to_remove:
                 del self.content_cache[content_id]
-                if content_id in self.content_fingerprints:
-                    del self.content_fingerprints[content_id]
+                self._unregister_duplicate_keys(content_id)
+                if self.near_duplicate_index is not None:
+                    self.near_duplicate_index.remove(content_id)
+        
+        # Entries warmed from the database are not in the content cache
+        max_dedup = self.config["cache_limits"].get("max_dedup_entries", 100000)
+        overflow = len(self.content_fingerprints) - max_dedup
+        if overflow > 0:
+            for content_id in list(islice(self.content_fingerprints, overflow)):
+                self._unregister_duplicate_keys(content_id)
     
     def _cleanup_history(self):
         """Clean up noise detection history"""
@@ -706,5 +916,7 @@ class NoiseReductionEngine:
             "noise_types": dict(noise_types.most_common()),
             "average_noise_score": avg_noise_score,
             "duplicate_clusters": len(self.duplicate_clusters),
-            "cached_content": len(self.content_cache)
+            "cached_content": len(self.content_cache),
+            "near_duplicate_index": (self.near_duplicate_index.get_statistics()
+                                     if self.near_duplicate_index is not None else None)
         }
\ No newline at end of file
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Priority Result Cache
+Size- and TTL-bounded LRU cache for the Universal Content Prioritizer
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .universal_source_monitor import ContentItem
+
+
+class PriorityCache:
+    """
+    LRU cache with a per-entry time-to-live
+
+    Entries expire ``ttl_seconds`` after they were stored. Reads move an entry
+    to the most-recently-used end; inserting beyond ``max_entries`` evicts from
+    the least-recently-used end, so memory stays bounded however long the
+    process runs. Expired entries are dropped when read and swept every
+    ``purge_interval`` inserts.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 3600, purge_interval: int = 1000):
+        """
+        Initialize priority cache
+
+        Args:
+            max_entries: Maximum cached results
+            ttl_seconds: Seconds a result stays valid
+            purge_interval: Inserts between sweeps for expired entries
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.purge_interval = purge_interval
+        self._puts_since_purge = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'invalidations': 0
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and time.monotonic() - entry[0] < self.ttl_seconds
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats['misses'] += 1
+            return None
+
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.ttl_seconds:
+            del self._entries[key]
+            self.stats['expirations'] += 1
+            self.stats['misses'] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats['hits'] += 1
+        return value
+
+    def put(self, key: str, value: Any):
+        """Store a value, evicting least recently used entries beyond max_entries"""
+        self._puts_since_purge += 1
+        if self._puts_since_purge >= self.purge_interval:
+            self._puts_since_purge = 0
+            self.purge_expired()
+
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    def pop(self, key: str) -> Optional[Any]:
+        """Remove and return a value regardless of age"""
+        entry = self._entries.pop(key, None)
+        return entry[1] if entry else None
+
+    def purge_expired(self) -> int:
+        """
+        Drop every expired entry
+
+        Returns:
+            Number of entries removed
+        """
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = [key for key, (stored_at, _) in self._entries.items() if stored_at < cutoff]
+        for key in expired:
+            del self._entries[key]
+        self.stats['expirations'] += len(expired)
+        return len(expired)
+
+    def clear(self):
+        """Invalidate every entry"""
+        if self._entries:
+            self.stats['invalidations'] += 1
+        self._entries.clear()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and occupancy"""
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'hit_rate': self.stats['hits'] / lookups if lookups else 0.0
+        }
+
+
+def content_hash(content: ContentItem) -> str:
+    """
+    Stable hash of everything the scoring strategies read from an item
+
+    Re-fetched copies of an unchanged item hash the same even when they are
+    new ContentItem objects.
+    """
+    payload = json.dumps(
+        [
+            content.source_id,
+            content.title,
+            content.content,
+            content.url,
+            content.published_date.isoformat() if content.published_date else None,
+            content.author,
+            content.topics,
+            content.metadata
+        ],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha1(payload.encode()).hexdigest()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Topic Signal Store
+Columnar, time-bucketed per-topic aggregates for the Trend Detection Engine
+"""
+
+import math
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+# Optional imports (pure Python fallback when NumPy is not installed)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Aggregate columns kept per bucket: signal count, sum of values, and the sums of
+# in-bucket time offsets needed to rebuild a least-squares slope over any window
+_COUNT, _SUM_Y, _SUM_DX, _SUM_DX2, _SUM_DXY = range(5)
+_COLUMNS = 5
+_EMPTY_BUCKET = -1
+_LATEST_VALUES = 3
+_INITIAL_CAPACITY = 8
+
+
+def regression_slope(n: float, sum_x: float, sum_y: float, sum_xy: float, sum_x2: float) -> float:
+    """Least-squares slope from running sums (0.0 when degenerate)"""
+    if n < 2:
+        return 0.0
+
+    denominator = n * sum_x2 - sum_x * sum_x
+    if abs(denominator) < 0.001:
+        return 0.0
+
+    return (n * sum_xy - sum_x * sum_y) / denominator
+
+
+class _TopicSeries:
+    """
+    Ring of per-bucket aggregates for a single topic
+
+    The ring starts small and doubles whenever the span of retained buckets
+    outgrows it, up to ring_size, so short-lived topics only pay for the
+    buckets they actually cover.
+    """
+
+    def __init__(self, ring_size: int):
+        self.ring_size = ring_size
+        self.capacity = 0
+        self.oldest: Optional[int] = None
+        self.newest: Optional[int] = None
+        self.bucket_ids, self.aggregates = self._allocate(min(ring_size, _INITIAL_CAPACITY))
+
+        self.sources: Dict[int, Set[str]] = {}
+        self.latest: List[Tuple[float, float]] = []  # newest (timestamp, value) pairs, oldest first
+
+    def _allocate(self, capacity: int):
+        """Empty bucket id and aggregate arrays for capacity buckets"""
+        self.capacity = capacity
+        if np is not None:
+            return np.full(capacity, _EMPTY_BUCKET, dtype=np.int64), np.zeros((capacity, _COLUMNS), dtype=np.float64)
+        return [_EMPTY_BUCKET] * capacity, [[0.0] * _COLUMNS for _ in range(capacity)]
+
+    def _grow(self, span: int, newest: int):
+        """Re-lay the ring out over enough slots for span buckets, dropping buckets past retention"""
+        capacity = self.capacity
+        while capacity < span:
+            capacity *= 2
+        old_ids, old_aggregates = self.bucket_ids, self.aggregates
+        self.bucket_ids, self.aggregates = self._allocate(min(self.ring_size, capacity))
+
+        self.oldest = None
+        for bucket_id, row in zip(old_ids, old_aggregates):
+            bucket_id = int(bucket_id)
+            if bucket_id == _EMPTY_BUCKET:
+                continue
+            if bucket_id <= newest - self.ring_size:
+                self.sources.pop(bucket_id, None)
+                continue
+            slot = bucket_id % self.capacity
+            self.bucket_ids[slot] = bucket_id
+            self.aggregates[slot] = row if np is not None else list(row)
+            self.oldest = bucket_id if self.oldest is None else min(self.oldest, bucket_id)
+
+    def add(self, bucket_id: int, offset_hours: float, timestamp: float, value: float, source_id: str) -> bool:
+        """Fold one signal into its bucket; False if the ring has already moved past it"""
+        if self.capacity < self.ring_size:
+            oldest = bucket_id if self.oldest is None else min(self.oldest, bucket_id)
+            newest = bucket_id if self.newest is None else max(self.newest, bucket_id)
+            if newest - oldest >= self.capacity:
+                self._grow(newest - oldest + 1, newest)
+            if self.capacity < self.ring_size:
+                self.oldest = bucket_id if self.oldest is None else min(self.oldest, bucket_id)
+        self.newest = bucket_id if self.newest is None else max(self.newest, bucket_id)
+
+        slot = bucket_id % self.capacity
+        current = int(self.bucket_ids[slot])
+
+        if current != bucket_id:
+            if current > bucket_id:
+                return False
+
+            # The slot still holds a bucket that has aged out of retention
+            self.sources.pop(current, None)
+            self.bucket_ids[slot] = bucket_id
+            if np is not None:
+                self.aggregates[slot] = 0.0
+            else:
+                self.aggregates[slot] = [0.0] * _COLUMNS
+
+        row = (1.0, value, offset_hours, offset_hours * offset_hours, offset_hours * value)
+        if np is not None:
+            self.aggregates[slot] += row
+        else:
+            aggregate = self.aggregates[slot]
+            for column, amount in enumerate(row):
+                aggregate[column] += amount
+
+        self.sources.setdefault(bucket_id, set()).add(source_id)
+
+        if len(self.latest) < _LATEST_VALUES:
+            self.latest.append((timestamp, value))
+            self.latest.sort(key=lambda pair: pair[0])
+        elif timestamp >= self.latest[0][0]:
+            self.latest[0] = (timestamp, value)
+            self.latest.sort(key=lambda pair: pair[0])
+
+        return True
+
+    def window_sums(self, cutoff_bucket: int, bucket_hours: float) -> Optional[Tuple[float, ...]]:
+        """
+        Sum the buckets at or after cutoff_bucket
+
+        Returns:
+            (count, sum_y, sum_x, sum_x2, sum_xy) with x in hours since the start of
+            cutoff_bucket, or None if the window is empty
+        """
+        if np is not None:
+            mask = self.bucket_ids >= cutoff_bucket
+            if not mask.any():
+                return None
+
+            rows = self.aggregates[mask]
+            offsets = (self.bucket_ids[mask] - cutoff_bucket) * bucket_hours
+            counts = rows[:, _COUNT]
+            return (
+                float(counts.sum()),
+                float(rows[:, _SUM_Y].sum()),
+                float((counts * offsets + rows[:, _SUM_DX]).sum()),
+                float((counts * offsets * offsets + 2 * offsets * rows[:, _SUM_DX] + rows[:, _SUM_DX2]).sum()),
+                float((offsets * rows[:, _SUM_Y] + rows[:, _SUM_DXY]).sum())
+            )
+
+        totals = [0.0] * _COLUMNS
+        found = False
+        for bucket_id, row in zip(self.bucket_ids, self.aggregates):
+            if bucket_id < cutoff_bucket:
+                continue
+            found = True
+            offset = (bucket_id - cutoff_bucket) * bucket_hours
+            count = row[_COUNT]
+            totals[0] += count
+            totals[1] += row[_SUM_Y]
+            totals[2] += count * offset + row[_SUM_DX]
+            totals[3] += count * offset * offset + 2 * offset * row[_SUM_DX] + row[_SUM_DX2]
+            totals[4] += offset * row[_SUM_Y] + row[_SUM_DXY]
+        return tuple(totals) if found else None
+
+    def window_sources(self, cutoff_bucket: int) -> Set[str]:
+        """Distinct sources seen in buckets at or after cutoff_bucket"""
+        sources: Set[str] = set()
+        for bucket_id, bucket_sources in self.sources.items():
+            if bucket_id >= cutoff_bucket:
+                sources.update(bucket_sources)
+        return sources
+
+
+class TopicSignalStore:
+    """
+    Per-topic running sums over fixed-width time buckets
+
+    Every topic owns a ring of up to ``retention_hours / bucket_minutes``
+    buckets, grown on demand to the span of time the topic has signals for. A
+    signal lands in the bucket covering its timestamp and only updates that
+    bucket's counters, so adding is amortized O(1) and expired buckets are
+    recycled in place instead of being swept. Window queries sum the buckets that start at
+    or after the window cutoff, so results include up to one bucket width of
+    signals older than the cutoff.
+    """
+
+    def __init__(self, bucket_minutes: float = 5, retention_hours: float = 720):
+        """
+        Initialize signal store
+
+        Args:
+            bucket_minutes: Width of one aggregation bucket
+            retention_hours: How far back buckets are kept
+        """
+        self.bucket_seconds = bucket_minutes * 60
+        self.bucket_hours = self.bucket_seconds / 3600
+        self.retention_seconds = retention_hours * 3600
+        self.ring_size = int(math.ceil(self.retention_seconds / self.bucket_seconds)) + 1
+
+        self.topics: Dict[str, _TopicSeries] = {}
+        self.signals_added = 0
+        self.signals_dropped = 0
+
+    def bucket_of(self, timestamp: float) -> int:
+        """Bucket index for a UNIX timestamp"""
+        return int(timestamp // self.bucket_seconds)
+
+    def add(self, topic: str, timestamp: float, value: float, source_id: str) -> bool:
+        """
+        Add one signal
+
+        Args:
+            topic: Signal topic
+            timestamp: UNIX timestamp of the signal
+            value: Signal value
+            source_id: Source that produced the signal
+
+        Returns:
+            False if the signal is older than the topic's retained buckets
+        """
+        series = self.topics.get(topic)
+        if series is None:
+            series = self.topics[topic] = _TopicSeries(self.ring_size)
+
+        bucket_id = self.bucket_of(timestamp)
+        offset_hours = (timestamp - bucket_id * self.bucket_seconds) / 3600
+
+        if series.add(bucket_id, offset_hours, timestamp, value, source_id):
+            self.signals_added += 1
+            return True
+
+        self.signals_dropped += 1
+        return False
+
+    def window(self, cutoff: float, include_sources: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregate every topic over the signals since cutoff
+
+        Args:
+            cutoff: UNIX timestamp where the window starts
+            include_sources: Whether to collect distinct source IDs per topic
+
+        Returns:
+            Topic -> {count, sum, mean, velocity, latest_values[, sources]} for
+            topics with at least one signal in the window
+        """
+        cutoff_bucket = self.bucket_of(cutoff)
+        stats = {}
+
+        for topic, series in self.topics.items():
+            sums = series.window_sums(cutoff_bucket, self.bucket_hours)
+            if sums is None or sums[0] == 0:
+                continue
+
+            count, sum_y, sum_x, sum_x2, sum_xy = sums
+            topic_stats = {
+                "count": int(round(count)),
+                "sum": sum_y,
+                "mean": sum_y / count,
+                "velocity": regression_slope(count, sum_x, sum_y, sum_xy, sum_x2),
+                "latest_values": [value for timestamp, value in series.latest if timestamp >= cutoff]
+            }
+            if include_sources:
+                topic_stats["sources"] = series.window_sources(cutoff_bucket)
+            stats[topic] = topic_stats
+
+        return stats
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Store size and bucket configuration"""
+        return {
+            "topics": len(self.topics),
+            "signals_added": self.signals_added,
+            "signals_dropped": self.signals_dropped,
+            "bucket_minutes": self.bucket_seconds / 60,
+            "buckets_per_topic": self.ring_size,
+            "allocated_buckets": sum(series.capacity for series in self.topics.values()),
+            "backend": "numpy" if np is not None else "python"
+        }
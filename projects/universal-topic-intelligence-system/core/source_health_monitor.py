@@ -102,10 +102,16 @@ class SourceHealthMonitor:
                     error_message TEXT,
                     items_found INTEGER DEFAULT 0,
                     items_stored INTEGER DEFAULT 0,
+                    not_modified BOOLEAN DEFAULT 0,  -- 304 response to a conditional GET
                     metadata TEXT  -- JSON for additional metrics
                 )
             """)
             
+            # Databases created before conditional GET support
+            cursor.execute("PRAGMA table_info(source_health_checks)")
+            if 'not_modified' not in [row[1] for row in cursor.fetchall()]:
+                cursor.execute("ALTER TABLE source_health_checks ADD COLUMN not_modified BOOLEAN DEFAULT 0")
+            
             # Source health summary table (current status)
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS source_health_summary (
@@ -140,7 +146,7 @@ class SourceHealthMonitor:
     def record_check(self, source_id: str, source_name: str, success: bool, 
                     response_time_ms: Optional[int] = None, error_type: str = None, 
                     error_message: str = None, items_found: int = 0, 
-                    items_stored: int = 0, **metadata) -> None:
+                    items_stored: int = 0, not_modified: bool = False, **metadata) -> None:
         """
         Record a health check result for a source
         
@@ -153,6 +159,7 @@ class SourceHealthMonitor:
             error_message: Detailed error message
             items_found: Number of items discovered
             items_stored: Number of items successfully stored
+            not_modified: Whether the source answered 304 Not Modified
             **metadata: Additional metrics
         """
         try:
@@ -163,11 +170,11 @@ class SourceHealthMonitor:
                 cursor.execute("""
                     INSERT INTO source_health_checks (
                         source_id, success, response_time_ms, error_type, 
-                        error_message, items_found, items_stored, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        error_message, items_found, items_stored, not_modified, metadata
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (
                     source_id, success, response_time_ms, error_type,
-                    error_message, items_found, items_stored, 
+                    error_message, items_found, items_stored, not_modified,
                     json.dumps(metadata) if metadata else None
                 ))
                 
@@ -460,7 +467,8 @@ class SourceHealthMonitor:
                         COUNT(*) as total_checks,
                         SUM(CASE WHEN success THEN 1 ELSE 0 END) as successful_checks,
                         COUNT(DISTINCT source_id) as sources_checked,
-                        AVG(response_time_ms) as avg_response_time
+                        AVG(response_time_ms) as avg_response_time,
+                        SUM(CASE WHEN not_modified THEN 1 ELSE 0 END) as not_modified_checks
                     FROM source_health_checks
                     WHERE check_time > datetime('now', '-24 hours')
                 """)
@@ -495,7 +503,8 @@ class SourceHealthMonitor:
                         'total_checks_24h': recent_activity[0] or 0,
                         'successful_checks_24h': recent_activity[1] or 0,
                         'sources_checked_24h': recent_activity[2] or 0,
-                        'avg_response_time_24h': round(recent_activity[3] or 0, 1)
+                        'avg_response_time_24h': round(recent_activity[3] or 0, 1),
+                        'not_modified_checks_24h': recent_activity[4] or 0
                     },
                     'top_errors': top_errors,
                     'sources': source_details
@@ -5,16 +5,18 @@ Implements velocity tracking and emergence detection for the Universal Topic Int
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set, Deque
 from datetime import datetime, timedelta
 from enum import Enum
 import json
 import logging
 import math
-from collections import defaultdict, Counter
+import time
+from collections import defaultdict, Counter, deque, OrderedDict
 from abc import ABC, abstractmethod
 
 from .universal_source_monitor import ContentItem
+from .signal_store import TopicSignalStore, regression_slope
 
 class TrendType(Enum):
     """Types of trends that can be detected"""
@@ -91,11 +93,6 @@ class TrendDetectionEngine:
         self.config = config or self._default_config()
         self.logger = logging.getLogger("TrendDetection")
         
-        # Signal storage and processing
-        self.signal_history: List[TrendSignal] = []
-        self.topic_baselines: Dict[str, float] = {}
-        self.trend_cache: Dict[str, TrendPattern] = {}
-        
         # Analysis windows (in hours)
         self.analysis_windows = {
             "immediate": 1,      # 1 hour - breaking news
@@ -105,6 +102,25 @@ class TrendDetectionEngine:
             "baseline": 720      # 30 days - baseline calculation
         }
         
+        store_config = {**self._default_config()["signal_store"], **self.config.get("signal_store", {})}
+        max_age_hours = self.config["signal_decay"]["max_age_days"] * 24
+        
+        # Signal storage and processing: per-topic bucket aggregates cover the whole
+        # retention period, raw signals are kept (bounded) for the detail detectors
+        self.signal_store = TopicSignalStore(
+            bucket_minutes=store_config["bucket_minutes"],
+            retention_hours=max(max_age_hours, self.analysis_windows["baseline"])
+        )
+        self.signal_history: Deque[TrendSignal] = deque(maxlen=store_config["max_raw_signals"])
+        self.topic_baselines: Dict[str, float] = {}
+        self.trend_cache: Dict[str, TrendPattern] = {}
+        
+        # Content seen recently (for viral detection) and content seen more than once,
+        # both ordered by when the content was last seen
+        self.max_tracked_content = store_config["max_tracked_content"]
+        self._content_first_signal: "OrderedDict[str, Tuple[float, float, str, str]]" = OrderedDict()
+        self._repeated_content: "OrderedDict[str, List[Tuple[float, float, str, str]]]" = OrderedDict()
+        
         # Initialize trend detection algorithms
         self._init_detectors()
     
@@ -137,6 +153,11 @@ class TrendDetectionEngine:
             "signal_decay": {
                 "half_life_hours": 24,   # Signal value halves every 24 hours
                 "max_age_days": 30       # Keep signals for 30 days max
+            },
+            "signal_store": {
+                "bucket_minutes": 5,          # Aggregation bucket width
+                "max_raw_signals": 100000,    # Raw signals kept for the detail detectors
+                "max_tracked_content": 100000 # Content IDs remembered for viral detection
             }
         }
     
@@ -183,15 +204,71 @@ class TrendDetectionEngine:
             }
         )
         
-        # Add to signal history
+        self.add_signal(signal)
+        
+        self.logger.debug(f"Added trend signal for topic '{signal.topic}' with value {signal_value:.3f}")
+        
+        return signal
+    
+    def add_signal(self, signal: TrendSignal) -> bool:
+        """
+        Add a trend signal to the aggregates and the raw signal history
+        
+        Args:
+            signal: Trend signal to add
+            
+        Returns:
+            False if the signal is older than the retention period and was dropped
+        """
+        timestamp = self._epoch(signal.timestamp)
+        if timestamp < time.time() - self.signal_store.retention_seconds:
+            return False
+        
+        if not self.signal_store.add(signal.topic, timestamp, signal.value, signal.source_id):
+            return False
+        
+        self._track_content(signal, timestamp)
         self.signal_history.append(signal)
         
         # Maintain signal history size
         self._cleanup_old_signals()
         
-        self.logger.debug(f"Added trend signal for topic '{signal.topic}' with value {signal_value:.3f}")
-        
-        return signal
+        return True
+    
+    @staticmethod
+    def _epoch(timestamp: datetime) -> float:
+        """UNIX timestamp for naive (local time) or timezone-aware datetimes"""
+        return timestamp.timestamp()
+    
+    def _track_content(self, signal: TrendSignal, timestamp: float):
+        """Remember content IDs so repeat signals for the same content can be checked for viral spread"""
+        content_id = signal.content_id
+        entry = (timestamp, signal.value, signal.topic, signal.source_id)
+        
+        repeated = self._repeated_content.get(content_id)
+        if repeated is not None:
+            repeated.append(entry)
+            self._repeated_content.move_to_end(content_id)
+        else:
+            first = self._content_first_signal.pop(content_id, None)
+            if first is None:
+                self._content_first_signal[content_id] = entry
+                while len(self._content_first_signal) > self.max_tracked_content:
+                    self._content_first_signal.popitem(last=False)
+                return
+            self._repeated_content[content_id] = [first, entry]
+        
+        self._prune_repeated_content()
+    
+    def _prune_repeated_content(self):
+        """Drop the least recently seen repeated content once it expires or exceeds the tracking limit"""
+        retention_cutoff = time.time() - self.signal_store.retention_seconds
+        
+        while self._repeated_content:
+            content_id, entries = next(iter(self._repeated_content.items()))
+            if len(self._repeated_content) <= self.max_tracked_content and max(entry[0] for entry in entries) >= retention_cutoff:
+                break
+            del self._repeated_content[content_id]
     
     def _calculate_signal_value(self, content: ContentItem, priority_score: float) -> float:
         """Calculate trend signal value from content metrics"""
@@ -272,23 +349,23 @@ class TrendDetectionEngine:
         return engagement
     
     def _cleanup_old_signals(self):
-        """Remove old signals to maintain performance"""
-        max_age = timedelta(days=self.config["signal_decay"]["max_age_days"])
-        
-        # Handle timezone-aware vs naive datetime comparison
-        now = datetime.now()
-        if self.signal_history and self.signal_history[0].timestamp.tzinfo:
-            # If signals have timezone info, make now timezone-aware
-            now = datetime.now(self.signal_history[0].timestamp.tzinfo)
+        """
+        Remove old signals to maintain performance
         
-        cutoff_time = now - max_age
+        Signals mostly arrive in time order, so expired ones are popped from the
+        front of the history. Out-of-order stragglers are skipped by the window
+        filters and eventually evicted by the history's maxlen.
+        """
+        max_age_days = self.config["signal_decay"]["max_age_days"]
+        cutoff = time.time() - max_age_days * 86400
         
-        original_count = len(self.signal_history)
-        self.signal_history = [s for s in self.signal_history if s.timestamp >= cutoff_time]
+        removed_count = 0
+        while self.signal_history and self._epoch(self.signal_history[0].timestamp) < cutoff:
+            self.signal_history.popleft()
+            removed_count += 1
         
-        removed_count = original_count - len(self.signal_history)
         if removed_count > 0:
-            self.logger.debug(f"Removed {removed_count} old signals (older than {max_age.days} days)")
+            self.logger.debug(f"Removed {removed_count} old signals (older than {max_age_days} days)")
     
     def analyze_trends(self, analysis_window: str = "medium") -> TrendAnalysisResult:
         """
@@ -301,17 +378,10 @@ class TrendDetectionEngine:
             Complete trend analysis results
         """
         window_hours = self.analysis_windows.get(analysis_window, 24)
-        
-        # Handle timezone-aware vs naive datetime comparison
-        now = datetime.now()
-        if self.signal_history and self.signal_history[0].timestamp.tzinfo:
-            # If signals have timezone info, make now timezone-aware
-            now = datetime.now(self.signal_history[0].timestamp.tzinfo)
-        
-        cutoff_time = now - timedelta(hours=window_hours)
+        cutoff = time.time() - window_hours * 3600
         
         # Filter signals to analysis window
-        relevant_signals = [s for s in self.signal_history if s.timestamp >= cutoff_time]
+        relevant_signals = [s for s in self.signal_history if self._epoch(s.timestamp) >= cutoff]
         
         if not relevant_signals:
             return TrendAnalysisResult(
@@ -340,8 +410,11 @@ class TrendDetectionEngine:
             except Exception as e:
                 self.logger.error(f"Error in {detector_name} detector: {e}")
         
-        # Calculate additional metrics
-        topic_velocities = self._calculate_topic_velocities(relevant_signals)
+        # Calculate additional metrics (velocities come from the bucket aggregates)
+        topic_velocities = {
+            topic: stats["velocity"]
+            for topic, stats in self.signal_store.window(cutoff, include_sources=False).items()
+        }
         emergence_candidates = self._identify_emergence_candidates(relevant_signals)
         declining_topics = self._identify_declining_topics(relevant_signals)
         viral_content = self._identify_viral_content(relevant_signals)
@@ -366,60 +439,23 @@ class TrendDetectionEngine:
         return result
     
     def _update_baselines(self):
-        """Update topic baselines using historical data"""
-        baseline_window = timedelta(hours=self.analysis_windows["baseline"])
-        
-        # Handle timezone-aware vs naive datetime comparison
-        now = datetime.now()
-        if self.signal_history and self.signal_history[0].timestamp.tzinfo:
-            # If signals have timezone info, make now timezone-aware
-            now = datetime.now(self.signal_history[0].timestamp.tzinfo)
-        
-        cutoff_time = now - baseline_window
+        """Update topic baselines from the per-topic bucket aggregates"""
+        cutoff = time.time() - self.analysis_windows["baseline"] * 3600
+        topic_stats = self.signal_store.window(cutoff, include_sources=False)
         
-        # Get baseline signals
-        baseline_signals = [s for s in self.signal_history if s.timestamp >= cutoff_time]
-        
-        # Calculate average signal value per topic
-        topic_signals = defaultdict(list)
-        for signal in baseline_signals:
-            topic_signals[signal.topic].append(signal.value)
+        total_count = sum(stats["count"] for stats in topic_stats.values())
+        global_average = sum(stats["sum"] for stats in topic_stats.values()) / total_count if total_count else 0.5
         
         # Update baselines
-        for topic, values in topic_signals.items():
-            if len(values) >= 5:  # Need minimum signals for reliable baseline
-                self.topic_baselines[topic] = sum(values) / len(values)
+        for topic, stats in topic_stats.items():
+            if stats["count"] >= 5:  # Need minimum signals for reliable baseline
+                self.topic_baselines[topic] = stats["mean"]
             else:
                 # Use global average if insufficient data
-                all_values = [s.value for s in baseline_signals]
-                self.topic_baselines[topic] = sum(all_values) / len(all_values) if all_values else 0.5
+                self.topic_baselines[topic] = global_average
         
         self.logger.debug(f"Updated baselines for {len(self.topic_baselines)} topics")
     
-    def _calculate_topic_velocities(self, signals: List[TrendSignal]) -> Dict[str, float]:
-        """Calculate velocity (rate of change) for each topic"""
-        topic_velocities = {}
-        
-        # Group signals by topic
-        topic_signals = defaultdict(list)
-        for signal in signals:
-            topic_signals[signal.topic].append(signal)
-        
-        # Calculate velocity for each topic
-        for topic, topic_signal_list in topic_signals.items():
-            if len(topic_signal_list) < 2:
-                topic_velocities[topic] = 0.0
-                continue
-            
-            # Sort by timestamp
-            topic_signal_list.sort(key=lambda x: x.timestamp)
-            
-            # Calculate velocity using linear regression or simple slope
-            velocity = self._calculate_velocity_slope(topic_signal_list)
-            topic_velocities[topic] = velocity
-        
-        return topic_velocities
-    
     def _calculate_velocity_slope(self, signals: List[TrendSignal]) -> float:
         """Calculate velocity slope for a list of signals"""
         if len(signals) < 2:
@@ -449,7 +485,6 @@ class TrendDetectionEngine:
     
     def _identify_emergence_candidates(self, signals: List[TrendSignal]) -> List[str]:
         """Identify topics that are emerging (new and growing)"""
-        emergence_config = self.config["emergence_thresholds"]
         candidates = []
         
         # Group by topic
@@ -458,21 +493,26 @@ class TrendDetectionEngine:
             topic_signals[signal.topic].append(signal)
         
         for topic, topic_signal_list in topic_signals.items():
-            # Check emergence criteria
             signal_count = len(topic_signal_list)
             source_count = len(set(s.source_id for s in topic_signal_list))
+            current_average = sum(s.value for s in topic_signal_list) / signal_count
             
-            if signal_count >= emergence_config["min_signals"] and source_count >= emergence_config["min_sources"]:
-                # Check if topic is "new" (low baseline)
-                baseline = self.topic_baselines.get(topic, 0.5)
-                current_average = sum(s.value for s in topic_signal_list) / len(topic_signal_list)
-                
-                # Check growth rate
-                if current_average / baseline >= emergence_config["growth_rate"]:
-                    candidates.append(topic)
+            if self._is_emergence_candidate(topic, signal_count, source_count, current_average):
+                candidates.append(topic)
         
         return candidates
     
+    def _is_emergence_candidate(self, topic: str, signal_count: int, source_count: int, current_average: float) -> bool:
+        """Emergence criteria: enough signals from enough sources, growing against the baseline"""
+        emergence_config = self.config["emergence_thresholds"]
+        
+        if signal_count < emergence_config["min_signals"] or source_count < emergence_config["min_sources"]:
+            return False
+        
+        # Check growth rate against the topic baseline
+        baseline = self.topic_baselines.get(topic, 0.5)
+        return current_average / baseline >= emergence_config["growth_rate"]
+    
     def _identify_declining_topics(self, signals: List[TrendSignal]) -> List[str]:
         """Identify topics that are declining"""
         declining = []
@@ -482,24 +522,24 @@ class TrendDetectionEngine:
             topic_signals[signal.topic].append(signal)
         
         for topic, topic_signal_list in topic_signals.items():
-            if len(topic_signal_list) < 3:  # Need enough data
-                continue
-            
             # Sort by timestamp
             topic_signal_list.sort(key=lambda x: x.timestamp)
             
             # Calculate trend slope
             slope = self._calculate_velocity_slope(topic_signal_list)
             
-            # Negative slope indicates decline
-            if slope < -0.1:  # Threshold for decline
+            if self._is_declining(len(topic_signal_list), slope):
                 declining.append(topic)
         
         return declining
     
+    @staticmethod
+    def _is_declining(signal_count: int, slope: float) -> bool:
+        """Negative slope over enough data indicates decline"""
+        return signal_count >= 3 and slope < -0.1  # Threshold for decline
+    
     def _identify_viral_content(self, signals: List[TrendSignal]) -> List[str]:
         """Identify content that has gone viral"""
-        viral_config = self.config["viral_thresholds"]
         viral = []
         
         # Group by content
@@ -514,30 +554,35 @@ class TrendDetectionEngine:
             # Sort by timestamp
             content_signal_list.sort(key=lambda x: x.timestamp)
             
-            # Check time window
             time_span = (content_signal_list[-1].timestamp - content_signal_list[0].timestamp).total_seconds() / 3600
+            velocity = self._calculate_velocity_slope(content_signal_list)
             
-            if time_span <= viral_config["time_window"]:
-                # Calculate velocity and acceleration
-                velocity = self._calculate_velocity_slope(content_signal_list)
-                
-                if velocity >= viral_config["min_velocity"]:
-                    viral.append(content_id)
+            if self._is_viral_content(time_span, velocity):
+                viral.append(content_id)
         
         return viral
     
+    def _is_viral_content(self, time_span_hours: float, velocity: float) -> bool:
+        """Content spreading fast enough within the viral time window"""
+        viral_config = self.config["viral_thresholds"]
+        return time_span_hours <= viral_config["time_window"] and velocity >= viral_config["min_velocity"]
+    
     def _calculate_analysis_confidence(self, trends: List[TrendPattern], signals: List[TrendSignal]) -> float:
         """Calculate confidence score for the analysis"""
         if not trends or not signals:
             return 0.0
         
+        unique_sources = len(set(s.source_id for s in signals))
+        return self._confidence_from_counts(len(signals), unique_sources)
+    
+    def _confidence_from_counts(self, signal_count: int, unique_sources: int) -> float:
+        """Weighted confidence from signal volume and source diversity"""
         weights = self.config["confidence_weights"]
         
         # Signal count factor (more signals = higher confidence)
-        signal_factor = min(1.0, len(signals) / 100)  # 100 signals = max confidence
+        signal_factor = min(1.0, signal_count / 100)  # 100 signals = max confidence
         
         # Source diversity factor
-        unique_sources = len(set(s.source_id for s in signals))
         diversity_factor = min(1.0, unique_sources / 10)  # 10 sources = max confidence
         
         # Pattern consistency (placeholder - could be enhanced)
@@ -557,22 +602,111 @@ class TrendDetectionEngine:
         return confidence
     
     def get_trend_summary(self, window: str = "medium") -> Dict[str, Any]:
-        """Get a summary of current trends"""
-        analysis = self.analyze_trends(window)
+        """
+        Get a summary of current trends
+        
+        Reads the per-topic bucket aggregates instead of re-scanning raw signals.
+        Velocity, emergence and viral trends are classified through the same
+        detector classify() methods that analyze_trends() uses.
+        """
+        window_hours = self.analysis_windows.get(window, 24)
+        now = time.time()
+        cutoff = now - window_hours * 3600
+        
+        topic_stats = self.signal_store.window(cutoff)
+        if topic_stats:
+            self._update_baselines()
+        
+        velocity_detector = self.detectors["velocity"]
+        emergence_detector = self.detectors["emergence"]
+        
+        trends: List[Tuple[TrendType, TrendStrength]] = []
+        emergence_candidates = []
+        declining_topics = []
+        
+        for topic, stats in topic_stats.items():
+            count = stats["count"]
+            source_count = len(stats["sources"])
+            
+            for classification in (
+                velocity_detector.classify(
+                    count, stats["velocity"],
+                    self.topic_baselines.get(topic, velocity_detector.DEFAULT_BASELINE),
+                    velocity_detector.current_value(stats["latest_values"])
+                ),
+                emergence_detector.classify(
+                    count, source_count,
+                    self.topic_baselines.get(topic, emergence_detector.DEFAULT_BASELINE),
+                    stats["mean"]
+                )
+            ):
+                if classification is not None:
+                    trends.append(classification)
+            
+            if self._is_emergence_candidate(topic, count, source_count, stats["mean"]):
+                emergence_candidates.append(topic)
+            
+            if self._is_declining(count, stats["velocity"]):
+                declining_topics.append(topic)
+        
+        viral_trends, viral_content = self._summarize_repeated_content(cutoff)
+        trends.extend(viral_trends)
+        
+        total_signals = sum(stats["count"] for stats in topic_stats.values())
+        confidence_score = 0.0
+        if trends and total_signals:
+            unique_sources = set()
+            for stats in topic_stats.values():
+                unique_sources.update(stats["sources"])
+            confidence_score = self._confidence_from_counts(total_signals, len(unique_sources))
         
         return {
-            "timestamp": analysis.analysis_timestamp.isoformat(),
-            "analysis_window_hours": analysis.analysis_window_hours,
-            "total_trends": len(analysis.detected_trends),
-            "trends_by_type": Counter(t.trend_type.value for t in analysis.detected_trends),
-            "trends_by_strength": Counter(t.trend_strength.value for t in analysis.detected_trends),
-            "top_emerging": analysis.emergence_candidates[:5],
-            "top_declining": analysis.declining_topics[:5],
-            "viral_content_count": len(analysis.viral_content),
-            "confidence_score": analysis.confidence_score,
-            "total_signals_analyzed": analysis.total_signals_analyzed,
-            "active_topics": len(analysis.topic_velocities)
+            "timestamp": datetime.now().isoformat(),
+            "analysis_window_hours": window_hours,
+            "total_trends": len(trends),
+            "trends_by_type": Counter(trend_type.value for trend_type, _ in trends),
+            "trends_by_strength": Counter(strength.value for _, strength in trends),
+            "top_emerging": emergence_candidates[:5],
+            "top_declining": declining_topics[:5],
+            "viral_content_count": len(viral_content),
+            "confidence_score": confidence_score,
+            "total_signals_analyzed": total_signals,
+            "active_topics": len(topic_stats)
         }
+    
+    def _summarize_repeated_content(self, cutoff: float) -> Tuple[List[Tuple[TrendType, TrendStrength]], List[str]]:
+        """
+        Viral trends and viral content among content IDs seen more than once
+        
+        Returns:
+            (ViralDetector trend classifications, content IDs _identify_viral_content would report)
+        """
+        viral_detector = self.detectors["viral"]
+        
+        trends = []
+        viral_content = []
+        
+        for content_id, entries in self._repeated_content.items():
+            in_window = sorted(entry for entry in entries if entry[0] >= cutoff)
+            if len(in_window) < 2:
+                continue
+            
+            duration = (in_window[-1][0] - in_window[0][0]) / 3600
+            values = [entry[1] for entry in in_window]
+            
+            classification = viral_detector.classify(duration, values[0], values[-1], max(values))
+            if classification is not None:
+                trends.append(classification)
+            
+            x_values = [(entry[0] - in_window[0][0]) / 3600 for entry in in_window]
+            slope = regression_slope(
+                len(values), sum(x_values), sum(values),
+                sum(x * y for x, y in zip(x_values, values)), sum(x * x for x in x_values)
+            )
+            if self._is_viral_content(duration, slope):
+                viral_content.append(content_id)
+        
+        return trends, viral_content
 
 
 # Individual trend detectors
@@ -593,6 +727,8 @@ class TrendDetector(ABC):
 class VelocityDetector(TrendDetector):
     """Detects trends based on velocity (rate of change)"""
     
+    DEFAULT_BASELINE = 0.5  # Baseline for topics without one
+    
     def detect_trends(self, signals: List[TrendSignal], baselines: Dict[str, float]) -> List[TrendPattern]:
         trends = []
         
@@ -602,22 +738,20 @@ class VelocityDetector(TrendDetector):
             topic_signals[signal.topic].append(signal)
         
         for topic, topic_signal_list in topic_signals.items():
-            if len(topic_signal_list) < 2:  # Need minimum signals (lowered for testing)
-                continue
-            
             # Sort by timestamp
             topic_signal_list.sort(key=lambda x: x.timestamp)
             
             # Calculate metrics
-            baseline = baselines.get(topic, 0.5)
-            current_value = sum(s.value for s in topic_signal_list[-3:]) / 3  # Average of last 3
+            baseline = baselines.get(topic, self.DEFAULT_BASELINE)
+            current_value = self.current_value([s.value for s in topic_signal_list])
             velocity = self._calculate_velocity(topic_signal_list)
-            acceleration = self._calculate_acceleration(topic_signal_list)
             
             # Determine trend type and strength
-            trend_type, trend_strength = self._classify_velocity_trend(velocity, baseline, current_value)
+            classification = self.classify(len(topic_signal_list), velocity, baseline, current_value)
             
-            if trend_type != TrendType.STABLE:
+            if classification is not None:
+                trend_type, trend_strength = classification
+                acceleration = self._calculate_acceleration(topic_signal_list)
                 # Calculate additional metrics
                 duration = (topic_signal_list[-1].timestamp - topic_signal_list[0].timestamp).total_seconds() / 3600
                 confidence = self._calculate_velocity_confidence(topic_signal_list, velocity)
@@ -681,6 +815,34 @@ class VelocityDetector(TrendDetector):
         
         return velocity_2 - velocity_1
     
+    @staticmethod
+    def current_value(values: List[float]) -> float:
+        """Current level of a topic: average of its last 3 values, oldest first"""
+        return sum(values[-3:]) / 3
+    
+    def classify(self, signal_count: int, velocity: float, baseline: float,
+                 current_value: float) -> Optional[Tuple[TrendType, TrendStrength]]:
+        """
+        Classify a topic from its aggregate metrics
+        
+        Args:
+            signal_count: Signals for the topic in the analysis window
+            velocity: Regression slope of the signal values per hour
+            baseline: Topic baseline
+            current_value: Result of current_value() for the topic
+            
+        Returns:
+            (trend type, strength), or None if the topic is not trending
+        """
+        if signal_count < 2:  # Need minimum signals (lowered for testing)
+            return None
+        
+        trend_type, trend_strength = self._classify_velocity_trend(velocity, baseline, current_value)
+        if trend_type == TrendType.STABLE:
+            return None
+        
+        return trend_type, trend_strength
+    
     def _classify_velocity_trend(self, velocity: float, baseline: float, current_value: float) -> Tuple[TrendType, TrendStrength]:
         """Classify trend type and strength based on velocity"""
         thresholds = self.config["velocity_thresholds"]
@@ -748,9 +910,10 @@ class VelocityDetector(TrendDetector):
 class EmergenceDetector(TrendDetector):
     """Detects emerging topics and new trends"""
     
+    DEFAULT_BASELINE = 0.1  # Low baseline for new topics
+    
     def detect_trends(self, signals: List[TrendSignal], baselines: Dict[str, float]) -> List[TrendPattern]:
         trends = []
-        emergence_config = self.config["emergence_thresholds"]
         
         # Group by topic
         topic_signals = defaultdict(list)
@@ -761,21 +924,15 @@ class EmergenceDetector(TrendDetector):
             signal_count = len(topic_signal_list)
             source_count = len(set(s.source_id for s in topic_signal_list))
             
-            # Check basic emergence criteria
-            if signal_count < emergence_config["min_signals"]:
-                continue
-            if source_count < emergence_config["min_sources"]:
-                continue
-            
-            baseline = baselines.get(topic, 0.1)  # Low baseline for new topics
+            baseline = baselines.get(topic, self.DEFAULT_BASELINE)
             current_average = sum(s.value for s in topic_signal_list) / len(topic_signal_list)
             
-            # Calculate novelty and growth
-            novelty_score = 1.0 - min(1.0, baseline / 0.5)  # How "new" the topic is
-            growth_rate = current_average / baseline if baseline > 0 else float('inf')
+            classification = self.classify(signal_count, source_count, baseline, current_average)
             
-            # Check emergence thresholds
-            if novelty_score >= emergence_config["novelty_threshold"] and growth_rate >= emergence_config["growth_rate"]:
+            if classification is not None:
+                trend_type, trend_strength = classification
+                novelty_score, growth_rate = self.emergence_metrics(baseline, current_average)
+                
                 # Calculate additional metrics
                 topic_signal_list.sort(key=lambda x: x.timestamp)
                 velocity = self._calculate_simple_velocity(topic_signal_list)
@@ -783,8 +940,8 @@ class EmergenceDetector(TrendDetector):
                 
                 trend = TrendPattern(
                     topic=topic,
-                    trend_type=TrendType.EMERGING,
-                    trend_strength=self._classify_emergence_strength(growth_rate),
+                    trend_type=trend_type,
+                    trend_strength=trend_strength,
                     velocity=velocity,
                     acceleration=0.0,  # Not calculated for emergence
                     baseline=baseline,
@@ -820,6 +977,42 @@ class EmergenceDetector(TrendDetector):
         
         return total_change / max(1, duration_hours)
     
+    @staticmethod
+    def emergence_metrics(baseline: float, current_average: float) -> Tuple[float, float]:
+        """(novelty score, growth rate) of a topic against its baseline"""
+        novelty_score = 1.0 - min(1.0, baseline / 0.5)  # How "new" the topic is
+        growth_rate = current_average / baseline if baseline > 0 else float('inf')
+        return novelty_score, growth_rate
+    
+    def classify(self, signal_count: int, source_count: int, baseline: float,
+                 current_average: float) -> Optional[Tuple[TrendType, TrendStrength]]:
+        """
+        Classify a topic from its aggregate metrics
+        
+        Args:
+            signal_count: Signals for the topic in the analysis window
+            source_count: Distinct sources behind those signals
+            baseline: Topic baseline
+            current_average: Mean signal value in the analysis window
+            
+        Returns:
+            (TrendType.EMERGING, strength), or None if the topic is not emerging
+        """
+        emergence_config = self.config["emergence_thresholds"]
+        
+        # Check basic emergence criteria
+        if signal_count < emergence_config["min_signals"]:
+            return None
+        if source_count < emergence_config["min_sources"]:
+            return None
+        
+        # Check emergence thresholds
+        novelty_score, growth_rate = self.emergence_metrics(baseline, current_average)
+        if novelty_score < emergence_config["novelty_threshold"] or growth_rate < emergence_config["growth_rate"]:
+            return None
+        
+        return TrendType.EMERGING, self._classify_emergence_strength(growth_rate)
+    
     def _classify_emergence_strength(self, growth_rate: float) -> TrendStrength:
         """Classify strength of emergence"""
         if growth_rate >= 10:
@@ -837,7 +1030,6 @@ class ViralDetector(TrendDetector):
     
     def detect_trends(self, signals: List[TrendSignal], baselines: Dict[str, float]) -> List[TrendPattern]:
         trends = []
-        viral_config = self.config["viral_thresholds"]
         
         # Group by content (not topic) for viral detection
         content_signals = defaultdict(list)
@@ -850,24 +1042,25 @@ class ViralDetector(TrendDetector):
             
             content_signal_list.sort(key=lambda x: x.timestamp)
             
-            # Check time window for viral spread
-            duration = (content_signal_list[-1].timestamp - content_signal_list[0].timestamp).total_seconds() / 3600
-            if duration > viral_config["time_window"]:
-                continue
-            
             # Calculate metrics
-            velocity = abs(content_signal_list[-1].value - content_signal_list[0].value) / max(1, duration)
+            duration = (content_signal_list[-1].timestamp - content_signal_list[0].timestamp).total_seconds() / 3600
+            first_value = content_signal_list[0].value
+            last_value = content_signal_list[-1].value
             peak_value = max(s.value for s in content_signal_list)
             
             # Check viral thresholds
-            if velocity >= viral_config["min_velocity"]:
+            classification = self.classify(duration, first_value, last_value, peak_value)
+            
+            if classification is not None:
+                trend_type, trend_strength = classification
+                velocity = self.spread_velocity(first_value, last_value, duration)
                 topic = content_signal_list[0].topic
                 baseline = baselines.get(topic, 0.5)
                 
                 trend = TrendPattern(
                     topic=topic,
-                    trend_type=TrendType.VIRAL,
-                    trend_strength=self._classify_viral_strength(velocity, peak_value),
+                    trend_type=trend_type,
+                    trend_strength=trend_strength,
                     velocity=velocity,
                     acceleration=0.0,
                     baseline=baseline,
@@ -891,6 +1084,37 @@ class ViralDetector(TrendDetector):
         
         return trends
     
+    @staticmethod
+    def spread_velocity(first_value: float, last_value: float, duration_hours: float) -> float:
+        """Change per hour between the first and last signal of a content item"""
+        return abs(last_value - first_value) / max(1, duration_hours)
+    
+    def classify(self, duration_hours: float, first_value: float, last_value: float,
+                 peak_value: float) -> Optional[Tuple[TrendType, TrendStrength]]:
+        """
+        Classify a content item from its first, last and peak signal values
+        
+        Args:
+            duration_hours: Time between the first and last signal
+            first_value: Value of the first signal
+            last_value: Value of the last signal
+            peak_value: Highest signal value
+            
+        Returns:
+            (TrendType.VIRAL, strength), or None if the content is not viral
+        """
+        viral_config = self.config["viral_thresholds"]
+        
+        # Check time window for viral spread
+        if duration_hours > viral_config["time_window"]:
+            return None
+        
+        velocity = self.spread_velocity(first_value, last_value, duration_hours)
+        if velocity < viral_config["min_velocity"]:
+            return None
+        
+        return TrendType.VIRAL, self._classify_viral_strength(velocity, peak_value)
+    
     def _classify_viral_strength(self, velocity: float, peak_value: float) -> TrendStrength:
         """Classify strength of viral trend"""
         if velocity >= 20 or peak_value >= 2.0:
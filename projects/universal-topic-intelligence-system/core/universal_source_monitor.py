@@ -7,14 +7,18 @@ Part of the Universal Topic Intelligence System
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Set, Callable
+from typing import Dict, List, Any, Optional, Set, Callable, TYPE_CHECKING
 from datetime import datetime, timedelta
 from pathlib import Path
+import inspect
 import json
 import logging
 import asyncio
 from enum import Enum
 
+if TYPE_CHECKING:
+    from .http_client import HTTPClientManager
+
 class SourceType(Enum):
     """Types of content sources"""
     RSS = "rss"
@@ -91,16 +95,19 @@ class UniversalSourceMonitor(ABC):
     Provides common functionality and enforces interface
     """
     
-    def __init__(self, source_metadata: SourceMetadata, config: Optional[Dict] = None):
+    def __init__(self, source_metadata: SourceMetadata, config: Optional[Dict] = None,
+                 http_client: Optional["HTTPClientManager"] = None):
         """
         Initialize universal source monitor
         
         Args:
             source_metadata: Metadata about the source
             config: Optional configuration overrides
+            http_client: Shared HTTP client for monitors that fetch over HTTP
         """
         self.source_metadata = source_metadata
         self.config = config or {}
+        self.http_client = http_client
         self.logger = self._setup_logging()
         self.cache = {}
         self.last_check = None
@@ -322,14 +329,27 @@ class SourceMonitorFactory:
         cls._monitors[source_type] = monitor_class
     
     @classmethod
-    def create_monitor(cls, source_metadata: SourceMetadata, config: Optional[Dict] = None) -> UniversalSourceMonitor:
+    def create_monitor(cls, source_metadata: SourceMetadata, config: Optional[Dict] = None,
+                       http_client: Optional["HTTPClientManager"] = None) -> UniversalSourceMonitor:
         """Create appropriate monitor for source type"""
         monitor_class = cls._monitors.get(source_metadata.source_type)
         if not monitor_class:
             raise ValueError(f"No monitor registered for source type: {source_metadata.source_type}")
         
+        # Monitors registered before http_client existed may not accept it
+        if http_client is not None and cls._accepts_http_client(monitor_class):
+            return monitor_class(source_metadata, config, http_client=http_client)
         return monitor_class(source_metadata, config)
     
+    @staticmethod
+    def _accepts_http_client(monitor_class: type) -> bool:
+        """Whether the monitor constructor takes an http_client argument"""
+        parameters = inspect.signature(monitor_class.__init__).parameters.values()
+        return any(
+            parameter.name == "http_client" or parameter.kind is inspect.Parameter.VAR_KEYWORD
+            for parameter in parameters
+        )
+    
     @classmethod
     def list_supported_types(cls) -> List[SourceType]:
         """List all supported source types"""
@@ -17,9 +17,11 @@ from sources.real_mcp_monitor import MCP_TEST_CONFIG
 from core import SourceMetadata, SourceType
 from core.language_filter import LanguageFilter
 from core.relevance_filter import RelevanceFilter
+from core.http_client import HTTPClientManager
 from core.incremental_updater import IncrementalUpdateManager
 from core.source_health_monitor import SourceHealthMonitor
 from storage.database import StorageManager
+from storage.write_behind import WriteBehindQueue
 from core.content_prioritizer import UniversalContentPrioritizer
 from core.trend_detection_engine import TrendDetectionEngine
 from core.noise_reduction_engine import NoiseReductionEngine
@@ -39,12 +41,14 @@ class UniversalMonitor:
     """
     
     def __init__(self):
-        self.storage = StorageManager()
+        self.storage = StorageManager(pooled=True)
+        self.write_queue = WriteBehindQueue(self.storage)
+        self.http_client = HTTPClientManager(limit=100, limit_per_host=4, ttl_dns_cache=300)
         self.prioritizer = UniversalContentPrioritizer()
         self.language_filter = LanguageFilter(target_languages=['en'], min_confidence=0.7)
         self.relevance_filter = RelevanceFilter()
         self.trend_detector = TrendDetectionEngine()
-        self.noise_filter = NoiseReductionEngine()
+        self.noise_filter = NoiseReductionEngine(index_db_path=self.storage.db_path, warm_from_db=True)
         self.incremental_updater = IncrementalUpdateManager()
         self.health_monitor = SourceHealthMonitor()
         
@@ -171,6 +175,46 @@ class UniversalMonitor:
             
         return []
     
+    async def _store_items(self, pending: List[tuple], source_name: str) -> int:
+        """
+        Queue prioritized items from one source on the write-behind queue
+        
+        Args:
+            pending: List of (ContentItem, PriorityResult) tuples
+            source_name: Source name for logging
+            
+        Returns:
+            Number of newly stored items
+            
+        Raises:
+            The storage error if the batch holding these items failed
+        """
+        if not pending:
+            return 0
+        
+        futures = await self.write_queue.submit_many(
+            [(item, priority.total_score, priority.priority_level.value) for item, priority in pending]
+        )
+        # Collect every outcome so no failed future goes unretrieved
+        stored_flags = await asyncio.gather(*futures, return_exceptions=True)
+        for stored in stored_flags:
+            if isinstance(stored, Exception):
+                raise stored
+        
+        # Only newly stored items feed trend detection
+        items_stored = 0
+        for (item, priority), stored in zip(pending, stored_flags):
+            if not stored:
+                continue
+            items_stored += 1
+            try:
+                self.trend_detector.add_content_signal(item, priority.total_score)
+            except Exception as e:
+                logger.error(f"Error adding trend signal for {item.item_id}: {e}")
+        
+        logger.debug(f"{source_name}: stored {items_stored} of {len(pending)} queued items")
+        return items_stored
+    
     async def monitor_source(self, source_config: Dict) -> Dict[str, Any]:
         """Monitor a single source"""
         
@@ -195,8 +239,9 @@ class UniversalMonitor:
         # Register source with incremental updater if missing
         self.incremental_updater.register_source_if_missing(metadata)
         
-        # Monitor using RSS
-        monitor = RSSSourceMonitor(metadata)
+        # Monitor using RSS, conditionally on the validators of the last full fetch
+        validators = self.incremental_updater.get_http_validators(source_id)
+        monitor = RSSSourceMonitor(metadata, config=validators, http_client=self.http_client)
         result = await monitor.monitor()
         
         # Calculate response time
@@ -230,6 +275,7 @@ class UniversalMonitor:
             else:
                 filtered_items = []
             
+            pending = []
             for item in filtered_items:
                 try:
                     # Apply language filter
@@ -253,25 +299,13 @@ class UniversalMonitor:
                     
                     # Calculate priority using intelligent strategy
                     priority_result = self.prioritizer.prioritize(item, strategy="intelligent")
-                    
-                    # Store in database
-                    stored = await self.storage.store_content(
-                        item=item,
-                        priority_score=priority_result.total_score,
-                        priority_level=priority_result.priority_level.value
-                    )
-                    
-                    if stored:
-                        items_stored += 1
-                        
-                        # Add to trend detection engine
-                        try:
-                            self.trend_detector.add_content_signal(item, priority_result.total_score)
-                        except Exception as e:
-                            logger.error(f"Error adding trend signal for {item.item_id}: {e}")
+                    pending.append((item, priority_result))
                         
                 except Exception as e:
                     logger.error(f"Error storing item from {source_config['name']}: {e}")
+            
+            # Store the whole source in one transaction
+            items_stored = await self._store_items(pending, source_config['name'])
         
         # Update last fetch timestamp if monitoring was successful
         if result.success:
@@ -280,6 +314,14 @@ class UniversalMonitor:
                 logger.debug(f"Updated last fetch timestamp for {source_config['name']}")
             except Exception as e:
                 logger.error(f"Error updating last fetch timestamp for {source_config['name']}: {e}")
+            
+            # Keep the validators only once the items they cover are stored, so a
+            # failed write is refetched in full instead of answered with a 304
+            if not monitor.not_modified and (monitor.etag, monitor.last_modified) != (validators['etag'], validators['last_modified']):
+                try:
+                    self.incremental_updater.update_http_validators(source_id, monitor.etag, monitor.last_modified)
+                except Exception as e:
+                    logger.error(f"Error updating HTTP validators for {source_config['name']}: {e}")
         
         # Record health check results
         error_type = None
@@ -311,7 +353,8 @@ class UniversalMonitor:
                 error_type=error_type,
                 error_message=error_message,
                 items_found=len(result.new_items) if result.success else 0,
-                items_stored=items_stored
+                items_stored=items_stored,
+                not_modified=monitor.not_modified
             )
         except Exception as e:
             logger.error(f"Error recording health check for {source_config['name']}: {e}")
@@ -323,6 +366,7 @@ class UniversalMonitor:
             "items_found": len(result.new_items) if result.success else 0,
             "items_filtered": items_filtered_out,
             "items_stored": items_stored,
+            "not_modified": monitor.not_modified,
             "response_time_ms": response_time_ms,
             "error": None if result.success else (result.errors[0] if result.errors else "Unknown error")
         }
@@ -388,8 +432,8 @@ class UniversalMonitor:
                 }
             
             # Store items in database
-            items_stored = 0
             items_filtered_out = 0
+            pending = []
             for item in monitoring_result.new_items:
                 try:
                     # Apply language filter
@@ -425,27 +469,13 @@ class UniversalMonitor:
                     
                     # Calculate priority using intelligent strategy
                     priority_result = self.prioritizer.prioritize(item, strategy="intelligent")
-                    
-                    # Store item
-                    stored = await self.storage.store_content(
-                        item=item,
-                        priority_score=priority_result.total_score,
-                        priority_level=priority_result.priority_level.value
-                    )
-                    
-                    if stored:
-                        items_stored += 1
-                        logger.info(f"Stored MCP item: {item.title[:60]}... (Priority: {priority_result.priority_level.value})")
-                        
-                        # Add to trend detection engine
-                        try:
-                            self.trend_detector.add_content_signal(item, priority_result.total_score)
-                        except Exception as e:
-                            logger.error(f"Error adding MCP trend signal for {item.item_id}: {e}")
+                    pending.append((item, priority_result))
                     
                 except Exception as e:
                     logger.error(f"Error storing MCP item {item.item_id}: {e}")
             
+            items_stored = await self._store_items(pending, mcp_config['name'])
+            
             return {
                 "source": mcp_config['name'],
                 "url": f"MCP:{mcp_config['type']}",
@@ -482,6 +512,10 @@ class UniversalMonitor:
         cycle_items_stored = 0
         cycle_items_filtered = 0
         
+        # Storage writes go through the write-behind queue so sources never
+        # block the event loop on SQLite
+        await self.write_queue.start()
+        
         # Monitor all sources concurrently
         tasks = []
         
@@ -495,7 +529,17 @@ class UniversalMonitor:
             task = self.monitor_mcp_source(mcp_source)
             tasks.append(task)
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            # Flush what was queued even if the cycle is cancelled
+            await self.write_queue.stop()
+            
+            # Idle keep-alive connections would not survive until the next cycle
+            await self.http_client.close()
+        
+        # Keep near-duplicate signatures across restarts
+        self.noise_filter.save_near_duplicate_index()
         
         # Process results
         source_results = []
@@ -542,17 +586,29 @@ class UniversalMonitor:
             "items_found_this_cycle": cycle_items_found,
             "items_filtered_this_cycle": cycle_items_filtered,
             "items_stored_this_cycle": cycle_items_stored,
+            "sources_not_modified": sum(1 for r in source_results if r.get("not_modified")),
             "success_rate": f"{(self.stats['sources_successful'] / total_sources * 100):.1f}%",
             "filter_rate": f"{(cycle_items_filtered / max(1, cycle_items_found) * 100):.1f}%",
             "source_results": source_results,
             "cumulative_stats": self.stats.copy(),
-            "trend_analysis": trend_summary
+            "trend_analysis": trend_summary,
+            "write_queue": self.write_queue.get_metrics(),
+            "http_client": self.http_client.get_statistics()
         }
         
         logger.info(f"Cycle complete: {cycle_items_found} found, {cycle_items_filtered} filtered, {cycle_items_stored} stored")
         
         return cycle_summary
     
+    async def shutdown(self):
+        """Flush pending writes and release storage, HTTP and writer thread resources"""
+        await self.write_queue.stop()
+        self.write_queue.close()
+        await self.http_client.close()
+        self.noise_filter.save_near_duplicate_index()
+        self.storage.close()
+        logger.info("Monitor shut down")
+    
     async def start_scheduled_monitoring(self, interval_minutes: int = 60):
         """Start continuous monitoring with specified interval"""
         
@@ -826,7 +882,7 @@ def main():
         return
     
     # Run monitoring
-    async def run():
+    async def run_mode():
         if args.mode == "single":
             print("Running single monitoring cycle...")
             result = await monitor.run_monitoring_cycle()
@@ -904,6 +960,13 @@ def main():
             
             return
     
+    async def run():
+        try:
+            await run_mode()
+        finally:
+            # Ctrl+C cancels run_mode; queued writes still reach the database
+            await monitor.shutdown()
+    
     try:
         asyncio.run(run())
     except KeyboardInterrupt:
@@ -20,6 +20,7 @@ from core import (
     SourceType,
     SourceMonitorFactory
 )
+from core.http_client import HTTPClientManager
 from core.language_filter import LanguageFilter
 from core.relevance_filter import RelevanceFilter
 
@@ -29,15 +30,22 @@ class RSSSourceMonitor(UniversalSourceMonitor):
     Handles RSS/Atom feeds with resilient fetching and parsing
     """
     
-    def __init__(self, source_metadata: SourceMetadata, config: Optional[Dict] = None):
+    def __init__(self, source_metadata: SourceMetadata, config: Optional[Dict] = None,
+                 http_client: Optional[HTTPClientManager] = None):
         """Initialize RSS monitor with enhanced configuration"""
-        super().__init__(source_metadata, config)
+        super().__init__(source_metadata, config, http_client=http_client)
         
         # RSS-specific configuration
         self.timeout = config.get("timeout", 30) if config else 30
         self.max_items = config.get("max_items", 50) if config else 50
         self.user_agent = config.get("user_agent", self._default_user_agent()) if config else self._default_user_agent()
         
+        # Conditional GET validators from the previous full fetch
+        self.etag = config.get("etag") if config else None
+        self.last_modified = config.get("last_modified") if config else None
+        self.not_modified = False
+        self.metrics["not_modified"] = 0
+        
         # Language filtering configuration
         self.language_filter = LanguageFilter(
             target_languages=config.get("target_languages", ["en"]) if config else ["en"],
@@ -61,8 +69,11 @@ class RSSSourceMonitor(UniversalSourceMonitor):
         """
         Fetch RSS feed content with error handling and retries
         
+        Sends If-None-Match / If-Modified-Since when validators from a
+        previous fetch are known; a 304 response sets ``not_modified``.
+        
         Returns:
-            List of raw RSS entries
+            List of raw RSS entries (empty when the feed is not modified)
         """
         if not self.source_metadata.source_url:
             self.logger.error(f"No URL configured for source {self.source_metadata.source_id}")
@@ -73,41 +84,44 @@ class RSSSourceMonitor(UniversalSourceMonitor):
             'Accept': 'application/rss+xml, application/atom+xml, application/xml, text/xml, */*'
         }
         
+        # Conditional GET: the server answers 304 if nothing changed
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        self.not_modified = False
+        
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    self.source_metadata.source_url,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    
-                    if response.status != 200:
-                        self.logger.warning(
-                            f"RSS fetch returned status {response.status} for {self.source_metadata.source_name}"
-                        )
-                        return []
-                    
-                    content = await response.text()
-                    
-                    # Parse RSS/Atom feed
-                    feed = feedparser.parse(content)
-                    
-                    if feed.bozo:
-                        self.logger.warning(
-                            f"RSS feed parse warning for {self.source_metadata.source_name}: {feed.bozo_exception}"
-                        )
-                    
-                    # Extract entries
-                    entries = []
-                    for entry in feed.entries[:self.max_items]:
-                        entries.append(self._normalize_entry(entry, feed))
-                    
-                    self.logger.info(
-                        f"Fetched {len(entries)} entries from {self.source_metadata.source_name}"
-                    )
-                    
-                    return entries
-                    
+            if self.http_client is not None:
+                # Shared session: pooled keep-alive connections and cached DNS
+                session = await self.http_client.get_session()
+                content = await self._request_feed(session, headers)
+            else:
+                async with aiohttp.ClientSession() as session:
+                    content = await self._request_feed(session, headers)
+            
+            if content is None:
+                return []
+            
+            # Parse RSS/Atom feed
+            feed = feedparser.parse(content)
+            
+            if feed.bozo:
+                self.logger.warning(
+                    f"RSS feed parse warning for {self.source_metadata.source_name}: {feed.bozo_exception}"
+                )
+            
+            # Extract entries
+            entries = []
+            for entry in feed.entries[:self.max_items]:
+                entries.append(self._normalize_entry(entry, feed))
+            
+            self.logger.info(
+                f"Fetched {len(entries)} entries from {self.source_metadata.source_name}"
+            )
+            
+            return entries
+            
         except asyncio.TimeoutError:
             self.logger.error(f"Timeout fetching RSS feed: {self.source_metadata.source_name}")
             return []
@@ -115,6 +129,36 @@ class RSSSourceMonitor(UniversalSourceMonitor):
             self.logger.error(f"Error fetching RSS feed {self.source_metadata.source_name}: {str(e)}")
             return []
     
+    async def _request_feed(self, session: aiohttp.ClientSession, headers: Dict[str, str]) -> Optional[str]:
+        """
+        GET the feed body, or None when it is unchanged or unavailable
+        
+        The connection goes back to the pool before the body is parsed.
+        """
+        async with session.get(
+            self.source_metadata.source_url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        ) as response:
+            
+            # Unchanged since the last fetch: no body to download or parse
+            if response.status == 304:
+                self.not_modified = True
+                self.metrics["not_modified"] += 1
+                self.logger.info(f"RSS feed not modified: {self.source_metadata.source_name}")
+                return None
+            
+            if response.status != 200:
+                self.logger.warning(
+                    f"RSS fetch returned status {response.status} for {self.source_metadata.source_name}"
+                )
+                return None
+            
+            content = await response.text()
+            self.etag = response.headers.get('ETag')
+            self.last_modified = response.headers.get('Last-Modified')
+            return content
+    
     def _normalize_entry(self, entry: Any, feed: Any) -> Dict[str, Any]:
         """
         Normalize RSS/Atom entry to common format
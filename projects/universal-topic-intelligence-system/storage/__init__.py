@@ -3,5 +3,7 @@ Storage layer for Universal Topic Intelligence System
 """
 
 from .database import StorageManager
+from .connection_pool import SQLiteConnectionPool
+from .write_behind import WriteBehindQueue
 
-__all__ = ['StorageManager']
\ No newline at end of file
+__all__ = ['StorageManager', 'SQLiteConnectionPool', 'WriteBehindQueue']
\ No newline at end of file
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+SQLite Connection Pool for Universal Topic Intelligence System
+Keeps one long-lived writer connection plus a pool of reader connections
+so hot paths stop paying sqlite3.connect/close on every call
+"""
+
+import sqlite3
+import threading
+import queue
+import logging
+from typing import Dict, Any, Optional, List
+from contextlib import contextmanager
+
+
+# Pragmas applied to every pooled connection. WAL lets readers run alongside
+# the single writer; NORMAL sync is durable across application crashes in WAL.
+DEFAULT_PRAGMAS: Dict[str, Any] = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -64000,        # negative = KiB, i.e. ~64MB page cache
+    'mmap_size': 268435456,      # 256MB memory-mapped I/O
+    'temp_store': 'MEMORY',
+    'busy_timeout': 30000
+}
+
+
+class SQLiteConnectionPool:
+    """
+    Pool of persistent SQLite connections
+
+    Writes are serialized through a single writer connection guarded by a lock,
+    reads borrow one of ``read_pool_size`` reader connections. Connections are
+    opened with a large statement cache so repeated INSERT/SELECT statements
+    are prepared once per connection instead of once per call.
+    """
+
+    def __init__(self,
+                 db_path: str,
+                 read_pool_size: int = 4,
+                 pragmas: Optional[Dict[str, Any]] = None,
+                 cached_statements: int = 256,
+                 timeout: float = 30.0):
+        """
+        Initialize connection pool
+
+        Args:
+            db_path: Path to SQLite database file
+            read_pool_size: Number of reader connections to keep open
+            pragmas: Overrides for DEFAULT_PRAGMAS
+            cached_statements: Size of each connection's prepared statement cache
+            timeout: Seconds to wait for a database lock / free reader
+        """
+        self.db_path = db_path
+        self.read_pool_size = max(1, read_pool_size)
+        self.pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+        self.cached_statements = cached_statements
+        self.timeout = timeout
+        self.logger = logging.getLogger("SQLiteConnectionPool")
+
+        self._write_lock = threading.RLock()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._all_readers: List[sqlite3.Connection] = []
+        self._pool_lock = threading.RLock()  # Guards the reader list and stats
+        self._closed = False
+
+        self.stats = {
+            'connections_opened': 0,
+            'write_checkouts': 0,
+            'read_checkouts': 0,
+            'read_waits': 0,
+            'rollbacks': 0
+        }
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a connection and apply the configured pragmas"""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            check_same_thread=False,
+            cached_statements=self.cached_statements
+        )
+        conn.row_factory = sqlite3.Row
+
+        for name, value in self.pragmas.items():
+            try:
+                conn.execute(f"PRAGMA {name}={value}")
+            except sqlite3.Error as e:
+                self.logger.warning(f"Could not apply PRAGMA {name}={value}: {e}")
+
+        self._record('connections_opened')
+        return conn
+
+    def _record(self, stat: str):
+        """Increment a usage counter; checkouts happen on many threads at once"""
+        with self._pool_lock:
+            self.stats[stat] += 1
+
+    @contextmanager
+    def writer(self):
+        """
+        Borrow the shared writer connection
+
+        Any transaction still open when the block exits (early return or
+        exception) is rolled back so the next caller starts clean.
+        """
+        if self._closed:
+            raise sqlite3.ProgrammingError("Connection pool is closed")
+
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._open_connection()
+            conn = self._writer
+            self._record('write_checkouts')
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    conn.rollback()
+                    self._record('rollbacks')
+
+    @contextmanager
+    def reader(self):
+        """Borrow a reader connection, opening one lazily up to the pool size"""
+        if self._closed:
+            raise sqlite3.ProgrammingError("Connection pool is closed")
+
+        conn = None
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                if len(self._all_readers) < self.read_pool_size:
+                    conn = self._open_connection()
+                    self._all_readers.append(conn)
+
+        if conn is None:
+            self._record('read_waits')
+            try:
+                conn = self._readers.get(timeout=self.timeout)
+            except queue.Empty:
+                raise sqlite3.OperationalError("Timed out waiting for a reader connection")
+
+        self._record('read_checkouts')
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            if self._closed:
+                conn.close()
+            else:
+                self._readers.put(conn)
+
+    def close(self):
+        """Close every pooled connection"""
+        self._closed = True
+
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+        with self._pool_lock:
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+            self._all_readers.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool usage statistics"""
+        with self._pool_lock:
+            return {
+                **self.stats,
+                'read_pool_size': self.read_pool_size,
+                'readers_open': len(self._all_readers),
+                'readers_idle': self._readers.qsize(),
+                'writer_open': self._writer is not None
+            }
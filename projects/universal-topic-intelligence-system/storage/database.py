@@ -13,25 +13,80 @@ import logging
 from contextlib import contextmanager
 
 from core import ContentItem, SourceMetadata, SourceType
+from .connection_pool import SQLiteConnectionPool
+
+
+# MCP column -> metadata key it is populated from. github_language is only
+# filled for github_repository items; 'language' otherwise means transcript language.
+MCP_FIELD_SOURCES = (
+    ('mcp_source_type', 'source_type'),
+    # YouTube fields
+    ('youtube_video_id', 'video_id'),
+    ('youtube_channel', 'channel'),
+    ('youtube_duration', 'duration'),
+    ('youtube_view_count', 'view_count'),
+    ('youtube_like_count', 'like_count'),
+    ('youtube_language', 'language'),
+    # GitHub fields
+    ('github_repo_name', 'repo_name'),
+    ('github_stars', 'stars'),
+    ('github_forks', 'forks'),
+    ('github_language', 'language'),
+    ('github_license', 'license'),
+    ('github_open_issues', 'open_issues'),
+    # Search fields
+    ('search_query', 'search_query'),
+    ('search_rank', 'search_rank'),
+    ('search_engine', 'search_engine'),
+    ('search_relevance_score', 'relevance_score'),
+    # Web content fields
+    ('web_domain', 'domain'),
+    ('web_content_type', 'content_type'),
+    ('web_content_length', 'content_length'),
+)
+
+MCP_COLUMNS = tuple(column for column, _ in MCP_FIELD_SOURCES)
+_EMPTY_MCP_VALUES = (None,) * len(MCP_COLUMNS)
+
+CONTENT_ITEM_COLUMNS = (
+    'item_id', 'source_id', 'title', 'content', 'url', 'published_date', 'author', 'topics',
+    'priority_score', 'priority_level',
+    *MCP_COLUMNS,
+    'metadata'
+)
+
+INSERT_CONTENT_ITEM_SQL = f"""
+    INSERT INTO content_items ({', '.join(CONTENT_ITEM_COLUMNS)})
+    VALUES ({', '.join('?' * len(CONTENT_ITEM_COLUMNS))})
+    ON CONFLICT(item_id) DO NOTHING
+"""
 
 
 class StorageManager:
     """Manages persistent storage for the intelligence system"""
     
-    def __init__(self, db_path: str = "topic_intelligence.db"):
+    def __init__(self, db_path: str = "topic_intelligence.db", pooled: bool = False,
+                 read_pool_size: int = 4, pragmas: Optional[Dict[str, Any]] = None):
         """
         Initialize storage manager
         
         Args:
             db_path: Path to SQLite database file
+            pooled: Share persistent WAL-mode connections across all calls
+                    instead of opening a connection per call
+            read_pool_size: Number of reader connections when pooled
+            pragmas: PRAGMA overrides for pooled connections
         """
         self.db_path = db_path
         self.logger = logging.getLogger("StorageManager")
+        self.pool = SQLiteConnectionPool(
+            db_path, read_pool_size=read_pool_size, pragmas=pragmas
+        ) if pooled else None
         self._initialize_database()
     
     def _initialize_database(self):
         """Create database tables if they don't exist"""
-        with self._get_connection() as conn:
+        with self._get_write_connection() as conn:
             cursor = conn.cursor()
             
             # Sources table
@@ -168,7 +223,12 @@ class StorageManager:
     
     @contextmanager
     def _get_connection(self):
-        """Get database connection with proper cleanup"""
+        """Get database connection for reads with proper cleanup"""
+        if self.pool:
+            with self.pool.reader() as conn:
+                yield conn
+            return
+        
         conn = sqlite3.connect(self.db_path, timeout=30)
         conn.row_factory = sqlite3.Row
         try:
@@ -176,6 +236,26 @@ class StorageManager:
         finally:
             conn.close()
     
+    @contextmanager
+    def _get_write_connection(self):
+        """Get database connection for writes (the shared writer when pooled)"""
+        if self.pool:
+            with self.pool.writer() as conn:
+                yield conn
+            return
+        
+        with self._get_connection() as conn:
+            yield conn
+    
+    def close(self):
+        """Close pooled connections (no-op in per-call connection mode)"""
+        if self.pool:
+            self.pool.close()
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool statistics (empty when not pooled)"""
+        return self.pool.get_stats() if self.pool else {}
+    
     def _create_mcp_indexes_if_possible(self, cursor):
         """
         Create MCP-specific indexes only if the columns exist
@@ -219,56 +299,19 @@ class StorageManager:
             True if saved successfully
         """
         try:
-            with self._get_connection() as conn:
+            with self._get_write_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Check if item already exists
-                cursor.execute(
-                    "SELECT item_id FROM content_items WHERE item_id = ?",
-                    (item.item_id,)
-                )
+                # Existing items are skipped by the conflict clause
+                cursor.execute(INSERT_CONTENT_ITEM_SQL,
+                               self._content_item_row(item, priority_score, priority_level))
+                conn.commit()
                 
-                if cursor.fetchone():
+                if cursor.rowcount == 0:
                     self.logger.debug(f"Item {item.item_id} already exists, skipping")
                     return False
                 
-                # Extract MCP-specific fields from metadata
-                mcp_fields = self._extract_mcp_fields(item.metadata)
-                
-                # Insert new item with MCP fields
-                cursor.execute("""
-                    INSERT INTO content_items (
-                        item_id, source_id, title, content, url, published_date, author, topics, 
-                        priority_score, priority_level, 
-                        mcp_source_type,
-                        youtube_video_id, youtube_channel, youtube_duration, youtube_view_count, 
-                        youtube_like_count, youtube_language,
-                        github_repo_name, github_stars, github_forks, github_language, 
-                        github_license, github_open_issues,
-                        search_query, search_rank, search_engine, search_relevance_score,
-                        web_domain, web_content_type, web_content_length,
-                        metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    item.item_id, item.source_id, item.title, item.content, item.url,
-                    item.published_date.isoformat() if item.published_date else None,
-                    item.author, json.dumps(item.topics), priority_score, priority_level,
-                    mcp_fields['mcp_source_type'],
-                    mcp_fields['youtube_video_id'], mcp_fields['youtube_channel'], 
-                    mcp_fields['youtube_duration'], mcp_fields['youtube_view_count'], 
-                    mcp_fields['youtube_like_count'], mcp_fields['youtube_language'],
-                    mcp_fields['github_repo_name'], mcp_fields['github_stars'], 
-                    mcp_fields['github_forks'], mcp_fields['github_language'], 
-                    mcp_fields['github_license'], mcp_fields['github_open_issues'],
-                    mcp_fields['search_query'], mcp_fields['search_rank'], 
-                    mcp_fields['search_engine'], mcp_fields['search_relevance_score'],
-                    mcp_fields['web_domain'], mcp_fields['web_content_type'], 
-                    mcp_fields['web_content_length'],
-                    json.dumps(item.metadata)
-                ))
-                
-                conn.commit()
-                self.logger.debug(f"Saved item: {item.title[:50]}... (MCP type: {mcp_fields['mcp_source_type']})")
+                self.logger.debug(f"Saved item: {item.title[:50]}... (MCP type: {(item.metadata or {}).get('source_type')})")
                 return True
                 
         except Exception as e:
@@ -300,62 +343,108 @@ class StorageManager:
         Returns:
             Number of items saved
         """
-        saved_count = 0
+        return self.save_content_items_bulk(items)['inserted']
+    
+    def save_content_items_bulk(self, items: List[tuple],
+                                return_inserted_ids: bool = False,
+                                raise_errors: bool = False) -> Dict[str, Any]:
+        """
+        Insert many content items in a single transaction
+        
+        Rows are generated lazily and written with one executemany over
+        ``INSERT ... ON CONFLICT(item_id) DO NOTHING``, so existing items are
+        skipped by SQLite rather than by a per-item SELECT.
+        
+        Args:
+            items: List of (ContentItem, priority_score, priority_level) tuples
+            return_inserted_ids: Also report which item IDs were newly inserted
+                                 (costs one chunked existence query per batch)
+            raise_errors: Re-raise a failed transaction instead of reporting
+                          zero counts, so callers can tell failure from "nothing new"
+            
+        Returns:
+            Dictionary with 'inserted' and 'skipped' counts, plus
+            'inserted_ids' when requested
+        """
+        result = {'inserted': 0, 'skipped': 0}
+        if return_inserted_ids:
+            result['inserted_ids'] = []
+        
+        if not items:
+            return result
         
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                for item, score, level in items:
-                    # Check if exists
-                    cursor.execute(
-                        "SELECT item_id FROM content_items WHERE item_id = ?",
-                        (item.item_id,)
-                    )
-                    
-                    if not cursor.fetchone():
-                        # Extract MCP-specific fields
-                        mcp_fields = self._extract_mcp_fields(item.metadata)
-                        
-                        cursor.execute("""
-                            INSERT INTO content_items (
-                                item_id, source_id, title, content, url, published_date, author, topics,
-                                priority_score, priority_level,
-                                mcp_source_type,
-                                youtube_video_id, youtube_channel, youtube_duration, youtube_view_count,
-                                youtube_like_count, youtube_language,
-                                github_repo_name, github_stars, github_forks, github_language,
-                                github_license, github_open_issues,
-                                search_query, search_rank, search_engine, search_relevance_score,
-                                web_domain, web_content_type, web_content_length,
-                                metadata
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            item.item_id, item.source_id, item.title, item.content, item.url,
-                            item.published_date.isoformat() if item.published_date else None,
-                            item.author, json.dumps(item.topics), score, level,
-                            mcp_fields['mcp_source_type'],
-                            mcp_fields['youtube_video_id'], mcp_fields['youtube_channel'],
-                            mcp_fields['youtube_duration'], mcp_fields['youtube_view_count'],
-                            mcp_fields['youtube_like_count'], mcp_fields['youtube_language'],
-                            mcp_fields['github_repo_name'], mcp_fields['github_stars'],
-                            mcp_fields['github_forks'], mcp_fields['github_language'],
-                            mcp_fields['github_license'], mcp_fields['github_open_issues'],
-                            mcp_fields['search_query'], mcp_fields['search_rank'],
-                            mcp_fields['search_engine'], mcp_fields['search_relevance_score'],
-                            mcp_fields['web_domain'], mcp_fields['web_content_type'],
-                            mcp_fields['web_content_length'],
-                            json.dumps(item.metadata)
-                        ))
-                        saved_count += 1
-                
+            with self._get_write_connection() as conn:
+                if return_inserted_ids:
+                    existing = self._existing_item_ids(conn, [item.item_id for item, _, _ in items])
+                    seen = set(existing)
+                    for item, _, _ in items:
+                        if item.item_id not in seen:
+                            seen.add(item.item_id)
+                            result['inserted_ids'].append(item.item_id)
+                
+                changes_before = conn.total_changes
+                conn.executemany(
+                    INSERT_CONTENT_ITEM_SQL,
+                    (self._content_item_row(item, score, level) for item, score, level in items)
+                )
                 conn.commit()
-                self.logger.info(f"Saved {saved_count} new items to database")
+                
+                result['inserted'] = conn.total_changes - changes_before
+                result['skipped'] = len(items) - result['inserted']
+                self.logger.info(f"Saved {result['inserted']} new items to database "
+                                 f"({result['skipped']} already present)")
                 
         except Exception as e:
             self.logger.error(f"Error in batch save: {str(e)}")
+            if raise_errors:
+                raise
+            result['inserted'] = 0
+            result['skipped'] = 0
+            if return_inserted_ids:
+                result['inserted_ids'] = []
+        
+        return result
+    
+    @staticmethod
+    def _existing_item_ids(conn: sqlite3.Connection, item_ids: List[str]) -> set:
+        """Look up which of the given item IDs are already stored"""
+        existing = set()
+        # Stay well below SQLite's host parameter limit
+        for start in range(0, len(item_ids), 900):
+            chunk = item_ids[start:start + 900]
+            placeholders = ','.join('?' * len(chunk))
+            rows = conn.execute(
+                f"SELECT item_id FROM content_items WHERE item_id IN ({placeholders})", chunk
+            )
+            existing.update(row[0] for row in rows)
+        return existing
+    
+    @staticmethod
+    def _content_item_row(item: ContentItem, priority_score: float,
+                          priority_level: str) -> tuple:
+        """Build the INSERT parameter tuple for a content item"""
+        metadata = item.metadata or {}
+        return (
+            item.item_id, item.source_id, item.title, item.content, item.url,
+            item.published_date.isoformat() if item.published_date else None,
+            item.author, json.dumps(item.topics), priority_score, priority_level,
+            *StorageManager._mcp_values(metadata),
+            json.dumps(metadata)
+        )
+    
+    @staticmethod
+    def _mcp_values(metadata: Dict[str, Any]) -> tuple:
+        """MCP column values from metadata, in MCP_FIELD_SOURCES order"""
+        if not metadata:
+            return _EMPTY_MCP_VALUES
         
-        return saved_count
+        get = metadata.get
+        is_github = get('source_type') == 'github_repository'
+        return tuple(
+            (get(key) if is_github else None) if column == 'github_language' else get(key)
+            for column, key in MCP_FIELD_SOURCES
+        )
     
     def _extract_mcp_fields(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -367,87 +456,7 @@ class StorageManager:
         Returns:
             Dictionary with extracted MCP fields
         """
-        # Initialize all fields with None
-        mcp_fields = {
-            'mcp_source_type': None,
-            # YouTube fields
-            'youtube_video_id': None,
-            'youtube_channel': None,
-            'youtube_duration': None,
-            'youtube_view_count': None,
-            'youtube_like_count': None,
-            'youtube_language': None,
-            # GitHub fields
-            'github_repo_name': None,
-            'github_stars': None,
-            'github_forks': None,
-            'github_language': None,
-            'github_license': None,
-            'github_open_issues': None,
-            # Search fields
-            'search_query': None,
-            'search_rank': None,
-            'search_engine': None,
-            'search_relevance_score': None,
-            # Web content fields
-            'web_domain': None,
-            'web_content_type': None,
-            'web_content_length': None
-        }
-        
-        if not metadata:
-            return mcp_fields
-        
-        # Extract source type
-        mcp_fields['mcp_source_type'] = metadata.get('source_type')
-        
-        # Extract YouTube fields
-        if 'video_id' in metadata:
-            mcp_fields['youtube_video_id'] = metadata.get('video_id')
-        if 'channel' in metadata:
-            mcp_fields['youtube_channel'] = metadata.get('channel')
-        if 'duration' in metadata:
-            mcp_fields['youtube_duration'] = metadata.get('duration')
-        if 'view_count' in metadata:
-            mcp_fields['youtube_view_count'] = metadata.get('view_count')
-        if 'like_count' in metadata:
-            mcp_fields['youtube_like_count'] = metadata.get('like_count')
-        if 'language' in metadata:
-            mcp_fields['youtube_language'] = metadata.get('language')
-        
-        # Extract GitHub fields
-        if 'repo_name' in metadata:
-            mcp_fields['github_repo_name'] = metadata.get('repo_name')
-        if 'stars' in metadata:
-            mcp_fields['github_stars'] = metadata.get('stars')
-        if 'forks' in metadata:
-            mcp_fields['github_forks'] = metadata.get('forks')
-        if 'language' in metadata and mcp_fields['mcp_source_type'] == 'github_repository':
-            mcp_fields['github_language'] = metadata.get('language')
-        if 'license' in metadata:
-            mcp_fields['github_license'] = metadata.get('license')
-        if 'open_issues' in metadata:
-            mcp_fields['github_open_issues'] = metadata.get('open_issues')
-        
-        # Extract search fields
-        if 'search_query' in metadata:
-            mcp_fields['search_query'] = metadata.get('search_query')
-        if 'search_rank' in metadata:
-            mcp_fields['search_rank'] = metadata.get('search_rank')
-        if 'search_engine' in metadata:
-            mcp_fields['search_engine'] = metadata.get('search_engine')
-        if 'relevance_score' in metadata:
-            mcp_fields['search_relevance_score'] = metadata.get('relevance_score')
-        
-        # Extract web content fields
-        if 'domain' in metadata:
-            mcp_fields['web_domain'] = metadata.get('domain')
-        if 'content_type' in metadata:
-            mcp_fields['web_content_type'] = metadata.get('content_type')
-        if 'content_length' in metadata:
-            mcp_fields['web_content_length'] = metadata.get('content_length')
-        
-        return mcp_fields
+        return dict(zip(MCP_COLUMNS, self._mcp_values(metadata)))
     
     def get_recent_items(self, 
                         topic: Optional[str] = None,
@@ -534,7 +543,7 @@ class StorageManager:
             error_increment: Increment error count by this amount
         """
         try:
-            with self._get_connection() as conn:
+            with self._get_write_connection() as conn:
                 cursor = conn.cursor()
                 
                 # Update or insert topic stats
@@ -573,7 +582,7 @@ class StorageManager:
             **kwargs: Additional metadata
         """
         try:
-            with self._get_connection() as conn:
+            with self._get_write_connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -840,7 +849,7 @@ class StorageManager:
             True if migration successful
         """
         try:
-            with self._get_connection() as conn:
+            with self._get_write_connection() as conn:
                 cursor = conn.cursor()
                 
                 # Check if migration is needed
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Write-Behind Ingestion Queue for Universal Topic Intelligence System
+Decouples source monitors from SQLite: items are queued on the event loop
+and flushed in batches by a dedicated writer thread
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+from core import ContentItem
+from .database import StorageManager
+
+
+class WriteBehindQueue:
+    """
+    Batches ContentItems from all sources into bulk writes
+
+    ``submit`` returns a future that resolves to True once the item's batch
+    has been committed and the item was newly inserted (False if it already
+    existed); if the batch's transaction fails the future raises the error.
+    A batch is flushed when ``batch_size`` items
+    are waiting or ``flush_interval`` seconds have passed since the first one
+    arrived. When ``max_queue_size`` items are waiting, producers block in
+    ``submit`` until the writer catches up.
+    """
+
+    def __init__(self,
+                 storage: StorageManager,
+                 batch_size: int = 500,
+                 flush_interval: float = 1.0,
+                 max_queue_size: int = 10000):
+        """
+        Initialize write-behind queue
+
+        Args:
+            storage: StorageManager that performs the bulk writes
+            batch_size: Maximum items per flush
+            flush_interval: Maximum seconds an item waits before a flush
+            max_queue_size: Queue depth at which producers are blocked
+        """
+        self.storage = storage
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.logger = logging.getLogger("WriteBehindQueue")
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="storage-writer")
+        self._queue: Optional[asyncio.Queue] = None
+        self._pump_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.metrics = {
+            'items_submitted': 0,
+            'items_flushed': 0,
+            'items_inserted': 0,
+            'batches_flushed': 0,
+            'flush_errors': 0,
+            'backpressure_waits': 0,
+            'max_queue_depth': 0,
+            'last_flush_ms': 0.0,
+            'max_flush_ms': 0.0,
+            'total_flush_ms': 0.0
+        }
+
+    @property
+    def running(self) -> bool:
+        """Whether the flush pump is active"""
+        return self._pump_task is not None and not self._pump_task.done()
+
+    async def start(self):
+        """Start the flush pump on the running event loop"""
+        if self.running:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._pump_task = asyncio.create_task(self._pump())
+        self.logger.debug("Write-behind queue started")
+
+    async def stop(self):
+        """Flush everything still queued and stop the pump"""
+        if not self.running:
+            return
+
+        await self._queue.put(None)  # sentinel: drain then exit
+        await self._pump_task
+        self._pump_task = None
+        self.logger.debug("Write-behind queue stopped")
+
+    def close(self):
+        """Shut down the writer thread (call after stop)"""
+        self._executor.shutdown(wait=True)
+
+    async def submit(self, item: ContentItem, priority_score: float = 0.5,
+                     priority_level: str = "medium") -> asyncio.Future:
+        """
+        Queue an item for storage
+
+        Args:
+            item: ContentItem to save
+            priority_score: Priority score from prioritizer
+            priority_level: Priority level (critical/high/medium/low)
+
+        Returns:
+            Future resolving to True if the item was newly stored, or raising
+            the storage error if its batch could not be written
+        """
+        if not self.running:
+            await self.start()
+
+        future = self._loop.create_future()
+        entry = (item, priority_score, priority_level, future)
+
+        if self._queue.full():
+            self.metrics['backpressure_waits'] += 1
+        await self._queue.put(entry)
+
+        self.metrics['items_submitted'] += 1
+        depth = self._queue.qsize()
+        if depth > self.metrics['max_queue_depth']:
+            self.metrics['max_queue_depth'] = depth
+
+        return future
+
+    async def submit_many(self, entries: List[Tuple[ContentItem, float, str]]) -> List[asyncio.Future]:
+        """
+        Queue several (item, priority_score, priority_level) tuples
+
+        Returns:
+            One future per entry, in order
+        """
+        return [await self.submit(item, score, level) for item, score, level in entries]
+
+    async def _pump(self):
+        """Collect queued entries into batches and hand them to the writer thread"""
+        stopping = False
+
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                break
+
+            batch = [first]
+            deadline = self._loop.time() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                timeout = deadline - self._loop.time()
+                try:
+                    if timeout > 0:
+                        entry = await asyncio.wait_for(self._queue.get(), timeout)
+                    else:
+                        entry = self._queue.get_nowait()
+                except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                    break
+
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[tuple]):
+        """Write one batch on the writer thread and resolve its futures"""
+        rows = [(item, score, level) for item, score, level, _ in batch]
+        start = time.perf_counter()
+
+        error = None
+
+        try:
+            result = await self._loop.run_in_executor(
+                self._executor,
+                lambda: self.storage.save_content_items_bulk(
+                    rows, return_inserted_ids=True, raise_errors=True
+                )
+            )
+            inserted_ids = set(result['inserted_ids'])
+        except Exception as e:
+            self.logger.error(f"Write-behind flush of {len(batch)} items failed: {e}")
+            self.metrics['flush_errors'] += 1
+            error = e
+            inserted_ids = set()
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.metrics['batches_flushed'] += 1
+        self.metrics['items_flushed'] += len(batch)
+        self.metrics['items_inserted'] += len(inserted_ids)
+        self.metrics['last_flush_ms'] = elapsed_ms
+        self.metrics['total_flush_ms'] += elapsed_ms
+        self.metrics['max_flush_ms'] = max(self.metrics['max_flush_ms'], elapsed_ms)
+
+        for item, _, _, future in batch:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(item.item_id in inserted_ids)
+                # Report each ID once even if it was queued twice
+                inserted_ids.discard(item.item_id)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get queue depth and flush latency metrics"""
+        batches = self.metrics['batches_flushed']
+        return {
+            **self.metrics,
+            'queue_depth': self._queue.qsize() if self._queue else 0,
+            'avg_flush_ms': self.metrics['total_flush_ms'] / batches if batches else 0.0,
+            'avg_batch_size': self.metrics['items_flushed'] / batches if batches else 0.0
+        }
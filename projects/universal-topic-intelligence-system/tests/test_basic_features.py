@@ -72,6 +72,41 @@ async def test_database_storage_works(temp_db):
         count = cursor.fetchone()[0]
         assert count == 1
 
+def test_bulk_save_reports_inserted_and_skipped(storage_manager):
+    """Bulk ingestion skips existing items in a single statement"""
+    items = [
+        (ContentItem(
+            item_id=f"bulk_{i}",
+            source_id="test_source",
+            title=f"Bulk Article {i}",
+            content="Bulk content",
+            url=f"https://example.com/bulk/{i}",
+            published_date=datetime.now(),
+            author="Test Author",
+            topics=["test"],
+            metadata={"source_type": "github_repository", "stars": i, "language": "Python"}
+        ), 0.5, "medium")
+        for i in range(5)
+    ]
+
+    first = storage_manager.save_content_items_bulk(items[:3])
+    assert first == {'inserted': 3, 'skipped': 0}
+
+    second = storage_manager.save_content_items_bulk(items, return_inserted_ids=True)
+    assert second['inserted'] == 2
+    assert second['skipped'] == 3
+    assert second['inserted_ids'] == ["bulk_3", "bulk_4"]
+
+    # Legacy batch API still returns the inserted count
+    assert storage_manager.save_content_items_batch(items) == 0
+
+    with sqlite3.connect(storage_manager.db_path) as conn:
+        row = conn.execute(
+            "SELECT github_stars, github_language FROM content_items WHERE item_id = ?",
+            ("bulk_4",)
+        ).fetchone()
+    assert row == (4, "Python")
+
 def test_prioritizer_works():
     """Test that content prioritizer assigns scores"""
     prioritizer = UniversalContentPrioritizer()
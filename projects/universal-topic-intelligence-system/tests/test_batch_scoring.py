@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for vectorized batch scoring in the content prioritizer
+"""
+
+import pytest
+import random
+from dataclasses import astuple
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import UniversalContentPrioritizer, ContentItem
+
+CHANNELS = ["React", "Fireship", "Google Developers", "Random Dev", ""]
+LANGUAGES = ["TypeScript", "Ruby", "Elixir", ""]
+LICENSES = ["MIT", "apache-2.0", "Proprietary", ""]
+DOMAINS = ["react.dev", "docs.python.org", "example.org", "dev.to", "blog.example.com", ""]
+TEXTS = [
+    "",
+    "Short note",
+    "A step by step tutorial: learn how to build an API with const hooks and useState. ## Usage\n- example",
+    "Performance optimization of the database backend architecture. import os\ndef main():\n    return 1 " * 20,
+    "Getting started guide with installation and usage examples for the framework library component. " * 30,
+]
+
+
+def make_item(index: int, rng: random.Random) -> ContentItem:
+    """Random item of a random source type"""
+    kind = index % 5
+    published = None
+    if rng.random() > 0.1:
+        published = datetime.now() - timedelta(hours=rng.choice([0.5, 12, 30, 200, 1000, 5000]))
+        if rng.random() > 0.5:
+            published = published.astimezone(timezone.utc)
+
+    if kind == 0:
+        metadata = {
+            "mcp_source_type": "youtube_transcript",
+            "youtube_view_count": rng.choice([0, 50, 4000, 120000, 2000000]),
+            "youtube_like_count": rng.choice([0, 10, 300, 9000]),
+            "youtube_channel": rng.choice(CHANNELS),
+            "youtube_duration": rng.choice(["", "PT45S", "PT4M10S", "PT25M30S", "PT45M", "PT1H30M"]),
+            "youtube_language": rng.choice(["en", "de"])
+        }
+    elif kind == 1:
+        metadata = {
+            "mcp_source_type": "github_repository",
+            "github_stars": rng.choice([0, 5, 150, 4000, 50000]),
+            "github_forks": rng.choice([0, 3, 40, 900]),
+            "github_open_issues": rng.choice([0, 2, 80, 500]),
+            "github_language": rng.choice(LANGUAGES),
+            "github_license": rng.choice(LICENSES),
+            "github_repo_name": rng.choice(["vercel/next.js", "acme/util-lib", "me/app"])
+        }
+    elif kind == 2:
+        metadata = {
+            "mcp_source_type": "web_search",
+            "search_query": rng.choice(["", "react hooks tutorial", "python api"]),
+            "search_rank": rng.choice([0, 1, 5, 15, 40]),
+            "search_relevance_score": rng.choice([0.0, 0.4, 0.95]),
+            "search_domain": rng.choice(DOMAINS)
+        }
+    elif kind == 3:
+        metadata = {"engagement_score": rng.choice([0.1, 0.9, "n/a"]), "social_signals": 0.4}
+    else:
+        metadata = {"mcp_source_type": "unknown_source"}
+
+    return ContentItem(
+        item_id=f"item_{index}",
+        source_id=f"source_{index % 7}",
+        title=rng.choice(["How to Build a React App", "shocking news", "Understanding closures in JavaScript", ""]),
+        content=rng.choice(TEXTS),
+        url=f"https://example.com/{index}",
+        published_date=published,
+        author="Test Author",
+        topics=rng.sample(["react", "ai", "python", "rust", "nextjs"], rng.randrange(0, 4)),
+        metadata=metadata
+    )
+
+
+@pytest.fixture
+def items():
+    rng = random.Random(5)
+    return [make_item(i, rng) for i in range(400)]
+
+
+@pytest.mark.parametrize("strategy", ["intelligent", "default", "technical"])
+def test_batch_matches_per_item(items, strategy):
+    """Vectorized batch results equal per-item prioritize() results"""
+    if strategy != "intelligent":
+        # Simple strategies pass metadata through unchecked
+        items = [item for item in items if item.metadata.get("engagement_score") != "n/a"]
+
+    batch_prioritizer = UniversalContentPrioritizer()
+    single_prioritizer = UniversalContentPrioritizer()
+    for prioritizer in (batch_prioritizer, single_prioritizer):
+        prioritizer.set_topic_preferences({"react": 0.9, "rust": 0.2})
+
+    batch = {r.content_item.item_id: r for r in batch_prioritizer.prioritize_batch(items, strategy=strategy)}
+
+    for item in items:
+        expected = single_prioritizer.prioritize(item, strategy=strategy)
+        result = batch[item.item_id]
+        # Tolerance covers the continuous recency decay between the two calls
+        assert astuple(result.factors) == pytest.approx(astuple(expected.factors), abs=1e-6)
+        assert result.total_score == pytest.approx(expected.total_score, abs=1e-6)
+        assert result.priority_level == expected.priority_level
+        assert result.reasoning == expected.reasoning
+        assert result.recommendations == expected.recommendations
+
+
+def test_non_numeric_metadata_uses_per_item_path(items):
+    """Items with non-numeric counts fall back to calculate_factors"""
+    odd = ContentItem(
+        item_id="odd", source_id="s", title="Odd", content="text", url="https://example.com/odd",
+        published_date=None, author="A", topics=[],
+        metadata={"mcp_source_type": "web_search", "search_rank": 3, "search_relevance_score": None}
+    )
+    prioritizer = UniversalContentPrioritizer()
+    with pytest.raises(TypeError):
+        # Same failure as the per-item path (max() over None and floats)
+        prioritizer.prioritize_batch(items[:10] + [odd], strategy="intelligent")
+
+
+def test_rescore_after_weight_change(items):
+    """use_cache=False recomputes totals with the new weights"""
+    prioritizer = UniversalContentPrioritizer()
+    before = {r.content_item.item_id: r.total_score for r in prioritizer.prioritize_batch(items, "intelligent")}
+
+    for name in prioritizer.config["weights"]:
+        prioritizer.config["weights"][name] = 0.0
+    prioritizer.config["weights"]["content_recency"] = 1.0
+
+    cached = prioritizer.prioritize_batch(items, "intelligent")
+    assert {r.content_item.item_id: r.total_score for r in cached} == before
+
+    rescored = prioritizer.prioritize_batch(items, "intelligent", use_cache=False)
+    assert all(r.total_score == r.factors.content_recency for r in rescored)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Tests for conditional GET (ETag / Last-Modified) feed polling
+"""
+
+import pytest
+from aiohttp import web
+from pathlib import Path
+import sys
+import hashlib
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import SourceMetadata, SourceType
+from core.http_client import HTTPClientManager
+from core.incremental_updater import IncrementalUpdateManager
+from core.source_health_monitor import SourceHealthMonitor
+from core.language_filter import LanguageFilter
+from core.content_prioritizer import UniversalContentPrioritizer
+from core.noise_reduction_engine import NoiseReductionEngine
+from core.trend_detection_engine import TrendDetectionEngine
+from sources import rss_monitor
+from sources.rss_monitor import RSSSourceMonitor
+from storage.database import StorageManager
+from monitor import UniversalMonitor
+
+FEED = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test Feed</title>
+<item><title>React Server Components</title><link>https://example.com/a</link>
+<guid>a</guid><description>Building React apps with server components</description></item>
+</channel></rss>"""
+ETAG = '"feed-v1"'
+LAST_MODIFIED = "Wed, 01 May 2024 12:00:00 GMT"
+
+
+@pytest.fixture
+async def feed_url():
+    """Local RSS server honouring If-None-Match"""
+    async def handler(request):
+        if request.headers.get("If-None-Match") == ETAG:
+            return web.Response(status=304)
+        return web.Response(
+            text=FEED,
+            content_type="application/rss+xml",
+            headers={"ETag": ETAG, "Last-Modified": LAST_MODIFIED}
+        )
+
+    app = web.Application()
+    app.router.add_get("/rss.xml", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/rss.xml"
+    await runner.cleanup()
+
+
+@pytest.fixture
+def db_path():
+    """Temp database with the storage schema"""
+    path = str(Path(tempfile.mkdtemp()) / "conditional.db")
+    StorageManager(db_path=path).close()
+    return path
+
+
+def make_metadata(url: str) -> SourceMetadata:
+    return SourceMetadata(
+        source_id="feed_1",
+        source_name="Feed 1",
+        source_type=SourceType.RSS,
+        source_url=url,
+        authority_score=0.9,
+        update_frequency="hourly",
+        topics=["react"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_not_modified_feed_skips_parse(feed_url, monkeypatch):
+    """A 304 response returns no entries without parsing the feed"""
+    parses = []
+    original_parse = rss_monitor.feedparser.parse
+    monkeypatch.setattr(rss_monitor.feedparser, "parse", lambda body: parses.append(body) or original_parse(body))
+
+    client = HTTPClientManager()
+    config = {"enable_language_filtering": False, "enable_relevance_filtering": False}
+    monitor = RSSSourceMonitor(make_metadata(feed_url), config, http_client=client)
+
+    assert len(await monitor.fetch_content()) == 1
+    assert (monitor.etag, monitor.last_modified) == (ETAG, LAST_MODIFIED)
+    assert not monitor.not_modified
+
+    result = await monitor.monitor()
+    await client.close()
+
+    assert result.success and result.new_items == []
+    assert monitor.not_modified
+    assert monitor.metrics["not_modified"] == 1
+    assert len(parses) == 1
+
+
+def test_validators_persist_per_source(db_path):
+    """ETag / Last-Modified are stored on the sources table"""
+    updater = IncrementalUpdateManager(db_path=db_path)
+    updater.register_source_if_missing(make_metadata("https://example.com/rss.xml"))
+
+    assert updater.get_http_validators("feed_1") == {"etag": None, "last_modified": None}
+    updater.update_http_validators("feed_1", ETAG, LAST_MODIFIED)
+    assert updater.get_http_validators("feed_1") == {"etag": ETAG, "last_modified": LAST_MODIFIED}
+    assert updater.get_incremental_stats()["sources_with_validators"] == 1
+
+    # Validators seed the next monitor's conditional request
+    monitor = RSSSourceMonitor(make_metadata("https://example.com/rss.xml"), updater.get_http_validators("feed_1"))
+    assert (monitor.etag, monitor.last_modified) == (ETAG, LAST_MODIFIED)
+
+
+def make_universal_monitor(db_path: str) -> UniversalMonitor:
+    """UniversalMonitor wired to a temp database, without scheduler or write queue"""
+    monitor = UniversalMonitor.__new__(UniversalMonitor)
+    monitor.http_client = HTTPClientManager()
+    monitor.prioritizer = UniversalContentPrioritizer()
+    monitor.language_filter = LanguageFilter(target_languages=['en'], min_confidence=0.7)
+    monitor.noise_filter = NoiseReductionEngine(index_db_path=db_path)
+    monitor.trend_detector = TrendDetectionEngine()
+    monitor.incremental_updater = IncrementalUpdateManager(db_path=db_path)
+    monitor.health_monitor = SourceHealthMonitor(db_path=db_path)
+    return monitor
+
+
+@pytest.mark.asyncio
+async def test_validators_saved_only_after_items_stored(feed_url, db_path, monkeypatch):
+    """A failed write keeps the old validators so the next poll refetches the feed"""
+    universal = make_universal_monitor(db_path)
+    source_config = {"url": feed_url, "name": "Feed 1", "topics": ["react"], "authority_score": 0.9}
+    source_id = hashlib.md5(feed_url.encode()).hexdigest()[:8]
+
+    async def failing_store(pending, source_name):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(universal, "_store_items", failing_store)
+    with pytest.raises(RuntimeError):
+        await universal.monitor_source(source_config)
+    assert universal.incremental_updater.get_http_validators(source_id) == {"etag": None, "last_modified": None}
+
+    async def stored(pending, source_name):
+        return len(pending)
+
+    monkeypatch.setattr(universal, "_store_items", stored)
+    summary = await universal.monitor_source(source_config)
+    await universal.http_client.close()
+
+    assert summary["success"] and not summary["not_modified"]
+    assert universal.incremental_updater.get_http_validators(source_id) == {"etag": ETAG, "last_modified": LAST_MODIFIED}
+
+
+def test_health_dashboard_counts_not_modified(db_path):
+    """304 checks are successful and counted separately"""
+    health = SourceHealthMonitor(db_path=db_path)
+    health.record_check("feed_1", "Feed 1", success=True, response_time_ms=40, items_found=1)
+    health.record_check("feed_1", "Feed 1", success=True, response_time_ms=5, not_modified=True)
+    health.record_check("feed_1", "Feed 1", success=True, response_time_ms=6, not_modified=True)
+
+    dashboard = health.get_health_dashboard()
+    assert dashboard["recent_activity"]["not_modified_checks_24h"] == 2
+    assert dashboard["recent_activity"]["successful_checks_24h"] == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for the exact-duplicate fingerprint and URL reverse indexes
+"""
+
+import pytest
+from datetime import datetime
+from pathlib import Path
+import sys
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import ContentItem
+from core.noise_reduction_engine import NoiseReductionEngine, NoiseType
+from storage.database import StorageManager
+
+
+def make_item(item_id: str, url: str, title: str = "Next.js 15 Released",
+              content: str = "Next.js 15 ships the stable React compiler and partial prerendering.") -> ContentItem:
+    return ContentItem(
+        item_id=item_id,
+        source_id="test_source",
+        title=title,
+        content=content,
+        url=url,
+        published_date=datetime.now(),
+        author="Test Author",
+        topics=["react"],
+        metadata={}
+    )
+
+
+def test_normalized_url_duplicates():
+    """Links differing only in tracking params, case or trailing slash match"""
+    engine = NoiseReductionEngine()
+    engine.analyze_content(make_item("a", "https://www.Example.com/post/", title="First title"))
+    result = engine.analyze_content(
+        make_item("b", "https://example.com/post?utm_source=rss", title="Other title", content="Other body")
+    )
+
+    assert NoiseType.DUPLICATE_EXACT in result.noise_types
+    assert result.similar_content_ids[0] == "a"
+
+
+def test_fingerprint_duplicates_with_different_urls():
+    """Identical content under a different URL is found through the fingerprint index"""
+    engine = NoiseReductionEngine()
+    engine.analyze_content(make_item("a", "https://example.com/one"))
+    result = engine.analyze_content(make_item("b", "https://mirror.example.org/two"))
+
+    assert NoiseType.DUPLICATE_EXACT in result.noise_types
+    assert "a" in result.similar_content_ids
+
+
+def test_reanalyzing_same_item_is_not_a_duplicate():
+    """An item never duplicates itself"""
+    engine = NoiseReductionEngine()
+    item = make_item("a", "https://example.com/one")
+    engine.analyze_content(item)
+    result = engine.analyze_content(item)
+
+    assert NoiseType.DUPLICATE_EXACT not in result.noise_types
+
+
+def test_cleanup_keeps_indexes_consistent():
+    """Evicted items disappear from both reverse indexes"""
+    config = NoiseReductionEngine()._default_config()
+    config["cache_limits"]["max_content_cache"] = 3
+    engine = NoiseReductionEngine(config)
+
+    for i in range(6):
+        engine.analyze_content(make_item(f"item_{i}", f"https://example.com/{i}", title=f"Title {i}",
+                                         content=f"Unique body number {i} " * 5))
+
+    indexed_ids = set().union(*engine.fingerprint_index.values())
+    assert indexed_ids == set(engine.content_cache) == set(engine.content_fingerprints)
+    assert set().union(*engine.url_index.values()) == set(engine.content_urls) == indexed_ids
+
+
+def test_warm_from_database_survives_restart():
+    """Items stored in a previous run are detected as duplicates after restart"""
+    db_path = str(Path(tempfile.mkdtemp()) / "warm.db")
+    storage = StorageManager(db_path=db_path)
+    storage.save_content_item(make_item("stored", "https://example.com/stored"))
+
+    engine = NoiseReductionEngine(index_db_path=db_path, warm_from_db=True)
+    assert "stored" in engine.content_fingerprints
+    assert "stored" not in engine.content_cache
+
+    result = engine.analyze_content(make_item("refetched", "https://example.com/stored/"))
+    assert NoiseType.DUPLICATE_EXACT in result.noise_types
+    assert result.similar_content_ids[0] == "stored"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
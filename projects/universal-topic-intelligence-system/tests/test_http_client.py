@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared HTTP client manager
+"""
+
+import pytest
+import asyncio
+from aiohttp import web
+from pathlib import Path
+import sys
+from typing import Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import SourceMetadata, SourceType, SourceMonitorFactory
+from core.http_client import HTTPClientManager, get_http_client
+from sources.rss_monitor import RSSSourceMonitor
+
+FEED = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test Feed</title>
+<item><title>React Server Components</title><link>https://example.com/a</link>
+<guid>a</guid><description>Building React apps with server components</description></item>
+</channel></rss>"""
+
+
+@pytest.fixture
+async def feed_server():
+    """Local RSS server that records the peak number of concurrent requests"""
+    state = {"active": 0, "peak": 0}
+
+    async def handler(request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.02)
+        state["active"] -= 1
+        return web.Response(text=FEED, content_type="application/rss+xml")
+
+    app = web.Application()
+    app.router.add_get("/feed/{name}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", state
+    await runner.cleanup()
+
+
+def make_monitor(base_url: str, index: int, http_client: Optional[HTTPClientManager]) -> RSSSourceMonitor:
+    metadata = SourceMetadata(
+        source_id=f"feed_{index}",
+        source_name=f"Feed {index}",
+        source_type=SourceType.RSS,
+        source_url=f"{base_url}/feed/{index}",
+        authority_score=0.9,
+        update_frequency="hourly",
+        topics=["react"]
+    )
+    config = {"enable_language_filtering": False, "enable_relevance_filtering": False}
+    return RSSSourceMonitor(metadata, config, http_client=http_client)
+
+
+@pytest.mark.asyncio
+async def test_monitors_share_pooled_connections(feed_server):
+    """Many monitors fetching one host reuse a few connections within the per-host limit"""
+    base_url, state = feed_server
+    client = HTTPClientManager(limit_per_host=2)
+    monitors = [make_monitor(base_url, i, client) for i in range(12)]
+
+    results = await asyncio.gather(*(m.fetch_content() for m in monitors))
+    await client.close()
+
+    assert all(len(entries) == 1 for entries in results)
+    assert state["peak"] <= 2
+
+    stats = client.get_statistics()
+    assert stats["sessions_created"] == 1
+    assert stats["requests"] == 12
+    assert stats["connections_created"] <= 2
+    assert stats["connections_reused"] == 12 - stats["connections_created"]
+    assert stats["connection_reuse_rate"] > 0.5
+    assert not stats["session_open"]
+
+
+@pytest.mark.asyncio
+async def test_session_reopens_after_close(feed_server):
+    """A closed manager transparently creates a new session on the next fetch"""
+    base_url, _ = feed_server
+    client = HTTPClientManager()
+    monitor = make_monitor(base_url, 0, client)
+
+    assert await monitor.fetch_content()
+    await client.close()
+    assert await monitor.fetch_content()
+    await client.close()
+
+    assert client.get_statistics()["sessions_created"] == 2
+
+
+def factory_metadata(source_type: SourceType = SourceType.RSS) -> SourceMetadata:
+    return SourceMetadata(
+        source_id="factory_feed",
+        source_name="Factory Feed",
+        source_type=source_type,
+        source_url="https://example.com/rss.xml",
+        authority_score=0.9,
+        update_frequency="hourly",
+        topics=["react"]
+    )
+
+
+def test_factory_injects_shared_client():
+    """Monitors get no client unless one is injected"""
+    metadata = factory_metadata()
+    client = HTTPClientManager()
+
+    assert SourceMonitorFactory.create_monitor(metadata).http_client is None
+    assert SourceMonitorFactory.create_monitor(metadata, http_client=client).http_client is client
+
+
+def test_factory_skips_client_for_legacy_monitors():
+    """Monitors whose constructor predates http_client are still created"""
+
+    class LegacyMonitor(RSSSourceMonitor):
+        def __init__(self, source_metadata, config=None):
+            super().__init__(source_metadata, config)
+
+    original = SourceMonitorFactory._monitors.get(SourceType.API)
+    SourceMonitorFactory.register_monitor(SourceType.API, LegacyMonitor)
+    try:
+        monitor = SourceMonitorFactory.create_monitor(
+            factory_metadata(SourceType.API), http_client=HTTPClientManager()
+        )
+    finally:
+        if original is None:
+            SourceMonitorFactory._monitors.pop(SourceType.API, None)
+        else:
+            SourceMonitorFactory.register_monitor(SourceType.API, original)
+
+    assert isinstance(monitor, LegacyMonitor)
+    assert monitor.http_client is None
+
+
+@pytest.mark.asyncio
+async def test_monitor_without_client_uses_per_call_session(feed_server):
+    """Without an injected client each fetch opens and closes its own session"""
+    base_url, _ = feed_server
+    monitor = make_monitor(base_url, 0, None)
+
+    assert await monitor.fetch_content()
+    assert await monitor.fetch_content()
+    assert monitor.http_client is None
+    assert not get_http_client().get_statistics()["session_open"]
+
+
+def test_stale_session_is_closed_when_replaced():
+    """A session bound to a finished event loop is closed before a new one is made"""
+    client = HTTPClientManager()
+    loop = asyncio.new_event_loop()
+    stale = loop.run_until_complete(client.get_session())
+    loop.close()
+
+    async def fresh_session():
+        session = await client.get_session()
+        await client.close()
+        return session
+
+    fresh = asyncio.run(fresh_session())
+
+    assert fresh is not stale
+    assert stale.closed
+    assert fresh.closed
+    assert client.get_statistics()["sessions_created"] == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
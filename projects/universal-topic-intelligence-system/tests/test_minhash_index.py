@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Tests for the MinHash LSH near-duplicate index
+"""
+
+import pytest
+from datetime import datetime
+from pathlib import Path
+import sqlite3
+import sys
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import ContentItem
+from core.minhash_index import MinHashLSHIndex
+from core.noise_reduction_engine import NoiseReductionEngine, NoiseType
+
+BASE_TEXT = ("React 19 introduces several new features including automatic batching "
+             "concurrent rendering improved Suspense server components and a new compiler "
+             "that removes most manual memoization from application code")
+
+
+def make_item(item_id: str, content: str, title: str = "React 19 Release Notes") -> ContentItem:
+    return ContentItem(
+        item_id=item_id,
+        source_id="test_source",
+        title=title,
+        content=content,
+        url=f"https://example.com/{item_id}",
+        published_date=datetime.now(),
+        author="Test Author",
+        topics=["react"],
+        metadata={}
+    )
+
+
+def test_index_finds_near_duplicates_only():
+    """Similar documents are candidates, unrelated ones are not"""
+    index = MinHashLSHIndex()
+    index.add("original", BASE_TEXT)
+    index.add("unrelated", "Bitcoin price rallies as ethereum staking yields climb across exchanges today")
+
+    matches = dict(index.query(BASE_TEXT.replace("improved", "better"), threshold=0.5))
+    assert "original" in matches
+    assert "unrelated" not in matches
+    assert matches["original"] > 0.5
+
+
+def test_index_remove_and_persistence():
+    """Removed items disappear and signatures round-trip through SQLite"""
+    index = MinHashLSHIndex()
+    index.add("a", BASE_TEXT)
+    index.add("b", BASE_TEXT + " plus extra words")
+    index.remove("b")
+    assert len(index) == 1
+
+    db_path = str(Path(tempfile.mkdtemp()) / "index.db")
+    index.save(db_path)
+
+    restored = MinHashLSHIndex()
+    assert restored.load(db_path) == 1
+    assert restored.signatures["a"] == index.signatures["a"]
+    assert [item_id for item_id, _ in restored.query(BASE_TEXT)] == ["a"]
+
+    # Signatures from a differently seeded index are not comparable
+    assert MinHashLSHIndex(seed=1).load(db_path) == 0
+
+
+def test_index_saves_only_changes():
+    """Saves after the first write only new signatures and delete only evicted ones"""
+    import sqlite3
+
+    db_path = str(Path(tempfile.mkdtemp()) / "index.db")
+    index = MinHashLSHIndex()
+    for i in range(20):
+        index.add(f"doc_{i}", f"{BASE_TEXT} variant {i}")
+    assert index.save(db_path) == 20
+    assert index.save(db_path) == 0
+
+    index.add("doc_new", BASE_TEXT + " brand new")
+    index.remove("doc_3")
+    assert index.save(db_path) == 1
+
+    with sqlite3.connect(db_path) as conn:
+        stored = {row[0] for row in conn.execute("SELECT item_id FROM minhash_signatures")}
+    assert stored == set(index.signatures)
+
+    # A reloaded index keeps saving incrementally to the same table
+    restored = MinHashLSHIndex()
+    assert restored.load(db_path) == 20
+    assert restored.save(db_path) == 0
+    restored.remove("doc_new")
+    assert restored.save(db_path) == 0
+    assert MinHashLSHIndex().load(db_path) == 19
+
+
+@pytest.mark.parametrize("verify", [False, True])
+def test_engine_uses_index_for_near_duplicates(verify):
+    """Engine flags near duplicates through the index, with optional verification"""
+    config = NoiseReductionEngine()._default_config()
+    config["near_duplicate_index"] = {"verify_with_sequence_matcher": verify}
+    engine = NoiseReductionEngine(config)
+
+    engine.analyze_content(make_item("first", BASE_TEXT))
+    result = engine.analyze_content(make_item("second", BASE_TEXT + " today"))
+
+    assert NoiseType.DUPLICATE_NEAR in result.noise_types
+    assert "first" in result.similar_content_ids
+    assert len(engine.near_duplicate_index) == 2
+
+
+def test_engine_index_survives_restart():
+    """Signatures saved next to the database are reloaded by a new engine"""
+    db_path = str(Path(tempfile.mkdtemp()) / "engine.db")
+    engine = NoiseReductionEngine(index_db_path=db_path)
+    engine.analyze_content(make_item("first", BASE_TEXT))
+    assert engine.save_near_duplicate_index() is True
+
+    restarted = NoiseReductionEngine(index_db_path=db_path)
+    result = restarted.analyze_content(make_item("second", BASE_TEXT + " today"))
+    assert "first" in result.similar_content_ids
+
+
+def test_cache_eviction_removes_index_entries():
+    """Items evicted from the content cache leave the index"""
+    config = NoiseReductionEngine()._default_config()
+    config["cache_limits"]["max_content_cache"] = 2
+    engine = NoiseReductionEngine(config)
+
+    for i in range(4):
+        engine.analyze_content(make_item(f"item_{i}", f"{BASE_TEXT} variant number {i}", title=f"Title {i}"))
+
+    assert set(engine.near_duplicate_index.signatures) <= set(engine.content_cache)
+    assert "item_0" not in engine.near_duplicate_index
+
+
+def test_index_trim_drops_oldest_including_loaded():
+    """trim() keeps the newest ids, treating loaded ids as older than new ones"""
+    db_path = str(Path(tempfile.mkdtemp()) / "trim.db")
+    index = MinHashLSHIndex()
+    for i in range(5):
+        index.add(f"doc_{i}", f"{BASE_TEXT} {i}")
+    index.add("doc_0", f"{BASE_TEXT} 0 again")  # Re-adding makes it the newest
+    index.save(db_path)
+
+    restarted = MinHashLSHIndex()
+    restarted.load(db_path)
+    restarted.add("new", BASE_TEXT)
+
+    assert restarted.trim(3) == 3
+    assert list(restarted.signatures) == ["doc_4", "doc_0", "new"]
+    assert "doc_1" not in restarted.candidates(restarted.signature(f"{BASE_TEXT} 1"))
+
+
+def test_persisted_index_stays_bounded_across_restarts():
+    """Restarts do not add a full cache of signatures to the saved index each time"""
+    db_path = str(Path(tempfile.mkdtemp()) / "bounded.db")
+    config = NoiseReductionEngine()._default_config()
+    config["cache_limits"]["max_content_cache"] = 50
+
+    for restart in range(4):
+        engine = NoiseReductionEngine(config, index_db_path=db_path)
+        for i in range(50):
+            engine.analyze_content(make_item(f"run{restart}_{i}", f"{BASE_TEXT} run {restart} item {i} " * 2,
+                                             title=f"Run {restart} item {i}"))
+        assert len(engine.near_duplicate_index) <= 50
+        assert engine.save_near_duplicate_index() is True
+
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute("SELECT COUNT(*) FROM minhash_signatures").fetchone()[0]
+        assert rows == 50
+
+    # The newest run survives, older runs were evicted
+    assert all(item_id.startswith("run3_") for item_id in engine.near_duplicate_index.signatures)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Tests for the bounded priority result cache
+"""
+
+import pytest
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import UniversalContentPrioritizer, ContentItem
+from core import priority_cache as priority_cache_module
+from core.priority_cache import PriorityCache, content_hash
+
+
+def make_item(item_id: str, title: str = "React Server Components guide") -> ContentItem:
+    return ContentItem(
+        item_id=item_id,
+        source_id="react_blog",
+        title=title,
+        content="How to build with server components",
+        url=f"https://example.com/{item_id}",
+        published_date=datetime(2024, 5, 1, 12, 0),
+        author="Test Author",
+        topics=["react"],
+        metadata={"engagement_score": 0.7}
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for TTL tests"""
+    now = [1000.0]
+    monkeypatch.setattr(priority_cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_lru_eviction_and_counters():
+    """Least recently used entries are evicted beyond max_entries"""
+    cache = PriorityCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1   # a becomes most recently used
+    cache.put("c", 3)            # evicts b
+
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    stats = cache.get_statistics()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 2 and stats["misses"] == 1
+
+
+def test_ttl_expiry(clock):
+    """Entries expire on read and are swept periodically"""
+    cache = PriorityCache(max_entries=100, ttl_seconds=10, purge_interval=3)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    clock[0] += 11
+
+    assert cache.get("a") is None
+    cache.put("c", 3)  # third insert sweeps "b"
+    assert len(cache) == 1
+    assert cache.get_statistics()["expirations"] == 2
+
+
+def test_preference_changes_invalidate(clock):
+    """Changing topic preferences or source authorities drops cached results"""
+    prioritizer = UniversalContentPrioritizer()
+    item = make_item("item_1")
+
+    first = prioritizer.prioritize(item)
+    assert prioritizer.prioritize(item) is first
+
+    prioritizer.set_topic_preferences({"react": 1.0})
+    second = prioritizer.prioritize(item)
+    assert second is not first
+    assert second.factors.topic_relevance == 1.0
+
+    prioritizer.set_source_authorities({"react_blog": 0.9})
+    assert prioritizer.prioritize(item).factors.source_authority == 0.9
+
+    stats = prioritizer.get_statistics()["cache"]
+    assert stats["invalidations"] == 2
+    assert stats["hits"] == 1
+
+
+def test_in_place_preference_edits_do_not_serve_stale_scores(clock):
+    """Setters copy the mapping, and edits made to the stored dict still invalidate"""
+    prioritizer = UniversalContentPrioritizer()
+    item = make_item("item_1")
+    preferences = {"react": 1.0}
+    prioritizer.set_topic_preferences(preferences)
+    first = prioritizer.prioritize(item)
+
+    # The caller's dict is not shared
+    preferences["react"] = 0.1
+    assert prioritizer.prioritize(item) is first
+
+    # Editing the stored dict directly is detected on the next lookup
+    prioritizer.topic_preferences["react"] = 0.2
+    assert prioritizer.prioritize(item).factors.topic_relevance == 0.2
+    prioritizer.source_scores["react_blog"] = 0.7
+    assert prioritizer.prioritize_batch([item])[0].factors.source_authority == 0.7
+
+    # Re-setting equal preferences keeps the cache
+    invalidations = prioritizer.get_statistics()["cache"]["invalidations"]
+    prioritizer.set_topic_preferences({"react": 0.2})
+    assert prioritizer.get_statistics()["cache"]["invalidations"] == invalidations
+
+
+def test_content_hash_keys_hit_for_refetched_items():
+    """In content_hash mode an identical re-fetched item reuses the cached result"""
+    config = UniversalContentPrioritizer()._default_config()
+    config["cache_key"] = "content_hash"
+    prioritizer = UniversalContentPrioritizer(config)
+
+    original = make_item("item_1")
+    refetched = replace(original, metadata=dict(original.metadata))
+    changed = replace(original, title="React Server Components guide (updated)")
+
+    assert content_hash(original) == content_hash(refetched)
+    assert content_hash(original) != content_hash(changed)
+
+    first = prioritizer.prioritize(original)
+    again = prioritizer.prioritize(refetched)
+    assert again.content_item is refetched
+    assert again.total_score == first.total_score
+    prioritizer.prioritize(changed)
+
+    stats = prioritizer.get_statistics()
+    assert stats["cache"]["hits"] == 1
+    assert stats["total_prioritized"] == 2
+
+
+def test_cache_size_is_bounded():
+    """A long-running prioritizer never holds more than cache_max_entries results"""
+    config = UniversalContentPrioritizer()._default_config()
+    config["cache_max_entries"] = 50
+    prioritizer = UniversalContentPrioritizer(config)
+
+    for i in range(200):
+        prioritizer.prioritize(make_item(f"item_{i}"))
+
+    stats = prioritizer.get_statistics()
+    assert stats["cache_size"] == 50
+    assert stats["cache"]["evictions"] == 150
+    assert stats["total_prioritized"] == 200
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
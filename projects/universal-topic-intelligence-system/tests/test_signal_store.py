@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Tests for the bucketed topic signal store and the TrendDetectionEngine aggregates
+"""
+
+import pytest
+import random
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.signal_store import TopicSignalStore, regression_slope
+from core.trend_detection_engine import TrendDetectionEngine, TrendSignal
+
+
+def make_signal(hours_ago: float, topic: str, value: float, source_id: str = "source", content_id: str = None) -> TrendSignal:
+    return TrendSignal(
+        timestamp=datetime.now() - timedelta(hours=hours_ago),
+        topic=topic,
+        value=value,
+        source_type="rss",
+        source_id=source_id,
+        content_id=content_id or f"{topic}_{hours_ago}_{value}"
+    )
+
+
+def direct_slope(points):
+    """Slope computed straight from the points, as the detectors do"""
+    start = points[0][0]
+    xs = [(t - start) / 3600 for t, _ in points]
+    ys = [v for _, v in points]
+    return regression_slope(len(xs), sum(xs), sum(ys), sum(x * y for x, y in zip(xs, ys)), sum(x * x for x in xs))
+
+
+def test_window_aggregates_match_direct_computation():
+    """Bucket sums reproduce count, mean and regression slope of the raw signals"""
+    rng = random.Random(3)
+    store = TopicSignalStore(bucket_minutes=5, retention_hours=48)
+    now = time.time()
+
+    # Align the cutoff with a bucket boundary so the window is exact
+    cutoff = store.bucket_of(now - 12 * 3600) * store.bucket_seconds
+    points = []
+    for _ in range(500):
+        timestamp = cutoff + rng.uniform(0, 12 * 3600)
+        value = 0.5 + (timestamp - cutoff) / 3600 * 0.05 + rng.uniform(-0.1, 0.1)
+        store.add("react", timestamp, value, f"source_{rng.randrange(7)}")
+        points.append((timestamp, value))
+    store.add("react", cutoff - 3600, 5.0, "outside")
+
+    stats = store.window(cutoff)["react"]
+    points.sort()
+
+    assert stats["count"] == 500
+    assert stats["mean"] == pytest.approx(sum(v for _, v in points) / 500)
+    assert stats["velocity"] == pytest.approx(direct_slope(points), rel=1e-6)
+    assert "outside" not in stats["sources"]
+    assert stats["latest_values"] == [v for _, v in points[-3:]]
+
+
+def test_expired_buckets_are_recycled():
+    """A bucket slot is reset when the ring wraps and stale signals are rejected"""
+    store = TopicSignalStore(bucket_minutes=60, retention_hours=4)
+    start = store.bucket_of(time.time()) * store.bucket_seconds - 10 * 3600
+
+    assert store.add("vue", start, 1.0, "a")
+    # Same ring slot, one full ring later
+    assert store.add("vue", start + store.ring_size * 3600, 2.0, "b")
+    assert store.add("vue", start, 1.0, "a") is False
+
+    stats = store.window(start)["vue"]
+    assert stats["count"] == 1
+    assert stats["sources"] == {"b"}
+    assert store.get_statistics()["signals_dropped"] == 1
+
+
+def test_ring_grows_with_observed_span():
+    """A topic only allocates buckets for the span it has signals for, and grown rings keep every bucket"""
+    store = TopicSignalStore(bucket_minutes=5, retention_hours=720)
+    now = time.time()
+
+    store.add("short_lived", now, 1.0, "a")
+    assert store.get_statistics()["allocated_buckets"] < 16
+
+    points = [(now - hours * 3600, 0.1 * hours) for hours in range(0, 240, 3)]
+    for timestamp, value in points:
+        assert store.add("long_lived", timestamp, value, "b")
+
+    series = store.topics["long_lived"]
+    assert store.topics["short_lived"].capacity < series.capacity <= store.ring_size
+    stats = store.window(now - 240 * 3600)["long_lived"]
+    assert stats["count"] == len(points)
+    assert stats["mean"] == pytest.approx(sum(v for _, v in points) / len(points))
+
+
+def test_engine_drops_signals_older_than_retention():
+    """Signals past max_age_days never reach the aggregates or history"""
+    engine = TrendDetectionEngine()
+    assert engine.add_signal(make_signal(24 * 31, "react", 1.0)) is False
+    assert engine.add_signal(make_signal(1, "react", 1.0)) is True
+    assert len(engine.signal_history) == 1
+    assert engine.signal_store.signals_added == 1
+
+
+def test_summary_matches_full_analysis():
+    """get_trend_summary from aggregates agrees with analyze_trends on the raw signals"""
+    engine = TrendDetectionEngine()
+
+    for i in range(10):
+        engine.add_signal(make_signal(5 - i * 0.5, "jquery", 1.2 - i * 0.1, f"src_{i % 3}"))
+        engine.add_signal(make_signal(5 - i * 0.5, "react", 0.4 + i * 0.12, f"src_{i % 4}"))
+    for i in range(3):
+        engine.add_signal(make_signal(2 - i * 0.5, "htmx", 0.9, f"new_{i}"))
+
+    analysis = engine.analyze_trends("short")
+    summary = engine.get_trend_summary("short")
+
+    assert summary["total_signals_analyzed"] == analysis.total_signals_analyzed == 23
+    assert summary["total_trends"] == len(analysis.detected_trends)
+    assert summary["trends_by_type"] == Counter(t.trend_type.value for t in analysis.detected_trends)
+    assert summary["trends_by_strength"] == Counter(t.trend_strength.value for t in analysis.detected_trends)
+    assert summary["top_declining"] == analysis.declining_topics[:5]
+    assert summary["top_emerging"] == analysis.emergence_candidates[:5]
+    assert summary["confidence_score"] == pytest.approx(analysis.confidence_score)
+    assert summary["active_topics"] == 3
+    assert "jquery" in summary["top_declining"]
+
+
+def test_repeated_content_is_pruned_on_ingest():
+    """Repeated content expires and is capped as new signals arrive, not only when summarized"""
+    config = TrendDetectionEngine()._default_config()
+    config["signal_store"] = {"max_tracked_content": 5}
+    engine = TrendDetectionEngine(config)
+
+    for i in range(20):
+        engine.add_signal(make_signal(2, "react", 0.5, content_id=f"item_{i}"))
+        engine.add_signal(make_signal(1, "react", 0.6, content_id=f"item_{i}"))
+
+    assert list(engine._repeated_content) == [f"item_{i}" for i in range(15, 20)]
+
+    # Age the tracked entries past retention; the next repeat evicts them
+    retention = engine.signal_store.retention_seconds
+    for entries in engine._repeated_content.values():
+        entries[:] = [(timestamp - retention, *rest) for timestamp, *rest in entries]
+    engine.add_signal(make_signal(2, "react", 0.5, content_id="fresh"))
+    engine.add_signal(make_signal(1, "react", 0.6, content_id="fresh"))
+
+    assert list(engine._repeated_content) == ["fresh"]
+
+
+def test_viral_summary_uses_detector_classification():
+    """Viral trends in the summary match ViralDetector.detect_trends on the same signals"""
+    engine = TrendDetectionEngine()
+    engine.add_signal(make_signal(2, "react", 0.1, content_id="spike"))
+    engine.add_signal(make_signal(1.9, "react", 9.0, content_id="spike"))
+    engine.add_signal(make_signal(1.5, "react", 0.5, content_id="slow"))
+    engine.add_signal(make_signal(1, "react", 0.6, content_id="slow"))
+
+    analysis = engine.analyze_trends("short")
+    summary = engine.get_trend_summary("short")
+
+    viral = [t for t in analysis.detected_trends if t.metadata.get("detector") == "viral"]
+    assert [t.key_content for t in viral] == [["spike"]]
+    assert summary["trends_by_type"]["viral"] == Counter(t.trend_type.value for t in analysis.detected_trends)["viral"]
+    assert summary["viral_content_count"] == len(analysis.viral_content)
+
+
+def test_raw_history_is_bounded():
+    """The raw history keeps at most max_raw_signals while aggregates keep counting"""
+    config = TrendDetectionEngine()._default_config()
+    config["signal_store"] = {"max_raw_signals": 50}
+    engine = TrendDetectionEngine(config)
+
+    for i in range(200):
+        engine.add_signal(make_signal(i / 100, "react", 0.5))
+
+    assert len(engine.signal_history) == 50
+    assert engine.get_trend_summary("short")["total_signals_analyzed"] == 200
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
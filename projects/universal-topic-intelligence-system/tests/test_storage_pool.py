@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for the pooled StorageManager connection layer
+"""
+
+import pytest
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+import sys
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import ContentItem
+from storage.database import StorageManager
+
+
+@pytest.fixture
+def temp_db():
+    """Create temporary database path for testing"""
+    temp_dir = tempfile.mkdtemp()
+    return str(Path(temp_dir) / "pooled.db")
+
+
+@pytest.fixture
+def pooled_storage(temp_db):
+    """Create pooled storage manager with temp database"""
+    storage = StorageManager(db_path=temp_db, pooled=True, read_pool_size=2)
+    yield storage
+    storage.close()
+
+
+def make_item(item_id: str) -> ContentItem:
+    return ContentItem(
+        item_id=item_id,
+        source_id="test_source",
+        title=f"Pooled item {item_id}",
+        content="Pooled storage content",
+        url=f"https://example.com/{item_id}",
+        published_date=datetime.now(),
+        author="Test Author",
+        topics=["test"],
+        metadata={}
+    )
+
+
+def test_pooled_mode_uses_wal(pooled_storage, temp_db):
+    """Pooled connections switch the database to WAL journaling"""
+    with sqlite3.connect(temp_db) as conn:
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode.lower() == "wal"
+
+
+def test_pooled_connections_are_reused(pooled_storage):
+    """Many writes and reads share the same few connections"""
+    for i in range(50):
+        assert pooled_storage.save_content_item(make_item(f"item_{i}")) is True
+        pooled_storage.get_item_count()
+
+    # Duplicate is skipped without leaving a transaction open on the writer
+    assert pooled_storage.save_content_item(make_item("item_0")) is False
+
+    stats = pooled_storage.get_pool_stats()
+    assert stats['connections_opened'] <= 3  # one writer + at most two readers
+    assert stats['write_checkouts'] >= 50
+    assert pooled_storage.get_item_count() == 50
+
+
+def test_pooled_writes_visible_to_other_connections(pooled_storage, temp_db):
+    """Committed writes on the shared writer are visible outside the pool"""
+    pooled_storage.save_content_item(make_item("visible"))
+    pooled_storage.save_metric("performance", "cycle_time", 1.5)
+
+    with sqlite3.connect(temp_db) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM content_items").fetchone()[0] == 1
+        assert conn.execute("SELECT COUNT(*) FROM metrics").fetchone()[0] == 1
+
+
+def test_pool_stats_exact_under_concurrent_readers(pooled_storage):
+    """Checkout counters are not lost when many threads borrow readers at once"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    pooled_storage.save_content_item(make_item("shared"))
+    before = pooled_storage.get_pool_stats()['read_checkouts']
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: pooled_storage.get_item_count(), range(400)))
+
+    assert pooled_storage.get_pool_stats()['read_checkouts'] - before == 400
+
+
+def test_unpooled_mode_has_no_pool(temp_db):
+    """Default mode keeps per-call connections"""
+    storage = StorageManager(db_path=temp_db)
+    assert storage.pool is None
+    assert storage.get_pool_stats() == {}
+    storage.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the write-behind ingestion queue
+"""
+
+import pytest
+import asyncio
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+import sys
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import ContentItem
+from storage.database import StorageManager
+from storage.write_behind import WriteBehindQueue
+
+
+@pytest.fixture
+def storage():
+    """Create pooled storage manager with temp database"""
+    temp_dir = tempfile.mkdtemp()
+    storage = StorageManager(db_path=str(Path(temp_dir) / "queue.db"), pooled=True)
+    yield storage
+    storage.close()
+
+
+def make_item(item_id: str) -> ContentItem:
+    return ContentItem(
+        item_id=item_id,
+        source_id="test_source",
+        title=f"Queued item {item_id}",
+        content="Queued content",
+        url=f"https://example.com/{item_id}",
+        published_date=datetime.now(),
+        author="Test Author",
+        topics=["test"],
+        metadata={}
+    )
+
+
+@pytest.mark.asyncio
+async def test_queue_batches_items_from_many_sources(storage):
+    """Concurrent producers are flushed in a few bulk batches"""
+    queue = WriteBehindQueue(storage, batch_size=50, flush_interval=0.05)
+    await queue.start()
+
+    async def produce(source: int):
+        futures = await queue.submit_many(
+            [(make_item(f"s{source}_{i}"), 0.5, "medium") for i in range(20)]
+        )
+        return await asyncio.gather(*futures)
+
+    results = await asyncio.gather(*(produce(s) for s in range(10)))
+    await queue.stop()
+    queue.close()
+
+    assert all(all(flags) for flags in results)
+    assert storage.get_item_count() == 200
+
+    metrics = queue.get_metrics()
+    assert metrics['items_flushed'] == 200
+    assert metrics['items_inserted'] == 200
+    assert metrics['batches_flushed'] <= 10
+    assert metrics['queue_depth'] == 0
+    assert metrics['avg_flush_ms'] > 0
+
+
+@pytest.mark.asyncio
+async def test_queue_reports_duplicates_as_not_stored(storage):
+    """Items already in the database resolve to False"""
+    storage.save_content_item(make_item("existing"))
+    queue = WriteBehindQueue(storage, batch_size=10, flush_interval=0.01)
+
+    existing = await queue.submit(make_item("existing"))
+    fresh = await queue.submit(make_item("fresh"))
+    assert await existing is False
+    assert await fresh is True
+
+    await queue.stop()
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_queue_applies_backpressure(storage):
+    """Producers wait once the queue is full instead of growing it"""
+    queue = WriteBehindQueue(storage, batch_size=5, flush_interval=0.01, max_queue_size=5)
+    await queue.start()
+
+    futures = await queue.submit_many([(make_item(f"bp_{i}"), 0.5, "low") for i in range(40)])
+    await asyncio.gather(*futures)
+    await queue.stop()
+    queue.close()
+
+    metrics = queue.get_metrics()
+    assert metrics['backpressure_waits'] > 0
+    assert metrics['max_queue_depth'] <= 5
+    assert metrics['items_inserted'] == 40
+
+
+@pytest.mark.asyncio
+async def test_queue_fails_futures_when_flush_fails(storage):
+    """A failed transaction is counted and raised to every waiting producer"""
+    with storage.pool.writer() as conn:
+        conn.execute("DROP TABLE content_items")
+        conn.commit()
+
+    queue = WriteBehindQueue(storage, batch_size=10, flush_interval=0.01)
+    futures = await queue.submit_many([(make_item(f"lost_{i}"), 0.5, "low") for i in range(3)])
+    results = await asyncio.gather(*futures, return_exceptions=True)
+    await queue.stop()
+    queue.close()
+
+    assert all(isinstance(result, sqlite3.Error) for result in results)
+    metrics = queue.get_metrics()
+    assert metrics['flush_errors'] == 1
+    assert metrics['items_inserted'] == 0
+
+
+def test_bulk_save_reports_or_raises_errors(storage):
+    """Bulk saves keep their zero-count result by default and raise on request"""
+    with storage.pool.writer() as conn:
+        conn.execute("DROP TABLE content_items")
+        conn.commit()
+
+    rows = [(make_item("broken"), 0.5, "low")]
+    assert storage.save_content_items_bulk(rows) == {'inserted': 0, 'skipped': 0}
+    with pytest.raises(sqlite3.Error):
+        storage.save_content_items_bulk(rows, raise_errors=True)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])